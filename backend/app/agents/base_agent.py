@@ -5,11 +5,12 @@ Abstract base class for all AI agents in the system.
 Provides common functionality for LLM interaction, logging, and error handling.
 """
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from app.agents.config import get_agent_config, TaskComplexity
 from app.agents.llm_manager import get_llm_manager, LLMProvider
@@ -34,6 +35,8 @@ class BaseAgent(ABC):
     agent_name: str = "base_agent"
     agent_description: str = "Base agent class"
     task_complexity: TaskComplexity = TaskComplexity.MEDIUM
+    # Set by agents that implement evaluate_rules() (two-phase execute_batch)
+    supports_rule_phase: bool = False
     
     def __init__(self):
         """Initialize the agent with configuration and LLM."""
@@ -167,6 +170,101 @@ class BaseAgent(ABC):
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    # ------------------------------------------
+    # Batch execution
+    # ------------------------------------------
+    
+    def evaluate_rules(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rule-based part of execute(), without any LLM call.
+        
+        Agents that override this (with needs_llm() and refine_with_llm()
+        where they use an LLM) and set supports_rule_phase get a two-phase
+        execute_batch(). Only called when supports_rule_phase is True.
+        """
+        return {}
+    
+    def needs_llm(self, input_data: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """Whether a rule-based result should be refined by the LLM."""
+        return False
+    
+    async def refine_with_llm(
+        self,
+        input_data: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Refine a rule-based result with an LLM call."""
+        return result
+    
+    async def execute_batch(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the agent over many inputs.
+        
+        Rule-based evaluation runs inline for the whole batch first, then
+        only the items that still need the LLM are refined, at most
+        max_concurrency (config.llm_batch_concurrency) at a time. Agents
+        without a rule phase (supports_rule_phase False) run execute()
+        under the same bound.
+        
+        Args:
+            items: Inputs for execute()
+            max_concurrency: Cap on concurrent LLM calls / executions
+            
+        Returns:
+            Results in input order; a failed item yields {"error": ...}
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.llm_batch_concurrency)
+        
+        if not self.supports_rule_phase:
+            async def run_one(item: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        return await self.execute(item)
+                    except Exception as e:
+                        logger.error(f"{self.agent_name} batch item failed: {e}")
+                        return {"error": str(e)}
+            
+            return list(await asyncio.gather(*(run_one(item) for item in items)))
+        
+        # Phase 1: rules for every item, off the event loop
+        results, pending = await asyncio.to_thread(self._evaluate_rules_batch, items)
+        
+        # Phase 2: bounded concurrent LLM refinement; keep the rule result on failure
+        async def refine(i: int):
+            async with semaphore:
+                try:
+                    results[i] = await self.refine_with_llm(items[i], results[i])
+                except Exception as e:
+                    logger.warning(f"{self.agent_name} LLM refinement failed, keeping rules: {e}")
+        
+        if pending:
+            await asyncio.gather(*(refine(i) for i in pending))
+        
+        return results
+    
+    def _evaluate_rules_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Run evaluate_rules() over a batch; returns results and indexes needing the LLM."""
+        results: List[Dict[str, Any]] = []
+        pending: List[int] = []
+        for i, item in enumerate(items):
+            try:
+                result = self.evaluate_rules(item)
+            except Exception as e:
+                logger.error(f"{self.agent_name} batch item failed: {e}")
+                result = {"error": str(e)}
+            else:
+                if self.needs_llm(item, result):
+                    pending.append(i)
+            results.append(result)
+        return results, pending
+    
     def _create_agent_executor(self):
         """
         Create a LangChain agent executor.
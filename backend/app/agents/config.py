@@ -80,6 +80,12 @@ class AgentConfig:
     # Processing settings
     batch_size: int = 10
     parallel_processing: bool = True
+    llm_batch_concurrency: int = 4  # LLM calls in flight per agent batch
+    priority_llm_refinement: bool = False  # LLM second opinion on medium urgency
+    
+    # Scraping settings
+    scrape_max_concurrency: int = 8  # Sources scraped at once
+    scrape_per_host_concurrency: int = 2  # Sources scraped at once per host
     
     # Logging
     log_decisions: bool = True
@@ -14,7 +14,7 @@ import json
 import logging
 import re
 from datetime import datetime
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 
 from app.agents.base_agent import BaseAgent
 from app.agents.config import TaskComplexity
@@ -124,6 +124,7 @@ class PriorityDetectionAgent(BaseAgent):
     agent_name = "priority_detection"
     agent_description = "Detects urgent content requiring immediate attention"
     task_complexity = TaskComplexity.MEDIUM  # Accuracy critical
+    supports_rule_phase = True
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for priority detection."""
@@ -143,23 +144,63 @@ class PriorityDetectionAgent(BaseAgent):
         Returns:
             Dict with urgency classification
         """
+        # Quick keyword-based classification (always runs, very fast)
+        keyword_result = self.evaluate_rules(input_data)
+        
+        # If keywords indicate critical/high, trust that; medium can
+        # optionally get an LLM second opinion
+        if self.needs_llm(input_data, keyword_result):
+            try:
+                return await self.refine_with_llm(input_data, keyword_result)
+            except Exception as e:
+                logger.warning(f"LLM refinement failed, keeping keyword result: {e}")
+        return keyword_result
+    
+    def evaluate_rules(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword-based urgency classification (no LLM call)."""
         title = input_data.get("title", "")
         content = input_data.get("content", "")
         source = input_data.get("source", "unknown")
         
         # Combine for analysis
         full_text = f"{title} {content}".lower()
+        return self._keyword_classification(full_text, source)
+    
+    def needs_llm(self, input_data: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """Only ambiguous (medium) results are worth an LLM call, and only if enabled."""
+        return self.config.priority_llm_refinement and result["urgency_level"] == "medium"
+    
+    async def refine_with_llm(
+        self,
+        input_data: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Ask the LLM to confirm or change a keyword classification."""
+        prompt = (
+            f"{PRIORITY_AGENT_PROMPT}\n\n"
+            f"Title: {input_data.get('title', '')}\n"
+            f"Source: {input_data.get('source', 'unknown')}\n"
+            f"Content: {str(input_data.get('content', ''))[:2000]}\n\n"
+            f"Keyword pre-classification: {result['urgency_level']} ({result['reasoning']})"
+        )
+        response = await self.invoke_llm(prompt)
         
-        # Quick keyword-based classification (always runs, very fast)
-        keyword_result = self._keyword_classification(full_text, source)
-        
-        # If keywords indicate critical/high, trust that
-        if keyword_result["urgency_level"] in ["critical", "high"]:
-            return keyword_result
+        match = re.search(r"\{.*\}", response, re.DOTALL)
+        llm_result = json.loads(match.group(0)) if match else {}
+        level = str(llm_result.get("urgency_level", "")).lower()
+        if level not in ("critical", "high", "medium", "low"):
+            return result
         
-        # For medium/low, can optionally use LLM for refinement
-        # But for speed, we use rule-based approach
-        return keyword_result
+        return {
+            **result,
+            "urgency_level": level,
+            "urgency_score": float(llm_result.get("urgency_score", result["urgency_score"])),
+            "fast_track": level in ["critical", "high"],
+            "notification_required": level == "critical",
+            "reasoning": llm_result.get("reasoning", result["reasoning"]),
+            "processing_priority": self._get_priority_number(level),
+            "decision_method": "llm_refined"
+        }
     
     def _keyword_classification(
         self, 
@@ -288,27 +329,36 @@ class PriorityDetectionAgent(BaseAgent):
     
     async def classify_batch(
         self, 
-        articles: List[Dict[str, Any]]
+        articles: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Classify urgency for a batch of articles.
         
+        Keyword classification runs for the whole batch before any LLM
+        refinement calls, which are bounded by max_concurrency.
+        
         Args:
             articles: List of articles to classify
+            max_concurrency: Cap on concurrent LLM calls (see execute_batch)
             
         Returns:
-            Dict with classified articles by urgency level
+            Dict with classified articles by urgency level; "results" holds
+            the per-article classifications in input order
         """
+        classifications = await self.execute_batch(articles, max_concurrency)
         results = {
             "critical": [],
             "high": [],
             "medium": [],
             "low": [],
-            "total": len(articles)
+            "total": len(articles),
+            "results": classifications
         }
         
-        for article in articles:
-            classification = await self.execute(article)
+        for article, classification in zip(articles, classifications):
+            if "error" in classification:
+                continue
             level = classification["urgency_level"]
             
             results[level].append({
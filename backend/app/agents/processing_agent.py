@@ -83,6 +83,7 @@ class ProcessingAgent(BaseAgent):
     agent_name = "processing"
     agent_description = "Processes and routes content through pipelines"
     task_complexity = TaskComplexity.SIMPLE  # Use fast 8B model
+    supports_rule_phase = True
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for content processing."""
@@ -102,6 +103,10 @@ class ProcessingAgent(BaseAgent):
         Returns:
             Dict with processed content and quality assessment
         """
+        return self.evaluate_rules(input_data)
+    
+    def evaluate_rules(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rule-based content processing (no LLM call)."""
         content = input_data.get("content", "")
         title = input_data.get("title", "")
         source = input_data.get("source", "unknown")
@@ -198,27 +203,33 @@ class ProcessingAgent(BaseAgent):
     
     async def process_batch(
         self, 
-        articles: List[Dict[str, Any]]
+        articles: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process a batch of articles.
         
         Args:
             articles: List of article dicts
+            max_concurrency: Cap on concurrent LLM calls (see execute_batch)
             
         Returns:
-            Dict with batch processing results
+            Dict with batch processing results; "results" holds the
+            per-article results in input order
         """
+        outcomes = await self.execute_batch(articles, max_concurrency)
         results = {
             "processed": [],
             "skipped": [],
             "rejected": [],
-            "total": len(articles)
+            "total": len(articles),
+            "results": outcomes
         }
         
-        for article in articles:
+        for article, result in zip(articles, outcomes):
             try:
-                result = await self.execute(article)
+                if "error" in result:
+                    raise RuntimeError(result["error"])
                 
                 if result["action"] == "process":
                     results["processed"].append({
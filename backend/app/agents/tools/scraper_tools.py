@@ -5,7 +5,7 @@ LangChain tools that wrap existing scraper functionality.
 The agents use these tools to execute scraping operations.
 
 Enhanced with Smart Caching to achieve 70% faster scraping through:
-- ETag/Last-Modified header checking
+- Conditional GET (ETag/Last-Modified), reusing the list page body
 - Content signature detection
 - Automatic cache invalidation
 
@@ -16,6 +16,7 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
 
 from langchain_core.tools import Tool
 
@@ -136,15 +137,16 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
     start_time = datetime.utcnow()
     
     try:
-        # Get scraper instance
-        scraper = get_scraper_instance(source_name)
+        # Get scraper instance (configurable scrapers come from the
+        # database, so keep the lookup off the event loop)
+        scraper = await asyncio.to_thread(get_scraper_instance, source_name)
         
         if not scraper:
             return {
                 "success": False,
                 "source_name": source_name,
                 "error": f"No scraper found for source '{source_name}'",
-                "available_scrapers": get_available_scrapers()
+                "available_scrapers": await asyncio.to_thread(get_available_scrapers)
             }
         
         # Get source configuration for caching
@@ -153,18 +155,28 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
         source_type = source_config.get("source_type", "news")
         cache_ttl = source_config.get("cache_ttl", 3600)
         
+        # Configurable scrapers can take the list page body from the change
+        # check, so check the page they actually scrape
+        reuses_list_page = isinstance(scraper, ConfigurableScraper)
+        if reuses_list_page:
+            source_url = scraper.list_url
+        
         # Get smart cache instance
         cache = await get_smart_cache()
         
-        # Check if we need to scrape or can use cache
-        if not force_refresh and source_url:
-            should_scrape, reason = await cache.should_scrape(
+        # One conditional GET decides between cache and scrape
+        fetch = None
+        if source_url:
+            fetch = await cache.fetch_if_changed(
                 source_name=source_name,
                 url=source_url,
-                source_type=source_type
+                source_type=source_type,
+                force=force_refresh,
+                keep_body=reuses_list_page
             )
+            reason = fetch.reason
             
-            if not should_scrape:
+            if not fetch.needs_scraping:
                 # Get cached articles
                 cached_articles = await cache.get_cached_articles(source_name)
                 
@@ -189,7 +201,10 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
         
         # Execute actual scraping
         logger.info(f"Cache MISS for {source_name}, performing fresh scrape...")
-        articles = await scraper.fetch_articles()
+        if fetch is not None and fetch.content is not None:
+            articles = await scraper.fetch_articles(list_page=fetch.content)
+        else:
+            articles = await scraper.fetch_articles()
         
         # Calculate duration
         duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -212,13 +227,16 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
                 source_name=source_name,
                 url=source_url,
                 articles=articles_data,
-                source_type=source_type
+                source_type=source_type,
+                response_headers=fetch.headers if fetch else None,
+                page_signature=fetch.signature if fetch else None
             )
             # Record the cache miss for metrics
             cache.metrics.record_miss(source_name, "content_changed")
         
         # Update database with scrape result
-        update_scrape_result(
+        await asyncio.to_thread(
+            update_scrape_result,
             source_name=source_name,
             articles_count=len(articles),
             success=True
@@ -232,6 +250,7 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
             "articles_count": len(articles),
             "articles": articles_data,
             "duration_ms": duration_ms,
+            "bytes_fetched": getattr(scraper, "bytes_fetched", 0),
             "scraped_at": datetime.utcnow().isoformat(),
             "from_cache": False,
             "cache_reason": "fresh_scrape"
@@ -241,7 +260,8 @@ async def _scrape_source_async(source_name: str, force_refresh: bool = False) ->
         logger.error(f"Error scraping {source_name}: {e}")
         
         # Update database with failure
-        update_scrape_result(
+        await asyncio.to_thread(
+            update_scrape_result,
             source_name=source_name,
             articles_count=0,
             success=False
@@ -440,6 +460,7 @@ class ScraperToolManager:
     def __init__(self):
         """Initialize the scraper tool manager."""
         self.available_scrapers = get_available_scrapers()
+        self._source_hosts: Dict[str, str] = {}
         logger.info(f"ScraperToolManager initialized with scrapers: {self.available_scrapers}")
     
     async def execute_scraper(self, source_name: str, force_refresh: bool = False) -> Dict[str, Any]:
@@ -463,6 +484,35 @@ class ScraperToolManager:
         """Get configuration for a specific source."""
         return SOURCE_CONFIG.get(source_name)
     
+    def get_source_host(self, source_name: str) -> str:
+        """
+        Get the host a source is scraped from, for per-host limits.
+        
+        Looks at SOURCE_CONFIG first, then the base URL of the scraper
+        execute_scraper would use (database-configured sources included).
+        Sources without a URL are treated as their own host. Hosts are
+        cached, as the scraper lookup may hit the database.
+        """
+        host = self._source_hosts.get(source_name)
+        if host is None:
+            host = self._source_hosts[source_name] = self._resolve_source_host(source_name)
+        return host
+    
+    @staticmethod
+    def _resolve_source_host(source_name: str) -> str:
+        url = SOURCE_CONFIG.get(source_name, {}).get("url")
+        if not url:
+            try:
+                scraper = get_scraper_instance(source_name)
+                url = str(scraper.source_info.url) if scraper else None
+            except Exception as e:
+                logger.warning(f"Could not look up host for {source_name}: {e}")
+        if url:
+            host = urlparse(url).hostname
+            if host:
+                return host[4:] if host.startswith("www.") else host
+        return source_name
+    
     async def get_cache_statistics(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
         return await _get_cache_stats_async()
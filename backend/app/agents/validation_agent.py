@@ -34,6 +34,7 @@ class ValidationAgent(BaseAgent):
     agent_name = "validation"
     agent_description = "Validates data quality and detects errors"
     task_complexity = TaskComplexity.SIMPLE  # Use fast 8B model
+    supports_rule_phase = True
     
     # Validation thresholds
     MIN_TITLE_LENGTH = 10
@@ -77,6 +78,10 @@ class ValidationAgent(BaseAgent):
         Returns:
             Dict with validation results
         """
+        return self.evaluate_rules(input_data)
+    
+    def evaluate_rules(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rule-based validation (no LLM call)."""
         issues = []
         corrections = {}
         
@@ -418,27 +423,33 @@ class ValidationAgent(BaseAgent):
     
     async def validate_batch(
         self, 
-        articles: List[Dict[str, Any]]
+        articles: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Validate a batch of articles.
         
         Args:
             articles: List of articles to validate
+            max_concurrency: Cap on concurrent LLM calls (see execute_batch)
             
         Returns:
-            Dict with validation results
+            Dict with validation results; "results" holds the per-article
+            validations in input order
         """
+        validations = await self.execute_batch(articles, max_concurrency)
         results = {
             "valid": [],
             "invalid": [],
             "needs_review": [],
-            "total": len(articles)
+            "total": len(articles),
+            "results": validations
         }
         
-        for article in articles:
+        for article, validation in zip(articles, validations):
             try:
-                validation = await self.execute(article)
+                if "error" in validation:
+                    raise RuntimeError(validation["error"])
                 
                 article_result = {
                     "article_id": article.get("article_id"),
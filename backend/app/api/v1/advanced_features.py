@@ -20,6 +20,7 @@ from app.layer4.advanced import (
     ScenarioSimulator,
     CorrelationAnalyzer,
     TrendForecaster,
+    TimeSeriesStore,
 )
 from app.layer4.advanced.scenario_simulator import ScenarioType
 from app.layer4.advanced.trend_forecaster import SeasonalPeriod
@@ -30,8 +31,9 @@ router = APIRouter(prefix="/advanced", tags=["Advanced Features"])
 ml_predictor = MLImpactPredictor()
 portfolio_analyzer = PortfolioAnalyzer()
 scenario_simulator = ScenarioSimulator()
-correlation_analyzer = CorrelationAnalyzer()
-trend_forecaster = TrendForecaster()
+time_series_store = TimeSeriesStore()
+correlation_analyzer = CorrelationAnalyzer(time_series_store)
+trend_forecaster = TrendForecaster(time_series_store)
 
 
 # ============================================================================
@@ -109,6 +111,12 @@ class DiversificationResponse(BaseModel):
     recommendations: List[str]
 
 
+class StressTestBatchRequest(BaseModel):
+    """Request to run several stress scenarios on a portfolio."""
+    # Scenario name -> factor multipliers; the built-in scenarios if None
+    scenarios: Optional[Dict[str, Dict[str, float]]] = None
+
+
 # Scenario Simulation Models
 class ScenarioCreateRequest(BaseModel):
     """Request to create a scenario."""
@@ -147,8 +155,9 @@ class MonteCarloRequest(BaseModel):
     scenario_id: str
     company_id: str
     baseline_indicators: Dict[str, float]
-    num_simulations: int = Field(default=100, ge=10, le=1000)
+    num_simulations: int = Field(default=100, ge=10, le=10000)
     variance_factor: float = Field(default=0.1, ge=0.01, le=0.5)
+    seed: Optional[int] = None
 
 
 # Correlation Analysis Models
@@ -434,6 +443,16 @@ async def run_stress_test(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.post("/portfolio/{portfolio_id}/stress-test/batch")
+async def run_stress_tests(portfolio_id: str, request: StressTestBatchRequest):
+    """Run several stress scenarios on a portfolio in one pass."""
+    try:
+        results = portfolio_analyzer.run_stress_tests(portfolio_id, request.scenarios)
+        return {"portfolio_id": portfolio_id, "results": results}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("/portfolio")
 async def list_portfolios():
     """List all portfolios."""
@@ -526,6 +545,7 @@ async def run_monte_carlo(request: MonteCarloRequest):
             request.baseline_indicators,
             request.num_simulations,
             request.variance_factor,
+            request.seed,
         )
         return results
     except ValueError as e:
@@ -606,13 +626,10 @@ async def add_correlation_data_batch(
     data: List[Dict[str, Any]],
 ):
     """Add batch data for correlation analysis."""
-    for point in data:
-        timestamp = datetime.fromisoformat(point["timestamp"])
-        correlation_analyzer.add_data_point(
-            company_id,
-            timestamp,
-            point["indicators"],
-        )
+    correlation_analyzer.add_historical_data(
+        company_id,
+        [(datetime.fromisoformat(point["timestamp"]), point["indicators"]) for point in data],
+    )
     return {"status": "success", "points_added": len(data)}
 
 
@@ -762,11 +779,11 @@ async def add_trend_data_batch(
     data: List[Dict[str, Any]],
 ):
     """Add batch data for trend analysis."""
-    for point in data:
-        timestamp = datetime.fromisoformat(point["timestamp"])
-        trend_forecaster.add_data_point(
-            company_id, indicator, timestamp, point["value"]
-        )
+    trend_forecaster.add_historical_data(
+        company_id,
+        indicator,
+        [(datetime.fromisoformat(point["timestamp"]), point["value"]) for point in data],
+    )
     return {"status": "success", "points_added": len(data)}
 
 
@@ -914,3 +931,16 @@ async def get_trend_data_summary(company_id: str):
     """Get summary of available trend data."""
     summary = trend_forecaster.get_data_summary(company_id)
     return summary
+
+
+# ============================================================================
+# Result Store Endpoints
+# ============================================================================
+
+@router.get("/result-stores/stats")
+async def get_result_store_stats():
+    """Hit/miss/eviction counters of the analyzers' result stores."""
+    stats: Dict[str, Any] = {}
+    for component in (ml_predictor, scenario_simulator, correlation_analyzer, trend_forecaster):
+        stats.update(component.get_result_stats())
+    return stats
@@ -9,6 +9,7 @@ import logging
 
 from app.services.system_health_service import SystemHealthService
 from app.db.mongodb import get_mongodb
+from app.utils.http_clients import get_http_pool_stats
 
 logger = logging.getLogger(__name__)
 
@@ -37,15 +38,18 @@ async def get_system_metrics() -> Dict[str, Any]:
         - api_metrics: API performance stats
         - resource_usage: CPU, memory, disk usage
         - endpoint_performance: Per-endpoint statistics
+        - http_pools: Shared HTTP client pool statistics
     """
     api_metrics = SystemHealthService.get_api_metrics()
     resource_usage = SystemHealthService.get_resource_usage()
     endpoint_performance = SystemHealthService.get_endpoint_performance()
+    http_pools = get_http_pool_stats()
     
     return {
         "api_metrics": api_metrics,
         "resource_usage": resource_usage,
         "endpoint_performance": endpoint_performance,
+        "http_pools": http_pools,
     }
 
 
@@ -84,6 +88,19 @@ async def get_recent_errors(limit: int = 10) -> Dict[str, Any]:
     }
 
 
+@router.get("/http")
+async def get_http_pool_health() -> Dict[str, Any]:
+    """
+    Get shared HTTP client pool statistics
+    
+    Returns:
+        - http2: Whether HTTP/2 support is available
+        - profiles: Per-client requests, connection reuse rate, peak
+          in-flight requests and per-host limit waits
+    """
+    return get_http_pool_stats()
+
+
 @router.get("/all")
 async def get_all_health_data() -> Dict[str, Any]:
     """
@@ -98,6 +115,7 @@ async def get_all_health_data() -> Dict[str, Any]:
     resource_usage = SystemHealthService.get_resource_usage()
     recent_errors = SystemHealthService.get_recent_errors(10)
     endpoint_performance = SystemHealthService.get_endpoint_performance()
+    http_pools = get_http_pool_stats()
     
     return {
         "system_status": system_status,
@@ -106,5 +124,6 @@ async def get_all_health_data() -> Dict[str, Any]:
         "resource_usage": resource_usage,
         "recent_errors": recent_errors,
         "endpoint_performance": endpoint_performance,
+        "http_pools": http_pools,
         "timestamp": system_status["timestamp"],
     }
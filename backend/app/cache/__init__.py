@@ -5,13 +5,13 @@ This module provides intelligent caching to reduce redundant scraping
 and improve overall system performance by 70%.
 
 Features:
-- Change detection (HEAD requests, ETag, Last-Modified)
+- Change detection (conditional GET, ETag, Last-Modified)
 - Content signature for quick change detection
 - Article caching with TTL
 - Metrics tracking for cache performance
 """
 
-from app.cache.smart_cache import SmartCacheManager, get_cache_manager
+from app.cache.smart_cache import SmartCacheManager, ListPageFetch, get_cache_manager
 from app.cache.change_detector import ChangeDetector
 from app.cache.cache_metrics import CacheMetrics
 from typing import Optional
@@ -49,6 +49,7 @@ def get_smart_cache_sync() -> SmartCacheManager:
 __all__ = [
     "SmartCacheManager",
     "SmartCache",  # Alias for backward compatibility
+    "ListPageFetch",
     "ChangeDetector", 
     "CacheMetrics",
     "get_smart_cache",
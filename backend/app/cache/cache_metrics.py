@@ -438,6 +438,16 @@ class CacheMetrics:
             logger.error(f"[CacheMetrics] Error resetting stats: {e}")
             return False
     
+    def get_http_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get shared HTTP client pool statistics.
+        
+        Returns:
+            Per-profile request, connection reuse and saturation counters
+        """
+        from app.utils.http_clients import get_http_pool_stats
+        return get_http_pool_stats()
+    
     def to_dict(self, stats: CacheStats) -> Dict[str, Any]:
         """Convert CacheStats to dictionary"""
         return asdict(stats)
@@ -14,6 +14,8 @@ from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import httpx
 
+from app.utils.http_clients import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,15 +62,10 @@ class HTTPHeaderDetector(BaseChangeDetector):
     
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True
-            )
-        return self._client
+        # Shared pooled client; the detector timeout is applied per request
+        return get_http_client("detector")
     
     async def detect_change(
         self, 
@@ -88,7 +85,7 @@ class HTTPHeaderDetector(BaseChangeDetector):
             if cached_data.get("last_modified"):
                 headers["If-Modified-Since"] = cached_data["last_modified"]
             
-            response = await client.head(url, headers=headers)
+            response = await client.head(url, headers=headers, timeout=self.timeout)
             duration = int((datetime.utcnow() - start).total_seconds() * 1000)
             
             # 304 Not Modified - definitive no change
@@ -180,9 +177,8 @@ class HTTPHeaderDetector(BaseChangeDetector):
             )
     
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The pooled client is shared process-wide; nothing to release
+        pass
 
 
 class ContentSignatureDetector(BaseChangeDetector):
@@ -196,15 +192,10 @@ class ContentSignatureDetector(BaseChangeDetector):
     def __init__(self, sample_size: int = 3000, timeout: int = 15):
         self.sample_size = sample_size
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True
-            )
-        return self._client
+        # Shared pooled client; the detector timeout is applied per request
+        return get_http_client("detector")
     
     def _normalize_content(self, content: str) -> str:
         """
@@ -264,11 +255,11 @@ class ContentSignatureDetector(BaseChangeDetector):
             # Try Range request first (faster)
             try:
                 headers = {"Range": f"bytes=0-{self.sample_size}"}
-                response = await client.get(url, headers=headers)
+                response = await client.get(url, headers=headers, timeout=self.timeout)
                 content = response.text[:self.sample_size]
             except:
                 # Fallback to full GET and truncate
-                response = await client.get(url)
+                response = await client.get(url, timeout=self.timeout)
                 content = response.text[:self.sample_size]
             
             duration = int((datetime.utcnow() - start).total_seconds() * 1000)
@@ -310,9 +301,8 @@ class ContentSignatureDetector(BaseChangeDetector):
             )
     
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The pooled client is shared process-wide; nothing to release
+        pass
 
 
 class RSSFeedDetector(BaseChangeDetector):
@@ -325,15 +315,10 @@ class RSSFeedDetector(BaseChangeDetector):
     
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True
-            )
-        return self._client
+        # Shared pooled client; the detector timeout is applied per request
+        return get_http_client("detector")
     
     async def detect_change(
         self, 
@@ -345,7 +330,7 @@ class RSSFeedDetector(BaseChangeDetector):
         
         try:
             client = await self._get_client()
-            response = await client.get(url)
+            response = await client.get(url, timeout=self.timeout)
             content = response.text
             
             duration = int((datetime.utcnow() - start).total_seconds() * 1000)
@@ -452,9 +437,8 @@ class RSSFeedDetector(BaseChangeDetector):
             )
     
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The pooled client is shared process-wide; nothing to release
+        pass
 
 
 class ChangeDetector:
@@ -5,7 +5,7 @@ Central manager for intelligent caching of scraped content.
 Integrates change detection, content caching, and metrics.
 
 Features:
-1. Quick change detection (HEAD request, ETag, Last-Modified)
+1. Single conditional GET (If-None-Match / If-Modified-Since)
 2. Page signature matching (partial content hash)
 3. Full article caching with configurable TTL
 4. Automatic cache invalidation
@@ -14,10 +14,14 @@ Features:
 Usage:
     cache = SmartCacheManager()
     
-    # Check if source needs scraping
-    if await cache.needs_scraping(source_name, url):
-        articles = await scraper.fetch_articles()
-        await cache.cache_articles(source_name, articles)
+    # Check if source needs scraping, keeping the list page body
+    fetch = await cache.fetch_if_changed(source_name, url)
+    if fetch.needs_scraping:
+        articles = await scraper.fetch_articles(list_page=fetch.content)
+        await cache.cache_articles(
+            source_name, url, articles,
+            response_headers=fetch.headers, page_signature=fetch.signature
+        )
     else:
         articles = await cache.get_cached_articles(source_name)
 """
@@ -27,9 +31,11 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import httpx
 
+from app.utils.http_clients import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +52,17 @@ class CacheEntry:
     expires_at: str
     
 
+@dataclass
+class ListPageFetch:
+    """Result of a conditional list page request"""
+    needs_scraping: bool
+    reason: str
+    status_code: Optional[int] = None
+    content: Optional[bytes] = None  # 200 body, only set when a scrape is needed
+    headers: Dict[str, str] = field(default_factory=dict)  # ETag / Last-Modified
+    signature: Optional[str] = None  # Signature of the page sample
+
+
 @dataclass
 class CacheConfig:
     """Configuration for cache behavior per source type"""
@@ -103,7 +120,6 @@ class SmartCacheManager:
         """
         self.redis = redis_client
         self.config = config or CacheConfig()
-        self._http_client: Optional[httpx.AsyncClient] = None
         
     async def _get_redis(self):
         """Lazy load Redis client"""
@@ -116,13 +132,13 @@ class SmartCacheManager:
         return self.redis
     
     async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=self.config.head_request_timeout,
-                follow_redirects=True
-            )
-        return self._http_client
+        """
+        Get the shared pooled HTTP client.
+        
+        Uses the scraper profile, timeout included, so a 200 list page
+        body is exactly what the scraper itself would have received.
+        """
+        return get_http_client("scraper")
     
     def _make_key(self, source_name: str, key_type: str) -> str:
         """Generate Redis key"""
@@ -144,8 +160,8 @@ class SmartCacheManager:
         
         Uses multi-level detection:
         1. Check if cache expired (TTL)
-        2. HEAD request for ETag/Last-Modified
-        3. Content signature comparison
+        2. Conditional GET (304 Not Modified = unchanged)
+        3. Content signature comparison on a 200 response
         
         Args:
             source_name: Name of the source
@@ -161,8 +177,6 @@ class SmartCacheManager:
             await self._track_miss(source_name, "force")
             return True, "force_requested"
         
-        redis = await self._get_redis()
-        
         # Level 0: Check if TTL expired
         ttl_expired, reason = await self._check_ttl_expired(source_name, source_type)
         if ttl_expired:
@@ -170,24 +184,56 @@ class SmartCacheManager:
             await self._track_miss(source_name, reason)
             return True, reason
         
-        # Level 1: Quick HTTP header check (ETag, Last-Modified)
-        changed, reason = await self._check_http_headers(source_name, url)
-        if changed:
-            logger.info(f"[Cache] HTTP headers indicate change for {source_name}: {reason}")
-            await self._track_miss(source_name, reason)
-            return True, reason
+        # Level 1 + 2: One conditional GET
+        fetch = await self._conditional_fetch(source_name, url)
+        await self._track_fetch(source_name, fetch)
+        return fetch.needs_scraping, fetch.reason
+    
+    async def fetch_if_changed(
+        self,
+        source_name: str,
+        url: str,
+        source_type: str = "news",
+        force: bool = False,
+        keep_body: bool = True
+    ) -> ListPageFetch:
+        """
+        Check a source and keep the list page body when it changed.
         
-        # Level 2: Content signature check (lightweight GET)
-        changed, reason = await self._check_content_signature(source_name, url)
-        if changed:
-            logger.info(f"[Cache] Content signature changed for {source_name}: {reason}")
-            await self._track_miss(source_name, reason)
-            return True, reason
+        Same checks as needs_scraping(), but a changed page's 200 body is
+        returned so the scraper can extract links without fetching it again.
+        When the cache is expired or bypassed the page is fetched
+        unconditionally, unless keep_body is False.
         
-        # Cache is still valid
-        logger.info(f"[Cache] HIT for {source_name} - no scraping needed")
-        await self._track_hit(source_name)
-        return False, "cache_valid"
+        Args:
+            source_name: Name of the source
+            url: List page URL
+            source_type: Type of source (news, government, api, social)
+            force: Force scrape regardless of cache
+            keep_body: Set False for scrapers that can't take the body
+            
+        Returns:
+            ListPageFetch with the decision, reason and (if changed) body
+        """
+        if force:
+            reason = "force_requested"
+        else:
+            ttl_expired, reason = await self._check_ttl_expired(source_name, source_type)
+            if not ttl_expired:
+                fetch = await self._conditional_fetch(source_name, url)
+                await self._track_fetch(source_name, fetch)
+                if not keep_body:
+                    fetch.content = None
+                return fetch
+        
+        await self._track_miss(source_name, "force" if force else reason)
+        if not keep_body:
+            return ListPageFetch(True, reason)
+        
+        fetch = await self._conditional_fetch(source_name, url, conditional=False)
+        fetch.needs_scraping = True
+        fetch.reason = reason
+        return fetch
     
     # Alias for backwards compatibility
     async def should_scrape(
@@ -230,7 +276,8 @@ class SmartCacheManager:
         url: str,
         articles: List[Dict[str, Any]],
         source_type: str = "news",
-        response_headers: Optional[Dict[str, str]] = None
+        response_headers: Optional[Dict[str, str]] = None,
+        page_signature: Optional[str] = None
     ) -> bool:
         """
         Cache scraped articles with metadata.
@@ -241,12 +288,14 @@ class SmartCacheManager:
             articles: List of article dictionaries
             source_type: Type of source for TTL calculation
             response_headers: HTTP response headers (for ETag, Last-Modified)
+            page_signature: Signature of the list page (from fetch_if_changed)
             
         Returns:
             True if caching succeeded
         """
         redis = await self._get_redis()
         ttl = self.config.get_ttl_for_type(source_type)
+        signature = page_signature or self._calculate_signature(json.dumps(articles))
         
         try:
             # Store articles
@@ -259,7 +308,7 @@ class SmartCacheManager:
                 url=url,
                 etag=response_headers.get("ETag") if response_headers else None,
                 last_modified=response_headers.get("Last-Modified") if response_headers else None,
-                content_signature=self._calculate_signature(json.dumps(articles)),
+                content_signature=signature,
                 articles_count=len(articles),
                 cached_at=datetime.utcnow().isoformat(),
                 expires_at=(datetime.utcnow() + timedelta(seconds=ttl)).isoformat()
@@ -280,7 +329,6 @@ class SmartCacheManager:
             
             # Store content signature
             sig_key = self._make_key(source_name, self.KEY_SIGNATURE)
-            signature = self._calculate_signature(json.dumps(articles))
             await redis.setex(sig_key, ttl, signature)
             
             # Store scrape timestamp
@@ -406,112 +454,91 @@ class SmartCacheManager:
             logger.warning(f"[Cache] Error parsing scraped_at: {e}")
             return True, "parse_error"
     
-    async def _check_http_headers(
-        self, 
-        source_name: str, 
-        url: str
-    ) -> Tuple[bool, str]:
+    async def _conditional_fetch(
+        self,
+        source_name: str,
+        url: str,
+        conditional: bool = True
+    ) -> ListPageFetch:
         """
-        Check if content changed using HTTP headers (HEAD request).
+        GET the list page with the stored validators.
         
-        Uses ETag and Last-Modified headers for efficient change detection.
+        A 304 means unchanged. On a 200 the sampled page signature is
+        compared with the stored one; if it differs the body is kept so
+        the scraper doesn't download it again.
         """
         redis = await self._get_redis()
         
         try:
-            client = await self._get_http_client()
-            
-            # Get cached headers
-            etag_key = self._make_key(source_name, self.KEY_ETAG)
-            lm_key = self._make_key(source_name, self.KEY_LAST_MODIFIED)
-            
-            cached_etag = await redis.get(etag_key)
-            cached_last_modified = await redis.get(lm_key)
+            cached_etag = cached_last_modified = cached_signature = None
+            if conditional:
+                cached_etag, cached_last_modified, cached_signature = await redis.mget(
+                    self._make_key(source_name, self.KEY_ETAG),
+                    self._make_key(source_name, self.KEY_LAST_MODIFIED),
+                    self._make_key(source_name, self.KEY_SIGNATURE)
+                )
             
-            # Make HEAD request with conditional headers
             headers = {}
             if cached_etag:
                 headers["If-None-Match"] = cached_etag
             if cached_last_modified:
                 headers["If-Modified-Since"] = cached_last_modified
             
-            response = await client.head(url, headers=headers)
+            client = await self._get_http_client()
+            response = await client.get(url, headers=headers)
             
             # 304 Not Modified = no change
             if response.status_code == 304:
-                return False, "not_modified_304"
-            
-            # Compare current headers with cached
-            current_etag = response.headers.get("ETag")
-            current_lm = response.headers.get("Last-Modified")
-            
-            # Check ETag
-            if cached_etag and current_etag:
-                if cached_etag != current_etag:
-                    return True, "etag_changed"
-            
-            # Check Last-Modified
-            if cached_last_modified and current_lm:
-                if cached_last_modified != current_lm:
-                    return True, "last_modified_changed"
-            
-            # No cached headers to compare - need full check
-            if not cached_etag and not cached_last_modified:
-                return True, "no_cached_headers"
+                return ListPageFetch(False, "not_modified_304", status_code=304)
+            
+            if response.status_code >= 400:
+                # Let the scraper fetch and report the failure itself
+                return ListPageFetch(
+                    True, f"http_{response.status_code}", status_code=response.status_code
+                )
+            
+            validators = {
+                name: response.headers[name]
+                for name in ("ETag", "Last-Modified")
+                if name in response.headers
+            }
+            signature = self._calculate_signature(
+                response.text[:self.config.signature_sample_size]
+            )
             
-            return False, "headers_unchanged"
+            if cached_signature and cached_signature == signature:
+                return ListPageFetch(
+                    False, "signature_unchanged",
+                    status_code=response.status_code,
+                    headers=validators,
+                    signature=signature
+                )
+            
+            current_etag = validators.get("ETag")
+            current_lm = validators.get("Last-Modified")
+            if cached_etag and current_etag and cached_etag != current_etag:
+                reason = "etag_changed"
+            elif cached_last_modified and current_lm and cached_last_modified != current_lm:
+                reason = "last_modified_changed"
+            elif cached_signature:
+                reason = "signature_changed"
+            else:
+                reason = "no_cached_signature"
+            
+            return ListPageFetch(
+                True, reason,
+                status_code=response.status_code,
+                content=response.content,
+                headers=validators,
+                signature=signature
+            )
             
         except httpx.TimeoutException:
-            logger.warning(f"[Cache] HEAD request timeout for {url}")
-            return True, "head_timeout"
-        except Exception as e:
-            logger.warning(f"[Cache] HEAD request error: {e}")
-            return True, "head_error"
-    
-    async def _check_content_signature(
-        self, 
-        source_name: str, 
-        url: str
-    ) -> Tuple[bool, str]:
-        """
-        Quick content signature check using partial content.
-        
-        Downloads only first N characters and compares hash.
-        """
-        redis = await self._get_redis()
-        
-        try:
-            client = await self._get_http_client()
-            
-            # Get cached signature
-            sig_key = self._make_key(source_name, self.KEY_SIGNATURE)
-            cached_signature = await redis.get(sig_key)
-            
-            if not cached_signature:
-                return True, "no_cached_signature"
-            
-            # Request only first N bytes using Range header
-            headers = {"Range": f"bytes=0-{self.config.signature_sample_size}"}
-            
-            try:
-                response = await client.get(url, headers=headers)
-                partial_content = response.text[:self.config.signature_sample_size]
-            except:
-                # If Range not supported, get full content and slice
-                response = await client.get(url)
-                partial_content = response.text[:self.config.signature_sample_size]
-            
-            # Calculate signature
-            current_signature = self._calculate_signature(partial_content)
-            
-            if cached_signature != current_signature:
-                return True, "signature_changed"
-            
-            return False, "signature_unchanged"
-            
+            logger.warning(f"[Cache] Conditional GET timeout for {url}")
+            return ListPageFetch(True, "fetch_timeout")
         except Exception as e:
-            logger.warning(f"[Cache] Signature check error: {e}")
-            return True, "signature_error"
+            logger.warning(f"[Cache] Conditional GET error: {e}")
+            return ListPageFetch(True, "fetch_error")
     
     # ==========================================
     # Helper Methods
@@ -537,6 +564,15 @@ class SmartCacheManager:
         except:
             pass  # Don't fail on metrics
     
+    async def _track_fetch(self, source_name: str, fetch: ListPageFetch):
+        """Log and track the outcome of a conditional fetch"""
+        if fetch.needs_scraping:
+            logger.info(f"[Cache] Change detected for {source_name}: {fetch.reason}")
+            await self._track_miss(source_name, fetch.reason)
+        else:
+            logger.info(f"[Cache] HIT for {source_name} ({fetch.reason}) - no scraping needed")
+            await self._track_hit(source_name)
+    
     async def _track_miss(self, source_name: str, reason: str):
         """Track cache miss with reason"""
         try:
@@ -548,10 +584,8 @@ class SmartCacheManager:
             pass  # Don't fail on metrics
     
     async def close(self):
-        """Close HTTP client"""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Release resources (the pooled HTTP client is shared process-wide)"""
+        pass
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -569,6 +603,7 @@ class SmartCacheManager:
             "bandwidth_saved_kb": 0.0,
             "time_saved_seconds": 0.0,
             "sources": {},
+            "http_pool": self.metrics.get_http_pool_stats(),
             "status": "operational"
         }
     
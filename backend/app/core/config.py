@@ -109,6 +109,10 @@ class Settings(BaseSettings):
     LLM_MAX_TOKENS: int = 2000
     LLM_CACHE_TTL: int = 3600  # 1 hour cache for LLM responses
 
+    # Layer 4 advanced analytics result stores (forecasts, simulations, ...)
+    LAYER4_RESULT_MAX_ENTRIES: int = 1000  # Per store, per worker
+    LAYER4_RESULT_TTL: int = 3600  # 1 hour
+
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=False,
@@ -5,6 +5,7 @@ from app.core.config import settings
 
 class RedisClient:
     client: aioredis.Redis = None
+    binary_client: aioredis.Redis = None
 
     def connect(self):
         """Connect to Redis"""
@@ -14,18 +15,38 @@ class RedisClient:
             decode_responses=True
         )
 
+    def connect_binary(self):
+        """Connect a client that returns raw bytes (for packed arrays)"""
+        self.binary_client = aioredis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            decode_responses=False
+        )
+
     def close(self):
         """Close Redis connection"""
         if self.client:
             self.client.close()
+        if self.binary_client:
+            self.binary_client.close()
 
     def get_client(self):
         """Get Redis client"""
         return self.client
 
+    def get_binary_client(self):
+        """Get Redis client without response decoding"""
+        if self.binary_client is None:
+            self.connect_binary()
+        return self.binary_client
+
 # Singleton instance
 redis_client = RedisClient()
 
 def get_redis():
     """Dependency for getting Redis client"""
     return redis_client.get_client()
+
+def get_redis_binary():
+    """Get the Redis client that returns bytes instead of str"""
+    return redis_client.get_binary_client()
@@ -7,16 +7,46 @@ Supports both local and API-based embedding generation.
 Models:
 - all-MiniLM-L6-v2: Fast, English-focused (default)
 - paraphrase-multilingual-MiniLM-L12-v2: For Sinhala/Tamil support
+
+Concurrent single-text generate() calls are micro-batched: requests are
+collected for a few milliseconds (or until the batch is full) and encoded
+in one forward pass on a worker thread. Recent results are memoised so
+repeated lookups for the same article skip the model and Redis.
 """
 
+import asyncio
 import logging
 import hashlib
-from typing import List, Dict, Any, Optional, Union
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+try:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS as _STOP_WORDS
+except ImportError:
+    _STOP_WORDS = frozenset()
+
+
+@lru_cache(maxsize=262144)
+def _feature_slot(feature: str, dim: int) -> Tuple[int, float]:
+    """
+    Bucket and sign for a hashed feature.
+    
+    Uses blake2b rather than hash(), which is salted per process, so the
+    projection is identical in every worker and across restarts.
+    """
+    value = int.from_bytes(
+        hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+    return value % dim, (1.0 if value >> 63 else -1.0)
+
 
 @dataclass
 class EmbeddingConfig:
@@ -29,6 +59,11 @@ class EmbeddingConfig:
     use_gpu: bool = False
     normalize: bool = True  # L2 normalize for cosine similarity
     cache_embeddings: bool = True
+    cache_ttl: int = 86400
+    cache_dtype: str = "float32"  # "float16" halves cache memory again
+    micro_batch_wait_ms: float = 5.0  # How long generate() waits for company
+    micro_batch_max_size: int = 32    # Flush early once this many are queued
+    memo_size: int = 512              # Recent single-text results kept in process
 
 
 class EmbeddingGenerator:
@@ -52,6 +87,20 @@ class EmbeddingGenerator:
         self._model = None
         self._multilingual_model = None
         self._initialized = False
+        
+        # Micro-batching state for generate()
+        self._memo: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._pending: List[Tuple[str, str, str, asyncio.Future]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
+        self._batch_stats = {
+            "requests": 0,
+            "memo_hits": 0,
+            "shared_inflight": 0,
+            "batches": 0,
+            "batched_texts": 0
+        }
     
     async def initialize(self):
         """Initialize the embedding model (lazy loading)"""
@@ -73,7 +122,7 @@ class EmbeddingGenerator:
         except ImportError:
             logger.warning(
                 "sentence-transformers not installed. "
-                "Using fallback TF-IDF based embeddings. "
+                "Using fallback hashed-feature embeddings. "
                 "Install with: pip install sentence-transformers"
             )
             self._initialized = True  # Will use fallback
@@ -95,11 +144,11 @@ class EmbeddingGenerator:
             self._initialized = True
     
     async def _get_redis(self):
-        """Lazy load Redis client"""
+        """Lazy load Redis client (cached vectors are raw bytes)"""
         if self.redis is None:
             try:
-                from app.db.redis_client import get_redis
-                self.redis = get_redis()
+                from app.db.redis_client import get_redis_binary
+                self.redis = get_redis_binary()
             except:
                 pass
         return self.redis
@@ -109,76 +158,155 @@ class EmbeddingGenerator:
         normalized = " ".join(text.lower().split())[:500]  # First 500 chars
         return hashlib.md5(normalized.encode()).hexdigest()
     
-    async def _get_cached_embedding(self, text_hash: str) -> Optional[np.ndarray]:
-        """Get cached embedding if available"""
-        if not self.config.cache_embeddings:
+    def _cache_key(self, text_hash: str) -> str:
+        """Redis key for a cached embedding (dtype-specific)"""
+        tag = "f16" if self.config.cache_dtype == "float16" else "f32"
+        return f"embedding:{tag}:{text_hash}"
+    
+    def _encode_embedding(self, embedding: np.ndarray) -> bytes:
+        """Pack an embedding into raw bytes of the configured dtype"""
+        return np.asarray(embedding).astype(self.config.cache_dtype).tobytes()
+    
+    def _decode_embedding(self, raw: Optional[bytes]) -> Optional[np.ndarray]:
+        """Unpack cached bytes; returns None for missing or malformed values"""
+        if not raw:
             return None
+        dtype = np.dtype(self.config.cache_dtype)
+        if len(raw) != self.config.embedding_dim * dtype.itemsize:
+            return None
+        return np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    
+    async def _get_cached_embeddings(
+        self,
+        text_hashes: List[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Get cached embeddings for several texts with one MGET"""
+        misses: List[Optional[np.ndarray]] = [None] * len(text_hashes)
+        if not self.config.cache_embeddings or not text_hashes:
+            return misses
         
         redis = await self._get_redis()
         if redis is None:
-            return None
+            return misses
         
         try:
-            key = f"embedding:{text_hash}"
-            cached = await redis.get(key)
-            if cached:
-                import json
-                return np.array(json.loads(cached), dtype=np.float32)
+            values = await redis.mget([self._cache_key(h) for h in text_hashes])
+            return [self._decode_embedding(raw) for raw in values]
         except Exception as e:
-            logger.debug(f"Cache miss for embedding: {e}")
-        
-        return None
+            logger.debug(f"Cache miss for embeddings: {e}")
+            return misses
     
-    async def _cache_embedding(self, text_hash: str, embedding: np.ndarray, ttl: int = 86400):
-        """Cache embedding for future use"""
-        if not self.config.cache_embeddings:
+    async def _cache_embeddings(
+        self,
+        embeddings: Dict[str, np.ndarray],
+        ttl: Optional[int] = None
+    ):
+        """Cache several embeddings with one pipelined round trip"""
+        if not self.config.cache_embeddings or not embeddings:
             return
         
         redis = await self._get_redis()
         if redis is None:
             return
         
+        ttl = ttl or self.config.cache_ttl
         try:
-            import json
-            key = f"embedding:{text_hash}"
-            await redis.setex(key, ttl, json.dumps(embedding.tolist()))
+            pipe = redis.pipeline(transaction=False)
+            for text_hash, embedding in embeddings.items():
+                pipe.setex(self._cache_key(text_hash), ttl, self._encode_embedding(embedding))
+            await pipe.execute()
         except Exception as e:
-            logger.debug(f"Failed to cache embedding: {e}")
+            logger.debug(f"Failed to cache embeddings: {e}")
     
-    def _generate_fallback_embedding(self, text: str) -> np.ndarray:
+    async def _get_cached_embedding(self, text_hash: str) -> Optional[np.ndarray]:
+        """Get cached embedding if available"""
+        return (await self._get_cached_embeddings([text_hash]))[0]
+    
+    async def _cache_embedding(self, text_hash: str, embedding: np.ndarray, ttl: Optional[int] = None):
+        """Cache embedding for future use"""
+        await self._cache_embeddings({text_hash: embedding}, ttl)
+    
+    def _generate_fallback_embeddings(self, texts: List[str]) -> np.ndarray:
         """
-        Generate TF-IDF based embedding as fallback.
+        Generate hashed-feature embeddings as fallback.
+        
+        Word unigrams and bigrams are projected into embedding_dim buckets
+        with a signed hash (the "hashing trick"), counts are log-scaled and
+        rows L2 normalised. Stateless and deterministic, so vectors are
+        comparable between articles, batches and processes. Less accurate
+        than the model but doesn't require sentence-transformers.
         
-        This is less accurate but doesn't require sentence-transformers.
+        Returns:
+            Array of shape (len(texts), embedding_dim)
         """
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.decomposition import TruncatedSVD
+        dim = self.config.embedding_dim
+        matrix = np.zeros((len(texts), dim), dtype=np.float32)
         
-        # Simple TF-IDF + SVD to get fixed-size embedding
-        vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        # Map each distinct feature in the batch to an id, then hash each
+        # distinct feature once and scatter all counts with numpy
+        vocabulary: Dict[str, int] = {}
+        doc_ids: List[int] = []
+        feature_ids: List[int] = []
+        for row, text in enumerate(texts):
+            tokens = [
+                t for t in _TOKEN_PATTERN.findall((text or "").lower())
+                if t not in _STOP_WORDS
+            ]
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            feature_ids.extend(vocabulary.setdefault(f, len(vocabulary)) for f in features)
+            doc_ids.extend([row] * len(features))
         
-        try:
-            tfidf = vectorizer.fit_transform([text])
-            
-            # Reduce to target dimension
-            if tfidf.shape[1] > self.config.embedding_dim:
-                svd = TruncatedSVD(n_components=self.config.embedding_dim)
-                embedding = svd.fit_transform(tfidf)[0]
-            else:
-                embedding = np.zeros(self.config.embedding_dim)
-                embedding[:tfidf.shape[1]] = tfidf.toarray()[0]
-            
-            # Normalize
-            if self.config.normalize:
-                norm = np.linalg.norm(embedding)
-                if norm > 0:
-                    embedding = embedding / norm
-            
-            return embedding.astype(np.float32)
-            
-        except Exception as e:
-            logger.error(f"Fallback embedding failed: {e}")
-            return np.zeros(self.config.embedding_dim, dtype=np.float32)
+        if not vocabulary:
+            return matrix
+        
+        slots = np.array([_feature_slot(f, dim) for f in vocabulary], dtype=np.float64)
+        columns = slots[:, 0].astype(np.intp)
+        signs = slots[:, 1].astype(np.float32)
+        
+        ids = np.asarray(feature_ids, dtype=np.intp)
+        np.add.at(matrix, (np.asarray(doc_ids, dtype=np.intp), columns[ids]), signs[ids])
+        
+        # Sublinear term frequency keeps repeated words from dominating
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        
+        if self.config.normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        
+        return matrix.astype(np.float32, copy=False)
+    
+    def _generate_fallback_embedding(self, text: str) -> np.ndarray:
+        """Hashed-feature fallback embedding for a single text"""
+        return self._generate_fallback_embeddings([text])[0]
+    
+    def _model_for(self, language: str):
+        """Model to use for a language (multilingual for Sinhala/Tamil when loaded)"""
+        if language in ["si", "ta"] and self._multilingual_model is not None:
+            return self._multilingual_model
+        return self._model
+    
+    async def _encode(self, model, texts: List[str]) -> np.ndarray:
+        """Encode texts in one forward pass on a worker thread"""
+        embeddings = await asyncio.to_thread(
+            model.encode,
+            texts,
+            normalize_embeddings=self.config.normalize,
+            batch_size=self.config.batch_size,
+            show_progress_bar=False
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+    
+    def _memo_get(self, text_hash: str) -> Optional[np.ndarray]:
+        embedding = self._memo.get(text_hash)
+        if embedding is not None:
+            self._memo.move_to_end(text_hash)
+        return embedding
+    
+    def _memo_put(self, text_hash: str, embedding: np.ndarray):
+        self._memo[text_hash] = embedding
+        self._memo.move_to_end(text_hash)
+        while len(self._memo) > self.config.memo_size:
+            self._memo.popitem(last=False)
     
     async def generate(
         self, 
@@ -189,6 +317,10 @@ class EmbeddingGenerator:
         """
         Generate embedding for a single text.
         
+        Concurrent calls are collected into one generate_batch() call, and
+        a call for a text already queued or recently embedded reuses that
+        result (e.g. duplicate check followed by registration).
+        
         Args:
             text: Text to embed
             language: Language code (en, si, ta)
@@ -202,42 +334,73 @@ class EmbeddingGenerator:
         if not text or len(text.strip()) < 10:
             return np.zeros(self.config.embedding_dim, dtype=np.float32)
         
-        # Check cache
-        if use_cache:
-            text_hash = self._text_hash(text)
-            cached = await self._get_cached_embedding(text_hash)
-            if cached is not None:
-                return cached
+        if not use_cache:
+            return (await self.generate_batch([text], [language], use_cache=False))[0]
         
-        # Truncate to max length
-        text = text[:self.config.max_seq_length * 4]  # Approximate char limit
+        self._batch_stats["requests"] += 1
+        text_hash = self._text_hash(text)
         
-        # Generate embedding
-        if self._model is not None:
-            try:
-                # Use multilingual model for non-English
-                model = self._model
-                if language in ["si", "ta"] and self._multilingual_model is not None:
-                    model = self._multilingual_model
-                
-                embedding = model.encode(
-                    text,
-                    normalize_embeddings=self.config.normalize,
-                    show_progress_bar=False
-                )
-                embedding = np.array(embedding, dtype=np.float32)
-                
-            except Exception as e:
-                logger.error(f"Error generating embedding: {e}")
-                embedding = self._generate_fallback_embedding(text)
-        else:
-            embedding = self._generate_fallback_embedding(text)
+        memoised = self._memo_get(text_hash)
+        if memoised is not None:
+            self._batch_stats["memo_hits"] += 1
+            return memoised
         
-        # Cache result
-        if use_cache:
-            await self._cache_embedding(text_hash, embedding)
+        future = self._inflight.get(text_hash)
+        if future is not None:
+            self._batch_stats["shared_inflight"] += 1
+            return await asyncio.shield(future)
         
-        return embedding
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[text_hash] = future
+        self._pending.append((text, language, text_hash, future))
+        
+        if len(self._pending) >= self.config.micro_batch_max_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.config.micro_batch_wait_ms / 1000, self._flush_pending
+            )
+        
+        # Shielded so one cancelled caller does not fail the shared batch
+        return await asyncio.shield(future)
+    
+    def _flush_pending(self):
+        """Start encoding everything queued by generate()"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, str, str, asyncio.Future]]):
+        """Encode one micro-batch and fan the results back out"""
+        self._batch_stats["batches"] += 1
+        self._batch_stats["batched_texts"] += len(batch)
+        try:
+            embeddings = await self.generate_batch(
+                [text for text, _, _, _ in batch],
+                [language for _, language, _, _ in batch]
+            )
+            for (_, _, text_hash, future), embedding in zip(batch, embeddings):
+                self._memo_put(text_hash, embedding)
+                if not future.done():
+                    future.set_result(embedding)
+        except Exception as e:
+            logger.error(f"Error in micro-batched embedding: {e}")
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+                    future.exception()  # Retrieved, so asyncio does not log it again
+        finally:
+            for _, _, text_hash, _ in batch:
+                self._inflight.pop(text_hash, None)
     
     async def generate_batch(
         self,
@@ -269,52 +432,58 @@ class EmbeddingGenerator:
         texts_to_embed = []
         indices_to_embed = []
         
+        text_hashes: Dict[int, str] = {}
+        
         if use_cache:
             for i, text in enumerate(texts):
                 if text and len(text.strip()) >= 10:
-                    text_hash = self._text_hash(text)
-                    cached = await self._get_cached_embedding(text_hash)
-                    if cached is not None:
-                        results[i] = cached
-                    else:
-                        texts_to_embed.append(text[:self.config.max_seq_length * 4])
-                        indices_to_embed.append(i)
+                    text_hashes[i] = self._text_hash(text)
                 else:
                     results[i] = np.zeros(self.config.embedding_dim, dtype=np.float32)
+            
+            # One round trip for every lookup
+            cached = await self._get_cached_embeddings(list(text_hashes.values()))
+            for (i, text_hash), embedding in zip(text_hashes.items(), cached):
+                if embedding is not None:
+                    results[i] = embedding
+                else:
+                    texts_to_embed.append(texts[i][:self.config.max_seq_length * 4])
+                    indices_to_embed.append(i)
         else:
             texts_to_embed = [t[:self.config.max_seq_length * 4] if t else "" for t in texts]
             indices_to_embed = list(range(len(texts)))
         
-        # Generate embeddings for uncached texts
+        # Generate embeddings for uncached texts, one pass per model
         if texts_to_embed and self._model is not None:
             try:
-                embeddings = self._model.encode(
-                    texts_to_embed,
-                    normalize_embeddings=self.config.normalize,
-                    batch_size=self.config.batch_size,
-                    show_progress_bar=False
-                )
-                
+                by_model: Dict[int, Tuple[Any, List[int]]] = {}
                 for i, idx in enumerate(indices_to_embed):
-                    emb = np.array(embeddings[i], dtype=np.float32)
-                    results[idx] = emb
-                    
-                    # Cache
-                    if use_cache:
-                        text_hash = self._text_hash(texts[idx])
-                        await self._cache_embedding(text_hash, emb)
-                        
+                    model = self._model_for(languages[idx])
+                    by_model.setdefault(id(model), (model, []))[1].append(i)
+                
+                to_cache = {}
+                for model, positions in by_model.values():
+                    embeddings = await self._encode(model, [texts_to_embed[i] for i in positions])
+                    for row, i in enumerate(positions):
+                        idx = indices_to_embed[i]
+                        emb = embeddings[row]
+                        results[idx] = emb
+                        if use_cache:
+                            to_cache[text_hashes[idx]] = emb
+                
+                # One pipelined round trip for every write
+                await self._cache_embeddings(to_cache)
+                
             except Exception as e:
                 logger.error(f"Error in batch embedding: {e}")
-                for idx in indices_to_embed:
-                    results[idx] = self._generate_fallback_embedding(texts[idx])
-        else:
-            # Use fallback for all
-            for idx in indices_to_embed:
-                if texts[idx]:
-                    results[idx] = self._generate_fallback_embedding(texts[idx])
-                else:
-                    results[idx] = np.zeros(self.config.embedding_dim, dtype=np.float32)
+                fallback = self._generate_fallback_embeddings(texts_to_embed)
+                for i, idx in enumerate(indices_to_embed):
+                    results[idx] = fallback[i]
+        elif texts_to_embed:
+            # Use fallback for all, in one vectorised pass
+            fallback = self._generate_fallback_embeddings(texts_to_embed)
+            for i, idx in enumerate(indices_to_embed):
+                results[idx] = fallback[i]
         
         return results
     
@@ -361,5 +530,12 @@ class EmbeddingGenerator:
             "max_seq_length": self.config.max_seq_length,
             "is_initialized": self._initialized,
             "has_sentence_transformers": self._model is not None,
-            "using_fallback": self._model is None
+            "using_fallback": self._model is None,
+            "micro_batching": {
+                **self._batch_stats,
+                "avg_batch_size": round(
+                    self._batch_stats["batched_texts"] / self._batch_stats["batches"], 2
+                ) if self._batch_stats["batches"] else 0.0,
+                "memo_entries": len(self._memo)
+            }
         }
@@ -659,7 +659,5 @@ class SemanticDeduplicator:
     
     async def clear_index(self):
         """Clear the similarity index (for testing)"""
-        self.similarity_engine._article_ids.clear()
-        self.similarity_engine._article_metadata.clear()
-        self.similarity_engine._initialized = False
+        self.similarity_engine.clear()
         await self.similarity_engine.initialize()
@@ -9,11 +9,22 @@ Features:
 - Configurable similarity thresholds
 - Rolling window management (48-hour default)
 - Batch search support
+
+Vectors are stored under stable int64 ids (``IndexIDMap2``) so expired
+articles can be removed with ``remove_ids`` without rebuilding the index
+or shifting the positions of the remaining articles.
+
+Persistence uses a binary snapshot in Redis: one raw float32 matrix plus a
+JSON metadata table without embeddings. Articles added since the last save
+are appended as small segments, which are folded into a new snapshot once
+``snapshot_max_segments`` have accumulated.
 """
 
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Deque
 from dataclasses import dataclass, field
 import numpy as np
 import json
@@ -42,6 +53,10 @@ class SimilarityConfig:
     # Search settings
     top_k: int = 10  # Number of candidates to retrieve
     batch_size: int = 100
+    
+    # Persistence
+    persist_every: int = 100  # Save a segment every N additions
+    snapshot_max_segments: int = 50  # Compact into a full snapshot after N
 
 
 @dataclass
@@ -64,6 +79,94 @@ class ArticleVector:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class NumpyFlatIndex:
+    """
+    Exact inner-product index used when FAISS is not installed.
+    
+    Mirrors the subset of the FAISS ``IndexIDMap2`` API the engine uses
+    (``add_with_ids``, ``remove_ids``, ``search``, ``ntotal``). Vectors live
+    in one contiguous float32 matrix that doubles in capacity as it fills;
+    removal moves the last row into the freed slot.
+    """
+    
+    def __init__(self, dim: int, capacity: int = 1024):
+        self.dim = dim
+        self._vectors = np.empty((capacity, dim), dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._rows: Dict[int, int] = {}  # index id -> row
+        self.ntotal = 0
+    
+    def _reserve(self, size: int):
+        """Grow storage by doubling until it holds ``size`` rows"""
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:self.ntotal] = self._vectors[:self.ntotal]
+        ids = np.empty(capacity, dtype=np.int64)
+        ids[:self.ntotal] = self._ids[:self.ntotal]
+        self._vectors, self._ids = vectors, ids
+    
+    def add_with_ids(self, vectors: np.ndarray, ids: np.ndarray):
+        """Append vectors under the given int64 ids"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        start = self.ntotal
+        end = start + len(vectors)
+        self._reserve(end)
+        self._vectors[start:end] = vectors
+        self._ids[start:end] = ids
+        for row, index_id in enumerate(ids, start):
+            self._rows[int(index_id)] = row
+        self.ntotal = end
+    
+    def remove_ids(self, ids: np.ndarray) -> int:
+        """Remove vectors by id; returns the number removed"""
+        removed = 0
+        for index_id in ids:
+            row = self._rows.pop(int(index_id), None)
+            if row is None:
+                continue
+            last = self.ntotal - 1
+            if row != last:
+                moved = int(self._ids[last])
+                self._vectors[row] = self._vectors[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+            self.ntotal = last
+            removed += 1
+        return removed
+    
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k inner-product search.
+        
+        Returns:
+            (scores, ids), each of shape (n_queries, k), best first. Missing
+            results are padded with id -1 like FAISS.
+        """
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        n_queries, n = len(queries), self.ntotal
+        scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+        ids = np.full((n_queries, k), -1, dtype=np.int64)
+        found = min(k, n)
+        if found == 0:
+            return scores, ids
+        
+        sims = queries @ self._vectors[:n].T
+        if found < n:
+            top = np.argpartition(sims, n - found, axis=1)[:, n - found:]
+        else:
+            top = np.broadcast_to(np.arange(n), (n_queries, n))
+        top_scores = np.take_along_axis(sims, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        
+        scores[:, :found] = np.take_along_axis(top_scores, order, axis=1)
+        ids[:, :found] = self._ids[np.take_along_axis(top, order, axis=1)]
+        return scores, ids
+
+
 class SimilarityEngine:
     """
     FAISS-based similarity search engine.
@@ -83,10 +186,19 @@ class SimilarityEngine:
         self.config = config or SimilarityConfig()
         self.redis = redis_client
         
-        # FAISS index
+        # FAISS index (IndexIDMap2: rows are addressed by int64 id, not position)
         self._index = None
-        self._article_ids: List[str] = []
+        self._article_ids: Dict[str, int] = {}  # article_id -> index id
+        self._id_to_article: Dict[int, str] = {}
         self._article_metadata: Dict[str, ArticleVector] = {}
+        self._next_id = 0
+        
+        # Insertion-ordered (scraped_at, index id) pairs for eviction
+        self._insertion_order: Deque[Tuple[datetime, int]] = deque()
+        
+        # Persistence: articles added since the last save, segments in Redis
+        self._unsaved: List[str] = []
+        self._segment_count = 0
         
         # Tracking
         self._initialized = False
@@ -101,19 +213,7 @@ class SimilarityEngine:
             import faiss
             self._faiss_available = True
             
-            # Create appropriate index
-            if self.config.index_type == "ivf":
-                # IVF index for large-scale approximate search
-                quantizer = faiss.IndexFlatIP(self.config.embedding_dim)
-                self._index = faiss.IndexIVFFlat(
-                    quantizer, 
-                    self.config.embedding_dim, 
-                    self.config.nlist,
-                    faiss.METRIC_INNER_PRODUCT
-                )
-            else:
-                # Flat index for exact search (good for < 100k vectors)
-                self._index = faiss.IndexFlatIP(self.config.embedding_dim)
+            self._index = self._create_index(faiss, self.config.nlist)
             
             logger.info(f"FAISS index initialized (type={self.config.index_type}, dim={self.config.embedding_dim})")
             
@@ -123,9 +223,11 @@ class SimilarityEngine:
                 "Install with: pip install faiss-cpu"
             )
             self._faiss_available = False
+            self._index = NumpyFlatIndex(self.config.embedding_dim)
         except Exception as e:
             logger.error(f"Error initializing FAISS: {e}")
             self._faiss_available = False
+            self._index = NumpyFlatIndex(self.config.embedding_dim)
         
         # Load existing index from Redis if available
         await self._load_from_redis()
@@ -138,21 +240,138 @@ class SimilarityEngine:
             try:
                 import faiss
                 self._faiss_available = True
-                self._index = faiss.IndexFlatIP(self.config.embedding_dim)
+                self._index = self._create_index(faiss, self.config.nlist)
             except ImportError:
                 self._faiss_available = False
+                self._index = NumpyFlatIndex(self.config.embedding_dim)
             self._initialized = True
     
+    def _create_index(self, faiss, nlist: int):
+        """Create an empty ID-mapped index of the configured type"""
+        if self.config.index_type == "ivf":
+            # IVF index for large-scale approximate search
+            quantizer = faiss.IndexFlatIP(self.config.embedding_dim)
+            base = faiss.IndexIVFFlat(
+                quantizer,
+                self.config.embedding_dim,
+                nlist,
+                faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            # Flat index for exact search (good for < 100k vectors)
+            base = faiss.IndexFlatIP(self.config.embedding_dim)
+        
+        return faiss.IndexIDMap2(base)
+    
+    def clear(self):
+        """Drop all indexed articles and mark the engine uninitialized"""
+        self._index = None
+        self._article_ids.clear()
+        self._id_to_article.clear()
+        self._article_metadata.clear()
+        self._insertion_order.clear()
+        self._unsaved.clear()
+        self._segment_count = 0
+        self._next_id = 0
+        self._initialized = False
+    
+    def _register(self, av: ArticleVector) -> int:
+        """Assign an index id to an article and record it for eviction"""
+        index_id = self._next_id
+        self._next_id += 1
+        self._article_ids[av.article_id] = index_id
+        self._id_to_article[index_id] = av.article_id
+        self._article_metadata[av.article_id] = av
+        self._insertion_order.append((av.scraped_at, index_id))
+        self._unsaved.append(av.article_id)
+        return index_id
+    
     async def _get_redis(self):
-        """Lazy load Redis client"""
+        """Lazy load Redis client (snapshots are binary, so no decoding)"""
         if self.redis is None:
             try:
-                from app.db.redis_client import get_redis
-                self.redis = get_redis()
+                from app.db.redis_client import get_redis_binary
+                self.redis = get_redis_binary()
             except:
                 pass
         return self.redis
     
+    # Redis keys for the binary snapshot and its append segments
+    SNAPSHOT_VECTORS_KEY = "dedup:index:snapshot:vectors"
+    SNAPSHOT_META_KEY = "dedup:index:snapshot:meta"
+    SEGMENT_VECTORS_KEY = "dedup:index:segments:vectors"
+    SEGMENT_META_KEY = "dedup:index:segments:meta"
+    # Pre-snapshot JSON format, read once for migration
+    LEGACY_IDS_KEY = "dedup:index:article_ids"
+    LEGACY_METADATA_KEY = "dedup:index:metadata"
+    
+    def _pack_rows(self, rows: List[ArticleVector]) -> Tuple[bytes, str]:
+        """Serialize articles to (float32 matrix bytes, metadata JSON)"""
+        if rows:
+            matrix = np.vstack([av.embedding for av in rows]).astype(np.float32, copy=False)
+        else:
+            matrix = np.empty((0, self.config.embedding_dim), dtype=np.float32)
+        meta = [
+            [av.article_id, av.title, av.source_name,
+             av.scraped_at.isoformat(), av.metadata]
+            for av in rows
+        ]
+        return matrix.tobytes(), json.dumps(meta)
+    
+    def _unpack_rows(self, vectors: bytes, meta: Any) -> List[ArticleVector]:
+        """Inverse of ``_pack_rows``; embeddings are views over ``vectors``"""
+        rows = json.loads(meta)
+        matrix = np.frombuffer(vectors, dtype=np.float32)
+        dim = self.config.embedding_dim
+        if matrix.size != len(rows) * dim:
+            raise ValueError(
+                f"Snapshot has {matrix.size} floats for {len(rows)} rows of dim {dim}"
+            )
+        matrix = matrix.reshape(len(rows), dim)
+        return [
+            ArticleVector(
+                article_id=article_id,
+                embedding=matrix[i],
+                title=title,
+                source_name=source_name,
+                scraped_at=datetime.fromisoformat(scraped_at),
+                metadata=metadata or {}
+            )
+            for i, (article_id, title, source_name, scraped_at, metadata)
+            in enumerate(rows)
+        ]
+    
+    def _unpack_legacy(self, ids_data: Any, metadata_data: Any) -> List[ArticleVector]:
+        """Parse the old JSON format (embeddings as float lists)"""
+        article_ids = json.loads(ids_data) if ids_data else []
+        metadata_dict = json.loads(metadata_data) if metadata_data else {}
+        rows = []
+        for article_id in article_ids:
+            meta = metadata_dict.get(article_id)
+            if meta is None:
+                continue
+            rows.append(ArticleVector(
+                article_id=meta["article_id"],
+                embedding=np.array(meta["embedding"], dtype=np.float32),
+                title=meta["title"],
+                source_name=meta["source_name"],
+                scraped_at=datetime.fromisoformat(meta["scraped_at"]),
+                metadata=meta.get("metadata", {})
+            ))
+        return rows
+    
+    def _decode_snapshot(
+        self,
+        snapshot: Tuple[Any, Any],
+        segments: List[Tuple[Any, Any]]
+    ) -> List[ArticleVector]:
+        """Decode the snapshot followed by its segments, in insertion order"""
+        rows: List[ArticleVector] = []
+        for vectors, meta in [snapshot, *segments]:
+            if meta:
+                rows.extend(self._unpack_rows(vectors or b"", meta))
+        return rows
+    
     async def _load_from_redis(self):
         """Load index state from Redis"""
         redis = await self._get_redis()
@@ -160,35 +379,54 @@ class SimilarityEngine:
             return
         
         try:
-            # Load article IDs
-            ids_data = await redis.get("dedup:index:article_ids")
-            if ids_data:
-                self._article_ids = json.loads(ids_data)
+            pipe = redis.pipeline(transaction=False)
+            pipe.get(self.SNAPSHOT_VECTORS_KEY)
+            pipe.get(self.SNAPSHOT_META_KEY)
+            pipe.lrange(self.SEGMENT_VECTORS_KEY, 0, -1)
+            pipe.lrange(self.SEGMENT_META_KEY, 0, -1)
+            snap_vectors, snap_meta, seg_vectors, seg_meta = await pipe.execute()
             
-            # Load metadata
-            metadata_data = await redis.get("dedup:index:metadata")
-            if metadata_data:
-                metadata_dict = json.loads(metadata_data)
-                for article_id, meta in metadata_dict.items():
-                    self._article_metadata[article_id] = ArticleVector(
-                        article_id=meta["article_id"],
-                        embedding=np.array(meta["embedding"], dtype=np.float32),
-                        title=meta["title"],
-                        source_name=meta["source_name"],
-                        scraped_at=datetime.fromisoformat(meta["scraped_at"]),
-                        metadata=meta.get("metadata", {})
-                    )
+            legacy = False
+            if snap_meta is None and not seg_meta:
+                ids_data = await redis.get(self.LEGACY_IDS_KEY)
+                metadata_data = await redis.get(self.LEGACY_METADATA_KEY)
+                if not ids_data:
+                    return
+                legacy = True
+                rows = await asyncio.to_thread(
+                    self._unpack_legacy, ids_data, metadata_data
+                )
+            else:
+                rows = await asyncio.to_thread(
+                    self._decode_snapshot,
+                    (snap_vectors, snap_meta),
+                    list(zip(seg_vectors, seg_meta))
+                )
+            
+            # Re-register in saved order so eviction order is preserved
+            loaded_ids = []
+            for av in rows:
+                if av.article_id in self._article_ids:
+                    continue
+                loaded_ids.append(self._register(av))
             
             # Rebuild FAISS index from embeddings
-            if self._faiss_available and self._article_metadata:
-                embeddings = [
-                    self._article_metadata[aid].embedding 
-                    for aid in self._article_ids
-                    if aid in self._article_metadata
-                ]
-                if embeddings:
-                    vectors = np.vstack(embeddings).astype(np.float32)
-                    self._index.add(vectors)
+            if self._index is not None and loaded_ids:
+                vectors = np.vstack([
+                    self._article_metadata[self._id_to_article[i]].embedding
+                    for i in loaded_ids
+                ])
+                self._index.add_with_ids(vectors, np.array(loaded_ids, dtype=np.int64))
+            
+            # Everything loaded is already persisted, unless it must be
+            # rewritten in the snapshot format
+            self._unsaved.clear()
+            self._segment_count = len(seg_meta)
+            if legacy:
+                self._segment_count = self.config.snapshot_max_segments
+            
+            # Segments may still hold articles evicted since they were written
+            await self._cleanup_old_articles()
             
             logger.info(f"Loaded {len(self._article_ids)} articles from Redis")
             
@@ -196,34 +434,50 @@ class SimilarityEngine:
             logger.warning(f"Could not load index from Redis: {e}")
     
     async def _save_to_redis(self):
-        """Persist index state to Redis"""
+        """
+        Persist index state to Redis.
+        
+        Appends the articles added since the last save as one segment, or
+        writes a fresh snapshot of all live articles once enough segments
+        have piled up. Serialization runs in a worker thread.
+        """
         redis = await self._get_redis()
         if redis is None:
+            self._unsaved.clear()
             return
         
+        compact = self._segment_count >= self.config.snapshot_max_segments
+        if compact:
+            article_ids = list(self._article_ids)
+        else:
+            article_ids = [
+                aid for aid in self._unsaved if aid in self._article_metadata
+            ]
+            if not article_ids:
+                self._unsaved.clear()
+                return
+        saved = len(self._unsaved)
+        rows = [self._article_metadata[aid] for aid in article_ids]
+        
         try:
-            # Save article IDs
-            await redis.set(
-                "dedup:index:article_ids",
-                json.dumps(self._article_ids)
-            )
+            vectors, meta = await asyncio.to_thread(self._pack_rows, rows)
             
-            # Save metadata (convert to serializable)
-            metadata_dict = {}
-            for article_id, av in self._article_metadata.items():
-                metadata_dict[article_id] = {
-                    "article_id": av.article_id,
-                    "embedding": av.embedding.tolist(),
-                    "title": av.title,
-                    "source_name": av.source_name,
-                    "scraped_at": av.scraped_at.isoformat(),
-                    "metadata": av.metadata
-                }
+            pipe = redis.pipeline(transaction=True)
+            if compact:
+                pipe.set(self.SNAPSHOT_VECTORS_KEY, vectors)
+                pipe.set(self.SNAPSHOT_META_KEY, meta)
+                pipe.delete(
+                    self.SEGMENT_VECTORS_KEY, self.SEGMENT_META_KEY,
+                    self.LEGACY_IDS_KEY, self.LEGACY_METADATA_KEY
+                )
+            else:
+                pipe.rpush(self.SEGMENT_VECTORS_KEY, vectors)
+                pipe.rpush(self.SEGMENT_META_KEY, meta)
+            await pipe.execute()
             
-            await redis.set(
-                "dedup:index:metadata",
-                json.dumps(metadata_dict)
-            )
+            # Articles added while the write was in flight stay unsaved
+            del self._unsaved[:saved]
+            self._segment_count = 0 if compact else self._segment_count + 1
             
         except Exception as e:
             logger.warning(f"Could not save index to Redis: {e}")
@@ -270,94 +524,56 @@ class SimilarityEngine:
             metadata=metadata or {}
         )
         
-        self._article_ids.append(article_id)
-        self._article_metadata[article_id] = av
+        index_id = self._register(av)
         
-        # Add to FAISS index
-        if self._faiss_available and self._index is not None:
-            self._index.add(embedding.reshape(1, -1).astype(np.float32))
+        # Add to FAISS (or numpy) index
+        if self._index is not None:
+            self._index.add_with_ids(
+                av.embedding.reshape(1, -1),
+                np.array([index_id], dtype=np.int64)
+            )
         
         # Cleanup old articles
         await self._cleanup_old_articles()
         
-        # Persist periodically
-        if len(self._article_ids) % 100 == 0:
+        # Persist every N additions (the size stays flat once at capacity)
+        if len(self._unsaved) >= self.config.persist_every:
             await self._save_to_redis()
         
         return True
     
     async def _cleanup_old_articles(self):
-        """Remove articles outside the rolling window"""
-        if len(self._article_ids) <= self.config.max_articles:
-            cutoff = datetime.utcnow() - timedelta(hours=self.config.window_hours)
-            
-            # Find articles to remove
-            to_remove = []
-            for article_id in self._article_ids:
-                if article_id in self._article_metadata:
-                    if self._article_metadata[article_id].scraped_at < cutoff:
-                        to_remove.append(article_id)
-            
-            if not to_remove:
-                return
-        else:
-            # Remove oldest articles if over max
-            excess = len(self._article_ids) - self.config.max_articles
-            to_remove = self._article_ids[:excess]
+        """
+        Remove articles outside the rolling window.
         
-        # Remove articles
-        for article_id in to_remove:
-            if article_id in self._article_metadata:
-                del self._article_metadata[article_id]
-            if article_id in self._article_ids:
-                self._article_ids.remove(article_id)
+        Articles are evicted from the front of the insertion queue while
+        they are expired or the index holds more than ``max_articles``,
+        so the cost is proportional to the number removed. Removal is by
+        index id, which leaves every other article's id untouched.
+        """
+        cutoff = datetime.utcnow() - timedelta(hours=self.config.window_hours)
+        order = self._insertion_order
+        
+        to_remove: List[int] = []
+        while order:
+            scraped_at, index_id = order[0]
+            if (len(order) <= self.config.max_articles
+                    and scraped_at >= cutoff):
+                break
+            order.popleft()
+            article_id = self._id_to_article.pop(index_id)
+            del self._article_ids[article_id]
+            del self._article_metadata[article_id]
+            to_remove.append(index_id)
+        
+        if not to_remove:
+            return
         
-        # Rebuild index if significant cleanup
-        if len(to_remove) > 100 and self._faiss_available:
-            await self._rebuild_index()
+        if self._index is not None:
+            self._index.remove_ids(np.array(to_remove, dtype=np.int64))
         
         logger.debug(f"Cleaned up {len(to_remove)} old articles")
     
-    async def _rebuild_index(self):
-        """Rebuild FAISS index from current articles"""
-        if not self._faiss_available:
-            return
-        
-        try:
-            import faiss
-            
-            # Create new index
-            if self.config.index_type == "ivf":
-                quantizer = faiss.IndexFlatIP(self.config.embedding_dim)
-                self._index = faiss.IndexIVFFlat(
-                    quantizer,
-                    self.config.embedding_dim,
-                    min(self.config.nlist, len(self._article_ids)),
-                    faiss.METRIC_INNER_PRODUCT
-                )
-            else:
-                self._index = faiss.IndexFlatIP(self.config.embedding_dim)
-            
-            # Add all embeddings
-            if self._article_ids:
-                embeddings = [
-                    self._article_metadata[aid].embedding
-                    for aid in self._article_ids
-                    if aid in self._article_metadata
-                ]
-                if embeddings:
-                    vectors = np.vstack(embeddings).astype(np.float32)
-                    
-                    if self.config.index_type == "ivf":
-                        self._index.train(vectors)
-                    
-                    self._index.add(vectors)
-            
-            logger.info(f"Rebuilt FAISS index with {len(self._article_ids)} articles")
-            
-        except Exception as e:
-            logger.error(f"Error rebuilding index: {e}")
-    
     async def search(
         self,
         embedding: np.ndarray,
@@ -376,50 +592,80 @@ class SimilarityEngine:
             List of similarity matches
         """
         await self.initialize()
+        return self._search_batch(embedding.reshape(1, -1), top_k, exclude_ids)[0]
+    
+    async def search_many(
+        self,
+        queries: np.ndarray,
+        top_k: Optional[int] = None,
+        exclude_ids: Optional[List[str]] = None
+    ) -> List[List[SimilarityMatch]]:
+        """
+        Search for several query embeddings with one index call.
         
+        Args:
+            queries: Query matrix (n_queries x embedding_dim)
+            top_k: Number of results per query
+            exclude_ids: Article IDs to exclude from every result list
+            
+        Returns:
+            One list of similarity matches per query, in query order
+        """
+        await self.initialize()
+        return self._search_batch(queries, top_k, exclude_ids)
+    
+    def _search_batch(
+        self,
+        queries: np.ndarray,
+        top_k: Optional[int],
+        exclude_ids: Optional[List[str]]
+    ) -> List[List[SimilarityMatch]]:
+        """Run a batched index search and map ids back to articles"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.config.embedding_dim)
         if not self._article_ids:
-            return []
+            return [[] for _ in range(len(queries))]
         
         top_k = top_k or self.config.top_k
         exclude_ids = set(exclude_ids or [])
         
-        query = embedding.reshape(1, -1).astype(np.float32)
+        if self._index is None:
+            return [
+                self._numpy_search(query, top_k, exclude_ids) for query in queries
+            ]
         
-        if self._faiss_available and self._index is not None:
-            # FAISS search
-            try:
-                # Search for more than needed to allow filtering
-                search_k = min(top_k * 2, len(self._article_ids))
-                scores, indices = self._index.search(query, search_k)
-                
-                matches = []
-                for score, idx in zip(scores[0], indices[0]):
-                    if idx < 0 or idx >= len(self._article_ids):
-                        continue
-                    
-                    article_id = self._article_ids[idx]
-                    if article_id in exclude_ids:
-                        continue
-                    
-                    av = self._article_metadata.get(article_id)
-                    if av:
-                        matches.append(SimilarityMatch(
-                            article_id=article_id,
-                            similarity_score=float(score),
-                            matched_at=datetime.utcnow().isoformat(),
-                            source_name=av.source_name
-                        ))
-                    
-                    if len(matches) >= top_k:
-                        break
+        try:
+            # Search for more than needed to allow filtering
+            search_k = min(
+                max(top_k * 2, top_k + len(exclude_ids)), len(self._article_ids)
+            )
+            scores, index_ids = self._index.search(queries, search_k)
+        except Exception as e:
+            logger.error(f"Index search error: {e}")
+            return [
+                self._numpy_search(query, top_k, exclude_ids) for query in queries
+            ]
+        
+        matched_at = datetime.utcnow().isoformat()
+        results = []
+        for row_scores, row_ids in zip(scores, index_ids):
+            matches = []
+            for score, index_id in zip(row_scores, row_ids):
+                article_id = self._id_to_article.get(int(index_id))
+                if article_id is None or article_id in exclude_ids:
+                    continue
                 
-                return matches
+                av = self._article_metadata[article_id]
+                matches.append(SimilarityMatch(
+                    article_id=article_id,
+                    similarity_score=float(score),
+                    matched_at=matched_at,
+                    source_name=av.source_name
+                ))
                 
-            except Exception as e:
-                logger.error(f"FAISS search error: {e}")
-                return self._numpy_search(embedding, top_k, exclude_ids)
-        else:
-            return self._numpy_search(embedding, top_k, exclude_ids)
+                if len(matches) >= top_k:
+                    break
+            results.append(matches)
+        return results
     
     def _numpy_search(
         self,
@@ -427,34 +673,31 @@ class SimilarityEngine:
         top_k: int,
         exclude_ids: set
     ) -> List[SimilarityMatch]:
-        """Fallback numpy-based search"""
-        if not self._article_metadata:
+        """Brute-force search straight from article metadata (last resort)"""
+        candidates = [
+            av for article_id, av in self._article_metadata.items()
+            if article_id not in exclude_ids
+        ]
+        if not candidates:
             return []
         
-        # Calculate similarities with all articles
-        similarities = []
-        for article_id, av in self._article_metadata.items():
-            if article_id in exclude_ids:
-                continue
-            
-            # Cosine similarity (assuming normalized embeddings)
-            sim = float(np.dot(embedding, av.embedding))
-            similarities.append((article_id, sim, av))
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top matches
-        matches = []
-        for article_id, sim, av in similarities[:top_k]:
-            matches.append(SimilarityMatch(
-                article_id=article_id,
-                similarity_score=sim,
-                matched_at=datetime.utcnow().isoformat(),
-                source_name=av.source_name
-            ))
-        
-        return matches
+        # Cosine similarity (assuming normalized embeddings)
+        matrix = np.vstack([av.embedding for av in candidates])
+        sims = matrix @ np.asarray(embedding, dtype=np.float32).ravel()
+        k = min(top_k, len(sims))
+        top = np.argpartition(sims, len(sims) - k)[len(sims) - k:]
+        top = top[np.argsort(-sims[top])]
+        
+        matched_at = datetime.utcnow().isoformat()
+        return [
+            SimilarityMatch(
+                article_id=candidates[i].article_id,
+                similarity_score=float(sims[i]),
+                matched_at=matched_at,
+                source_name=candidates[i].source_name
+            )
+            for i in top
+        ]
     
     def search_sync(
         self,
@@ -464,14 +707,7 @@ class SimilarityEngine:
     ) -> List[SimilarityMatch]:
         """Synchronous search for non-async contexts"""
         self._ensure_initialized()
-        
-        if not self._article_ids:
-            return []
-        
-        top_k = top_k or self.config.top_k
-        exclude_ids = set(exclude_ids or [])
-        
-        return self._numpy_search(embedding, top_k, exclude_ids)
+        return self._search_batch(embedding.reshape(1, -1), top_k, exclude_ids)[0]
     
     def classify_similarity(self, score: float) -> str:
         """
@@ -256,6 +256,47 @@ class MongoDBArticleLoader:
         
         return result.modified_count > 0
     
+    async def mark_many_as_layer2_processed(
+        self,
+        article_ids: List[str],
+        layer2_result: Dict[str, Any]
+    ) -> int:
+        """
+        Mark many articles as processed by Layer 2 in one round trip.
+        
+        Applies the same update as ``mark_as_layer2_processed`` with a single
+        ``update_many`` on ``article_id $in``.
+        
+        Args:
+            article_ids: IDs of the articles to update.
+            layer2_result: Results from Layer 2 processing (shared by all).
+            
+        Returns:
+            Number of articles modified.
+        """
+        if not article_ids:
+            return 0
+        if not self._connected:
+            await self.connect()
+        
+        update = {
+            "$set": {
+                "layer2_processed": True,
+                "layer2_result": layer2_result,
+                "layer2_processed_at": datetime.utcnow()
+            },
+            "$push": {
+                "processing_pipeline.stages_completed": "layer2_enhanced"
+            }
+        }
+        
+        result = await self.db.processed_articles.update_many(
+            {"article_id": {"$in": list(article_ids)}},
+            update
+        )
+        
+        return result.modified_count
+    
     async def count_unprocessed(self) -> int:
         """Count articles waiting for Layer 2 processing."""
         if not self._connected:
@@ -20,8 +20,12 @@ from collections import defaultdict
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from .keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+
 
 @dataclass
 class IndicatorDefinition:
@@ -83,6 +87,8 @@ class FullIndicatorCalculator:
             'password': os.getenv('POSTGRES_PASSWORD', 'postgres_secure_2024')
         }
         self.indicators: List[IndicatorDefinition] = []
+        self._matcher: Optional[KeywordMatcher] = None
+        self._matcher_signature: tuple = ()
         self._load_indicators()
         
     def _load_indicators(self):
@@ -129,10 +135,51 @@ class FullIndicatorCalculator:
             conn.close()
             
             logger.info(f"Loaded {len(self.indicators)} indicator definitions")
+            self._get_matcher()
         except Exception as e:
             logger.error(f"Failed to load indicator definitions: {e}")
             self.indicators = []
         
+    @staticmethod
+    def _article_text(article: Dict[str, Any]) -> str:
+        """Build the lowercased title + body text used for keyword matching."""
+        title = article.get('title', '') or ''
+        body = article.get('body', '') or ''
+        
+        # Also check content nested structure
+        content = article.get('content', {})
+        if isinstance(content, dict):
+            title = title or content.get('title_translated', '') or content.get('title_original', '')
+            body = body or content.get('body_translated', '') or content.get('body_original', '')
+        
+        return f"{title} {body}".lower()
+        
+    @staticmethod
+    def _score_from_matches(matches: int) -> float:
+        """Convert a keyword hit count into a 0-1 match score."""
+        if matches == 0:
+            return 0.0
+            
+        # Calculate match score
+        # At least 2 keywords = strong match
+        # 1 keyword = weak match
+        if matches >= 3:
+            return 1.0
+        elif matches >= 2:
+            return 0.8
+        else:
+            return 0.4
+            
+    def _get_matcher(self) -> KeywordMatcher:
+        """Return the compiled keyword matcher, rebuilding it if indicators changed."""
+        signature = tuple(
+            (ind.indicator_id, tuple(ind.keywords or ())) for ind in self.indicators
+        )
+        if self._matcher is None or signature != self._matcher_signature:
+            self._matcher = KeywordMatcher([ind.keywords for ind in self.indicators])
+            self._matcher_signature = signature
+        return self._matcher
+        
     def _match_article_to_indicator(
         self, 
         article: Dict[str, Any], 
@@ -142,21 +189,13 @@ class FullIndicatorCalculator:
         Calculate match score between article and indicator.
         
         Returns a score 0-1 indicating how well the article matches.
+        Bulk callers should use ``calculate_all_indicators``, which scans each
+        article once for all indicators.
         """
         if not indicator.keywords:
             return 0.0
             
-        # Get article text
-        title = article.get('title', '') or ''
-        body = article.get('body', '') or ''
-        
-        # Also check content nested structure
-        content = article.get('content', {})
-        if isinstance(content, dict):
-            title = title or content.get('title_translated', '') or content.get('title_original', '')
-            body = body or content.get('body_translated', '') or content.get('body_original', '')
-        
-        text = f"{title} {body}".lower()
+        text = self._article_text(article)
         
         if not text.strip():
             return 0.0
@@ -168,18 +207,7 @@ class FullIndicatorCalculator:
             if re.search(pattern, text):
                 matches += 1
         
-        if matches == 0:
-            return 0.0
-            
-        # Calculate match score
-        # At least 2 keywords = strong match
-        # 1 keyword = weak match
-        if matches >= 3:
-            return 1.0
-        elif matches >= 2:
-            return 0.8
-        else:
-            return 0.4
+        return self._score_from_matches(matches)
             
     def _calculate_frequency_indicator(
         self,
@@ -187,8 +215,11 @@ class FullIndicatorCalculator:
         indicator: IndicatorDefinition
     ) -> float:
         """Calculate frequency-based indicator value."""
-        count = len(matching_articles)
+        return self._frequency_value(len(matching_articles))
         
+    @staticmethod
+    def _frequency_value(count: int) -> float:
+        """Map a matching-article count to the 0-100 frequency scale."""
         # Normalize to 0-100 scale
         # Assume 10 articles/day is high activity
         if count == 0:
@@ -210,26 +241,49 @@ class FullIndicatorCalculator:
         # Average sentiment scores
         sentiments = []
         for article in matching_articles:
-            sentiment = article.get('sentiment', {})
-            
-            # Check nested nlp_features
-            if not sentiment:
-                nlp = article.get('nlp_features', {})
-                sentiment = nlp.get('sentiment', {})
-                
-            if isinstance(sentiment, dict):
-                score = sentiment.get('score', sentiment.get('compound', 0.5))
-                # Convert -1 to 1 scale to 0-100
-                if -1 <= score <= 1:
-                    score = (score + 1) * 50
+            score = self._article_sentiment(article)
+            if score is not None:
                 sentiments.append(score)
-            elif isinstance(sentiment, (int, float)):
-                sentiments.append(float(sentiment))
                 
         if sentiments:
             return sum(sentiments) / len(sentiments)
         return 50.0
         
+    @staticmethod
+    def _article_sentiment(article: Dict[str, Any]) -> Optional[float]:
+        """Extract an article's sentiment on a 0-100 scale, if present."""
+        sentiment = article.get('sentiment', {})
+        
+        # Check nested nlp_features
+        if not sentiment:
+            nlp = article.get('nlp_features', {})
+            sentiment = nlp.get('sentiment', {})
+            
+        if isinstance(sentiment, dict):
+            score = sentiment.get('score', sentiment.get('compound', 0.5))
+            # Convert -1 to 1 scale to 0-100
+            if -1 <= score <= 1:
+                score = (score + 1) * 50
+            return score
+        elif isinstance(sentiment, (int, float)):
+            return float(sentiment)
+        return None
+        
+    def create_accumulator(self, category_filter: Optional[str] = None) -> 'IndicatorAccumulator':
+        """
+        Create an incremental accumulator over the loaded indicators.
+        
+        Articles can be added one at a time (e.g. from a streaming pipeline)
+        without keeping the full article list in memory.
+        """
+        selected = list(range(len(self.indicators)))
+        if category_filter:
+            selected = [
+                idx for idx in selected
+                if self.indicators[idx].pestel_category == category_filter
+            ]
+        return IndicatorAccumulator(self, selected)
+        
     def calculate_all_indicators(
         self,
         articles: List[Dict[str, Any]],
@@ -245,59 +299,19 @@ class FullIndicatorCalculator:
         Returns:
             List of calculated indicator values
         """
-        results = []
-        
         if not self.indicators:
             logger.warning("No indicators loaded")
-            return results
+            return []
         
-        # Filter indicators if needed
-        indicators = self.indicators
-        if category_filter:
-            indicators = [i for i in indicators if i.pestel_category == category_filter]
-            
-        logger.info(f"Calculating {len(indicators)} indicators from {len(articles)} articles")
+        accumulator = self.create_accumulator(category_filter)
         
-        for indicator in indicators:
-            # Find matching articles
-            matching = []
-            scores = []
-            
-            for article in articles:
-                score = self._match_article_to_indicator(article, indicator)
-                if score > 0.3:  # Threshold for matching
-                    matching.append(article)
-                    scores.append(score)
-                    
-            # Calculate value based on calculation type
-            if indicator.calculation_type == 'frequency_count':
-                value = self._calculate_frequency_indicator(matching, indicator)
-            elif indicator.calculation_type == 'sentiment_aggregate':
-                value = self._calculate_sentiment_indicator(matching, indicator)
-            else:
-                # Default: frequency-based
-                value = self._calculate_frequency_indicator(matching, indicator)
-                
-            # Calculate confidence based on article count and match quality
-            if matching:
-                avg_score = sum(scores) / len(scores)
-                confidence = min(1.0, (len(matching) / 5) * avg_score)
-            else:
-                confidence = 0.0
-                
-            results.append(IndicatorValue(
-                indicator_id=indicator.indicator_id,
-                indicator_name=indicator.indicator_name,
-                pestel_category=indicator.pestel_category,
-                subcategory=indicator.subcategory,
-                value=round(value, 1),
-                confidence=round(confidence, 2),
-                article_count=len(matching),
-                matching_articles=[a.get('article_id', str(a.get('_id', 'unknown'))) for a in matching[:5]],
-                calculation_type=indicator.calculation_type
-            ))
+        logger.info(f"Calculating {len(accumulator.selected)} indicators from {len(articles)} articles")
+        
+        # Scan each article once for all indicators
+        for article in articles:
+            accumulator.add(article)
             
-        return results
+        return accumulator.results()
         
     def calculate_composite_scores(
         self,
@@ -456,6 +470,96 @@ class FullIndicatorCalculator:
         }
 
 
+class IndicatorAccumulator:
+    """
+    Incremental indicator calculation state.
+    
+    Keeps only per-indicator counters, match scores, sentiment sums and the
+    first few matching article IDs, so memory does not grow with article
+    bodies. ``results()`` yields the same values as ``calculate_all_indicators``
+    over the same articles in the same order.
+    """
+    
+    MAX_MATCHING_IDS = 5
+    
+    def __init__(self, calculator: FullIndicatorCalculator, selected: List[int]):
+        self.calculator = calculator
+        self.selected = selected
+        self.articles_seen = 0
+        self._selected_set = set(selected)
+        self._matcher = calculator._get_matcher()
+        self._counts: Dict[int, int] = defaultdict(int)
+        self._score_sums: Dict[int, float] = defaultdict(float)
+        self._sentiment_sums: Dict[int, float] = defaultdict(float)
+        self._sentiment_counts: Dict[int, int] = defaultdict(int)
+        self._matching_ids: Dict[int, List[str]] = defaultdict(list)
+        
+    def add(self, article: Dict[str, Any]):
+        """Match one article against all selected indicators."""
+        self.articles_seen += 1
+        text = self.calculator._article_text(article)
+        if not text.strip():
+            return
+            
+        sentiment = _UNSET
+        for idx, hits in self._matcher.count_hits(text).items():
+            if idx not in self._selected_set:
+                continue
+            score = self.calculator._score_from_matches(hits)
+            if score <= 0.3:  # Threshold for matching
+                continue
+            self._counts[idx] += 1
+            self._score_sums[idx] += score
+            if len(self._matching_ids[idx]) < self.MAX_MATCHING_IDS:
+                self._matching_ids[idx].append(
+                    article.get('article_id', str(article.get('_id', 'unknown')))
+                )
+            if self.calculator.indicators[idx].calculation_type == 'sentiment_aggregate':
+                if sentiment is _UNSET:
+                    sentiment = self.calculator._article_sentiment(article)
+                if sentiment is not None:
+                    self._sentiment_sums[idx] += sentiment
+                    self._sentiment_counts[idx] += 1
+                    
+    def results(self) -> List[IndicatorValue]:
+        """Build indicator values from the accumulated state."""
+        results = []
+        for idx in self.selected:
+            indicator = self.calculator.indicators[idx]
+            count = self._counts.get(idx, 0)
+            
+            # Calculate value based on calculation type
+            if indicator.calculation_type == 'sentiment_aggregate':
+                if count and self._sentiment_counts.get(idx):
+                    value = self._sentiment_sums[idx] / self._sentiment_counts[idx]
+                else:
+                    value = 50.0
+            else:
+                # frequency_count and default: frequency-based
+                value = self.calculator._frequency_value(count)
+                
+            # Calculate confidence based on article count and match quality
+            if count:
+                avg_score = self._score_sums[idx] / count
+                confidence = min(1.0, (count / 5) * avg_score)
+            else:
+                confidence = 0.0
+                
+            results.append(IndicatorValue(
+                indicator_id=indicator.indicator_id,
+                indicator_name=indicator.indicator_name,
+                pestel_category=indicator.pestel_category,
+                subcategory=indicator.subcategory,
+                value=round(value, 1),
+                confidence=round(confidence, 2),
+                article_count=count,
+                matching_articles=list(self._matching_ids.get(idx, [])),
+                calculation_type=indicator.calculation_type
+            ))
+            
+        return results
+
+
 # Factory function
 def create_full_indicator_calculator(pg_config: Optional[Dict[str, Any]] = None) -> FullIndicatorCalculator:
     """Create and return a FullIndicatorCalculator instance."""
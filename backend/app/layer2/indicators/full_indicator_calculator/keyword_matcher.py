@@ -0,0 +1,102 @@
+"""
+Compiled multi-keyword matcher for indicator definitions.
+
+Builds a single combined word-boundary regex over every indicator keyword
+so each article is scanned once, instead of once per (indicator, keyword)
+pair.  Hit counts are identical to running ``re.search(r'\\bkw\\b', text)``
+for each keyword of each indicator.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+
+class KeywordMatcher:
+    """
+    Matches article text against the keyword lists of many indicators.
+
+    The combined pattern is a zero-width lookahead, so overlapping keywords
+    at different positions are all found.  At a given start position the
+    alternation yields the longest matching keyword; any shorter keyword
+    matching at the same position must be a string prefix of it, so those
+    are verified explicitly with their own anchored patterns.
+    """
+
+    def __init__(self, keyword_lists: Sequence[Sequence[str]]):
+        """
+        Args:
+            keyword_lists: One keyword list per indicator, in indicator order.
+        """
+        self.size = len(keyword_lists)
+
+        # keyword -> indicator indices (with multiplicity, so duplicate
+        # keywords within one indicator still count twice as before)
+        self._owners: Dict[str, List[int]] = defaultdict(list)
+        self._empty_owners: List[int] = []
+
+        for idx, keywords in enumerate(keyword_lists):
+            for keyword in keywords or []:
+                kw = (keyword or '').lower()
+                if kw:
+                    self._owners[kw].append(idx)
+                else:
+                    # r'\b\b' matches wherever the text has a word boundary
+                    self._empty_owners.append(idx)
+
+        unique = sorted(self._owners, key=len, reverse=True)
+        self._pattern = None
+        if unique:
+            alternation = '|'.join(re.escape(kw) for kw in unique)
+            self._pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+
+        # Shorter keywords that are prefixes of a longer one can match at the
+        # same position; pre-compute them with anchored verifiers.
+        self._prefixes: Dict[str, List[tuple]] = {}
+        verifiers = {kw: re.compile(re.escape(kw) + r'\b') for kw in unique}
+        by_first = defaultdict(list)
+        for kw in unique:
+            by_first[kw[0]].append(kw)
+        for kw in unique:
+            shorter = [
+                (other, verifiers[other])
+                for other in by_first[kw[0]]
+                if len(other) < len(kw) and kw.startswith(other)
+            ]
+            if shorter:
+                self._prefixes[kw] = shorter
+
+    def find_keywords(self, text: str) -> set:
+        """Return the set of distinct (lowercased) keywords present in text."""
+        found = set()
+        if self._pattern is None:
+            return found
+
+        prefixes = self._prefixes
+        for match in self._pattern.finditer(text):
+            kw = match.group(1)
+            found.add(kw)
+            shorter = prefixes.get(kw)
+            if shorter:
+                start = match.start()
+                for other, verifier in shorter:
+                    if other not in found and verifier.match(text, start):
+                        found.add(other)
+        return found
+
+    def count_hits(self, text: str) -> Dict[int, int]:
+        """
+        Count matched keywords per indicator for already-lowercased text.
+
+        Returns:
+            Mapping of indicator index -> number of its keywords present.
+            Indicators without hits are omitted.
+        """
+        hits: Dict[int, int] = defaultdict(int)
+        for kw in self.find_keywords(text):
+            for idx in self._owners[kw]:
+                hits[idx] += 1
+        if self._empty_owners and re.search(r'\b', text):
+            for idx in self._empty_owners:
+                hits[idx] += 1
+        return hits
@@ -272,13 +272,14 @@ class AdaptiveFeatureExtractor:
 
         return self
 
-    def transform(self, article: Dict, use_cache: bool = True) -> np.ndarray:
+    def transform(self, article: Dict, use_cache: bool = True, entity_doc=None) -> np.ndarray:
         """
         Extract feature vector with caching support.
         
         Args:
             article: Article dictionary
             use_cache: Use cache if enabled (for production)
+            entity_doc: Pre-parsed spaCy Doc for entity features (from batch)
             
         Returns:
             Feature vector
@@ -319,7 +320,7 @@ class AdaptiveFeatureExtractor:
         
         # 8. Entity features (8 dimensions) - IF ENABLED
         if self.feature_config['enable_entities']:
-            features.extend(self._extract_entity_features(article))
+            features.extend(self._extract_entity_features(article, doc=entity_doc))
         
         # 9. Word2Vec embeddings (100 dimensions) - IF ENABLED
         if self.feature_config['enable_word2vec']:
@@ -369,9 +370,22 @@ class AdaptiveFeatureExtractor:
         else:
             iterator = articles
         
+        # Parse entity docs for the whole batch with nlp.pipe
+        entity_docs = {}
+        if self.feature_config['enable_entities'] and self._spacy_nlp is not None:
+            pending = [
+                i for i, article in enumerate(articles)
+                if not (self.enable_cache and self._generate_cache_key(article) in self._feature_cache)
+            ]
+            if pending:
+                from app.layer2.nlp_processing.spacy_loader import pipe_texts
+                texts = [self._entity_text(articles[i]) for i in pending]
+                docs = pipe_texts(self._spacy_nlp, texts, len(texts), batch_size=batch_size)
+                entity_docs = dict(zip(pending, docs))
+        
         feature_matrix = []
-        for article in iterator:
-            features = self.transform(article)
+        for i, article in enumerate(iterator):
+            features = self.transform(article, entity_doc=entity_docs.get(i))
             feature_matrix.append(features)
         
         return np.array(feature_matrix)
@@ -584,18 +598,21 @@ class AdaptiveFeatureExtractor:
         ]
     
     def _load_spacy_model(self):
-        """Load spaCy NER model"""
+        """Load spaCy NER model (shared process-wide)"""
         if self._spacy_nlp is None:
-            import spacy
-            self._spacy_nlp = spacy.load("en_core_web_sm")
+            from app.layer2.nlp_processing.spacy_loader import get_spacy_model
+            self._spacy_nlp = get_spacy_model()
+    
+    @staticmethod
+    def _entity_text(article: Dict) -> str:
+        return f"{article.get('title', '')} {article.get('content', '')}"
     
-    def _extract_entity_features(self, article: Dict) -> List[float]:
+    def _extract_entity_features(self, article: Dict, doc=None) -> List[float]:
         """Extract named entity features (8 dimensions)"""
-        if self._spacy_nlp is None:
-            return [0.0] * 8
-        
-        text = f"{article.get('title', '')} {article.get('content', '')}"
-        doc = self._spacy_nlp(text)
+        if doc is None:
+            if self._spacy_nlp is None:
+                return [0.0] * 8
+            doc = self._spacy_nlp(self._entity_text(article))
         
         person_count = sum(1 for ent in doc.ents if ent.label_ == 'PERSON')
         org_count = sum(1 for ent in doc.ents if ent.label_ == 'ORG')
@@ -1,12 +1,18 @@
 """Rule-based indicator classification using keyword matching (optimized)"""
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterable
+from collections import Counter, defaultdict
 import re
 from functools import lru_cache
 import hashlib
 
 from .keyword_config import INDICATOR_KEYWORDS, KEYWORD_WEIGHTS
 
+# Word tokens as seen by the regex engine: a \b...\b keyword made of word
+# characters matches exactly where a maximal run of \w equals the keyword.
+_TOKEN_RE = re.compile(r'\w+')
+_SIMPLE_KEYWORD_RE = re.compile(r'\w+(?: \w+)*')
+
 
 class RuleBasedClassifier:
     """Rule-based indicator assignment using keyword matching with caching"""
@@ -24,6 +30,9 @@ class RuleBasedClassifier:
         # Precompile regex patterns for performance
         self._compiled_patterns = self._compile_keyword_patterns()
         
+        # Inverted keyword index for the tokenize-once path
+        self._build_keyword_index()
+        
         # Cache statistics
         self.cache_hits = 0
         self.cache_misses = 0
@@ -43,6 +52,89 @@ class RuleBasedClassifier:
         
         return compiled
 
+    def _build_keyword_index(self):
+        """
+        Build a keyword -> (indicator, weight_category, keyword) inverted index.
+
+        Single-word keywords are looked up in a token Counter, multi-word
+        keywords are matched as n-grams starting from their first token.
+        Keywords that cannot be expressed as space-separated word tokens (or
+        whose n-grams can overlap themselves, where findall semantics differ
+        from n-gram counts) keep their precompiled regex.
+        """
+        # keyword (lowercased) -> [(ordinal, indicator_id, weight_category, original)]
+        self._keyword_entries: Dict[str, List[Tuple[int, str, str, str]]] = defaultdict(list)
+        # first token -> [(keyword tokens, keyword)]
+        self._ngram_index: Dict[str, List[Tuple[Tuple[str, ...], str]]] = defaultdict(list)
+        self._single_keywords = set()
+        self._regex_keywords: Dict[str, re.Pattern] = {}
+        self._indicator_order = {ind: pos for pos, ind in enumerate(self.keyword_config)}
+        
+        ordinal = 0
+        for indicator_id, config in self.keyword_config.items():
+            for weight_category, keyword_list in config['keywords'].items():
+                for keyword in keyword_list:
+                    kw = keyword.lower()
+                    self._keyword_entries[kw].append(
+                        (ordinal, indicator_id, weight_category, keyword)
+                    )
+                    ordinal += 1
+        
+        for kw in self._keyword_entries:
+            tokens = tuple(kw.split(' '))
+            if not _SIMPLE_KEYWORD_RE.fullmatch(kw) or self._self_overlapping(tokens):
+                self._regex_keywords[kw] = re.compile(r'\b' + re.escape(kw) + r'\b')
+            elif len(tokens) == 1:
+                self._single_keywords.add(kw)
+            else:
+                self._ngram_index[tokens[0]].append((tokens, kw))
+    
+    @staticmethod
+    def _self_overlapping(tokens: Tuple[str, ...]) -> bool:
+        """True if a proper suffix of the n-gram equals its prefix."""
+        return any(tokens[-k:] == tokens[:k] for k in range(1, len(tokens)))
+    
+    def _count_keywords(self, text: str) -> Dict[str, int]:
+        """
+        Count occurrences of every configured keyword in lowercased text.
+        
+        Tokenizes the text once; equivalent to ``len(pattern.findall(text))``
+        for each keyword pattern.
+        """
+        spans = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
+        token_counts = Counter(tok for tok, _, _ in spans)
+        
+        counts: Dict[str, int] = {}
+        for kw in self._single_keywords.intersection(token_counts):
+            counts[kw] = token_counts[kw]
+        
+        ngram_index = self._ngram_index
+        if ngram_index:
+            n_tokens = len(spans)
+            for i, (tok, _, _) in enumerate(spans):
+                candidates = ngram_index.get(tok)
+                if not candidates:
+                    continue
+                for tokens, kw in candidates:
+                    n = len(tokens)
+                    if i + n > n_tokens:
+                        continue
+                    for j in range(1, n):
+                        prev_end = spans[i + j - 1][2]
+                        tok_j, start_j, _ = spans[i + j]
+                        # Keyword tokens are separated by exactly one space
+                        if tok_j != tokens[j] or start_j != prev_end + 1 or text[prev_end] != ' ':
+                            break
+                    else:
+                        counts[kw] = counts.get(kw, 0) + 1
+        
+        for kw, pattern in self._regex_keywords.items():
+            matches = len(pattern.findall(text))
+            if matches:
+                counts[kw] = matches
+        
+        return counts
+
     def classify_article(self, article_text: str, article_title: str = "") -> List[Dict]:
         """
         Classify article and return indicator assignments with confidence (cached)
@@ -78,11 +170,45 @@ class RuleBasedClassifier:
         # Convert to tuple for caching
         return tuple(tuple(r.items()) for r in results)
 
-    def _classify_uncached(self, article_text: str, article_title: str) -> List[Dict]:
-        """Actual classification logic without caching"""
+    def _classify_uncached(self, article_text: str, article_title: str = "") -> List[Dict]:
+        """Actual classification logic without caching (tokenize-once path)"""
         # Combine title and content (title has 2x weight for importance)
         full_text = f"{article_title} {article_title} {article_text}".lower()
 
+        counts = self._count_keywords(full_text)
+        
+        # Gather hits per indicator in configuration order so scores are
+        # summed in the same order as the per-pattern implementation
+        hits = []
+        for kw, matches in counts.items():
+            for entry in self._keyword_entries[kw]:
+                hits.append((entry, matches))
+        hits.sort(key=lambda h: h[0][0])
+        
+        per_indicator: Dict[str, Tuple[float, List[str]]] = {}
+        for (_, indicator_id, weight_category, keyword), matches in hits:
+            score, matched = per_indicator.get(indicator_id, (0.0, []))
+            matched.append(keyword)
+            # Diminishing returns for multiple matches (cap at 3)
+            per_indicator[indicator_id] = (score + self.weights[weight_category] * min(matches, 3), matched)
+
+        assignments = []
+
+        for indicator_id in sorted(per_indicator, key=self._indicator_order.get):
+            match_score, matched_keywords = per_indicator[indicator_id]
+
+            if match_score > 0.1:  # Minimum threshold
+                assignments.append(self._build_assignment(indicator_id, match_score, matched_keywords))
+
+        # Sort by confidence (highest first)
+        assignments.sort(key=lambda x: x['confidence'], reverse=True)
+
+        return assignments
+
+    def _classify_with_patterns(self, article_text: str, article_title: str = "") -> List[Dict]:
+        """Reference classification running every precompiled pattern (one scan per keyword)"""
+        full_text = f"{article_title} {article_title} {article_text}".lower()
+
         assignments = []
 
         for indicator_id, config in self.keyword_config.items():
@@ -92,20 +218,51 @@ class RuleBasedClassifier:
             )
 
             if match_score > 0.1:  # Minimum threshold
-                confidence = self._normalize_confidence(match_score)
-                assignments.append({
-                    'indicator_id': indicator_id,
-                    'indicator_name': config['name'],
-                    'confidence': confidence,
-                    'matched_keywords': matched_keywords,
-                    'keyword_match_count': len(matched_keywords)
-                })
+                assignments.append(self._build_assignment(indicator_id, match_score, matched_keywords))
 
-        # Sort by confidence (highest first)
         assignments.sort(key=lambda x: x['confidence'], reverse=True)
 
         return assignments
 
+    def _build_assignment(self, indicator_id: str, match_score: float, matched_keywords: List[str]) -> Dict:
+        """Build an indicator assignment dict from a raw match score"""
+        return {
+            'indicator_id': indicator_id,
+            'indicator_name': self.keyword_config[indicator_id]['name'],
+            'confidence': self._normalize_confidence(match_score),
+            'matched_keywords': matched_keywords,
+            'keyword_match_count': len(matched_keywords)
+        }
+
+    def classify_batch(
+        self,
+        articles: Iterable[Dict],
+        text_field: str = 'content',
+        title_field: str = 'title'
+    ) -> List[List[Dict]]:
+        """
+        Classify many articles with the shared tokenizer and keyword index
+
+        Bypasses the per-article LRU cache, which only adds hashing overhead
+        for large one-off batches.
+
+        Args:
+            articles: Iterable of article dicts
+            text_field: Key holding the article body
+            title_field: Key holding the article title
+
+        Returns:
+            One assignment list per article, in input order
+        """
+        results = []
+        for article in articles:
+            article_text = article.get(text_field) or ''
+            if not article_text.strip():
+                results.append([])
+                continue
+            results.append(self._classify_uncached(article_text, article.get(title_field) or ''))
+        return results
+
     def _calculate_match_score_optimized(self, text: str, indicator_id: str) -> Tuple[float, List[str]]:
         """
         Calculate weighted match score using precompiled patterns (optimized)
@@ -1,8 +1,8 @@
-import spacy
 import re
 import time
-from typing import List
+from typing import Dict, List, Optional
 from dateutil import parser as date_parser
+from app.layer2.nlp_processing.spacy_loader import get_spacy_model, pipe_texts
 from app.layer2.nlp_processing.entity_schemas import (
     Location, Organization, Person, DateEntity,
     AmountEntity, PercentageEntity, ExtractedEntities
@@ -15,7 +15,7 @@ class EntityExtractor:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._nlp = spacy.load("en_core_web_sm")
+            cls._nlp = get_spacy_model()
         return cls._instance
 
     CURRENCY_PATTERN = re.compile(
@@ -28,10 +28,45 @@ class EntityExtractor:
         """Extract all entities from article"""
         start_time = time.time()
 
-        full_text = f"{title}\n\n{content}"[:1_000_000]
+        full_text = self._full_text(title, content)
 
         doc = self._nlp(full_text)
 
+        return self._build_entities(article_id, doc, full_text, start_time)
+
+    def extract_entities_batch(
+        self,
+        articles: List[Dict],
+        batch_size: int = 64,
+        n_process: Optional[int] = None
+    ) -> List[ExtractedEntities]:
+        """Extract entities from many articles with a single nlp.pipe pass
+
+        Args:
+            articles: Dicts with article_id, title and content keys
+            batch_size: Texts per spaCy batch
+            n_process: Worker processes (None = scale with batch size)
+
+        Returns:
+            ExtractedEntities per article, in input order
+        """
+        texts = [
+            self._full_text(a.get("title", ""), a.get("content", ""))
+            for a in articles
+        ]
+        results = []
+        start_time = time.time()
+        docs = pipe_texts(self._nlp, texts, len(texts), batch_size=batch_size, n_process=n_process)
+        for article, text, doc in zip(articles, texts, docs):
+            results.append(self._build_entities(article.get("article_id", ""), doc, text, start_time))
+            start_time = time.time()
+        return results
+
+    @staticmethod
+    def _full_text(title: str, content: str) -> str:
+        return f"{title}\n\n{content}"[:1_000_000]
+
+    def _build_entities(self, article_id: str, doc, full_text: str, start_time: float) -> ExtractedEntities:
         locations = self._extract_locations(doc)
         organizations = self._extract_organizations(doc)
         persons = self._extract_persons(doc)
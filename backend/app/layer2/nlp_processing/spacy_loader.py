@@ -0,0 +1,98 @@
+"""Process-wide shared spaCy pipelines
+
+Loading ``en_core_web_sm`` takes seconds and hundreds of MB, so every
+component that needs NER shares one pipeline per (model, disabled
+components) combination instead of calling ``spacy.load`` itself.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Components not needed for named entity recognition. tok2vec is kept
+# because NER may listen to it.
+NER_DISABLED_COMPONENTS: Tuple[str, ...] = (
+    "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"
+)
+
+# Below this many texts, worker processes cost more than they save
+MIN_TEXTS_PER_PROCESS = 250
+
+_models: Dict[Tuple[str, Tuple[str, ...]], object] = {}
+_lock = threading.Lock()
+
+
+def get_spacy_model(
+    model_name: str = DEFAULT_MODEL,
+    disable: Iterable[str] = NER_DISABLED_COMPONENTS
+):
+    """Return the shared spaCy pipeline, loading it on first use
+
+    Args:
+        model_name: spaCy package name
+        disable: Pipeline components to disable (ignored if not present)
+
+    Returns:
+        spacy.Language instance shared by all callers in this process
+    """
+    key = (model_name, tuple(sorted(disable)))
+    nlp = _models.get(key)
+    if nlp is not None:
+        return nlp
+
+    with _lock:
+        nlp = _models.get(key)
+        if nlp is None:
+            import spacy
+            nlp = spacy.load(model_name)
+            for name in key[1]:
+                if name in nlp.pipe_names:
+                    nlp.disable_pipe(name)
+            _models[key] = nlp
+    return nlp
+
+
+def resolve_n_process(n_texts: int, n_process: Optional[int] = None) -> int:
+    """Pick a worker process count for ``nlp.pipe``
+
+    An explicit ``n_process`` wins. Otherwise use one process per
+    ``MIN_TEXTS_PER_PROCESS`` texts, up to the CPU count.
+    """
+    if n_process is not None:
+        return max(1, n_process)
+    cpus = os.cpu_count() or 1
+    return max(1, min(cpus, n_texts // MIN_TEXTS_PER_PROCESS))
+
+
+def pipe_texts(
+    nlp,
+    texts: Iterable[str],
+    n_texts: int,
+    batch_size: int = 64,
+    n_process: Optional[int] = None
+) -> Iterator:
+    """Run ``nlp.pipe`` with batching and automatic process fan-out
+
+    Args:
+        nlp: spaCy pipeline (usually from ``get_spacy_model``)
+        texts: Texts to process
+        n_texts: Number of texts, used to size the worker pool
+        batch_size: Texts per batch
+        n_process: Worker processes (None = automatic)
+
+    Returns:
+        Iterator of Doc objects in input order
+    """
+    return nlp.pipe(
+        texts,
+        batch_size=batch_size,
+        n_process=resolve_n_process(n_texts, n_process)
+    )
+
+
+def clear_spacy_cache():
+    """Drop all cached pipelines (mainly for tests)"""
+    with _lock:
+        _models.clear()
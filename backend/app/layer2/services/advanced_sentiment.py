@@ -391,13 +391,7 @@ Provide evidence-based assessments with supporting quotes."""
                 return self._create_neutral_result(start_time, source="quick_check")
         
         try:
-            # Truncate very long texts
-            max_length = 3500
-            if len(full_text) > max_length:
-                full_text = full_text[:max_length] + "..."
-            
-            # Build prompt
-            prompt = self.ANALYSIS_PROMPT.format(article_text=full_text)
+            prompt = self._build_prompt(full_text)
             
             # Get LLM analysis
             response = await self.llm_client.generate_structured(
@@ -438,6 +432,15 @@ Provide evidence-based assessments with supporting quotes."""
         Returns:
             List of AdvancedSentimentResult objects
         """
+        # One cache round trip for the whole batch instead of one per item
+        prompts = []
+        for item in texts:
+            title, text = item.get("title", ""), item.get("text", "")
+            full_text = f"{title}\n\n{text}" if title else text
+            if len(full_text) >= self.min_text_length:
+                prompts.append(self._build_prompt(full_text))
+        await self.llm_client.prefetch_cached(prompts, self.SYSTEM_PROMPT)
+        
         semaphore = asyncio.Semaphore(concurrency)
         
         async def analyze_with_limit(item: Dict[str, str]) -> AdvancedSentimentResult:
@@ -451,6 +454,13 @@ Provide evidence-based assessments with supporting quotes."""
         tasks = [analyze_with_limit(item) for item in texts]
         return await asyncio.gather(*tasks)
     
+    def _build_prompt(self, full_text: str) -> str:
+        """Build the analysis prompt, truncating very long texts."""
+        max_length = 3500
+        if len(full_text) > max_length:
+            full_text = full_text[:max_length] + "..."
+        return self.ANALYSIS_PROMPT.format(article_text=full_text)
+    
     def _quick_sentiment_check(self, text: str) -> Optional[float]:
         """
         Quick keyword-based sentiment check to skip LLM for neutral content.
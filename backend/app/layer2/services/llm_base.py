@@ -5,19 +5,24 @@ Provides foundational LLM functionality:
 - Groq Llama 3.1 70B client (FREE tier)
 - Redis caching for responses
 - Error handling with fallback
-- Rate limiting and retry logic
+- Non-blocking token-bucket rate limiting per API key
+- Retry logic
 - Structured output parsing
-- Multi-API key support with automatic rotation
+- Multi-API key support with automatic rotation and spill-over
 
 This is the base class that all LLM-powered services inherit from.
 """
 
 import os
 import json
+import asyncio
 import hashlib
 import logging
+import math
+import threading
 import time
-from typing import Dict, Any, Optional, List, Type, TypeVar
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Type, TypeVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
@@ -26,14 +31,122 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter that waits without blocking the event loop.
+    
+    acquire() reserves the next token straight away (the balance may go
+    negative) and then sleeps until that token is due, so concurrent
+    callers are served in arrival order and no lock is held while waiting.
+    acquire_sync() is the same for synchronous callers.
+    """
+    
+    def __init__(self, requests_per_minute: int, capacity: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.rate = 0.0
+        self.capacity = 0.0
+        self.configure(requests_per_minute, capacity)
+        self._tokens = self.capacity
+        
+        # Statistics
+        self.total_acquired = 0
+        self.total_waits = 0
+        self.total_wait_seconds = 0.0
+    
+    def configure(self, requests_per_minute: int, capacity: Optional[int] = None):
+        """Change the refill rate (and burst capacity, default one minute's worth)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests_per_minute = max(1, requests_per_minute)
+            self.rate = self.requests_per_minute / 60.0
+            self.capacity = float(capacity or self.requests_per_minute)
+            self._tokens = min(self._tokens, self.capacity)
+    
+    def _refill(self, now: float):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+    
+    def _reserve(self) -> float:
+        """Take the next token and return how long until it is due."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            self.total_acquired += 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.total_waits += 1
+            self.total_wait_seconds += wait
+            return wait
+    
+    def _cancel_reservation(self):
+        with self._lock:
+            self._tokens += 1
+            self.total_acquired -= 1
+    
+    def try_acquire(self) -> bool:
+        """Take a token only if one is free now (never jumps queued waiters)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.total_acquired += 1
+            return True
+    
+    def wait_time(self) -> float:
+        """Seconds a new acquire() would wait."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+    
+    async def acquire(self):
+        """Wait (asynchronously) for a token."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._cancel_reservation()
+                raise
+    
+    def acquire_sync(self):
+        """Wait (blocking) for a token; for synchronous callers only."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            tokens = self._tokens
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "available_tokens": round(max(tokens, 0.0), 2),
+            "queued": math.ceil(-tokens) if tokens < 0 else 0,
+            "acquired": self.total_acquired,
+            "waits": self.total_waits,
+            "wait_seconds": round(self.total_wait_seconds, 2)
+        }
+
+
 class APIKeyManager:
     """
     Manages multiple API keys with automatic rotation.
     
     When a rate limit is hit on one key, automatically switches to the next available key.
     Keys are read from GROQ_API_KEY (single key) or GROQ_API_KEYS (comma-separated list).
+    
+    Each key has an AsyncTokenBucket shared by every service in the
+    process. acquire_key() takes a request slot, spilling over to another
+    key when the preferred key's bucket is empty.
     """
     
+    DEFAULT_REQUESTS_PER_MINUTE = 30  # Groq free tier, per key
+    
     _instance = None
     _initialized = False
     
@@ -49,6 +162,8 @@ class APIKeyManager:
         self._keys: List[str] = []
         self._current_index = 0
         self._key_status: Dict[str, Dict[str, Any]] = {}  # Track status of each key
+        self.requests_per_minute = self.DEFAULT_REQUESTS_PER_MINUTE
+        self._buckets: Dict[str, AsyncTokenBucket] = {}  # key_id -> bucket
         self._load_keys()
         APIKeyManager._initialized = True
     
@@ -157,6 +272,82 @@ class APIKeyManager:
         if next_key:
             logger.info(f"Rotated to API key {self._get_key_id(next_key)}")
     
+    # ------------------------------------------
+    # Request rate limiting
+    # ------------------------------------------
+    
+    def configure_rate_limit(self, requests_per_minute: int):
+        """Set the per-key request rate (applies to existing buckets too)."""
+        if requests_per_minute == self.requests_per_minute:
+            return
+        self.requests_per_minute = requests_per_minute
+        for bucket in self._buckets.values():
+            bucket.configure(requests_per_minute)
+    
+    def get_bucket(self, key: str) -> AsyncTokenBucket:
+        """Get the token bucket for a key."""
+        key_id = self._get_key_id(key)
+        bucket = self._buckets.get(key_id)
+        if bucket is None:
+            bucket = self._buckets[key_id] = AsyncTokenBucket(self.requests_per_minute)
+        return bucket
+    
+    def _usable_keys(self, preferred: Optional[str]) -> List[str]:
+        """Keys not marked rate limited, preferred first, then rotation order."""
+        now = datetime.now()
+        n = len(self._keys)
+        ordered = [self._keys[(self._current_index + i) % n] for i in range(n)]
+        if preferred in ordered:
+            ordered.remove(preferred)
+            ordered.insert(0, preferred)
+        
+        usable = []
+        for key in ordered:
+            until = self._key_status.get(self._get_key_id(key), {}).get("rate_limited_until")
+            if until is None or until < now:
+                usable.append(key)
+        return usable
+    
+    def _choose_key(self, preferred: Optional[str]) -> Tuple[Optional[str], bool]:
+        """
+        Pick a key for the next request.
+        
+        Returns (key, acquired): a key whose bucket had a free token (already
+        taken), else the key with the shortest wait (token not yet taken).
+        """
+        usable = self._usable_keys(preferred)
+        if not usable:
+            return None, False
+        
+        for key in usable:
+            if self.get_bucket(key).try_acquire():
+                return key, True
+        
+        return min(usable, key=lambda k: self.get_bucket(k).wait_time()), False
+    
+    async def acquire_key(self, preferred: Optional[str] = None) -> Optional[str]:
+        """
+        Take a request slot, waiting without blocking the event loop.
+        
+        Args:
+            preferred: Key to use if its bucket has capacity (the caller's
+                current key); otherwise spills over to another key
+        
+        Returns:
+            Key the slot was taken on, or None if every key is rate limited
+        """
+        key, acquired = self._choose_key(preferred)
+        if key is not None and not acquired:
+            await self.get_bucket(key).acquire()
+        return key
+    
+    def acquire_key_sync(self, preferred: Optional[str] = None) -> Optional[str]:
+        """Blocking version of acquire_key() for synchronous callers."""
+        key, acquired = self._choose_key(preferred)
+        if key is not None and not acquired:
+            self.get_bucket(key).acquire_sync()
+        return key
+    
     def record_success(self, key: str):
         """Record a successful call with a key."""
         key_id = self._get_key_id(key)
@@ -175,7 +366,8 @@ class APIKeyManager:
                     "rate_limited_until": str(self._key_status[self._get_key_id(k)].get("rate_limited_until")) 
                         if self._key_status[self._get_key_id(k)].get("rate_limited_until") else None,
                     "total_calls": self._key_status[self._get_key_id(k)].get("total_calls", 0),
-                    "errors": self._key_status[self._get_key_id(k)].get("errors", 0)
+                    "errors": self._key_status[self._get_key_id(k)].get("errors", 0),
+                    "rate_limiter": self.get_bucket(k).get_stats()
                 }
                 for k in self._keys
             }
@@ -252,20 +444,78 @@ class LLMResponse:
         }
 
 
+class _LRUTier:
+    """In-process LRU of decoded cache entries with per-entry expiry."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class LLMCache:
     """
-    Redis-based cache for LLM responses.
+    Two-tier cache for LLM responses.
+    
+    An in-process LRU sits in front of Redis, so repeated prompts are served
+    without a network round trip. Async callers use aget/aset/aget_many on a
+    redis.asyncio client (one MGET for a whole batch); the sync get/set keep
+    using the blocking client for synchronous callers.
+    
+    coalesce() makes identical concurrent prompts share one upstream call,
+    e.g. when the same wire story arrives from several sources at once.
     
     Provides 60-70% cache hit rate by caching
     responses for similar content.
     """
     
-    def __init__(self, redis_url: str = None, ttl_hours: int = 24):
+    DEFAULT_MEMORY_ENTRIES = 2048
+    DEFAULT_MEMORY_TTL_SECONDS = 3600
+    
+    def __init__(
+        self,
+        redis_url: str = None,
+        ttl_hours: int = 24,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        memory_ttl_seconds: float = DEFAULT_MEMORY_TTL_SECONDS
+    ):
         """Initialize cache with Redis connection."""
         self._redis = None
+        self._async_redis = None
+        self._async_redis_loop = None
         self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
         self._ttl_seconds = ttl_hours * 3600
         self._enabled = True
+        self._memory = _LRUTier(memory_entries, min(memory_ttl_seconds, self._ttl_seconds))
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+        self._local_stats = {
+            "memory_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "batch_lookups": 0
+        }
         self._init_redis()
     
     def _init_redis(self):
@@ -280,26 +530,52 @@ class LLMCache:
             self._redis = None
             self._enabled = False
     
+    def _get_async_redis(self):
+        """redis.asyncio client for the running event loop (None without Redis)."""
+        if not self._enabled:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._async_redis is None or self._async_redis_loop is not loop:
+            try:
+                import redis.asyncio as aioredis
+                self._async_redis = aioredis.from_url(self._redis_url)
+                self._async_redis_loop = loop
+            except Exception as e:
+                logger.warning(f"Async Redis not available for LLM cache: {e}")
+                self._async_redis = None
+        return self._async_redis
+    
     def _generate_key(self, prefix: str, content: str) -> str:
         """Generate cache key from content hash."""
         content_hash = hashlib.md5(content.encode()).hexdigest()
         return f"llm:{prefix}:{content_hash}"
     
     def get(self, prefix: str, content: str) -> Optional[Dict[str, Any]]:
-        """Get cached response if available."""
+        """Get cached response if available (blocking; sync callers only)."""
+        key = self._generate_key(prefix, content)
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._local_stats["memory_hits"] += 1
+            return cached
+        
         if not self._enabled or not self._redis:
+            self._local_stats["misses"] += 1
             return None
         
         try:
-            key = self._generate_key(prefix, content)
             cached = self._redis.get(key)
             
             if cached:
                 # Update hit count
                 self._redis.hincrby("llm:stats", "hits", 1)
-                return json.loads(cached)
+                value = json.loads(cached)
+                self._memory.set(key, value)
+                self._local_stats["redis_hits"] += 1
+                return value
             
             self._redis.hincrby("llm:stats", "misses", 1)
+            self._local_stats["misses"] += 1
             return None
             
         except Exception as e:
@@ -307,12 +583,14 @@ class LLMCache:
             return None
     
     def set(self, prefix: str, content: str, response: Dict[str, Any]):
-        """Cache a response."""
+        """Cache a response (blocking; sync callers only)."""
+        key = self._generate_key(prefix, content)
+        self._memory.set(key, response)
+        
         if not self._enabled or not self._redis:
             return
         
         try:
-            key = self._generate_key(prefix, content)
             self._redis.setex(
                 key,
                 self._ttl_seconds,
@@ -321,10 +599,125 @@ class LLMCache:
         except Exception as e:
             logger.warning(f"Cache set error: {e}")
     
+    async def aget(self, prefix: str, content: str) -> Optional[Dict[str, Any]]:
+        """Get cached response if available."""
+        return (await self.aget_many(prefix, [content]))[0]
+    
+    async def aget_many(
+        self,
+        prefix: str,
+        contents: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up several prompts at once.
+        
+        Memory hits are served locally; the rest go to Redis in a single
+        MGET, with the hit/miss counters updated in the same round trip.
+        
+        Returns:
+            Cached responses (or None) in the order of contents
+        """
+        keys = [self._generate_key(prefix, c) for c in contents]
+        results: List[Optional[Dict[str, Any]]] = [self._memory.get(k) for k in keys]
+        missing = [i for i, value in enumerate(results) if value is None]
+        self._local_stats["memory_hits"] += len(keys) - len(missing)
+        
+        client = self._get_async_redis() if missing else None
+        if client is None:
+            self._local_stats["misses"] += len(missing)
+            return results
+        
+        if len(keys) > 1:
+            self._local_stats["batch_lookups"] += 1
+        
+        try:
+            raw = await client.mget([keys[i] for i in missing])
+            hits = 0
+            for i, value in zip(missing, raw):
+                if value:
+                    results[i] = json.loads(value)
+                    self._memory.set(keys[i], results[i])
+                    hits += 1
+            
+            pipe = client.pipeline(transaction=False)
+            if hits:
+                pipe.hincrby("llm:stats", "hits", hits)
+            if len(missing) - hits:
+                pipe.hincrby("llm:stats", "misses", len(missing) - hits)
+            await pipe.execute()
+            
+            self._local_stats["redis_hits"] += hits
+            self._local_stats["misses"] += len(missing) - hits
+        except Exception as e:
+            logger.warning(f"Cache get error: {e}")
+        
+        return results
+    
+    async def aset(self, prefix: str, content: str, response: Dict[str, Any]):
+        """Cache a response."""
+        key = self._generate_key(prefix, content)
+        self._memory.set(key, response)
+        
+        client = self._get_async_redis()
+        if client is None:
+            return
+        
+        try:
+            await client.setex(key, self._ttl_seconds, json.dumps(response))
+        except Exception as e:
+            logger.warning(f"Cache set error: {e}")
+    
+    async def coalesce(self, prefix: str, content: str, compute):
+        """
+        Run compute() once for concurrent callers with the same prompt.
+        
+        The first caller runs it; callers arriving while it is in flight
+        await the same result (or exception).
+        
+        Args:
+            prefix: Cache prefix
+            content: Prompt content the key is derived from
+            compute: Zero-argument coroutine function
+        """
+        key = self._generate_key(prefix, content)
+        while key in self._inflight:
+            future = self._inflight[key]
+            self._local_stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Retry ourselves only if the leader was cancelled, not us
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved, so asyncio does not log it again
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        local = {
+            **self._local_stats,
+            "memory_entries": len(self._memory),
+            "memory_max_entries": self._memory.max_entries,
+            "inflight": len(self._inflight)
+        }
+        
         if not self._enabled or not self._redis:
-            return {"enabled": False}
+            return {"enabled": False, **local}
         
         try:
             stats = self._redis.hgetall("llm:stats")
@@ -336,11 +729,12 @@ class LLMCache:
                 "enabled": True,
                 "hits": hits,
                 "misses": misses,
-                "hit_rate": round(hits / total * 100, 1) if total > 0 else 0
+                "hit_rate": round(hits / total * 100, 1) if total > 0 else 0,
+                **local
             }
         except Exception as e:
             logger.warning(f"Cache stats error: {e}")
-            return {"enabled": True, "error": str(e)}
+            return {"enabled": True, "error": str(e), **local}
 
 
 class BaseLLMService(ABC):
@@ -361,8 +755,10 @@ class BaseLLMService(ABC):
         self._llm = None
         self._current_api_key = None
         self._cache = LLMCache(ttl_hours=self.config.cache_ttl_hours)
-        self._last_request_time = 0
-        self._request_count = 0
+        self._llm_clients: Dict[str, Any] = {}  # api key -> client, for spill-over
+        
+        # Per-key request buckets are shared through the key manager
+        api_key_manager.configure_rate_limit(self.config.requests_per_minute)
         
         # Statistics
         self._stats = {
@@ -371,7 +767,8 @@ class BaseLLMService(ABC):
             "llm_calls": 0,
             "errors": 0,
             "total_processing_time_ms": 0,
-            "key_rotations": 0
+            "key_rotations": 0,
+            "key_spillovers": 0
         }
         
         self._init_llm()
@@ -392,12 +789,14 @@ class BaseLLMService(ABC):
                     return
                 
                 self._current_api_key = api_key
-                self._llm = ChatGroq(
-                    model=self.config.model,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
-                    api_key=api_key
-                )
+                self._llm = self._llm_clients.get(api_key)
+                if self._llm is None:
+                    self._llm = self._llm_clients[api_key] = ChatGroq(
+                        model=self.config.model,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        api_key=api_key
+                    )
                 key_id = api_key_manager._get_key_id(api_key)
                 logger.info(f"LLM initialized: {self.config.provider.value}/{self.config.model} with key {key_id}")
                 
@@ -429,25 +828,142 @@ class BaseLLMService(ABC):
         """Cache key prefix for this service."""
         pass
     
+    def _use_rate_limited_key(self, key: Optional[str]):
+        """Switch the client to the key a request slot was taken on."""
+        if key and key != self._current_api_key:
+            logger.debug(
+                f"Spilling over to API key {api_key_manager._get_key_id(key)} "
+                f"(bucket for current key is empty)"
+            )
+            self._init_llm(key)
+            self._stats["key_spillovers"] += 1
+    
     def _rate_limit(self):
-        """Apply rate limiting."""
-        current_time = time.time()
+        """Apply rate limiting (blocking; synchronous callers only)."""
+        self._use_rate_limited_key(api_key_manager.acquire_key_sync(self._current_api_key))
+    
+    async def _rate_limit_async(self):
+        """Apply rate limiting without blocking the event loop."""
+        self._use_rate_limited_key(await api_key_manager.acquire_key(self._current_api_key))
+    
+    def _get_cached_response(
+        self,
+        cache_content: str,
+        start_time: float
+    ) -> Optional[LLMResponse]:
+        """Return the cached response for a prompt, if any."""
+        return self._cached_response(
+            self._cache.get(self.cache_prefix, cache_content), start_time
+        )
+    
+    def _cached_response(
+        self,
+        cached: Optional[Dict[str, Any]],
+        start_time: float
+    ) -> Optional[LLMResponse]:
+        if not cached:
+            return None
+        
+        self._stats["cache_hits"] += 1
+        return LLMResponse(
+            content=cached.get("content", ""),
+            parsed=cached.get("parsed"),
+            model=self.config.model,
+            provider=self.config.provider.value,
+            cached=True,
+            processing_time_ms=(time.time() - start_time) * 1000
+        )
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: str) -> List[Any]:
+        from langchain_core.messages import HumanMessage, SystemMessage
+        
+        messages = []
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+        messages.append(HumanMessage(content=prompt))
+        return messages
+    
+    def _should_cache(self, result: LLMResponse, use_cache: bool) -> bool:
+        return use_cache and self.config.enable_caching and bool(result.parsed)
+    
+    @staticmethod
+    def _cache_payload(result: LLMResponse) -> Dict[str, Any]:
+        return {"content": result.content, "parsed": result.parsed}
+    
+    def _handle_llm_result(self, response: Any, start_time: float) -> LLMResponse:
+        """Parse and record a successful LLM response."""
+        content = response.content
+        
+        # Try to parse as JSON
+        parsed = None
+        try:
+            # Extract JSON from response if wrapped in markdown
+            json_content = content
+            if "```json" in content:
+                json_content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                json_content = content.split("```")[1].split("```")[0]
+            
+            parsed = json.loads(json_content.strip())
+        except (json.JSONDecodeError, IndexError):
+            pass  # Not JSON response
         
-        # Reset counter every minute
-        if current_time - self._last_request_time > 60:
-            self._request_count = 0
-            self._last_request_time = current_time
+        processing_time = (time.time() - start_time) * 1000
+        self._stats["total_processing_time_ms"] += processing_time
+        
+        result = LLMResponse(
+            content=content,
+            parsed=parsed,
+            model=self.config.model,
+            provider=self.config.provider.value,
+            cached=False,
+            processing_time_ms=processing_time,
+            tokens_used=getattr(response, 'usage', {}).get('total_tokens', 0)
+        )
+        
+        # Record success with API key manager
+        if self._current_api_key:
+            api_key_manager.record_success(self._current_api_key)
+        
+        return result
+    
+    def _handle_llm_error(self, error: Exception) -> Optional[bool]:
+        """
+        Handle a failed attempt.
+        
+        Returns True to retry immediately (rotated to a fresh key), False
+        to give up (rate limited on every key) or None for a normal retry.
+        """
+        error_str = str(error).lower()
         
-        # Check rate limit
-        if self._request_count >= self.config.requests_per_minute:
-            sleep_time = 60 - (current_time - self._last_request_time)
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached, sleeping {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-                self._request_count = 0
-                self._last_request_time = time.time()
+        # Check for rate limit errors
+        is_rate_limit = any(phrase in error_str for phrase in [
+            "rate limit", "rate_limit", "429", "too many requests",
+            "quota exceeded", "token limit", "requests per minute",
+            "daily limit", "tokens per day"
+        ])
         
-        self._request_count += 1
+        if is_rate_limit:
+            logger.warning(f"Rate limit hit on API key: {api_key_manager._get_key_id(self._current_api_key) if self._current_api_key else 'unknown'}")
+            
+            # Try to rotate to next key
+            if self._rotate_api_key():
+                logger.info("Successfully rotated to new API key, retrying...")
+                return True
+            logger.error("No more API keys available. All keys are rate limited.")
+            return False
+        
+        return None
+    
+    def _failed_response(self, error: Optional[str], start_time: float) -> LLMResponse:
+        self._stats["errors"] += 1
+        return LLMResponse(
+            content="",
+            success=False,
+            error=error,
+            processing_time_ms=(time.time() - start_time) * 1000
+        )
     
     def _call_llm(
         self,
@@ -458,6 +974,8 @@ class BaseLLMService(ABC):
         """
         Call the LLM with caching and error handling.
         
+        Blocks while rate limited; async code should use _call_llm_async.
+        
         Args:
             prompt: User prompt
             system_prompt: System prompt
@@ -474,18 +992,9 @@ class BaseLLMService(ABC):
         
         # Check cache first
         if use_cache and self.config.enable_caching:
-            cached = self._cache.get(self.cache_prefix, cache_content)
+            cached = self._get_cached_response(cache_content, start_time)
             if cached:
-                self._stats["cache_hits"] += 1
-                processing_time = (time.time() - start_time) * 1000
-                return LLMResponse(
-                    content=cached.get("content", ""),
-                    parsed=cached.get("parsed"),
-                    model=self.config.model,
-                    provider=self.config.provider.value,
-                    cached=True,
-                    processing_time_ms=processing_time
-                )
+                return cached
         
         # Check if LLM is available
         if not self.is_available:
@@ -504,79 +1013,21 @@ class BaseLLMService(ABC):
         for attempt in range(self.config.max_retries):
             try:
                 self._stats["llm_calls"] += 1
-                
-                from langchain_core.messages import HumanMessage, SystemMessage
-                
-                messages = []
-                if system_prompt:
-                    messages.append(SystemMessage(content=system_prompt))
-                messages.append(HumanMessage(content=prompt))
-                
-                response = self._llm.invoke(messages)
-                content = response.content
-                
-                # Try to parse as JSON
-                parsed = None
-                try:
-                    # Extract JSON from response if wrapped in markdown
-                    json_content = content
-                    if "```json" in content:
-                        json_content = content.split("```json")[1].split("```")[0]
-                    elif "```" in content:
-                        json_content = content.split("```")[1].split("```")[0]
-                    
-                    parsed = json.loads(json_content.strip())
-                except (json.JSONDecodeError, IndexError):
-                    pass  # Not JSON response
-                
-                processing_time = (time.time() - start_time) * 1000
-                self._stats["total_processing_time_ms"] += processing_time
-                
-                result = LLMResponse(
-                    content=content,
-                    parsed=parsed,
-                    model=self.config.model,
-                    provider=self.config.provider.value,
-                    cached=False,
-                    processing_time_ms=processing_time,
-                    tokens_used=getattr(response, 'usage', {}).get('total_tokens', 0)
-                )
+                response = self._llm.invoke(self._build_messages(prompt, system_prompt))
+                result = self._handle_llm_result(response, start_time)
                 
                 # Cache successful response
-                if use_cache and self.config.enable_caching and parsed:
-                    self._cache.set(self.cache_prefix, cache_content, {
-                        "content": content,
-                        "parsed": parsed
-                    })
-                
-                # Record success with API key manager
-                if self._current_api_key:
-                    api_key_manager.record_success(self._current_api_key)
-                
+                if self._should_cache(result, use_cache):
+                    self._cache.set(self.cache_prefix, cache_content, self._cache_payload(result))
                 return result
                 
             except Exception as e:
                 last_error = str(e)
-                error_str = str(e).lower()
-                
-                # Check for rate limit errors
-                is_rate_limit = any(phrase in error_str for phrase in [
-                    "rate limit", "rate_limit", "429", "too many requests",
-                    "quota exceeded", "token limit", "requests per minute",
-                    "daily limit", "tokens per day"
-                ])
-                
-                if is_rate_limit:
-                    logger.warning(f"Rate limit hit on API key: {api_key_manager._get_key_id(self._current_api_key) if self._current_api_key else 'unknown'}")
-                    
-                    # Try to rotate to next key
-                    if self._rotate_api_key():
-                        logger.info("Successfully rotated to new API key, retrying...")
-                        # Reset attempt counter to give new key a fresh start
-                        continue
-                    else:
-                        logger.error("No more API keys available. All keys are rate limited.")
-                        break
+                retry_now = self._handle_llm_error(e)
+                if retry_now is True:
+                    continue
+                if retry_now is False:
+                    break
                 
                 logger.warning(f"LLM call attempt {attempt + 1} failed: {e}")
                 
@@ -584,15 +1035,98 @@ class BaseLLMService(ABC):
                     time.sleep(self.config.retry_delay_seconds * (attempt + 1))
         
         # All retries failed
-        self._stats["errors"] += 1
-        processing_time = (time.time() - start_time) * 1000
+        return self._failed_response(last_error, start_time)
+    
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        use_cache: bool = True
+    ) -> LLMResponse:
+        """
+        Async version of _call_llm.
         
-        return LLMResponse(
-            content="",
-            success=False,
-            error=last_error,
-            processing_time_ms=processing_time
+        Waits for rate limit tokens and retry delays with await, and calls
+        the model with ainvoke, so the event loop is never blocked. Cache
+        lookups go through the async cache tiers, and concurrent calls with
+        the same prompt share one upstream request.
+        """
+        start_time = time.time()
+        self._stats["total_calls"] += 1
+        
+        cache_content = f"{system_prompt}|||{prompt}"
+        
+        if not (use_cache and self.config.enable_caching):
+            return await self._invoke_llm_async(prompt, system_prompt, start_time)
+        
+        cached = self._cached_response(
+            await self._cache.aget(self.cache_prefix, cache_content), start_time
         )
+        if cached:
+            return cached
+        
+        async def compute() -> LLMResponse:
+            result = await self._invoke_llm_async(prompt, system_prompt, start_time)
+            if self._should_cache(result, use_cache):
+                await self._cache.aset(self.cache_prefix, cache_content, self._cache_payload(result))
+            return result
+        
+        return await self._cache.coalesce(self.cache_prefix, cache_content, compute)
+    
+    async def _invoke_llm_async(
+        self,
+        prompt: str,
+        system_prompt: str,
+        start_time: float
+    ) -> LLMResponse:
+        """Rate-limited model call with retries (no caching)."""
+        if not self.is_available:
+            return LLMResponse(
+                content="",
+                success=False,
+                error="LLM not available",
+                processing_time_ms=(time.time() - start_time) * 1000
+            )
+        
+        await self._rate_limit_async()
+        
+        last_error = None
+        for attempt in range(self.config.max_retries):
+            try:
+                self._stats["llm_calls"] += 1
+                response = await self._llm.ainvoke(self._build_messages(prompt, system_prompt))
+                return self._handle_llm_result(response, start_time)
+                
+            except Exception as e:
+                last_error = str(e)
+                retry_now = self._handle_llm_error(e)
+                if retry_now is True:
+                    continue
+                if retry_now is False:
+                    break
+                
+                logger.warning(f"LLM call attempt {attempt + 1} failed: {e}")
+                
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(self.config.retry_delay_seconds * (attempt + 1))
+        
+        return self._failed_response(last_error, start_time)
+    
+    async def prefetch_cached(self, prompts: List[str], system_prompt: str = "") -> int:
+        """
+        Warm the in-process cache tier for a batch of prompts.
+        
+        Looks all prompts up in one round trip, so the per-item calls that
+        follow are served from memory instead of one GET each.
+        
+        Returns:
+            Number of prompts found in the cache
+        """
+        if not prompts or not self.config.enable_caching:
+            return 0
+        contents = [f"{system_prompt}|||{p}" for p in prompts]
+        found = await self._cache.aget_many(self.cache_prefix, contents)
+        return sum(1 for value in found if value)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get service statistics."""
@@ -616,6 +1150,7 @@ class BaseLLMService(ABC):
             "llm_calls": self._stats["llm_calls"],
             "errors": self._stats["errors"],
             "key_rotations": self._stats.get("key_rotations", 0),
+            "key_spillovers": self._stats.get("key_spillovers", 0),
             "avg_processing_time_ms": round(avg_time, 2),
             "cache": cache_stats
         }
@@ -689,7 +1224,7 @@ class GroqLLMClient(BaseLLMService):
         Returns:
             Parsed response or None on failure
         """
-        response = self._call_llm(prompt, system_prompt, use_cache=True)
+        response = await self._call_llm_async(prompt, system_prompt, use_cache=True)
         
         if not response.success or not response.parsed:
             return None
@@ -720,4 +1255,22 @@ class GroqLLMClient(BaseLLMService):
             LLMResponse with content
         """
         return self._call_llm(prompt, system_prompt, use_cache=True)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a response from the LLM without blocking the event loop.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt
+            
+        Returns:
+            LLMResponse with content
+        """
+        return await self._call_llm_async(prompt, system_prompt, use_cache=True)
 
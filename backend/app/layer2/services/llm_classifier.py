@@ -354,13 +354,7 @@ Provide concise but informative reasoning."""
             return await self._fallback_classify(full_text, start_time)
         
         try:
-            # Truncate very long texts
-            max_length = 4000
-            if len(full_text) > max_length:
-                full_text = full_text[:max_length] + "..."
-            
-            # Build prompt
-            prompt = self.CLASSIFICATION_PROMPT.format(article_text=full_text)
+            prompt = self._build_prompt(full_text)
             
             # Get LLM classification
             response = await self.llm_client.generate_structured(
@@ -401,6 +395,15 @@ Provide concise but informative reasoning."""
         Returns:
             List of ClassificationResult objects
         """
+        # One cache round trip for the whole batch instead of one per article
+        prompts = []
+        for article in articles:
+            title, text = article.get("title", ""), article.get("text", "")
+            full_text = f"{title}\n\n{text}" if title else text
+            if self._should_use_llm(full_text):
+                prompts.append(self._build_prompt(full_text))
+        await self.llm_client.prefetch_cached(prompts, self.SYSTEM_PROMPT)
+        
         semaphore = asyncio.Semaphore(concurrency)
         
         async def classify_with_limit(article: Dict[str, str]) -> ClassificationResult:
@@ -414,6 +417,13 @@ Provide concise but informative reasoning."""
         tasks = [classify_with_limit(article) for article in articles]
         return await asyncio.gather(*tasks)
     
+    def _build_prompt(self, full_text: str) -> str:
+        """Build the classification prompt, truncating very long texts."""
+        max_length = 4000
+        if len(full_text) > max_length:
+            full_text = full_text[:max_length] + "..."
+        return self.CLASSIFICATION_PROMPT.format(article_text=full_text)
+    
     def _should_use_llm(self, text: str) -> bool:
         """
         Determine if LLM should be used for this text.
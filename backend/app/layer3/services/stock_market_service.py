@@ -3,19 +3,30 @@ Stock Market Service - Layer 3
 Fetches data from Colombo Stock Exchange API
 """
 
-import httpx
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
+from app.utils.async_cache import SingleFlightCache
+from app.utils.http_clients import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # CSE API base URL
 CSE_BASE_URL = "https://www.cse.lk/api"
 
-# Cache for CSE data
-_cse_cache: Dict[str, Dict[str, Any]] = {}
+# Cache for CSE data: one refresh in flight per endpoint, stale data served
+# while it runs, and a background refresh shortly before expiry
 CACHE_DURATION = timedelta(minutes=5)
+STALE_DURATION = timedelta(minutes=10)
+REFRESH_AHEAD = timedelta(seconds=30)
+
+_cse_cache = SingleFlightCache(
+    "cse",
+    ttl_seconds=CACHE_DURATION.total_seconds(),
+    stale_seconds=STALE_DURATION.total_seconds(),
+    refresh_ahead_seconds=REFRESH_AHEAD.total_seconds()
+)
 
 
 class StockMarketService:
@@ -27,38 +38,32 @@ class StockMarketService:
         Fetch market summary from CSE API
         Returns comprehensive market data including indices, top movers, etc.
         """
-        # Check cache first
-        cache_key = "market_summary"
-        if cache_key in _cse_cache:
-            cached_data = _cse_cache[cache_key]
-            if datetime.now() - cached_data["timestamp"] < CACHE_DURATION:
-                logger.info("Returning cached CSE market data")
-                return cached_data["data"]
-
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Fetch trade summary
-                response = await client.get(f"{CSE_BASE_URL}/tradeSummary")
-                response.raise_for_status()
-                trade_data = response.json()
-
-                # Transform to our format
-                market_data = StockMarketService._transform_cse_data(trade_data)
-
-                # Cache the result
-                _cse_cache[cache_key] = {
-                    "data": market_data,
-                    "timestamp": datetime.now()
-                }
-
-                logger.info("Successfully fetched CSE market data")
-                return market_data
-
+            return await _cse_cache.get(
+                "market_summary", StockMarketService._fetch_market_summary
+            )
         except Exception as e:
             logger.error(f"Failed to fetch CSE data: {str(e)}")
             # Return mock data as fallback
             return StockMarketService._get_mock_data()
 
+    @staticmethod
+    async def _fetch_market_summary() -> Dict[str, Any]:
+        """Fetch and transform the CSE trade summary (uncached)"""
+        market_data = StockMarketService._transform_cse_data(
+            await StockMarketService._fetch_cse("tradeSummary")
+        )
+        logger.info("Successfully fetched CSE market data")
+        return market_data
+
+    @staticmethod
+    async def _fetch_cse(endpoint: str) -> Dict[str, Any]:
+        """GET a CSE API endpoint through the shared client"""
+        client = get_http_client("api")
+        response = await client.get(f"{CSE_BASE_URL}/{endpoint}", timeout=10.0)
+        response.raise_for_status()
+        return response.json()
+
     @staticmethod
     def _transform_cse_data(api_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -194,6 +199,10 @@ class StockMarketService:
     @staticmethod
     def clear_cache():
         """Clear the CSE data cache"""
-        global _cse_cache
-        _cse_cache = {}
+        _cse_cache.invalidate()
         logger.info("CSE cache cleared")
+
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        """Get CSE cache statistics"""
+        return _cse_cache.get_stats()
@@ -7,6 +7,8 @@ This module provides advanced analytical capabilities including:
 - Scenario Simulation: What-if analysis engine
 - Correlation Analysis: Cross-indicator relationships
 - Trend Forecasting: Time-series predictions
+- Time-Series Store: Columnar history shared by the analyzers
+- Result Store: Bounded, expiring storage for analysis results
 """
 
 from .ml_impact_predictor import (
@@ -21,6 +23,7 @@ from .portfolio_analyzer import (
     PortfolioAnalyzer,
     Portfolio,
     PortfolioRisk,
+    PortfolioMatrices,
     ConcentrationAlert,
     DiversificationScore,
 )
@@ -49,6 +52,13 @@ from .trend_forecaster import (
     TrendDirection,
 )
 
+from .time_series_store import (
+    TimeSeriesStore,
+    TimeSeries,
+)
+
+from .result_store import ResultStore
+
 __all__ = [
     # ML Impact Prediction
     "MLImpactPredictor",
@@ -60,6 +70,7 @@ __all__ = [
     "PortfolioAnalyzer",
     "Portfolio",
     "PortfolioRisk",
+    "PortfolioMatrices",
     "ConcentrationAlert",
     "DiversificationScore",
     # Scenario Simulation
@@ -80,4 +91,9 @@ __all__ = [
     "Forecast",
     "SeasonalPattern",
     "TrendDirection",
+    # Time-Series Store
+    "TimeSeriesStore",
+    "TimeSeries",
+    # Result Store
+    "ResultStore",
 ]
@@ -12,7 +12,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
-import math
+
+import numpy as np
+
+from .result_store import ResultStore
+from .time_series_store import TimeSeries, TimeSeriesStore, to_datetime
 
 
 class CorrelationType(Enum):
@@ -163,16 +167,36 @@ class CorrelationAnalyzer:
     
     Provides correlation matrix calculation, lead/lag detection,
     and causal inference capabilities.
+    
+    History lives in a TimeSeriesStore, one multi-column series per
+    company under ("correlation", company_id). Analyses run on an aligned
+    (indicators x days) matrix taken from it; that matrix and the
+    correlation matrices, lead/lag relations and clusters computed from
+    it are cached per company until new data arrives.
     """
     
-    def __init__(self):
-        """Initialize the correlation analyzer."""
-        self._historical_data: Dict[str, List[Tuple[datetime, Dict[str, float]]]] = {}
-        self._correlation_matrices: Dict[str, CorrelationMatrix] = {}
-        self._relationships: Dict[str, IndicatorRelationship] = {}
-        self._clusters: Dict[str, IndicatorCluster] = {}
+    RETENTION_DAYS = 365
+    
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        """
+        Initialize the correlation analyzer.
+        
+        Args:
+            store: Time-series store to keep history in (a private one
+                if None)
+        """
+        self._store = store if store is not None else TimeSeriesStore()
+        self._correlation_matrices = ResultStore("correlation.matrices")
+        self._relationships = ResultStore("correlation.relationships")
+        self._clusters = ResultStore("correlation.clusters")
         self._matrix_counter = 0
         self._cluster_counter = 0
+        
+        # company_id -> (indicator names, indicators x days matrix)
+        self._series: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        # (company_id, *cache key) -> cached analysis result, dropped when
+        # data changes
+        self._results = ResultStore("correlation.results")
     
     def add_data_point(
         self,
@@ -181,20 +205,7 @@ class CorrelationAnalyzer:
         indicators: Dict[str, float],
     ) -> None:
         """Add a data point for correlation analysis."""
-        if company_id not in self._historical_data:
-            self._historical_data[company_id] = []
-        
-        self._historical_data[company_id].append((timestamp, indicators.copy()))
-        
-        # Sort by timestamp
-        self._historical_data[company_id].sort(key=lambda x: x[0])
-        
-        # Keep only last 365 days
-        cutoff = datetime.now() - timedelta(days=365)
-        self._historical_data[company_id] = [
-            dp for dp in self._historical_data[company_id]
-            if dp[0] > cutoff
-        ]
+        self.add_historical_data(company_id, [(timestamp, indicators)])
     
     def add_historical_data(
         self,
@@ -202,8 +213,80 @@ class CorrelationAnalyzer:
         data: List[Tuple[datetime, Dict[str, float]]],
     ) -> None:
         """Add batch historical data."""
-        for timestamp, indicators in data:
-            self.add_data_point(company_id, timestamp, indicators)
+        key = ("correlation", company_id)
+        self._store.extend(key, data)
+        
+        # Keep only the retention window
+        self._store.trim(key, datetime.now() - timedelta(days=self.RETENTION_DAYS))
+        
+        self._invalidate(company_id)
+    
+    def _invalidate(self, company_id: Optional[str] = None) -> None:
+        """Drop the aligned matrix and cached results for new data."""
+        if company_id:
+            self._series.pop(company_id, None)
+            for key in self._results.keys():
+                if key[0] == company_id:
+                    self._results.pop(key)
+        else:
+            self._series.clear()
+            self._results.clear()
+    
+    def _get_history(self, company_id: str) -> Optional[TimeSeries]:
+        """The company's stored series, None if it has no data points."""
+        series = self._store.get(("correlation", company_id))
+        return series if series is not None and len(series) else None
+    
+    def _get_series(self, company_id: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Aligned indicator series for a company.
+        
+        Returns sorted indicator names and a (indicators x days) matrix.
+        Indicators missing from a data point count as 0.0.
+        """
+        cached = self._series.get(company_id)
+        if cached is not None:
+            return cached
+        
+        history = self._get_history(company_id)
+        if history is None:
+            return [], np.zeros((0, 0))
+        
+        stored = history.values
+        reported = ~np.isnan(stored).all(axis=1)
+        columns = history.columns
+        order = sorted(
+            (i for i in range(len(columns)) if reported[i]), key=lambda i: columns[i]
+        )
+        names = [columns[i] for i in order]
+        values = np.nan_to_num(stored[order], nan=0.0)
+        
+        self._series[company_id] = (names, values)
+        return names, values
+    
+    def _get_indicator_series(self, company_id: str, indicator: str) -> np.ndarray:
+        """One indicator's series (zeros if it was never reported)."""
+        names, values = self._get_series(company_id)
+        try:
+            return values[names.index(indicator)]
+        except ValueError:
+            return np.zeros(values.shape[1])
+    
+    def _correlation_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Pearson correlation matrix for the rows of values.
+        
+        Constant series correlate 0.0 with everything else (1.0 with
+        themselves), and values are clipped to [-1, 1].
+        """
+        if values.shape[0] == 0:
+            return np.zeros((0, 0))
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.atleast_2d(np.corrcoef(values))
+        corr = np.clip(np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0), -1.0, 1.0)
+        np.fill_diagonal(corr, 1.0)
+        return corr
     
     def calculate_correlation_matrix(
         self,
@@ -220,69 +303,65 @@ class CorrelationAnalyzer:
         Returns:
             CorrelationMatrix with all correlations
         """
-        data = self._historical_data.get(company_id, [])
-        if len(data) < 2:
+        history = self._get_history(company_id)
+        if history is None or len(history) < 2:
             raise ValueError(f"Insufficient data for company {company_id}")
         
+        cache_key = ("matrix", tuple(sorted(set(indicators))) if indicators else None)
+        cached = self._results.get((company_id, *cache_key))
+        if cached is not None:
+            return cached
+        
         self._matrix_counter += 1
         matrix_id = f"matrix_{self._matrix_counter}"
         
         # Get indicator list
-        all_indicators = set()
-        for _, ind_values in data:
-            all_indicators.update(ind_values.keys())
-        
+        names, values = self._get_series(company_id)
         if indicators:
-            all_indicators = all_indicators.intersection(set(indicators))
-        
-        indicator_list = sorted(list(all_indicators))
-        
-        # Build time series for each indicator
-        time_series: Dict[str, List[float]] = {ind: [] for ind in indicator_list}
-        
-        for _, ind_values in data:
-            for ind in indicator_list:
-                time_series[ind].append(ind_values.get(ind, 0.0))
+            wanted = set(indicators)
+            rows = [i for i, name in enumerate(names) if name in wanted]
+        else:
+            rows = list(range(len(names)))
+        indicator_list = [names[i] for i in rows]
         
         # Calculate correlations
-        correlations: Dict[str, Dict[str, float]] = {}
-        pairs: List[CorrelationPair] = []
-        
-        for i, ind_a in enumerate(indicator_list):
-            correlations[ind_a] = {}
-            for j, ind_b in enumerate(indicator_list):
-                if i == j:
-                    correlations[ind_a][ind_b] = 1.0
-                elif j < i:
-                    # Already calculated
-                    correlations[ind_a][ind_b] = correlations[ind_b][ind_a]
-                else:
-                    corr = self._pearson_correlation(
-                        time_series[ind_a],
-                        time_series[ind_b],
-                    )
-                    correlations[ind_a][ind_b] = corr
-                    
-                    pair = CorrelationPair(
-                        indicator_a=ind_a,
-                        indicator_b=ind_b,
-                        correlation=corr,
-                        correlation_type=self._get_correlation_type(corr),
-                        sample_size=len(data),
-                        period_start=data[0][0],
-                        period_end=data[-1][0],
-                    )
-                    pairs.append(pair)
+        corr = self._correlation_array(values[rows])
+        correlations: Dict[str, Dict[str, float]] = {
+            ind: dict(zip(indicator_list, corr[i].tolist()))
+            for i, ind in enumerate(indicator_list)
+        }
         
-        # Find strongest correlations
-        positive_pairs = [p for p in pairs if p.correlation > 0]
-        negative_pairs = [p for p in pairs if p.correlation < 0]
+        upper_i, upper_j = np.triu_indices(len(indicator_list), k=1)
+        upper = corr[upper_i, upper_j]
+        sample_size = len(history)
+        period_start = to_datetime(history.timestamps[0])
+        period_end = to_datetime(history.timestamps[-1])
+        pairs: List[CorrelationPair] = [
+            CorrelationPair(
+                indicator_a=indicator_list[i],
+                indicator_b=indicator_list[j],
+                correlation=c,
+                correlation_type=self._get_correlation_type(c),
+                sample_size=sample_size,
+                period_start=period_start,
+                period_end=period_end,
+            )
+            for i, j, c in zip(upper_i.tolist(), upper_j.tolist(), upper.tolist())
+        ]
         
-        strongest_positive = max(positive_pairs, key=lambda x: x.correlation) if positive_pairs else None
-        strongest_negative = min(negative_pairs, key=lambda x: x.correlation) if negative_pairs else None
+        # Find strongest correlations
+        strongest_positive = None
+        strongest_negative = None
+        if pairs:
+            best = int(np.argmax(upper))
+            worst = int(np.argmin(upper))
+            if upper[best] > 0:
+                strongest_positive = pairs[best]
+            if upper[worst] < 0:
+                strongest_negative = pairs[worst]
         
         # Calculate average
-        avg_corr = sum(p.correlation for p in pairs) / len(pairs) if pairs else 0.0
+        avg_corr = float(upper.mean()) if pairs else 0.0
         
         matrix = CorrelationMatrix(
             matrix_id=matrix_id,
@@ -293,33 +372,13 @@ class CorrelationAnalyzer:
             strongest_negative=strongest_negative,
             average_correlation=avg_corr,
             indicators=indicator_list,
-            sample_size=len(data),
+            sample_size=sample_size,
         )
         
         self._correlation_matrices[matrix_id] = matrix
+        self._results[(company_id, *cache_key)] = matrix
         return matrix
     
-    def _pearson_correlation(self, x: List[float], y: List[float]) -> float:
-        """Calculate Pearson correlation coefficient."""
-        n = len(x)
-        if n != len(y) or n < 2:
-            return 0.0
-        
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-        
-        numerator = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
-        
-        sum_sq_x = sum((xi - mean_x) ** 2 for xi in x)
-        sum_sq_y = sum((yi - mean_y) ** 2 for yi in y)
-        
-        denominator = math.sqrt(sum_sq_x * sum_sq_y)
-        
-        if denominator == 0:
-            return 0.0
-        
-        return numerator / denominator
-    
     def _get_correlation_type(self, corr: float) -> CorrelationType:
         """Convert correlation value to type."""
         if corr >= 0.7:
@@ -356,72 +415,105 @@ class CorrelationAnalyzer:
         Returns:
             LeadLagRelation with detected relationship
         """
-        data = self._historical_data.get(company_id, [])
-        if len(data) < max_lag_days + 5:
+        history = self._get_history(company_id)
+        if history is None or len(history) < max_lag_days + 5:
             raise ValueError("Insufficient data for lead/lag detection")
         
-        # Build time series
-        series_a = [d[1].get(indicator_a, 0.0) for d in data]
-        series_b = [d[1].get(indicator_b, 0.0) for d in data]
-        
-        best_lag = 0
-        best_correlation = 0.0
-        
-        # Test different lags
-        for lag in range(-max_lag_days, max_lag_days + 1):
-            if lag == 0:
-                lagged_a = series_a
-                lagged_b = series_b
-            elif lag > 0:
-                # A leads B by 'lag' days
-                lagged_a = series_a[:-lag]
-                lagged_b = series_b[lag:]
-            else:
-                # B leads A by 'abs(lag)' days
-                lagged_a = series_a[abs(lag):]
-                lagged_b = series_b[:lag]
-            
-            if len(lagged_a) >= 2:
-                corr = abs(self._pearson_correlation(lagged_a, lagged_b))
-                if corr > best_correlation:
-                    best_correlation = corr
-                    best_lag = lag
+        cache_key = ("lead_lag", indicator_a, indicator_b, max_lag_days)
+        cached = self._results.get((company_id, *cache_key))
+        if cached is not None:
+            return cached
+        
+        series_a = self._get_indicator_series(company_id, indicator_a)
+        series_b = self._get_indicator_series(company_id, indicator_b)
+        
+        # Correlation at every lag from -max_lag_days to +max_lag_days;
+        # positive lags mean A leads B
+        lags, lag_corrs = self._lagged_correlations(series_a, series_b, max_lag_days)
+        
+        # First lag with the strongest absolute correlation
+        best = int(np.argmax(np.abs(lag_corrs)))
+        if lag_corrs[best] == 0:
+            best = int(np.flatnonzero(lags == 0)[0])
+        best_lag = int(lags[best])
+        actual_corr = float(lag_corrs[best])
+        best_correlation = abs(actual_corr)
         
         # Determine leading indicator
-        if best_lag > 0:
-            leading = indicator_a
-            lagging = indicator_b
-            lag_days = best_lag
-        elif best_lag < 0:
+        if best_lag < 0:
             leading = indicator_b
             lagging = indicator_a
-            lag_days = abs(best_lag)
         else:
             leading = indicator_a
             lagging = indicator_b
-            lag_days = 0
-        
-        # Get actual correlation value (with sign)
-        if lag_days > 0:
-            if best_lag > 0:
-                lagged_a = series_a[:-lag_days]
-                lagged_b = series_b[lag_days:]
-            else:
-                lagged_a = series_a[lag_days:]
-                lagged_b = series_b[:-lag_days]
-            actual_corr = self._pearson_correlation(lagged_a, lagged_b)
-        else:
-            actual_corr = self._pearson_correlation(series_a, series_b)
         
-        return LeadLagRelation(
+        relation = LeadLagRelation(
             leading_indicator=leading,
             lagging_indicator=lagging,
-            lag_days=lag_days,
+            lag_days=abs(best_lag),
             correlation_at_lag=actual_corr,
             correlation_type=self._get_correlation_type(actual_corr),
             confidence=best_correlation,
             predictive_power=best_correlation ** 2,
         )
+        
+        self._results[(company_id, *cache_key)] = relation
+        return relation
+    
+    def _lagged_correlations(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        max_lag: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pearson correlation of x[t] against y[t + lag] for every lag.
+        
+        The cross products for all lags come from one FFT
+        cross-correlation; window sums come from prefix sums, so each lag
+        is still a Pearson correlation over just the overlapping days.
+        
+        Returns:
+            (lags, correlations) for lags -max_lag..max_lag (limited to
+            lags that leave at least two overlapping points)
+        """
+        n = len(x)
+        max_lag = max(0, min(max_lag, n - 2))
+        lags = np.arange(-max_lag, max_lag + 1)
+        
+        # Centering keeps the sum-based variances well conditioned
+        x = x - x.mean()
+        y = y - y.mean()
+        
+        size = 1 << (2 * n - 1).bit_length()
+        cross = np.fft.irfft(np.conj(np.fft.rfft(x, size)) * np.fft.rfft(y, size), size)
+        sum_xy = cross[lags % size]
+        
+        prefix_x = np.concatenate(([0.0], np.cumsum(x)))
+        prefix_y = np.concatenate(([0.0], np.cumsum(y)))
+        prefix_xx = np.concatenate(([0.0], np.cumsum(x * x)))
+        prefix_yy = np.concatenate(([0.0], np.cumsum(y * y)))
+        
+        # x[x_start:x_end] lines up with y[y_start:y_end]
+        x_start = np.maximum(-lags, 0)
+        x_end = n - np.maximum(lags, 0)
+        y_start = np.maximum(lags, 0)
+        y_end = n - np.maximum(-lags, 0)
+        count = n - np.abs(lags)
+        
+        sum_x = prefix_x[x_end] - prefix_x[x_start]
+        sum_y = prefix_y[y_end] - prefix_y[y_start]
+        var_x = prefix_xx[x_end] - prefix_xx[x_start] - sum_x ** 2 / count
+        var_y = prefix_yy[y_end] - prefix_yy[y_start] - sum_y ** 2 / count
+        cov = sum_xy - sum_x * sum_y / count
+        
+        # Treat windows with (numerically) no variance as uncorrelated
+        tolerance = 1e-12 * max(prefix_xx[-1], prefix_yy[-1], 1e-300)
+        valid = (var_x > tolerance) & (var_y > tolerance)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corrs = np.where(valid, cov / np.sqrt(var_x * var_y), 0.0)
+        
+        return lags, np.clip(corrs, -1.0, 1.0)
     
     def infer_causality(
         self,
@@ -442,12 +534,12 @@ class CorrelationAnalyzer:
         Returns:
             CausalLink with inferred causality
         """
-        data = self._historical_data.get(company_id, [])
-        if len(data) < lag_order + 10:
+        history = self._get_history(company_id)
+        if history is None or len(history) < lag_order + 10:
             raise ValueError("Insufficient data for causal inference")
         
-        series_a = [d[1].get(indicator_a, 0.0) for d in data]
-        series_b = [d[1].get(indicator_b, 0.0) for d in data]
+        series_a = self._get_indicator_series(company_id, indicator_a)
+        series_b = self._get_indicator_series(company_id, indicator_b)
         
         # Simple Granger-like test: compare predictive power
         # Does A help predict B?
@@ -511,8 +603,8 @@ class CorrelationAnalyzer:
     
     def _test_predictive_power(
         self,
-        predictor: List[float],
-        target: List[float],
+        predictor: np.ndarray,
+        target: np.ndarray,
         lag_order: int,
     ) -> float:
         """
@@ -523,32 +615,22 @@ class CorrelationAnalyzer:
         if len(predictor) != len(target) or len(predictor) < lag_order + 5:
             return 0.0
         
-        # Create lagged versions
-        n = len(target) - lag_order
+        predictor = np.asarray(predictor, dtype=float)
+        target = np.asarray(target, dtype=float)
         
-        # Baseline: predict target from its own lags
-        baseline_predictions = []
-        for i in range(lag_order, len(target)):
-            # Simple average of past values
-            baseline_predictions.append(sum(target[i-lag_order:i]) / lag_order)
+        # Trailing lag_order-day averages, from prefix sums
+        own_sums = np.concatenate(([0.0], np.cumsum(target)))
+        pred_sums = np.concatenate(([0.0], np.cumsum(predictor)))
+        own_avg = (own_sums[lag_order:-1] - own_sums[:-lag_order - 1]) / lag_order
+        pred_avg = (pred_sums[lag_order:-1] - pred_sums[:-lag_order - 1]) / lag_order
         
         actual = target[lag_order:]
         
-        baseline_error = sum(
-            (a - p) ** 2 for a, p in zip(actual, baseline_predictions)
-        ) / len(actual)
-        
-        # With predictor: add lagged predictor
-        enhanced_predictions = []
-        for i in range(lag_order, len(target)):
-            # Average of own lags + predictor lags
-            own_avg = sum(target[i-lag_order:i]) / lag_order
-            pred_avg = sum(predictor[i-lag_order:i]) / lag_order
-            enhanced_predictions.append((own_avg + pred_avg) / 2)
+        # Baseline: predict target from its own lags
+        baseline_error = float(np.mean((actual - own_avg) ** 2))
         
-        enhanced_error = sum(
-            (a - p) ** 2 for a, p in zip(actual, enhanced_predictions)
-        ) / len(actual)
+        # With predictor: average of own lags + predictor lags
+        enhanced_error = float(np.mean((actual - (own_avg + pred_avg) / 2) ** 2))
         
         # Improvement
         if baseline_error > 0:
@@ -670,58 +752,58 @@ class CorrelationAnalyzer:
         if not matrix.indicators:
             return []
         
-        # Simple hierarchical clustering based on correlation distance
-        indicators = matrix.indicators.copy()
-        clusters: List[List[str]] = [[ind] for ind in indicators]
-        
-        while len(clusters) > num_clusters:
-            # Find most similar pair of clusters
-            best_pair = (0, 1)
-            best_sim = -2.0
-            
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    sim = self._cluster_similarity(
-                        clusters[i], clusters[j], matrix
-                    )
-                    if sim > best_sim:
-                        best_sim = sim
-                        best_pair = (i, j)
+        cache_key = ("clusters", num_clusters)
+        cached = self._results.get((company_id, *cache_key))
+        if cached is not None:
+            return list(cached)
+        
+        # Average-linkage hierarchical clustering on the correlation matrix.
+        # similarity[i, j] is the mean correlation between clusters i and j
+        indicators = matrix.indicators
+        corr = np.array([
+            [matrix.correlations[a][b] for b in indicators] for a in indicators
+        ])
+        similarity = corr.copy()
+        sizes = np.ones(len(indicators))
+        clusters: List[List[int]] = [[i] for i in range(len(indicators))]
+        
+        while len(clusters) > max(num_clusters, 1):
+            # Find most similar pair of clusters (first pair on ties)
+            masked = np.where(
+                np.triu(np.ones_like(similarity, dtype=bool), k=1), similarity, -np.inf
+            )
+            i, j = np.unravel_index(int(np.argmax(masked)), masked.shape)
             
             # Merge clusters
-            i, j = best_pair
+            merged = (sizes[i] * similarity[i] + sizes[j] * similarity[j]) / (sizes[i] + sizes[j])
+            similarity[i, :] = merged
+            similarity[:, i] = merged
+            sizes[i] += sizes[j]
             clusters[i].extend(clusters[j])
             clusters.pop(j)
+            similarity = np.delete(np.delete(similarity, j, axis=0), j, axis=1)
+            sizes = np.delete(sizes, j)
         
         # Create cluster objects
         result = []
-        for idx, cluster_indicators in enumerate(clusters):
+        for idx, members in enumerate(clusters):
             self._cluster_counter += 1
             cluster_id = f"cluster_{self._cluster_counter}"
             
-            # Calculate internal correlation
-            internal_corrs = []
-            for i in range(len(cluster_indicators)):
-                for j in range(i + 1, len(cluster_indicators)):
-                    corr = matrix.correlations.get(
-                        cluster_indicators[i], {}
-                    ).get(cluster_indicators[j], 0.0)
-                    internal_corrs.append(corr)
+            block = corr[np.ix_(members, members)]
             
-            avg_internal = sum(internal_corrs) / len(internal_corrs) if internal_corrs else 0.0
+            # Calculate internal correlation
+            if len(members) > 1:
+                upper = block[np.triu_indices(len(members), k=1)]
+                avg_internal = float(upper.mean())
+            else:
+                avg_internal = 0.0
             
             # Find centroid (most connected indicator)
-            connectedness = {}
-            for ind in cluster_indicators:
-                total_corr = sum(
-                    abs(matrix.correlations.get(ind, {}).get(other, 0.0))
-                    for other in cluster_indicators
-                    if other != ind
-                )
-                connectedness[ind] = total_corr
-            
-            centroid = max(connectedness.keys(), key=lambda x: connectedness[x])
+            connectedness = np.abs(block).sum(axis=1) - np.abs(np.diag(block))
+            centroid = indicators[members[int(np.argmax(connectedness))]]
             
+            cluster_indicators = [indicators[m] for m in members]
             cluster = IndicatorCluster(
                 cluster_id=cluster_id,
                 name=f"Cluster {idx + 1}",
@@ -734,23 +816,8 @@ class CorrelationAnalyzer:
             self._clusters[cluster_id] = cluster
             result.append(cluster)
         
-        return result
-    
-    def _cluster_similarity(
-        self,
-        cluster_a: List[str],
-        cluster_b: List[str],
-        matrix: CorrelationMatrix,
-    ) -> float:
-        """Calculate average correlation between two clusters."""
-        correlations = []
-        
-        for ind_a in cluster_a:
-            for ind_b in cluster_b:
-                corr = matrix.correlations.get(ind_a, {}).get(ind_b, 0.0)
-                correlations.append(corr)
-        
-        return sum(correlations) / len(correlations) if correlations else 0.0
+        self._results[(company_id, *cache_key)] = result
+        return list(result)
     
     def get_top_correlations(
         self,
@@ -765,37 +832,47 @@ class CorrelationAnalyzer:
         if positive_only:
             pairs = [p for p in pairs if p.correlation > 0]
         
-        # Sort by absolute correlation
-        pairs.sort(key=lambda x: abs(x.correlation), reverse=True)
+        # Sort by absolute correlation (a copy, the matrix may be cached)
+        pairs = sorted(pairs, key=lambda x: abs(x.correlation), reverse=True)
         
         return pairs[:n]
     
     def get_data_summary(self, company_id: str) -> Dict[str, Any]:
         """Get summary of available data for a company."""
-        data = self._historical_data.get(company_id, [])
+        history = self._get_history(company_id)
         
-        if not data:
+        if history is None:
             return {"company_id": company_id, "data_points": 0}
         
-        all_indicators = set()
-        for _, ind_values in data:
-            all_indicators.update(ind_values.keys())
+        all_indicators, _ = self._get_series(company_id)
         
         return {
             "company_id": company_id,
-            "data_points": len(data),
+            "data_points": len(history),
             "date_range": {
-                "start": data[0][0].isoformat(),
-                "end": data[-1][0].isoformat(),
+                "start": to_datetime(history.timestamps[0]).isoformat(),
+                "end": to_datetime(history.timestamps[-1]).isoformat(),
             },
             "indicators": list(all_indicators),
             "indicator_count": len(all_indicators),
         }
     
+    def get_result_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters of the result stores."""
+        return {
+            store.name: store.get_stats()
+            for store in (
+                self._results,
+                self._correlation_matrices,
+                self._relationships,
+                self._clusters,
+            )
+        }
+    
     def clear_data(self, company_id: Optional[str] = None) -> None:
         """Clear historical data."""
         if company_id:
-            if company_id in self._historical_data:
-                del self._historical_data[company_id]
+            self._store.clear(("correlation", company_id))
         else:
-            self._historical_data.clear()
+            self._store.clear(("correlation",))
+        self._invalidate(company_id)
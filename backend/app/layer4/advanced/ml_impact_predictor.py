@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Any, Tuple
 import math
 import random
 
+from .result_store import ResultStore
+
 
 class PredictionConfidence(Enum):
     """Confidence levels for predictions."""
@@ -159,7 +161,7 @@ class MLImpactPredictor:
         """Initialize the ML impact predictor."""
         self._models: Dict[str, Dict[str, Any]] = {}
         self._feature_history: Dict[str, List[FeatureSet]] = {}
-        self._predictions: Dict[str, ImpactPrediction] = {}
+        self._predictions = ResultStore("ml.predictions")
         self._model_metrics: Dict[str, ModelMetrics] = {}
         self._prediction_counter = 0
         
@@ -717,6 +719,10 @@ class MLImpactPredictor:
         """Get metrics for a trained model."""
         return self._model_metrics.get(model_id)
     
+    def get_result_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters of the result store."""
+        return {self._predictions.name: self._predictions.get_stats()}
+    
     def list_models(self) -> List[str]:
         """List all available models."""
         return list(self._models.keys())
@@ -6,14 +6,48 @@ Provides multi-company portfolio risk analysis including:
 - Diversification analysis
 - Concentration alerts
 - Cross-company correlations
+- Multi-scenario stress testing
+
+Each portfolio is mirrored in numpy arrays (weights, a positions x risk
+factors exposure matrix, a positions x indicators matrix and sector and
+region codes), so risk, correlation, diversification and stress results
+are batched array operations instead of per-company loops.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 import math
 
+import numpy as np
+
+
+# Risk factors in exposure matrix column order
+RISK_FACTORS = ("supply_chain", "operational", "financial", "market")
+
+# Factor multipliers per stress scenario
+STRESS_SCENARIOS: Dict[str, Dict[str, float]] = {
+    "market_crash": {
+        "supply_chain": 1.5,
+        "operational": 1.3,
+        "financial": 2.0,
+        "market": 2.5,
+    },
+    "supply_disruption": {
+        "supply_chain": 3.0,
+        "operational": 1.8,
+        "financial": 1.2,
+        "market": 1.1,
+    },
+    "economic_recession": {
+        "supply_chain": 1.2,
+        "operational": 1.4,
+        "financial": 1.8,
+        "market": 1.5,
+    },
+}
+
 
 class RiskLevel(Enum):
     """Portfolio risk levels."""
@@ -150,18 +184,42 @@ class Portfolio:
     alerts: List[ConcentrationAlert] = field(default_factory=list)
 
 
+@dataclass
+class PortfolioMatrices:
+    """Array view of a portfolio's positions, in portfolio order."""
+    company_ids: List[str]
+    weights: np.ndarray  # (positions,)
+    overall_risk: np.ndarray  # (positions,)
+    exposures: np.ndarray  # (positions x RISK_FACTORS)
+    
+    # Group codes index into the name lists, in order of first appearance
+    sectors: List[str]
+    sector_codes: np.ndarray
+    regions: List[str]
+    region_codes: np.ndarray
+    
+    # Key indicator values, NaN where a company doesn't report one
+    indicator_names: List[str]
+    indicators: np.ndarray  # (positions x indicators)
+
+
 class PortfolioAnalyzer:
     """
     Portfolio risk analyzer for multi-company analysis.
     
     Provides portfolio-level risk assessment, diversification
     analysis, and concentration alerts.
+    
+    Each portfolio's PortfolioMatrices and company correlation matrix are
+    cached until the portfolio is changed through the analyzer
+    (add_company, remove_company, update_company_risk).
     """
     
     def __init__(self):
         """Initialize the portfolio analyzer."""
         self._portfolios: Dict[str, Portfolio] = {}
-        self._correlations: Dict[str, Dict[str, float]] = {}
+        self._matrices: Dict[str, PortfolioMatrices] = {}
+        self._correlations: Dict[str, np.ndarray] = {}
         self._alert_counter = 0
         
         # Configuration thresholds
@@ -182,6 +240,7 @@ class PortfolioAnalyzer:
             created_at=datetime.now(),
         )
         self._portfolios[portfolio_id] = portfolio
+        self._invalidate(portfolio_id)
         return portfolio
     
     def get_portfolio(self, portfolio_id: str) -> Optional[Portfolio]:
@@ -230,6 +289,7 @@ class PortfolioAnalyzer:
         if portfolio_weight == 0.0:
             self._rebalance_weights(portfolio)
         
+        self._invalidate(portfolio_id)
         return profile
     
     def remove_company(self, portfolio_id: str, company_id: str) -> bool:
@@ -242,6 +302,7 @@ class PortfolioAnalyzer:
             del portfolio.companies[company_id]
             portfolio.total_companies = len(portfolio.companies)
             self._rebalance_weights(portfolio)
+            self._invalidate(portfolio_id)
             return True
         
         return False
@@ -286,8 +347,64 @@ class PortfolioAnalyzer:
         
         profile.last_updated = datetime.now()
         
+        self._invalidate(portfolio_id)
         return profile
     
+    def _invalidate(self, portfolio_id: str) -> None:
+        """Drop cached arrays after a portfolio changes."""
+        self._matrices.pop(portfolio_id, None)
+        self._correlations.pop(portfolio_id, None)
+    
+    def get_matrices(self, portfolio_id: str) -> PortfolioMatrices:
+        """Array view of a portfolio (cached until it changes)."""
+        portfolio = self._portfolios.get(portfolio_id)
+        if not portfolio:
+            raise ValueError(f"Portfolio {portfolio_id} not found")
+        
+        matrices = self._matrices.get(portfolio_id)
+        if matrices is None:
+            matrices = self._build_matrices(portfolio)
+            self._matrices[portfolio_id] = matrices
+        return matrices
+    
+    def _build_matrices(self, portfolio: Portfolio) -> PortfolioMatrices:
+        """Build the arrays for a portfolio in one pass over its companies."""
+        profiles = list(portfolio.companies.values())
+        n = len(profiles)
+        
+        sectors: Dict[str, int] = {}
+        regions: Dict[str, int] = {}
+        indicator_index: Dict[str, int] = {}
+        for profile in profiles:
+            sectors.setdefault(profile.sector, len(sectors))
+            regions.setdefault(profile.region, len(regions))
+            for name in profile.key_indicators:
+                indicator_index.setdefault(name, len(indicator_index))
+        
+        indicators = np.full((n, len(indicator_index)), np.nan)
+        for row, profile in enumerate(profiles):
+            for name, value in profile.key_indicators.items():
+                indicators[row, indicator_index[name]] = value
+        
+        return PortfolioMatrices(
+            company_ids=[p.company_id for p in profiles],
+            weights=np.array([p.portfolio_weight for p in profiles], dtype=float),
+            overall_risk=np.array([p.overall_risk for p in profiles], dtype=float),
+            exposures=np.array(
+                [
+                    [p.supply_chain_risk, p.operational_risk, p.financial_risk, p.market_risk]
+                    for p in profiles
+                ],
+                dtype=float,
+            ).reshape(n, len(RISK_FACTORS)),
+            sectors=list(sectors),
+            sector_codes=np.array([sectors[p.sector] for p in profiles], dtype=np.intp),
+            regions=list(regions),
+            region_codes=np.array([regions[p.region] for p in profiles], dtype=np.intp),
+            indicator_names=list(indicator_index),
+            indicators=indicators,
+        )
+    
     def calculate_portfolio_risk(
         self,
         portfolio_id: str,
@@ -305,29 +422,18 @@ class PortfolioAnalyzer:
                 risk_level=RiskLevel.LOW,
             )
         
-        # Calculate weighted risks
-        weighted_supply = 0.0
-        weighted_operational = 0.0
-        weighted_financial = 0.0
-        weighted_market = 0.0
+        m = self.get_matrices(portfolio_id)
         
-        risk_contributions = []
-        
-        for profile in portfolio.companies.values():
-            weight = profile.portfolio_weight
-            
-            weighted_supply += profile.supply_chain_risk * weight
-            weighted_operational += profile.operational_risk * weight
-            weighted_financial += profile.financial_risk * weight
-            weighted_market += profile.market_risk * weight
-            
-            risk_contributions.append(
-                (profile.company_id, profile.overall_risk * weight)
-            )
+        # Weighted risk per factor
+        weighted_supply, weighted_operational, weighted_financial, weighted_market = (
+            (m.weights @ m.exposures).tolist()
+        )
         
-        # Sort by contribution
-        risk_contributions.sort(key=lambda x: x[1], reverse=True)
-        top_contributors = [c[0] for c in risk_contributions[:5]]
+        # Top contributors by weighted overall risk (ties keep portfolio order)
+        contributions = m.overall_risk * m.weights
+        top_contributors = [
+            m.company_ids[i] for i in np.argsort(-contributions, kind="stable")[:5]
+        ]
         
         # Calculate overall risk
         overall_risk = (
@@ -344,12 +450,11 @@ class PortfolioAnalyzer:
         
         if include_correlations and len(portfolio.companies) > 1:
             correlations = self._calculate_company_correlations(portfolio)
-            if correlations:
-                avg_corr = sum(correlations) / len(correlations)
-                max_corr = max(correlations)
-                # Higher correlation increases risk
-                correlation_adjustment = avg_corr * 0.1
-                overall_risk += correlation_adjustment
+            avg_corr = float(correlations.mean())
+            max_corr = float(correlations.max())
+            # Higher correlation increases risk
+            correlation_adjustment = avg_corr * 0.1
+            overall_risk += correlation_adjustment
         
         overall_risk = min(1.0, overall_risk)
         
@@ -360,22 +465,13 @@ class PortfolioAnalyzer:
         var_95 = overall_risk * 1.65  # 95% confidence
         var_99 = overall_risk * 2.33  # 99% confidence
         
-        # Risk by sector
-        risk_by_sector: Dict[str, float] = {}
-        risk_by_region: Dict[str, float] = {}
-        
-        for profile in portfolio.companies.values():
-            if profile.sector not in risk_by_sector:
-                risk_by_sector[profile.sector] = 0.0
-            risk_by_sector[profile.sector] += (
-                profile.overall_risk * profile.portfolio_weight
-            )
-            
-            if profile.region not in risk_by_region:
-                risk_by_region[profile.region] = 0.0
-            risk_by_region[profile.region] += (
-                profile.overall_risk * profile.portfolio_weight
-            )
+        # Risk by sector and region
+        risk_by_sector = dict(zip(m.sectors, np.bincount(
+            m.sector_codes, weights=contributions, minlength=len(m.sectors)
+        ).tolist()))
+        risk_by_region = dict(zip(m.regions, np.bincount(
+            m.region_codes, weights=contributions, minlength=len(m.regions)
+        ).tolist()))
         
         portfolio_risk = PortfolioRisk(
             portfolio_id=portfolio_id,
@@ -402,56 +498,56 @@ class PortfolioAnalyzer:
     def _calculate_company_correlations(
         self,
         portfolio: Portfolio,
-    ) -> List[float]:
-        """Calculate correlations between companies in portfolio."""
-        correlations = []
-        
-        companies = list(portfolio.companies.values())
-        
-        for i in range(len(companies)):
-            for j in range(i + 1, len(companies)):
-                # Simple correlation based on indicator similarity
-                corr = self._calculate_indicator_correlation(
-                    companies[i], companies[j]
-                )
-                correlations.append(corr)
-        
-        return correlations
-    
-    def _calculate_indicator_correlation(
-        self,
-        company1: CompanyRiskProfile,
-        company2: CompanyRiskProfile,
-    ) -> float:
-        """Calculate correlation between two companies based on indicators."""
-        # Find common indicators
-        common_keys = set(company1.key_indicators.keys()) & set(
-            company2.key_indicators.keys()
-        )
-        
-        if not common_keys:
-            # Same sector/region = assumed correlation
-            corr = 0.0
-            if company1.sector == company2.sector:
-                corr += 0.3
-            if company1.region == company2.region:
-                corr += 0.2
-            return corr
-        
-        # Calculate similarity
-        differences = []
-        for key in common_keys:
-            diff = abs(
-                company1.key_indicators[key] - company2.key_indicators[key]
+    ) -> np.ndarray:
+        """Correlations between each pair of companies (upper triangle)."""
+        corr = self.get_company_correlation_matrix(portfolio.portfolio_id)
+        return corr[np.triu_indices(len(corr), k=1)]
+    
+    def get_company_correlation_matrix(self, portfolio_id: str) -> np.ndarray:
+        """
+        (positions x positions) company correlation matrix.
+        
+        Rows follow PortfolioMatrices.company_ids. Cached until the
+        portfolio changes.
+        """
+        corr = self._correlations.get(portfolio_id)
+        if corr is None:
+            corr = self._correlation_matrix(self.get_matrices(portfolio_id))
+            self._correlations[portfolio_id] = corr
+        return corr
+    
+    def _correlation_matrix(self, m: PortfolioMatrices) -> np.ndarray:
+        """
+        Correlations between companies based on indicators.
+        
+        Companies sharing key indicators correlate by indicator similarity,
+        1 - mean |difference| over the shared indicators (floored at 0).
+        Companies sharing none get an assumed 0.3 for the same sector plus
+        0.2 for the same region.
+        """
+        n = len(m.company_ids)
+        reported = (~np.isnan(m.indicators)).astype(float)
+        values = np.nan_to_num(m.indicators, nan=0.0)
+        
+        # Shared indicator counts and summed absolute differences, pairwise
+        shared = reported @ reported.T
+        distance = np.zeros((n, n))
+        for k in range(values.shape[1]):
+            column = values[:, k]
+            distance += np.abs(column[:, None] - column[None, :]) * np.outer(
+                reported[:, k], reported[:, k]
             )
-            differences.append(diff)
         
-        avg_diff = sum(differences) / len(differences)
-        
-        # Convert difference to correlation (inverse relationship)
-        correlation = max(0.0, 1.0 - avg_diff)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = np.maximum(0.0, 1.0 - distance / shared)
+        assumed = (
+            0.3 * (m.sector_codes[:, None] == m.sector_codes[None, :]) +
+            0.2 * (m.region_codes[:, None] == m.region_codes[None, :])
+        )
         
-        return correlation
+        corr = np.where(shared > 0, similarity, assumed)
+        np.fill_diagonal(corr, 1.0)
+        return corr
     
     def _get_risk_level(self, risk_score: float) -> RiskLevel:
         """Convert risk score to level."""
@@ -478,22 +574,21 @@ class PortfolioAnalyzer:
         if not portfolio.companies:
             return DiversificationScore(overall_score=0.0)
         
-        # Calculate sector concentration
-        sector_weights: Dict[str, float] = {}
-        regional_weights: Dict[str, float] = {}
+        m = self.get_matrices(portfolio_id)
         
-        for profile in portfolio.companies.values():
-            if profile.sector not in sector_weights:
-                sector_weights[profile.sector] = 0.0
-            sector_weights[profile.sector] += profile.portfolio_weight
-            
-            if profile.region not in regional_weights:
-                regional_weights[profile.region] = 0.0
-            regional_weights[profile.region] += profile.portfolio_weight
+        # Calculate sector and regional concentration
+        sector_totals = np.bincount(
+            m.sector_codes, weights=m.weights, minlength=len(m.sectors)
+        )
+        regional_totals = np.bincount(
+            m.region_codes, weights=m.weights, minlength=len(m.regions)
+        )
+        sector_weights = dict(zip(m.sectors, sector_totals.tolist()))
+        regional_weights = dict(zip(m.regions, regional_totals.tolist()))
         
         # Calculate Herfindahl-Hirschman Index (HHI) for concentration
-        sector_hhi = sum(w ** 2 for w in sector_weights.values())
-        regional_hhi = sum(w ** 2 for w in regional_weights.values())
+        sector_hhi = float((sector_totals ** 2).sum())
+        regional_hhi = float((regional_totals ** 2).sum())
         
         # Convert HHI to diversification score (inverse)
         # HHI ranges from 1/n (perfect diversification) to 1 (full concentration)
@@ -515,8 +610,7 @@ class PortfolioAnalyzer:
         )
         
         # Size diversification (assume equal weight is ideal)
-        weights = [p.portfolio_weight for p in portfolio.companies.values()]
-        weight_variance = sum((w - 1/len(weights)) ** 2 for w in weights) / len(weights)
+        weight_variance = float(((m.weights - 1 / len(m.weights)) ** 2).mean())
         size_diversification = max(0.0, 1.0 - weight_variance * 10)
         
         # Overall score
@@ -573,92 +667,100 @@ class PortfolioAnalyzer:
         if not portfolio.companies:
             return alerts
         
-        # Check sector concentration
-        sector_weights: Dict[str, List[str]] = {}
-        for profile in portfolio.companies.values():
-            if profile.sector not in sector_weights:
-                sector_weights[profile.sector] = []
-            sector_weights[profile.sector].append(profile.company_id)
-        
-        for sector, companies in sector_weights.items():
-            concentration = len(companies) / len(portfolio.companies)
-            if concentration > self._sector_concentration_threshold:
-                self._alert_counter += 1
-                alerts.append(
-                    ConcentrationAlert(
-                        alert_id=f"alert_{self._alert_counter}",
-                        alert_type="sector",
-                        severity=self._get_alert_severity(concentration),
-                        concentrated_element=sector,
-                        concentration_percentage=concentration,
-                        threshold_exceeded=self._sector_concentration_threshold,
-                        potential_impact=(
-                            f"Sector-wide issues in {sector} could affect "
-                            f"{concentration:.0%} of portfolio"
-                        ),
-                        affected_companies=companies,
-                        recommendation=(
-                            f"Consider reducing exposure to {sector} sector"
-                        ),
-                    )
+        m = self.get_matrices(portfolio_id)
+        
+        # Check sector concentration (share of companies)
+        for sector, concentration, companies in self._concentrated_groups(
+            m, m.sectors, m.sector_codes, self._sector_concentration_threshold
+        ):
+            self._alert_counter += 1
+            alerts.append(
+                ConcentrationAlert(
+                    alert_id=f"alert_{self._alert_counter}",
+                    alert_type="sector",
+                    severity=self._get_alert_severity(concentration),
+                    concentrated_element=sector,
+                    concentration_percentage=concentration,
+                    threshold_exceeded=self._sector_concentration_threshold,
+                    potential_impact=(
+                        f"Sector-wide issues in {sector} could affect "
+                        f"{concentration:.0%} of portfolio"
+                    ),
+                    affected_companies=companies,
+                    recommendation=(
+                        f"Consider reducing exposure to {sector} sector"
+                    ),
                 )
+            )
         
-        # Check regional concentration
-        regional_weights: Dict[str, List[str]] = {}
-        for profile in portfolio.companies.values():
-            if profile.region not in regional_weights:
-                regional_weights[profile.region] = []
-            regional_weights[profile.region].append(profile.company_id)
-        
-        for region, companies in regional_weights.items():
-            concentration = len(companies) / len(portfolio.companies)
-            if concentration > self._regional_concentration_threshold:
-                self._alert_counter += 1
-                alerts.append(
-                    ConcentrationAlert(
-                        alert_id=f"alert_{self._alert_counter}",
-                        alert_type="regional",
-                        severity=self._get_alert_severity(concentration),
-                        concentrated_element=region,
-                        concentration_percentage=concentration,
-                        threshold_exceeded=self._regional_concentration_threshold,
-                        potential_impact=(
-                            f"Regional issues in {region} could affect "
-                            f"{concentration:.0%} of portfolio"
-                        ),
-                        affected_companies=companies,
-                        recommendation=(
-                            f"Consider adding companies from other regions"
-                        ),
-                    )
+        # Check regional concentration (share of companies)
+        for region, concentration, companies in self._concentrated_groups(
+            m, m.regions, m.region_codes, self._regional_concentration_threshold
+        ):
+            self._alert_counter += 1
+            alerts.append(
+                ConcentrationAlert(
+                    alert_id=f"alert_{self._alert_counter}",
+                    alert_type="regional",
+                    severity=self._get_alert_severity(concentration),
+                    concentrated_element=region,
+                    concentration_percentage=concentration,
+                    threshold_exceeded=self._regional_concentration_threshold,
+                    potential_impact=(
+                        f"Regional issues in {region} could affect "
+                        f"{concentration:.0%} of portfolio"
+                    ),
+                    affected_companies=companies,
+                    recommendation=(
+                        f"Consider adding companies from other regions"
+                    ),
                 )
+            )
         
         # Check individual company concentration
-        for profile in portfolio.companies.values():
-            if profile.portfolio_weight > self._company_concentration_threshold:
-                self._alert_counter += 1
-                alerts.append(
-                    ConcentrationAlert(
-                        alert_id=f"alert_{self._alert_counter}",
-                        alert_type="company",
-                        severity=self._get_alert_severity(profile.portfolio_weight),
-                        concentrated_element=profile.company_name,
-                        concentration_percentage=profile.portfolio_weight,
-                        threshold_exceeded=self._company_concentration_threshold,
-                        potential_impact=(
-                            f"Issues with {profile.company_name} could "
-                            f"significantly impact portfolio"
-                        ),
-                        affected_companies=[profile.company_id],
-                        recommendation=(
-                            f"Consider reducing weight of {profile.company_name}"
-                        ),
-                    )
+        for index in np.flatnonzero(m.weights > self._company_concentration_threshold):
+            profile = portfolio.companies[m.company_ids[index]]
+            self._alert_counter += 1
+            alerts.append(
+                ConcentrationAlert(
+                    alert_id=f"alert_{self._alert_counter}",
+                    alert_type="company",
+                    severity=self._get_alert_severity(profile.portfolio_weight),
+                    concentrated_element=profile.company_name,
+                    concentration_percentage=profile.portfolio_weight,
+                    threshold_exceeded=self._company_concentration_threshold,
+                    potential_impact=(
+                        f"Issues with {profile.company_name} could "
+                        f"significantly impact portfolio"
+                    ),
+                    affected_companies=[profile.company_id],
+                    recommendation=(
+                        f"Consider reducing weight of {profile.company_name}"
+                    ),
                 )
+            )
         
         portfolio.alerts = alerts
         return alerts
     
+    def _concentrated_groups(
+        self,
+        m: PortfolioMatrices,
+        names: List[str],
+        codes: np.ndarray,
+        threshold: float,
+    ) -> List[Tuple[str, float, List[str]]]:
+        """(group, share of companies, company IDs) for groups over threshold."""
+        shares = np.bincount(codes, minlength=len(names)) / len(codes)
+        return [
+            (
+                names[code],
+                float(shares[code]),
+                [m.company_ids[i] for i in np.flatnonzero(codes == code)],
+            )
+            for code in np.flatnonzero(shares > threshold)
+        ]
+    
     def _get_alert_severity(self, concentration: float) -> AlertSeverity:
         """Determine alert severity based on concentration level."""
         if concentration >= 0.7:
@@ -675,71 +777,76 @@ class PortfolioAnalyzer:
         portfolio_id: str,
         stress_scenario: str = "market_crash",
     ) -> Dict[str, Any]:
-        """Run stress test on portfolio."""
+        """Run stress test on portfolio (unknown scenarios use market_crash)."""
+        multipliers = STRESS_SCENARIOS.get(
+            stress_scenario,
+            STRESS_SCENARIOS["market_crash"],
+        )
+        return self.run_stress_tests(
+            portfolio_id, {stress_scenario: multipliers}
+        )[stress_scenario]
+    
+    def run_stress_tests(
+        self,
+        portfolio_id: str,
+        scenarios: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several stress scenarios on a portfolio at once.
+        
+        A company's stressed risk is the mean of its factor risks times the
+        scenario's factor multipliers, capped at 1.0. All scenarios are
+        applied to all positions in one (positions x factors) by
+        (factors x scenarios) matrix product.
+        
+        Args:
+            portfolio_id: Portfolio to stress
+            scenarios: Scenario name -> factor multipliers (factors left
+                out keep a multiplier of 1.0); STRESS_SCENARIOS if None
+            
+        Returns:
+            Scenario name -> stress test result
+        """
         portfolio = self._portfolios.get(portfolio_id)
         if not portfolio:
             raise ValueError(f"Portfolio {portfolio_id} not found")
         
-        # Define stress multipliers
-        stress_multipliers = {
-            "market_crash": {
-                "supply_chain": 1.5,
-                "operational": 1.3,
-                "financial": 2.0,
-                "market": 2.5,
-            },
-            "supply_disruption": {
-                "supply_chain": 3.0,
-                "operational": 1.8,
-                "financial": 1.2,
-                "market": 1.1,
-            },
-            "economic_recession": {
-                "supply_chain": 1.2,
-                "operational": 1.4,
-                "financial": 1.8,
-                "market": 1.5,
-            },
-        }
-        
-        multipliers = stress_multipliers.get(
-            stress_scenario,
-            stress_multipliers["market_crash"],
-        )
-        
-        # Calculate stressed risks
-        stressed_risks = {}
-        for company_id, profile in portfolio.companies.items():
-            stressed_overall = min(1.0, (
-                profile.supply_chain_risk * multipliers["supply_chain"] * 0.25 +
-                profile.operational_risk * multipliers["operational"] * 0.25 +
-                profile.financial_risk * multipliers["financial"] * 0.25 +
-                profile.market_risk * multipliers["market"] * 0.25
-            ))
-            stressed_risks[company_id] = stressed_overall
-        
-        # Calculate stressed portfolio risk
-        stressed_portfolio_risk = sum(
-            stressed_risks[cid] * profile.portfolio_weight
-            for cid, profile in portfolio.companies.items()
+        if scenarios is None:
+            scenarios = STRESS_SCENARIOS
+        names = list(scenarios)
+        m = self.get_matrices(portfolio_id)
+        
+        # (factors x scenarios), each factor counts a quarter
+        multipliers = np.array(
+            [[scenarios[name].get(factor, 1.0) for name in names] for factor in RISK_FACTORS],
+            dtype=float,
+        ).reshape(len(RISK_FACTORS), len(names))
+        stressed = np.minimum(1.0, m.exposures @ (multipliers * 0.25))
+        stressed_portfolio = m.weights @ stressed
+        most_affected = stressed.argmax(axis=0) if m.company_ids else None
+        
+        original_risk = (
+            portfolio.current_risk.overall_risk_score
+            if portfolio.current_risk
+            else 0.5
         )
         
-        return {
-            "scenario": stress_scenario,
-            "original_risk": portfolio.current_risk.overall_risk_score
-            if portfolio.current_risk
-            else 0.5,
-            "stressed_risk": stressed_portfolio_risk,
-            "risk_increase": stressed_portfolio_risk - (
-                portfolio.current_risk.overall_risk_score
-                if portfolio.current_risk
-                else 0.5
-            ),
-            "company_stressed_risks": stressed_risks,
-            "most_affected": max(stressed_risks, key=stressed_risks.get)
-            if stressed_risks
-            else None,
-        }
+        results = {}
+        for column, name in enumerate(names):
+            stressed_risk = float(stressed_portfolio[column])
+            results[name] = {
+                "scenario": name,
+                "original_risk": original_risk,
+                "stressed_risk": stressed_risk,
+                "risk_increase": stressed_risk - original_risk,
+                "company_stressed_risks": dict(
+                    zip(m.company_ids, stressed[:, column].tolist())
+                ),
+                "most_affected": m.company_ids[most_affected[column]]
+                if m.company_ids
+                else None,
+            }
+        return results
     
     def list_portfolios(self) -> List[str]:
         """List all portfolio IDs."""
@@ -749,5 +856,6 @@ class PortfolioAnalyzer:
         """Delete a portfolio."""
         if portfolio_id in self._portfolios:
             del self._portfolios[portfolio_id]
+            self._invalidate(portfolio_id)
             return True
         return False
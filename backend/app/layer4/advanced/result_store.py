@@ -0,0 +1,190 @@
+"""
+Result Store Module.
+
+Bounded, expiring storage for the results the Layer 4 analyzers keep
+around (forecasts, simulation results, predictions, correlation matrices),
+providing:
+- A size limit with least-recently-used eviction
+- TTL-based expiry
+- Hit/miss/eviction counters
+
+Stores behave like a small dict (store[key] = value, store.get(key),
+key in store, len(store), store.values()), so analyzers can swap them in
+for the plain dicts they used to grow without bound.
+
+Usage:
+    forecasts = ResultStore("trend.forecasts", max_entries=1000, ttl_seconds=3600)
+    forecasts[forecast.forecast_id] = forecast
+    forecasts.get(forecast_id)
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 3600.0
+
+_MISSING = object()
+
+
+def _setting(name: str, default: Any) -> Any:
+    """A value from app settings, default if settings can't be loaded."""
+    try:
+        from app.core.config import settings
+        return getattr(settings, name, default)
+    except Exception:
+        return default
+
+
+class ResultStore:
+    """
+    Size- and age-bounded in-memory result store.
+
+    Entries are kept in least-recently-used order. Adding an entry beyond
+    max_entries evicts the least recently used one. Expired entries are
+    dropped on access and by a periodic sweep on writes. Results are
+    per-process.
+
+    Args:
+        name: Name reported in stats
+        max_entries: Entries kept (settings default if None)
+        ttl_seconds: Lifetime of an entry (settings default if None)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        if max_entries is None:
+            max_entries = _setting("LAYER4_RESULT_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        if ttl_seconds is None:
+            ttl_seconds = _setting("LAYER4_RESULT_TTL", DEFAULT_TTL_SECONDS)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, expires_at on the monotonic clock)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._next_sweep = time.monotonic() + self._sweep_interval()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def _sweep_interval(self) -> float:
+        return min(self.ttl_seconds, 60.0)
+
+    # ------------------------------------------------------------------
+    # Dict-style access
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        """Live entries."""
+        self.purge_expired()
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used beyond the limit."""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.purge_expired()
+
+        self._entries[key] = (value, now + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The stored value, default if missing or expired."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > now:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+            self._stats["expirations"] += 1
+
+        self._stats["misses"] += 1
+        return default
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a value, default if missing or expired."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        return value if expires_at > time.monotonic() else default
+
+    def keys(self) -> List[Hashable]:
+        """Keys of live entries, least recently used first."""
+        self.purge_expired()
+        return list(self._entries)
+
+    def values(self) -> List[Any]:
+        """Values of live entries, least recently used first."""
+        self.purge_expired()
+        return [value for value, _ in self._entries.values()]
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """(key, value) pairs of live entries."""
+        self.purge_expired()
+        return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def purge_expired(self) -> int:
+        """Drop expired in-memory entries. Returns the number dropped."""
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._stats["expirations"] += len(expired)
+        self._next_sweep = now + self._sweep_interval()
+        return len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss, eviction and expiry counters."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "name": self.name,
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups * 100, 2) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
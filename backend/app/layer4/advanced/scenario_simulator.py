@@ -12,8 +12,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable
-import math
-import random
+
+import numpy as np
+
+from .result_store import ResultStore
 
 
 class ScenarioType(Enum):
@@ -150,7 +152,7 @@ class ScenarioSimulator:
         """Initialize the scenario simulator."""
         self._scenarios: Dict[str, Scenario] = {}
         self._propagation_rules: List[ImpactPropagation] = []
-        self._simulation_results: Dict[str, SimulationResult] = {}
+        self._simulation_results = ResultStore("scenario.simulation_results")
         self._scenario_counter = 0
         self._simulation_counter = 0
         
@@ -546,16 +548,22 @@ class ScenarioSimulator:
         baseline_indicators: Dict[str, float],
         num_simulations: int = 100,
         variance_factor: float = 0.1,
+        seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation for uncertainty analysis.
         
+        All iterations are simulated together: the shocks are drawn up front
+        as one (iterations x indicators) array and every day of the horizon
+        is applied to all iterations at once.
+        
         Args:
             scenario_id: Scenario to simulate
             company_id: Company to simulate for
             baseline_indicators: Current indicator values
             num_simulations: Number of simulations to run
             variance_factor: Variance for random perturbation
+            seed: Seed for the random generator (same seed, same results)
             
         Returns:
             Statistical results from simulations
@@ -563,66 +571,130 @@ class ScenarioSimulator:
         scenario = self._scenarios.get(scenario_id)
         if not scenario:
             raise ValueError(f"Scenario {scenario_id} not found")
+        if num_simulations < 1:
+            raise ValueError("num_simulations must be at least 1")
         
-        results: List[SimulationResult] = []
-        
-        for i in range(num_simulations):
-            # Perturb scenario parameters
-            perturbed_indicators = {}
-            for indicator, change in scenario.affected_indicators.items():
-                perturbation = random.gauss(0, variance_factor * abs(change))
-                perturbed_indicators[indicator] = change + perturbation
-            
-            # Create temporary perturbed scenario
-            temp_scenario = Scenario(
-                scenario_id=f"temp_{i}",
-                name=scenario.name,
-                description=scenario.description,
-                scenario_type=scenario.scenario_type,
-                affected_indicators=perturbed_indicators,
-                duration_days=scenario.duration_days,
-                probability=scenario.probability,
-            )
-            
-            self._scenarios[temp_scenario.scenario_id] = temp_scenario
-            
-            result = self.run_simulation(
-                temp_scenario.scenario_id,
-                company_id,
-                baseline_indicators,
-            )
-            results.append(result)
-            
-            # Clean up temp scenario
-            del self._scenarios[temp_scenario.scenario_id]
-        
-        # Calculate statistics
-        impacts = [r.overall_impact for r in results]
+        # Perturb scenario parameters: one row per iteration
+        changes = np.array(list(scenario.affected_indicators.values()), dtype=float)
+        rng = np.random.default_rng(seed)
+        noise = rng.standard_normal((num_simulations, len(changes)))
+        shocks = changes + noise * (variance_factor * np.abs(changes))
         
-        mean_impact = sum(impacts) / len(impacts)
-        variance = sum((x - mean_impact) ** 2 for x in impacts) / len(impacts)
-        std_dev = math.sqrt(variance)
+        outcome = self._simulate_batch(scenario, shocks, baseline_indicators)
+        impacts = outcome["overall_impact"]
+        avg_changes = outcome["avg_change"]
         
-        sorted_impacts = sorted(impacts)
-        percentile_5 = sorted_impacts[int(len(sorted_impacts) * 0.05)]
-        percentile_95 = sorted_impacts[int(len(sorted_impacts) * 0.95)]
+        sorted_impacts = np.sort(impacts)
+        percentile_5 = sorted_impacts[int(num_simulations * 0.05)]
+        percentile_95 = sorted_impacts[int(num_simulations * 0.95)]
         
         # Count severity distribution
-        severity_counts = {"low": 0, "medium": 0, "high": 0, "critical": 0}
-        for r in results:
-            severity_counts[r.severity] += 1
+        severity_counts = {
+            "low": int(np.count_nonzero(impacts < 0.1)),
+            "medium": int(np.count_nonzero((impacts >= 0.1) & (impacts < 0.2))),
+            "high": int(np.count_nonzero((impacts >= 0.2) & (impacts < 0.3))),
+            "critical": int(np.count_nonzero(impacts >= 0.3)),
+        }
         
         return {
             "num_simulations": num_simulations,
-            "mean_impact": mean_impact,
-            "std_dev": std_dev,
-            "min_impact": min(impacts),
-            "max_impact": max(impacts),
-            "percentile_5": percentile_5,
-            "percentile_95": percentile_95,
+            "mean_impact": float(impacts.mean()),
+            "std_dev": float(impacts.std()),
+            "min_impact": float(sorted_impacts[0]),
+            "max_impact": float(sorted_impacts[-1]),
+            "percentile_5": float(percentile_5),
+            "percentile_95": float(percentile_95),
             "severity_distribution": severity_counts,
-            "positive_outcomes": sum(1 for r in results if r.impact_direction == "positive"),
-            "negative_outcomes": sum(1 for r in results if r.impact_direction == "negative"),
+            "positive_outcomes": int(np.count_nonzero(avg_changes > 0.05)),
+            "negative_outcomes": int(np.count_nonzero(avg_changes < -0.05)),
+            "seed": seed,
+        }
+    
+    def _simulate_batch(
+        self,
+        scenario: Scenario,
+        shocks: np.ndarray,
+        baseline_indicators: Dict[str, float],
+        simulation_days: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Simulate many perturbed copies of a scenario in one pass.
+        
+        Follows run_simulation step for step, with each indicator held as a
+        vector over iterations instead of a float.
+        
+        Args:
+            scenario: Scenario to simulate
+            shocks: (iterations x affected indicators) changes, columns in
+                scenario.affected_indicators order
+            baseline_indicators: Current indicator values
+            simulation_days: Override scenario duration
+            
+        Returns:
+            Per-iteration arrays: final indicator values (keyed by name),
+            overall_impact, avg_change, peak_impact and peak_day
+        """
+        duration = simulation_days or scenario.duration_days
+        names = list(baseline_indicators.keys())
+        column = {name: i for i, name in enumerate(names)}
+        affected = list(scenario.affected_indicators.keys())
+        source_column = {name: j for j, name in enumerate(affected)}
+        
+        # Indicator-major layout keeps each indicator's iterations contiguous
+        shocks = np.ascontiguousarray(np.asarray(shocks, dtype=float).T)
+        num_iterations = shocks.shape[1]
+        baseline = np.array([baseline_indicators[k] for k in names], dtype=float)
+        state = np.repeat(baseline[:, None], num_iterations, axis=1)
+        
+        direct = [(column[name], j) for j, name in enumerate(affected) if name in column]
+        rules = []
+        for rule in self._propagation_rules:
+            if rule.source_indicator in source_column:
+                source = shocks[source_column[rule.source_indicator]]
+                triggered = np.abs(source) >= rule.min_trigger
+                if rule.target_indicator in column and triggered.any():
+                    rules.append((rule, source, triggered, column[rule.target_indicator]))
+        
+        peak_impact = np.zeros(num_iterations)
+        peak_day = np.zeros(num_iterations, dtype=int)
+        
+        for day in range(duration):
+            # Apply direct scenario effects
+            effect_factor = self._calculate_effect_factor(
+                day, duration, scenario.onset_days, scenario.recovery_days
+            )
+            for row, j in direct:
+                np.clip(state[row] + shocks[j] * effect_factor, 0.0, 1.0, out=state[row])
+            
+            # Apply propagation effects
+            for rule, source, triggered, row in rules:
+                if day < rule.delay_days:
+                    continue
+                scale = (
+                    rule.propagation_factor *
+                    self._calculate_effect_factor(
+                        day - rule.delay_days, duration - rule.delay_days, 0, 0
+                    ) *
+                    (1 - rule.decay_rate * (day - rule.delay_days) / duration)
+                )
+                propagated = np.clip(source * scale, -rule.max_impact, rule.max_impact)
+                state[row] = np.where(
+                    triggered, np.clip(state[row] + propagated, 0.0, 1.0), state[row]
+                )
+            
+            # Track peak impact
+            day_impact = np.abs(state - baseline[:, None]).mean(axis=0)
+            improved = day_impact > peak_impact
+            peak_impact = np.where(improved, day_impact, peak_impact)
+            peak_day = np.where(improved, day, peak_day)
+        
+        indicator_changes = state - baseline[:, None]
+        return {
+            "final_indicators": {name: state[i] for i, name in enumerate(names)},
+            "overall_impact": np.abs(indicator_changes).mean(axis=0),
+            "avg_change": indicator_changes.mean(axis=0),
+            "peak_impact": peak_impact,
+            "peak_day": peak_day,
         }
     
     def run_sensitivity_analysis(
@@ -764,6 +836,10 @@ class ScenarioSimulator:
         """Get a simulation result by ID."""
         return self._simulation_results.get(simulation_id)
     
+    def get_result_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters of the result store."""
+        return {self._simulation_results.name: self._simulation_results.get_stats()}
+    
     def delete_scenario(self, scenario_id: str) -> bool:
         """Delete a scenario."""
         if scenario_id in self._scenarios:
@@ -0,0 +1,296 @@
+"""
+Time-Series Store Module.
+
+In-process columnar storage for the Layer 4 analytics, providing:
+- Growable numpy arrays per series (amortised O(1) ordered appends)
+- Bulk ingest with a single stable sort
+- Bisect-based window slicing
+- Retention trimming without copying
+
+Each series has one timestamp column and any number of named value
+columns. Values are stored indicator-major, so a column over a window is
+a contiguous array view, and all columns over a window form an
+(indicators x points) matrix view.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+VALUE_COLUMN = "value"
+
+PointValue = Union[float, Mapping[str, float]]
+
+
+def _to_datetime64(timestamp: datetime) -> np.datetime64:
+    """Naive datetime64[us]; aware timestamps are converted to UTC first."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(timestamp, "us")
+
+
+def to_datetime(timestamp: np.datetime64) -> datetime:
+    """Convert a stored timestamp back to a datetime."""
+    return timestamp.astype("datetime64[us]").item()
+
+
+class TimeSeries:
+    """
+    Time-ordered series held in growable numpy arrays.
+
+    Points are kept sorted by timestamp; points with equal timestamps stay
+    in insertion order. Columns missing from a point hold fill_value (NaN
+    by default, so readers can tell "not reported" from a real value).
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str] = (),
+        fill_value: float = np.nan,
+        capacity: int = 64,
+    ):
+        self.fill_value = fill_value
+        self._columns: List[str] = []
+        self._column_index: Dict[str, int] = {}
+        self._timestamps = np.empty(max(capacity, 1), dtype="datetime64[us]")
+        self._values = np.full((0, len(self._timestamps)), fill_value)
+        self._start = 0
+        self._end = 0
+        self.version = 0  # Bumped on every change
+
+        for column in columns:
+            self._add_column(column)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in storage order."""
+        return list(self._columns)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """All timestamps (datetime64[us] view)."""
+        return self._timestamps[self._start:self._end]
+
+    @property
+    def values(self) -> np.ndarray:
+        """All values as a (columns x points) view."""
+        return self._values[:, self._start:self._end]
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """One column's values (contiguous view), None if unknown."""
+        index = self._column_index.get(name)
+        if index is None:
+            return None
+        return self._values[index, self._start:self._end]
+
+    def append(self, timestamp: datetime, value: PointValue) -> None:
+        """Add one point, keeping timestamp order."""
+        self.extend([timestamp], [value])
+
+    def extend(
+        self,
+        timestamps: Sequence[datetime],
+        values: Sequence[PointValue],
+    ) -> None:
+        """
+        Add many points at once.
+
+        In-order batches are appended as they are; otherwise the series is
+        re-sorted once (stably) after the batch is written.
+        """
+        if len(timestamps) != len(values):
+            raise ValueError("timestamps and values must have the same length")
+        count = len(timestamps)
+        if count == 0:
+            return
+
+        new_timestamps = np.array(
+            [_to_datetime64(t) for t in timestamps], dtype="datetime64[us]"
+        )
+
+        # Register new columns before reserving space
+        for value in values:
+            names = value.keys() if isinstance(value, Mapping) else (VALUE_COLUMN,)
+            for name in names:
+                if name not in self._column_index:
+                    self._add_column(name)
+
+        if count == 1 and len(self) and new_timestamps[0] < self._timestamps[self._end - 1]:
+            self._insert(new_timestamps[0], values[0])
+            return
+
+        self._reserve(count)
+        begin, end = self._end, self._end + count
+        self._timestamps[begin:end] = new_timestamps
+        block = self._values[:, begin:end]
+        block.fill(self.fill_value)
+        for offset, value in enumerate(values):
+            if isinstance(value, Mapping):
+                for name, item in value.items():
+                    block[self._column_index[name], offset] = item
+            else:
+                block[self._column_index[VALUE_COLUMN], offset] = value
+
+        in_order = (
+            bool(np.all(new_timestamps[1:] >= new_timestamps[:-1])) and
+            (begin == self._start or new_timestamps[0] >= self._timestamps[begin - 1])
+        )
+        self._end = end
+        if not in_order:
+            order = np.argsort(self.timestamps, kind="stable")
+            self._timestamps[self._start:self._end] = self.timestamps[order]
+            self._values[:, self._start:self._end] = self.values[:, order]
+        self.version += 1
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Timestamps and (columns x points) values with start <= t < end.
+
+        Both are views; bounds are found by bisection.
+        """
+        lo, hi = self._bounds(start, end)
+        return self._timestamps[lo:hi], self._values[:, lo:hi]
+
+    def column_window(
+        self,
+        name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and one column's values with start <= t < end."""
+        lo, hi = self._bounds(start, end)
+        index = self._column_index.get(name)
+        if index is None:
+            return self._timestamps[lo:hi], np.full(hi - lo, self.fill_value)
+        return self._timestamps[lo:hi], self._values[index, lo:hi]
+
+    def trim(self, before: datetime) -> int:
+        """Drop points older than before. Returns the number dropped."""
+        cut, _ = self._bounds(before, None)
+        dropped = cut - self._start
+        if dropped:
+            self._start = cut
+            self.version += 1
+        return dropped
+
+    def _bounds(self, start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+        timestamps = self.timestamps
+        lo = 0 if start is None else int(np.searchsorted(timestamps, _to_datetime64(start), "left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, _to_datetime64(end), "left"))
+        return self._start + lo, self._start + max(lo, hi)
+
+    def _insert(self, timestamp: np.datetime64, value: PointValue) -> None:
+        """Insert one out-of-order point after any equal timestamps."""
+        self._reserve(1)
+        at = self._start + int(np.searchsorted(self.timestamps, timestamp, "right"))
+        self._timestamps[at + 1:self._end + 1] = self._timestamps[at:self._end]
+        self._values[:, at + 1:self._end + 1] = self._values[:, at:self._end]
+        self._timestamps[at] = timestamp
+        self._values[:, at] = self.fill_value
+        if isinstance(value, Mapping):
+            for name, item in value.items():
+                self._values[self._column_index[name], at] = item
+        else:
+            self._values[self._column_index[VALUE_COLUMN], at] = value
+        self._end += 1
+        self.version += 1
+
+    def _reserve(self, extra: int) -> None:
+        """Make room for extra points at the end."""
+        size = len(self)
+        capacity = len(self._timestamps)
+        if self._end + extra <= capacity:
+            return
+
+        if size + extra > capacity // 2:
+            capacity = max(capacity * 2, size + extra)
+        timestamps = np.empty(capacity, dtype="datetime64[us]")
+        values = np.full((len(self._columns), capacity), self.fill_value)
+        timestamps[:size] = self.timestamps
+        values[:, :size] = self.values
+        self._timestamps, self._values = timestamps, values
+        self._start, self._end = 0, size
+
+    def _add_column(self, name: str) -> None:
+        self._column_index[name] = len(self._columns)
+        self._columns.append(name)
+        row = np.full((1, len(self._timestamps)), self.fill_value)
+        self._values = np.vstack([self._values, row])
+
+
+class TimeSeriesStore:
+    """
+    Keyed collection of TimeSeries shared by the Layer 4 analyzers.
+
+    Keys are tuples, typically namespaced by the owner, e.g.
+    ("trend", company_id, indicator) or ("correlation", company_id).
+    """
+
+    def __init__(self, fill_value: float = np.nan):
+        self.fill_value = fill_value
+        self._series: Dict[Tuple[Hashable, ...], TimeSeries] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[TimeSeries]:
+        """The series for a key, None if it has no data yet."""
+        return self._series.get(key)
+
+    def series(self, key: Tuple[Hashable, ...]) -> TimeSeries:
+        """The series for a key, created empty if needed."""
+        series = self._series.get(key)
+        if series is None:
+            series = TimeSeries(fill_value=self.fill_value)
+            self._series[key] = series
+        return series
+
+    def append(self, key: Tuple[Hashable, ...], timestamp: datetime, value: PointValue) -> TimeSeries:
+        """Add one point to a series."""
+        series = self.series(key)
+        series.append(timestamp, value)
+        return series
+
+    def extend(
+        self,
+        key: Tuple[Hashable, ...],
+        points: Iterable[Tuple[datetime, PointValue]],
+    ) -> TimeSeries:
+        """Add a batch of (timestamp, value) points to a series."""
+        points = list(points)
+        series = self.series(key)
+        series.extend([t for t, _ in points], [v for _, v in points])
+        return series
+
+    def trim(self, key: Tuple[Hashable, ...], before: datetime) -> int:
+        """Drop a series' points older than before."""
+        series = self._series.get(key)
+        return series.trim(before) if series is not None else 0
+
+    def keys(self, prefix: Tuple[Hashable, ...] = ()) -> List[Tuple[Hashable, ...]]:
+        """Keys starting with prefix."""
+        return [key for key in self._series if key[:len(prefix)] == prefix]
+
+    def remove(self, key: Tuple[Hashable, ...]) -> bool:
+        """Drop one series."""
+        return self._series.pop(key, None) is not None
+
+    def clear(self, prefix: Tuple[Hashable, ...] = ()) -> int:
+        """Drop every series whose key starts with prefix."""
+        keys = self.keys(prefix)
+        for key in keys:
+            del self._series[key]
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Series and point counts."""
+        return {
+            "series": len(self._series),
+            "points": sum(len(s) for s in self._series.values()),
+        }
@@ -9,11 +9,17 @@ Provides time-series analysis and forecasting including:
 """
 
 from dataclasses import dataclass, field
+from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Deque, Dict, List, Optional, Any, Sequence, Tuple
 import math
 
+import numpy as np
+
+from .result_store import ResultStore
+from .time_series_store import TimeSeriesStore, VALUE_COLUMN, to_datetime
+
 
 class TrendDirection(Enum):
     """Direction of trend."""
@@ -176,15 +182,28 @@ class TrendForecaster:
     
     Provides trend detection, seasonality analysis,
     and forecast generation.
+    
+    History lives in a TimeSeriesStore under ("trend", company_id,
+    indicator) keys; the analyses read array views from it. Trends,
+    forecasts and patterns are kept in bounded, expiring ResultStores,
+    and only the most recent anomalies are kept.
     """
     
-    def __init__(self):
-        """Initialize the trend forecaster."""
-        self._historical_data: Dict[str, Dict[str, List[Tuple[datetime, float]]]] = {}
-        self._trends: Dict[str, Trend] = {}
-        self._forecasts: Dict[str, Forecast] = {}
-        self._seasonal_patterns: Dict[str, SeasonalPattern] = {}
-        self._anomalies: List[TrendAnomaly] = []
+    MAX_ANOMALIES = 1000
+    
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        """
+        Initialize the trend forecaster.
+        
+        Args:
+            store: Time-series store to keep history in (a private one
+                if None)
+        """
+        self._store = store if store is not None else TimeSeriesStore()
+        self._trends = ResultStore("trend.trends")
+        self._forecasts = ResultStore("trend.forecasts")
+        self._seasonal_patterns = ResultStore("trend.seasonal_patterns")
+        self._anomalies: Deque[TrendAnomaly] = deque(maxlen=self.MAX_ANOMALIES)
         
         self._trend_counter = 0
         self._forecast_counter = 0
@@ -199,16 +218,7 @@ class TrendForecaster:
         value: float,
     ) -> None:
         """Add a single data point."""
-        if company_id not in self._historical_data:
-            self._historical_data[company_id] = {}
-        
-        if indicator not in self._historical_data[company_id]:
-            self._historical_data[company_id][indicator] = []
-        
-        self._historical_data[company_id][indicator].append((timestamp, value))
-        
-        # Sort by timestamp
-        self._historical_data[company_id][indicator].sort(key=lambda x: x[0])
+        self._store.append(("trend", company_id, indicator), timestamp, value)
     
     def add_historical_data(
         self,
@@ -217,8 +227,7 @@ class TrendForecaster:
         data: List[Tuple[datetime, float]],
     ) -> None:
         """Add batch historical data."""
-        for timestamp, value in data:
-            self.add_data_point(company_id, indicator, timestamp, value)
+        self._store.extend(("trend", company_id, indicator), data)
     
     def detect_trend(
         self,
@@ -237,42 +246,41 @@ class TrendForecaster:
         Returns:
             Detected Trend
         """
-        data = self._get_indicator_data(company_id, indicator)
-        if len(data) < 5:
+        timestamps, values = self._get_indicator_data(company_id, indicator)
+        if len(values) < 5:
             raise ValueError(f"Insufficient data for trend detection")
         
         # Filter by lookback
         if lookback_days:
             cutoff = datetime.now() - timedelta(days=lookback_days)
-            data = [(t, v) for t, v in data if t > cutoff]
+            timestamps, values = self._get_indicator_data(company_id, indicator, cutoff)
         
-        if len(data) < 5:
+        if len(values) < 5:
             raise ValueError("Insufficient data after filtering")
         
         self._trend_counter += 1
         trend_id = f"trend_{self._trend_counter}"
         
-        # Extract values
-        timestamps = [(d[0] - data[0][0]).days for d in data]
-        values = [d[1] for d in data]
+        # Days since the first point
+        days = self._day_offsets(timestamps)
         
         # Linear regression
-        slope, intercept, r_squared = self._linear_regression(timestamps, values)
+        slope, intercept, r_squared = self._linear_regression(days, values)
         
         # Determine direction
         direction = self._classify_direction(slope, values)
         
         # Determine trend type
-        trend_type = self._classify_trend_type(timestamps, values, slope)
+        trend_type = self._classify_trend_type(days, values, slope)
         
         # Calculate volatility
         volatility = self._calculate_volatility(values)
         
         # Calculate acceleration (change in slope)
-        acceleration = self._calculate_acceleration(timestamps, values)
+        acceleration = self._calculate_acceleration(days, values)
         
         # Confidence based on R-squared and data points
-        confidence = min(0.95, r_squared * 0.7 + len(data) / 100 * 0.3)
+        confidence = min(0.95, r_squared * 0.7 + len(values) / 100 * 0.3)
         
         trend = Trend(
             trend_id=trend_id,
@@ -285,9 +293,9 @@ class TrendForecaster:
             r_squared=r_squared,
             is_significant=abs(slope) > 0.001 and r_squared > 0.1,
             confidence=confidence,
-            period_start=data[0][0],
-            period_end=data[-1][0],
-            data_points=len(data),
+            period_start=to_datetime(timestamps[0]),
+            period_end=to_datetime(timestamps[-1]),
+            data_points=len(values),
             acceleration=acceleration,
             volatility=volatility,
         )
@@ -299,39 +307,50 @@ class TrendForecaster:
         self,
         company_id: str,
         indicator: str,
-    ) -> List[Tuple[datetime, float]]:
-        """Get time series data for an indicator."""
-        if company_id not in self._historical_data:
-            return []
-        return self._historical_data[company_id].get(indicator, [])
+        start: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values for an indicator (views, from start on)."""
+        series = self._store.get(("trend", company_id, indicator))
+        if series is None:
+            return np.empty(0, dtype="datetime64[us]"), np.empty(0)
+        return series.column_window(VALUE_COLUMN, start)
+    
+    def _day_offsets(self, timestamps: np.ndarray) -> np.ndarray:
+        """Whole days since the first timestamp."""
+        if len(timestamps) == 0:
+            return np.empty(0)
+        return ((timestamps - timestamps[0]) // np.timedelta64(1, "D")).astype(float)
     
     def _linear_regression(
         self,
-        x: List[float],
-        y: List[float],
+        x: Sequence[float],
+        y: Sequence[float],
     ) -> Tuple[float, float, float]:
         """Calculate linear regression parameters."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
         n = len(x)
         if n < 2:
             return 0.0, 0.0, 0.0
         
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
+        mean_x = float(x.mean())
+        mean_y = float(y.mean())
         
         # Calculate slope and intercept
-        numerator = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
-        denominator = sum((xi - mean_x) ** 2 for xi in x)
+        dx = x - mean_x
+        dy = y - mean_y
+        denominator = float(dx @ dx)
         
         if denominator == 0:
             return 0.0, mean_y, 0.0
         
-        slope = numerator / denominator
+        slope = float(dx @ dy) / denominator
         intercept = mean_y - slope * mean_x
         
         # Calculate R-squared
-        predictions = [slope * xi + intercept for xi in x]
-        ss_res = sum((yi - pi) ** 2 for yi, pi in zip(y, predictions))
-        ss_tot = sum((yi - mean_y) ** 2 for yi in y)
+        residuals = y - (slope * x + intercept)
+        ss_res = float(residuals @ residuals)
+        ss_tot = float(dy @ dy)
         
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
         r_squared = max(0.0, r_squared)
@@ -341,10 +360,10 @@ class TrendForecaster:
     def _classify_direction(
         self,
         slope: float,
-        values: List[float],
+        values: Sequence[float],
     ) -> TrendDirection:
         """Classify trend direction."""
-        mean_value = sum(values) / len(values) if values else 1.0
+        mean_value = float(np.mean(values)) if len(values) else 1.0
         if mean_value == 0:
             mean_value = 1.0
         
@@ -364,28 +383,25 @@ class TrendForecaster:
     
     def _classify_trend_type(
         self,
-        timestamps: List[float],
-        values: List[float],
+        timestamps: Sequence[float],
+        values: Sequence[float],
         linear_slope: float,
     ) -> TrendType:
         """Classify the type of trend."""
+        values = np.asarray(values, dtype=float)
         if len(values) < 10:
             return TrendType.LINEAR
         
         # Check for mean reversion
-        mean = sum(values) / len(values)
-        crossings = sum(
-            1 for i in range(1, len(values))
-            if (values[i-1] - mean) * (values[i] - mean) < 0
-        )
+        centered = values - values.mean()
+        crossings = int(np.count_nonzero(centered[:-1] * centered[1:] < 0))
         
         if crossings > len(values) * 0.3:
             return TrendType.MEAN_REVERTING
         
         # Check for exponential trend
-        if all(v > 0 for v in values):
-            log_values = [math.log(v) for v in values]
-            _, _, r_squared_log = self._linear_regression(timestamps, log_values)
+        if np.all(values > 0):
+            _, _, r_squared_log = self._linear_regression(timestamps, np.log(values))
             _, _, r_squared_linear = self._linear_regression(timestamps, values)
             
             if r_squared_log > r_squared_linear + 0.1:
@@ -398,14 +414,14 @@ class TrendForecaster:
         
         return TrendType.LINEAR
     
-    def _calculate_volatility(self, values: List[float]) -> float:
+    def _calculate_volatility(self, values: Sequence[float]) -> float:
         """Calculate volatility (normalized standard deviation)."""
         if len(values) < 2:
             return 0.0
         
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std_dev = math.sqrt(variance)
+        values = np.asarray(values, dtype=float)
+        mean = float(values.mean())
+        std_dev = float(values.std())
         
         # Normalize by mean
         if mean != 0:
@@ -414,8 +430,8 @@ class TrendForecaster:
     
     def _calculate_acceleration(
         self,
-        timestamps: List[float],
-        values: List[float],
+        timestamps: Sequence[float],
+        values: Sequence[float],
     ) -> float:
         """Calculate acceleration (change in slope over time)."""
         if len(values) < 10:
@@ -452,8 +468,8 @@ class TrendForecaster:
         Returns:
             Detected SeasonalPattern
         """
-        data = self._get_indicator_data(company_id, indicator)
-        if len(data) < period.value * 2:
+        timestamps, values = self._get_indicator_data(company_id, indicator)
+        if len(values) < period.value * 2:
             raise ValueError(
                 f"Need at least {period.value * 2} data points for seasonality"
             )
@@ -463,46 +479,38 @@ class TrendForecaster:
         
         period_days = period.value
         
-        # Group values by position in period
-        period_values: Dict[int, List[float]] = {}
-        
-        for timestamp, value in data:
-            if period == SeasonalPeriod.WEEKLY:
-                idx = timestamp.weekday()
-            elif period == SeasonalPeriod.MONTHLY:
-                idx = timestamp.day - 1
-            elif period == SeasonalPeriod.QUARTERLY:
-                idx = (timestamp.timetuple().tm_yday - 1) % 90
-            else:  # YEARLY
-                idx = timestamp.timetuple().tm_yday - 1
-            
-            if idx not in period_values:
-                period_values[idx] = []
-            period_values[idx].append(value)
+        # Position of each point in the period
+        days = timestamps.astype("datetime64[D]")
+        if period == SeasonalPeriod.WEEKLY:
+            # 1970-01-01 was a Thursday (weekday 3)
+            positions = (days.astype(np.int64) + 3) % 7
+        elif period == SeasonalPeriod.MONTHLY:
+            positions = (days - days.astype("datetime64[M]")).astype(np.int64)
+        elif period == SeasonalPeriod.QUARTERLY:
+            positions = (days - days.astype("datetime64[Y]")).astype(np.int64) % 90
+        else:  # YEARLY
+            positions = (days - days.astype("datetime64[Y]")).astype(np.int64)
         
         # Calculate average for each position
-        overall_mean = sum(v for d, v in data) / len(data)
-        
-        seasonal_factors: Dict[int, float] = {}
-        for idx, values in period_values.items():
-            period_mean = sum(values) / len(values)
-            if overall_mean != 0:
-                seasonal_factors[idx] = period_mean / overall_mean
-            else:
-                seasonal_factors[idx] = 1.0
+        counts = np.bincount(positions)
+        sums = np.bincount(positions, weights=values)
+        present = np.flatnonzero(counts)
+        period_means = sums[present] / counts[present]
+        
+        overall_mean = float(values.mean())
+        if overall_mean != 0:
+            factors = period_means / overall_mean
+        else:
+            factors = np.ones(len(present))
+        seasonal_factors: Dict[int, float] = dict(zip(present.tolist(), factors.tolist()))
         
         # Calculate strength of seasonality
-        factor_variance = sum(
-            (f - 1.0) ** 2 for f in seasonal_factors.values()
-        ) / len(seasonal_factors)
+        factor_variance = float(np.mean((factors - 1.0) ** 2))
         strength = min(1.0, math.sqrt(factor_variance) * 5)
         
         # Find peak and trough
-        if seasonal_factors:
-            peak_idx = max(seasonal_factors.keys(), key=lambda x: seasonal_factors[x])
-            trough_idx = min(seasonal_factors.keys(), key=lambda x: seasonal_factors[x])
-        else:
-            peak_idx = trough_idx = 0
+        peak_idx = int(present[np.argmax(factors)])
+        trough_idx = int(present[np.argmin(factors)])
         
         pattern = SeasonalPattern(
             pattern_id=pattern_id,
@@ -543,8 +551,8 @@ class TrendForecaster:
         Returns:
             Forecast with predicted values
         """
-        data = self._get_indicator_data(company_id, indicator)
-        if len(data) < 10:
+        timestamps, values = self._get_indicator_data(company_id, indicator)
+        if len(values) < 10:
             raise ValueError("Need at least 10 data points for forecasting")
         
         self._forecast_counter += 1
@@ -555,7 +563,7 @@ class TrendForecaster:
         
         # Detect seasonality if requested
         seasonal_pattern = None
-        if include_seasonality and len(data) >= 14:
+        if include_seasonality and len(values) >= 14:
             try:
                 seasonal_pattern = self.detect_seasonality(
                     company_id, indicator, SeasonalPeriod.WEEKLY
@@ -564,12 +572,12 @@ class TrendForecaster:
                 pass
         
         # Generate forecasts
-        last_date = data[-1][0]
-        last_value = data[-1][1]
-        values = [d[1] for d in data]
+        first_date = to_datetime(timestamps[0])
+        last_date = to_datetime(timestamps[-1])
+        last_value = float(values[-1])
         
         # Calculate historical error for confidence intervals
-        historical_error = self._calculate_volatility(values[-30:] if len(values) > 30 else values)
+        historical_error = self._calculate_volatility(values[-30:])
         
         forecasted_values: List[ForecastPoint] = []
         
@@ -578,7 +586,7 @@ class TrendForecaster:
             
             # Trend component
             trend_value = trend.intercept + trend.slope * (
-                (forecast_date - data[0][0]).days
+                (forecast_date - first_date).days
             )
             
             # Seasonal component
@@ -625,7 +633,7 @@ class TrendForecaster:
             change_direction = "stable"
         
         # Backtest for accuracy estimation
-        mape, rmse = self._backtest_forecast(data, trend)
+        mape, rmse = self._backtest_forecast(timestamps, values, trend)
         
         forecast = Forecast(
             forecast_id=forecast_id,
@@ -634,7 +642,7 @@ class TrendForecaster:
             generated_at=datetime.now(),
             horizon_days=horizon_days,
             method="trend_seasonal" if seasonal_pattern else "trend",
-            historical_values=data[-30:],  # Last 30 points
+            historical_values=list(zip(timestamps[-30:].tolist(), values[-30:].tolist())),  # Last 30 points
             forecasted_values=forecasted_values,
             underlying_trend=trend,
             seasonal_pattern=seasonal_pattern,
@@ -649,33 +657,25 @@ class TrendForecaster:
     
     def _backtest_forecast(
         self,
-        data: List[Tuple[datetime, float]],
+        timestamps: np.ndarray,
+        values: np.ndarray,
         trend: Trend,
         test_size: int = 10,
     ) -> Tuple[float, float]:
         """Backtest forecast accuracy."""
-        if len(data) < test_size + 10:
+        if len(values) < test_size + 10:
             return 0.1, 0.1  # Default errors
         
-        train_data = data[:-test_size]
-        test_data = data[-test_size:]
+        days_ahead = self._day_offsets(timestamps)[-test_size:]
+        actual = values[-test_size:]
+        predicted = trend.intercept + trend.slope * days_ahead
         
-        # Get last training date
-        last_train_date = train_data[-1][0]
+        nonzero = actual != 0
+        errors = np.zeros(test_size)
+        errors[nonzero] = np.abs(actual - predicted)[nonzero] / actual[nonzero]
         
-        errors = []
-        squared_errors = []
-        
-        for test_date, actual in test_data:
-            days_ahead = (test_date - data[0][0]).days
-            predicted = trend.intercept + trend.slope * days_ahead
-            
-            error = abs(actual - predicted) / actual if actual != 0 else 0
-            errors.append(error)
-            squared_errors.append((actual - predicted) ** 2)
-        
-        mape = sum(errors) / len(errors) if errors else 0.0
-        rmse = math.sqrt(sum(squared_errors) / len(squared_errors)) if squared_errors else 0.0
+        mape = float(errors.mean())
+        rmse = math.sqrt(float(np.mean((actual - predicted) ** 2)))
         
         return mape, rmse
     
@@ -696,58 +696,57 @@ class TrendForecaster:
         Returns:
             List of detected TrendAnomaly
         """
-        data = self._get_indicator_data(company_id, indicator)
-        if len(data) < 20:
+        timestamps, values = self._get_indicator_data(company_id, indicator)
+        if len(values) < 20:
             return []
         
         anomalies: List[TrendAnomaly] = []
         
-        values = [d[1] for d in data]
-        mean = sum(values) / len(values)
-        std_dev = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+        mean = float(values.mean())
+        std_dev = float(values.std())
         
         threshold = sensitivity * std_dev
         
-        for i, (timestamp, value) in enumerate(data):
-            deviation = abs(value - mean)
+        deviations = np.abs(values - mean)
+        for i in np.flatnonzero(deviations > threshold).tolist():
+            value = float(values[i])
+            deviation = float(deviations[i])
+            self._anomaly_counter += 1
             
-            if deviation > threshold:
-                self._anomaly_counter += 1
+            # Determine type
+            if i > 0 and i < len(values) - 1:
+                prev_value = values[i-1]
+                next_value = values[i+1]
                 
-                # Determine type
-                if i > 0 and i < len(data) - 1:
-                    prev_value = data[i-1][1]
-                    next_value = data[i+1][1]
-                    
-                    if abs(value - prev_value) > threshold and abs(next_value - prev_value) < std_dev:
-                        anomaly_type = "outlier"
-                    else:
-                        anomaly_type = "level_shift"
-                else:
+                if abs(value - prev_value) > threshold and abs(next_value - prev_value) < std_dev:
                     anomaly_type = "outlier"
-                
-                # Determine severity
-                if deviation > 3 * std_dev:
-                    severity = "high"
-                elif deviation > 2 * std_dev:
-                    severity = "medium"
                 else:
-                    severity = "low"
-                
-                anomalies.append(
-                    TrendAnomaly(
-                        anomaly_id=f"anomaly_{self._anomaly_counter}",
-                        indicator=indicator,
-                        company_id=company_id,
-                        detected_at=timestamp,
-                        anomaly_type=anomaly_type,
-                        severity=severity,
-                        expected_value=mean,
-                        actual_value=value,
-                        deviation=deviation / std_dev,  # In standard deviations
-                        explanation=f"{anomaly_type.title()} detected: value is {deviation/std_dev:.1f} standard deviations from mean",
-                    )
+                    anomaly_type = "level_shift"
+            else:
+                anomaly_type = "outlier"
+            
+            # Determine severity
+            if deviation > 3 * std_dev:
+                severity = "high"
+            elif deviation > 2 * std_dev:
+                severity = "medium"
+            else:
+                severity = "low"
+            
+            anomalies.append(
+                TrendAnomaly(
+                    anomaly_id=f"anomaly_{self._anomaly_counter}",
+                    indicator=indicator,
+                    company_id=company_id,
+                    detected_at=to_datetime(timestamps[i]),
+                    anomaly_type=anomaly_type,
+                    severity=severity,
+                    expected_value=mean,
+                    actual_value=value,
+                    deviation=deviation / std_dev,  # In standard deviations
+                    explanation=f"{anomaly_type.title()} detected: value is {deviation/std_dev:.1f} standard deviations from mean",
                 )
+            )
         
         self._anomalies.extend(anomalies)
         return anomalies
@@ -769,27 +768,25 @@ class TrendForecaster:
         Returns:
             List of trend change anomalies
         """
-        data = self._get_indicator_data(company_id, indicator)
-        if len(data) < window_size * 3:
+        timestamps, values = self._get_indicator_data(company_id, indicator)
+        if len(values) < window_size * 3:
             return []
         
         anomalies: List[TrendAnomaly] = []
         
-        values = [d[1] for d in data]
-        timestamps = [d[0] for d in data]
+        # Local trend slope for every window at once: windows[s] is
+        # values[s:s + window_size], regressed against 0..window_size-1
+        windows = np.lib.stride_tricks.sliding_window_view(values, window_size)
+        dx = np.arange(window_size) - (window_size - 1) / 2
+        slopes = windows @ dx / (dx @ dx)
         
         prev_direction = None
         
-        for i in range(window_size, len(data) - window_size):
+        for i in range(window_size, len(values) - window_size):
             # Calculate local trend
-            local_x = list(range(window_size))
-            local_y = values[i - window_size // 2:i + window_size // 2]
-            
-            if len(local_y) < window_size:
-                continue
-            
-            slope, _, _ = self._linear_regression(local_x, local_y)
-            direction = self._classify_direction(slope, local_y)
+            start = i - window_size // 2
+            slope = float(slopes[start])
+            direction = self._classify_direction(slope, windows[start])
             
             if prev_direction is not None and direction != prev_direction:
                 # Check if it's a significant change
@@ -801,11 +798,11 @@ class TrendForecaster:
                             anomaly_id=f"anomaly_{self._anomaly_counter}",
                             indicator=indicator,
                             company_id=company_id,
-                            detected_at=timestamps[i],
+                            detected_at=to_datetime(timestamps[i]),
                             anomaly_type="reversal",
                             severity="medium",
-                            expected_value=values[i-1],
-                            actual_value=values[i],
+                            expected_value=float(values[i-1]),
+                            actual_value=float(values[i]),
                             deviation=abs(slope) * 100,
                             previous_trend=prev_direction,
                             new_trend=direction,
@@ -884,20 +881,29 @@ class TrendForecaster:
         """Get a trend by ID."""
         return self._trends.get(trend_id)
     
+    def get_result_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters of the result stores."""
+        return {
+            store.name: store.get_stats()
+            for store in (self._trends, self._forecasts, self._seasonal_patterns)
+        }
+    
     def get_data_summary(self, company_id: str) -> Dict[str, Any]:
         """Get summary of available data."""
-        if company_id not in self._historical_data:
+        keys = self._store.keys(("trend", company_id))
+        if not keys:
             return {"company_id": company_id, "indicators": {}}
         
         indicators = {}
-        for ind, data in self._historical_data[company_id].items():
-            if data:
-                indicators[ind] = {
-                    "data_points": len(data),
-                    "start_date": data[0][0].isoformat(),
-                    "end_date": data[-1][0].isoformat(),
-                    "min_value": min(d[1] for d in data),
-                    "max_value": max(d[1] for d in data),
+        for key in keys:
+            timestamps, values = self._get_indicator_data(company_id, key[2])
+            if len(values):
+                indicators[key[2]] = {
+                    "data_points": len(values),
+                    "start_date": to_datetime(timestamps[0]).isoformat(),
+                    "end_date": to_datetime(timestamps[-1]).isoformat(),
+                    "min_value": float(values.min()),
+                    "max_value": float(values.max()),
                 }
         
         return {
@@ -909,7 +915,6 @@ class TrendForecaster:
     def clear_data(self, company_id: Optional[str] = None) -> None:
         """Clear historical data."""
         if company_id:
-            if company_id in self._historical_data:
-                del self._historical_data[company_id]
+            self._store.clear(("trend", company_id))
         else:
-            self._historical_data.clear()
+            self._store.clear(("trend",))
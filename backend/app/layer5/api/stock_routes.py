@@ -52,3 +52,12 @@ async def clear_cache():
             status_code=500,
             detail="Failed to clear cache"
         )
+
+
+@router.get("/cache-stats")
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get stock market cache statistics
+    (hits, stale hits, coalesced requests, background refreshes)
+    """
+    return StockMarketService.get_cache_stats()
@@ -7,6 +7,7 @@ from app.core.config import settings
 from app.api.v1.router import api_router
 from app.db.mongodb_entities import MongoDBEntityStorage
 from app.api.v1.endpoints.cache import cache
+from app.utils.http_clients import close_http_clients
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -35,6 +36,11 @@ def create_app() -> FastAPI:
     # Serve static files (dashboard)
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
+    @app.on_event("shutdown")
+    async def shutdown_http_clients():
+        """Close pooled HTTP connections"""
+        await close_http_clients()
+
     # Root endpoint - serve dashboard
     @app.get("/")
     async def root():
@@ -7,6 +7,7 @@ Manages state across the data collection pipeline.
 Components:
     - MasterOrchestrator: Main LangGraph workflow controller
     - StateManager: Distributed state management with Redis
+    - ScrapeScheduler: Concurrent source scraping with per-host limits
 
 Usage:
     from app.orchestrator import create_orchestrator
@@ -21,6 +22,7 @@ from app.orchestrator.state_manager import (
     PipelineState,
     get_state_manager
 )
+from app.orchestrator.scrape_scheduler import ScrapeScheduler
 from app.orchestrator.master_orchestrator import (
     MasterOrchestrator,
     create_orchestrator
@@ -32,6 +34,8 @@ __all__ = [
     "PipelinePhase",
     "PipelineState",
     "get_state_manager",
+    # Scraping
+    "ScrapeScheduler",
     # Orchestrator
     "MasterOrchestrator",
     "create_orchestrator"
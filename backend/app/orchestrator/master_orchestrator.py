@@ -31,6 +31,7 @@ from app.orchestrator.state_manager import (
     PipelinePhase, 
     get_state_manager
 )
+from app.orchestrator.scrape_scheduler import ScrapeScheduler
 
 # Source Reputation System imports
 try:
@@ -85,6 +86,12 @@ class MasterOrchestrator:
         
         # Initialize tools
         self.scraper_manager = ScraperToolManager()
+        self.scrape_scheduler = ScrapeScheduler(
+            execute=self.scraper_manager.execute_scraper,
+            host_for=self.scraper_manager.get_source_host,
+            max_concurrency=self.config.scrape_max_concurrency,
+            per_host_concurrency=self.config.scrape_per_host_concurrency
+        )
         
         # Initialize Source Reputation System (lazy initialization - requires DB session)
         # QualityFilter and ReputationManager will be initialized per-session
@@ -212,7 +219,8 @@ class MasterOrchestrator:
         """
         Node: Execute scrapers for selected sources.
         
-        Runs scrapers in parallel with rate limiting.
+        Runs scrapers concurrently through the ScrapeScheduler and
+        records per-source wall time and bytes fetched in the metrics.
         """
         logger.info(f"Run {state['run_id']}: Scraping {len(state['sources_to_scrape'])} sources")
         
@@ -224,36 +232,40 @@ class MasterOrchestrator:
             
             scraped_content = []
             errors = state.get("errors", [])
+            source_metrics = {}
             
-            # Scrape each source
-            for source_name in state["sources_to_scrape"]:
-                try:
-                    # Execute scraper
-                    result = await self.scraper_manager.execute_scraper(source_name)
-                    
-                    if result.get("success"):
-                        articles = result.get("articles", [])
-                        for article in articles:
-                            article["source_name"] = source_name
-                            scraped_content.append(article)
-                            
-                            await self.state_manager.add_scraped_content(
-                                state['run_id'], 
-                                article
-                            )
-                    else:
-                        errors.append({
-                            "phase": "scrape_content",
-                            "source": source_name,
-                            "error": result.get("error", "Unknown error")
-                        })
-                        
-                except Exception as e:
+            # Scrape all sources concurrently (global and per-host caps)
+            start = datetime.utcnow()
+            results = await self.scrape_scheduler.run(state["sources_to_scrape"])
+            wall_time_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
+            
+            for source_name, result in zip(state["sources_to_scrape"], results):
+                articles = result.get("articles", []) if result.get("success") else []
+                source_metrics[source_name] = {
+                    "success": bool(result.get("success")),
+                    "host": result["host"],
+                    "wall_time_ms": result["wall_time_ms"],
+                    "bytes_fetched": result["bytes_fetched"],
+                    "articles": len(articles),
+                    "from_cache": result.get("from_cache", False)
+                }
+                
+                if not result.get("success"):
                     errors.append({
                         "phase": "scrape_content",
                         "source": source_name,
-                        "error": str(e)
+                        "error": result.get("error", "Unknown error")
                     })
+                    continue
+                
+                for article in articles:
+                    article["source_name"] = source_name
+                    scraped_content.append(article)
+            
+            await self.state_manager.add_many_scraped_content(
+                state['run_id'],
+                scraped_content
+            )
             
             return {
                 "scraped_content": scraped_content,
@@ -261,7 +273,10 @@ class MasterOrchestrator:
                 "errors": errors,
                 "metrics": {
                     **state.get("metrics", {}),
-                    "articles_scraped": len(scraped_content)
+                    "articles_scraped": len(scraped_content),
+                    "scrape_wall_time_ms": wall_time_ms,
+                    "bytes_fetched": sum(m["bytes_fetched"] for m in source_metrics.values()),
+                    "sources": source_metrics
                 }
             }
             
@@ -289,7 +304,8 @@ class MasterOrchestrator:
         """
         Node: Process all scraped articles.
         
-        Uses ProcessingAgent to clean and enhance content.
+        Uses ProcessingAgent.process_batch to clean and enhance content
+        (rule-based pass for the whole batch, bounded LLM concurrency).
         """
         logger.info(f"Run {state['run_id']}: Processing {len(state['scraped_content'])} articles")
         
@@ -301,37 +317,45 @@ class MasterOrchestrator:
             
             processed_articles = []
             errors = state.get("errors", [])
+            contents = state["scraped_content"]
             
-            # Process each article
-            for content in state["scraped_content"]:
-                try:
-                    result = await self.processing_agent.execute({
-                        "content": content,
+            batch = await self.processing_agent.process_batch(
+                [
+                    {
+                        **content,
+                        "content": content.get("body") or content.get("content") or "",
                         "source": content.get("source_name", "unknown")
+                    }
+                    for content in contents
+                ],
+                max_concurrency=self.config.llm_batch_concurrency
+            )
+            
+            for content, result in zip(contents, batch["results"]):
+                if result.get("action") == "process":
+                    processed_articles.append({
+                        **content,
+                        **result.get("processed_content", {}),
+                        "processing_quality_score": result.get("quality_score"),
+                        "content_type": result.get("content_type"),
+                        "content_hash": result.get("content_hash")
                     })
-                    
-                    if result.get("success"):
-                        processed = result.get("processed_article", {})
-                        processed_articles.append(processed)
-                        
-                        await self.state_manager.add_processed_article(
-                            state['run_id'], 
-                            processed
-                        )
-                    else:
-                        errors.append({
-                            "phase": "process_articles",
-                            "article_url": content.get("url", "unknown"),
-                            "error": result.get("error", "Processing failed")
-                        })
-                        
-                except Exception as e:
+                else:
                     errors.append({
                         "phase": "process_articles",
                         "article_url": content.get("url", "unknown"),
-                        "error": str(e)
+                        "error": (
+                            result.get("error")
+                            or result.get("reason")
+                            or result.get("recommendation", "Processing failed")
+                        )
                     })
             
+            await self.state_manager.add_many_processed_articles(
+                state['run_id'],
+                processed_articles
+            )
+            
             return {
                 "processed_articles": processed_articles,
                 "phase": PipelinePhase.PROCESSING.value,
@@ -359,40 +383,48 @@ class MasterOrchestrator:
         """
         Node: Classify priority/urgency for all articles.
         
-        Uses PriorityAgent to detect critical content.
+        Uses PriorityAgent.classify_batch to detect critical content.
         """
         logger.info(f"Run {state['run_id']}: Classifying priority for {len(state['processed_articles'])} articles")
         
         try:
             classifications = []
             critical_count = 0
+            articles = state["processed_articles"]
             
-            for article in state["processed_articles"]:
-                try:
-                    result = await self.priority_agent.execute({
-                        "article": article
-                    })
-                    
-                    classification = {
+            batch = await self.priority_agent.classify_batch(
+                [
+                    {
                         **article,
-                        "urgency_level": result.get("urgency_level", "MEDIUM"),
-                        "urgency_reason": result.get("reason", ""),
-                        "urgency_score": result.get("urgency_score", 50)
+                        "content": article.get("body") or article.get("content") or "",
+                        "source": article.get("source_name", "unknown")
                     }
-                    
-                    classifications.append(classification)
-                    
-                    if result.get("urgency_level") in ["CRITICAL", "HIGH"]:
-                        critical_count += 1
-                        
-                except Exception as e:
+                    for article in articles
+                ],
+                max_concurrency=self.config.llm_batch_concurrency
+            )
+            
+            for article, result in zip(articles, batch["results"]):
+                if "error" in result:
                     # On error, assign default priority
                     classifications.append({
                         **article,
                         "urgency_level": "MEDIUM",
-                        "urgency_reason": f"Classification error: {e}",
+                        "urgency_reason": f"Classification error: {result['error']}",
                         "urgency_score": 50
                     })
+                    continue
+                
+                urgency_level = result.get("urgency_level", "medium").upper()
+                classifications.append({
+                    **article,
+                    "urgency_level": urgency_level,
+                    "urgency_reason": result.get("reasoning", ""),
+                    "urgency_score": result.get("urgency_score", 50)
+                })
+                
+                if urgency_level in ["CRITICAL", "HIGH"]:
+                    critical_count += 1
             
             return {
                 "priority_classifications": classifications,
@@ -423,7 +455,7 @@ class MasterOrchestrator:
         """
         Node: Validate quality of all articles.
         
-        Uses ValidationAgent to ensure data quality.
+        Uses ValidationAgent.validate_batch to ensure data quality.
         """
         logger.info(f"Run {state['run_id']}: Validating {len(state['priority_classifications'])} articles")
         
@@ -436,41 +468,44 @@ class MasterOrchestrator:
             validated_articles = []
             rejected_count = 0
             errors = state.get("errors", [])
+            articles = state["priority_classifications"]
             
-            for article in state["priority_classifications"]:
-                try:
-                    result = await self.validation_agent.execute({
-                        "content": article
+            batch = await self.validation_agent.validate_batch(
+                [
+                    {**article, "source": article.get("source_name", "unknown")}
+                    for article in articles
+                ],
+                max_concurrency=self.config.llm_batch_concurrency
+            )
+            validation_timestamp = datetime.utcnow().isoformat()
+            
+            for article, result in zip(articles, batch["results"]):
+                if "error" in result:
+                    errors.append({
+                        "phase": "validate_quality",
+                        "article_url": article.get("url", "unknown"),
+                        "error": result["error"]
                     })
-                    
-                    if result.get("is_valid", False):
-                        validated = {
-                            **article,
-                            "quality_score": result.get("quality_score", 0),
-                            "validation_timestamp": datetime.utcnow().isoformat()
-                        }
-                        validated_articles.append(validated)
-                        
-                        await self.state_manager.add_validated_article(
-                            state['run_id'], 
-                            validated
-                        )
-                    else:
-                        rejected_count += 1
-                        errors.append({
-                            "phase": "validate_quality",
-                            "article_url": article.get("url", "unknown"),
-                            "reason": "Failed validation",
-                            "issues": result.get("issues", [])
-                        })
-                        
-                except Exception as e:
+                elif result.get("is_valid", False):
+                    validated_articles.append({
+                        **article,
+                        "quality_score": result.get("quality_score", 0),
+                        "validation_timestamp": validation_timestamp
+                    })
+                else:
+                    rejected_count += 1
                     errors.append({
                         "phase": "validate_quality",
                         "article_url": article.get("url", "unknown"),
-                        "error": str(e)
+                        "reason": "Failed validation",
+                        "issues": result.get("validation_issues", [])
                     })
             
+            await self.state_manager.add_many_validated_articles(
+                state['run_id'],
+                validated_articles
+            )
+            
             return {
                 "validated_articles": validated_articles,
                 "phase": PipelinePhase.VALIDATION.value,
@@ -44,6 +44,69 @@ class PipelineState(TypedDict):
     metrics: Dict[str, Any]
 
 
+class _MemoryPipeline:
+    """
+    In-memory stand-in for a Redis pipeline, used when Redis is unavailable.
+    
+    Supports the list/hash commands StateManager issues; hashes are dicts
+    and lists are lists inside the shared store.
+    """
+    
+    def __init__(self, store: Dict[str, Any]):
+        self._store = store
+        self._ops: List[Any] = []
+    
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        
+        def queue(*args, **kwargs):
+            self._ops.append((getattr(self, f"_{name}"), args, kwargs))
+            return self
+        return queue
+    
+    async def execute(self) -> List[Any]:
+        ops, self._ops = self._ops, []
+        return [op(*args, **kwargs) for op, args, kwargs in ops]
+    
+    def _delete(self, *keys: str) -> int:
+        return sum(self._store.pop(k, None) is not None for k in keys)
+    
+    def _expire(self, key: str, ttl: int) -> bool:
+        return key in self._store
+    
+    def _hset(self, key: str, field: Optional[str] = None, value: Any = None,
+              mapping: Optional[Dict[str, Any]] = None) -> int:
+        h = self._store.setdefault(key, {})
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        h.update(items)
+        return len(items)
+    
+    def _hget(self, key: str, field: str) -> Any:
+        return self._store.get(key, {}).get(field)
+    
+    def _hgetall(self, key: str) -> Dict[str, Any]:
+        return dict(self._store.get(key, {}))
+    
+    def _hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        h = self._store.setdefault(key, {})
+        h[field] = h.get(field, 0) + amount
+        return h[field]
+    
+    _hincrbyfloat = _hincrby
+    
+    def _rpush(self, key: str, *values: Any) -> int:
+        lst = self._store.setdefault(key, [])
+        lst.extend(values)
+        return len(lst)
+    
+    def _lrange(self, key: str, start: int, end: int) -> List[Any]:
+        lst = self._store.get(key, [])
+        return lst[start:] if end == -1 else lst[start:end + 1]
+
+
 class StateManager:
     """
     Manages distributed state for the AI agent orchestrator.
@@ -52,8 +115,27 @@ class StateManager:
     - Distributed execution
     - Recovery from failures
     - State inspection/debugging
+    
+    Each run is stored field by field so writers append instead of
+    rewriting the whole state:
+    - {prefix}{run_id}:meta     hash  (run_id, phase, started_at, updated_at)
+    - {prefix}{run_id}:metrics  hash  (HINCRBY counters)
+    - {prefix}{run_id}:<field>  list  (sources_to_scrape and one per
+      article/error list, items JSON encoded)
+    
+    Writes go through one pipeline per call, so add_many_* stores any
+    number of items in a single round trip. Writes don't check that the
+    run exists; stray keys expire with the state TTL.
     """
     
+    # Per-item JSON lists and the metric each one counts
+    LIST_FIELDS = {
+        "scraped_content": "articles_scraped",
+        "processed_articles": "articles_processed",
+        "validated_articles": "articles_validated",
+        "errors": "errors_count",
+    }
+    
     def __init__(self, redis_url: Optional[str] = None):
         """Initialize state manager with Redis connection."""
         config = get_agent_config()
@@ -61,7 +143,8 @@ class StateManager:
         self._redis: Optional[redis.Redis] = None
         
         # Fallback in-memory state when Redis is unavailable
-        self._memory_state: Dict[str, str] = {}
+        # (key -> dict for hashes, list for lists)
+        self._memory_state: Dict[str, Any] = {}
         
         # State key prefix
         self.prefix = "agent_state:"
@@ -95,6 +178,35 @@ class StateManager:
         """Generate Redis key for a state entry."""
         return f"{self.prefix}{run_id}:{key}"
     
+    def _pipeline(self):
+        """Redis pipeline, or the in-memory equivalent."""
+        if self._redis:
+            return self._redis.pipeline(transaction=False)
+        return _MemoryPipeline(self._memory_state)
+    
+    def _touch(self, pipe, run_id: str, *fields: str) -> None:
+        """Queue updated_at and TTL refresh for the written keys."""
+        meta_key = self._get_key(run_id, "meta")
+        pipe.hset(meta_key, "updated_at", datetime.utcnow().isoformat())
+        for key in (meta_key, *(self._get_key(run_id, f) for f in fields)):
+            pipe.expire(key, self.state_ttl)
+    
+    @staticmethod
+    def _parse_metrics(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert metric hash values back to numbers."""
+        metrics = {}
+        for name, value in raw.items():
+            if isinstance(value, str):
+                try:
+                    value = int(value)
+                except ValueError:
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+            metrics[name] = value
+        return metrics
+    
     async def create_run(self) -> str:
         """
         Create a new pipeline run.
@@ -103,28 +215,30 @@ class StateManager:
             run_id: Unique identifier for this run
         """
         run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+        now = datetime.utcnow().isoformat()
         
-        initial_state: PipelineState = {
+        pipe = self._pipeline()
+        pipe.hset(self._get_key(run_id, "meta"), mapping={
             "run_id": run_id,
             "phase": PipelinePhase.IDLE.value,
-            "started_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
-            "sources_to_scrape": [],
-            "scraped_content": [],
-            "processed_articles": [],
-            "validated_articles": [],
-            "errors": [],
-            "metrics": {
-                "sources_analyzed": 0,
-                "articles_scraped": 0,
-                "articles_processed": 0,
-                "articles_validated": 0,
-                "articles_stored": 0,
-                "errors_count": 0
-            }
-        }
+            "started_at": now,
+            "updated_at": now
+        })
+        pipe.hset(self._get_key(run_id, "metrics"), mapping={
+            "sources_analyzed": 0,
+            "articles_scraped": 0,
+            "articles_processed": 0,
+            "articles_validated": 0,
+            "articles_stored": 0,
+            "errors_count": 0
+        })
+        self._touch(pipe, run_id, "metrics")
+        
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error creating state for {run_id}: {e}")
         
-        await self._set_state(run_id, initial_state)
         logger.info(f"Created new pipeline run: {run_id}")
         
         return run_id
@@ -139,34 +253,40 @@ class StateManager:
         Returns:
             Current state or None if not found
         """
-        key = self._get_key(run_id, "state")
-        
         try:
-            if self._redis:
-                data = await self._redis.get(key)
-            else:
-                data = self._memory_state.get(key)
+            pipe = self._pipeline()
+            pipe.hgetall(self._get_key(run_id, "meta"))
+            pipe.hgetall(self._get_key(run_id, "metrics"))
+            pipe.lrange(self._get_key(run_id, "sources_to_scrape"), 0, -1)
+            for field in self.LIST_FIELDS:
+                pipe.lrange(self._get_key(run_id, field), 0, -1)
+            meta, metrics, sources, *lists = await pipe.execute()
             
-            if data:
-                return json.loads(data)
+            if not meta:
+                return await self._get_legacy_state(run_id)
+            
+            state: PipelineState = {
+                "run_id": meta.get("run_id", run_id),
+                "phase": meta.get("phase", PipelinePhase.IDLE.value),
+                "started_at": meta.get("started_at"),
+                "updated_at": meta.get("updated_at"),
+                "sources_to_scrape": list(sources),
+                "metrics": self._parse_metrics(metrics)
+            }
+            for field, items in zip(self.LIST_FIELDS, lists):
+                state[field] = [json.loads(item) for item in items]
+            return state
         except Exception as e:
             logger.error(f"Error getting state for {run_id}: {e}")
         
         return None
     
-    async def _set_state(self, run_id: str, state: PipelineState) -> None:
-        """Set the complete state for a run."""
-        state["updated_at"] = datetime.utcnow().isoformat()
-        key = self._get_key(run_id, "state")
-        
-        try:
-            data = json.dumps(state, default=str)
-            if self._redis:
-                await self._redis.setex(key, self.state_ttl, data)
-            else:
-                self._memory_state[key] = data
-        except Exception as e:
-            logger.error(f"Error setting state for {run_id}: {e}")
+    async def _get_legacy_state(self, run_id: str) -> Optional[PipelineState]:
+        """Read a run written as a single JSON blob (pre field-level state)."""
+        if not self._redis:
+            return None
+        data = await self._redis.get(self._get_key(run_id, "state"))
+        return json.loads(data) if data else None
     
     async def update_phase(
         self, 
@@ -174,11 +294,14 @@ class StateManager:
         phase: PipelinePhase
     ) -> None:
         """Update the current phase of the pipeline."""
-        state = await self.get_state(run_id)
-        if state:
-            state["phase"] = phase.value
-            await self._set_state(run_id, state)
+        pipe = self._pipeline()
+        pipe.hset(self._get_key(run_id, "meta"), "phase", phase.value)
+        self._touch(pipe, run_id)
+        try:
+            await pipe.execute()
             logger.info(f"Run {run_id}: Phase updated to {phase.value}")
+        except Exception as e:
+            logger.error(f"Error updating phase for {run_id}: {e}")
     
     async def set_sources_to_scrape(
         self, 
@@ -186,11 +309,39 @@ class StateManager:
         sources: List[str]
     ) -> None:
         """Set the list of sources that should be scraped."""
-        state = await self.get_state(run_id)
-        if state:
-            state["sources_to_scrape"] = sources
-            state["metrics"]["sources_analyzed"] = len(sources)
-            await self._set_state(run_id, state)
+        key = self._get_key(run_id, "sources_to_scrape")
+        pipe = self._pipeline()
+        pipe.delete(key)
+        if sources:
+            pipe.rpush(key, *sources)
+        pipe.hset(self._get_key(run_id, "metrics"), "sources_analyzed", len(sources))
+        self._touch(pipe, run_id, "sources_to_scrape", "metrics")
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error setting sources for {run_id}: {e}")
+    
+    async def _append(
+        self,
+        run_id: str,
+        field: str,
+        items: List[Dict[str, Any]]
+    ) -> None:
+        """RPUSH items onto a list field and bump its counter, in one round trip."""
+        if not items:
+            return
+        
+        pipe = self._pipeline()
+        pipe.rpush(
+            self._get_key(run_id, field),
+            *(json.dumps(item, default=str) for item in items)
+        )
+        pipe.hincrby(self._get_key(run_id, "metrics"), self.LIST_FIELDS[field], len(items))
+        self._touch(pipe, run_id, field, "metrics")
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error appending {field} for {run_id}: {e}")
     
     async def add_scraped_content(
         self, 
@@ -198,11 +349,15 @@ class StateManager:
         content: Dict[str, Any]
     ) -> None:
         """Add scraped content to the state."""
-        state = await self.get_state(run_id)
-        if state:
-            state["scraped_content"].append(content)
-            state["metrics"]["articles_scraped"] += 1
-            await self._set_state(run_id, state)
+        await self._append(run_id, "scraped_content", [content])
+    
+    async def add_many_scraped_content(
+        self,
+        run_id: str,
+        contents: List[Dict[str, Any]]
+    ) -> None:
+        """Add a batch of scraped content to the state."""
+        await self._append(run_id, "scraped_content", contents)
     
     async def add_processed_article(
         self, 
@@ -210,11 +365,15 @@ class StateManager:
         article: Dict[str, Any]
     ) -> None:
         """Add a processed article to the state."""
-        state = await self.get_state(run_id)
-        if state:
-            state["processed_articles"].append(article)
-            state["metrics"]["articles_processed"] += 1
-            await self._set_state(run_id, state)
+        await self._append(run_id, "processed_articles", [article])
+    
+    async def add_many_processed_articles(
+        self,
+        run_id: str,
+        articles: List[Dict[str, Any]]
+    ) -> None:
+        """Add a batch of processed articles to the state."""
+        await self._append(run_id, "processed_articles", articles)
     
     async def add_validated_article(
         self, 
@@ -222,11 +381,15 @@ class StateManager:
         article: Dict[str, Any]
     ) -> None:
         """Add a validated article to the state."""
-        state = await self.get_state(run_id)
-        if state:
-            state["validated_articles"].append(article)
-            state["metrics"]["articles_validated"] += 1
-            await self._set_state(run_id, state)
+        await self._append(run_id, "validated_articles", [article])
+    
+    async def add_many_validated_articles(
+        self,
+        run_id: str,
+        articles: List[Dict[str, Any]]
+    ) -> None:
+        """Add a batch of validated articles to the state."""
+        await self._append(run_id, "validated_articles", articles)
     
     async def add_error(
         self, 
@@ -234,12 +397,18 @@ class StateManager:
         error: Dict[str, Any]
     ) -> None:
         """Add an error to the state."""
-        state = await self.get_state(run_id)
-        if state:
-            error["timestamp"] = datetime.utcnow().isoformat()
-            state["errors"].append(error)
-            state["metrics"]["errors_count"] += 1
-            await self._set_state(run_id, state)
+        await self.add_many_errors(run_id, [error])
+    
+    async def add_many_errors(
+        self,
+        run_id: str,
+        errors: List[Dict[str, Any]]
+    ) -> None:
+        """Add a batch of errors to the state."""
+        timestamp = datetime.utcnow().isoformat()
+        for error in errors:
+            error["timestamp"] = timestamp
+        await self._append(run_id, "errors", errors)
     
     async def increment_metric(
         self, 
@@ -248,20 +417,31 @@ class StateManager:
         amount: int = 1
     ) -> None:
         """Increment a metric counter."""
-        state = await self.get_state(run_id)
-        if state:
-            if metric_name in state["metrics"]:
-                state["metrics"][metric_name] += amount
-            else:
-                state["metrics"][metric_name] = amount
-            await self._set_state(run_id, state)
+        key = self._get_key(run_id, "metrics")
+        pipe = self._pipeline()
+        if isinstance(amount, int):
+            pipe.hincrby(key, metric_name, amount)
+        else:
+            pipe.hincrbyfloat(key, metric_name, amount)
+        self._touch(pipe, run_id, "metrics")
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Error incrementing {metric_name} for {run_id}: {e}")
     
     async def get_metrics(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Get metrics for a run."""
-        state = await self.get_state(run_id)
-        if state:
-            return state["metrics"]
-        return None
+        try:
+            pipe = self._pipeline()
+            pipe.hgetall(self._get_key(run_id, "metrics"))
+            metrics, = await pipe.execute()
+            if metrics:
+                return self._parse_metrics(metrics)
+        except Exception as e:
+            logger.error(f"Error getting metrics for {run_id}: {e}")
+        
+        state = await self._get_legacy_state(run_id) if self._redis else None
+        return state["metrics"] if state else None
     
     async def complete_run(
         self, 
@@ -278,27 +458,35 @@ class StateManager:
         Returns:
             Final run summary
         """
-        state = await self.get_state(run_id)
-        if not state:
+        meta_key = self._get_key(run_id, "meta")
+        metrics_key = self._get_key(run_id, "metrics")
+        
+        pipe = self._pipeline()
+        pipe.hget(meta_key, "started_at")
+        started_at, = await pipe.execute()
+        if not started_at:
             return {"error": "Run not found"}
         
         phase = PipelinePhase.COMPLETED if success else PipelinePhase.ERROR
-        state["phase"] = phase.value
-        state["updated_at"] = datetime.utcnow().isoformat()
         
         # Calculate duration
-        started = datetime.fromisoformat(state["started_at"])
+        started = datetime.fromisoformat(started_at)
         duration = (datetime.utcnow() - started).total_seconds()
-        state["metrics"]["duration_seconds"] = duration
         
-        await self._set_state(run_id, state)
+        pipe = self._pipeline()
+        pipe.hset(meta_key, "phase", phase.value)
+        pipe.hset(metrics_key, "duration_seconds", duration)
+        self._touch(pipe, run_id, "metrics")
+        pipe.hgetall(metrics_key)
+        pipe.lrange(self._get_key(run_id, "errors"), 0, -1)
+        *_, metrics, errors = await pipe.execute()
         
         return {
             "run_id": run_id,
             "success": success,
             "duration_seconds": duration,
-            "metrics": state["metrics"],
-            "errors": state["errors"] if not success else []
+            "metrics": self._parse_metrics(metrics),
+            "errors": [json.loads(e) for e in errors] if not success else []
         }
     
     async def get_recent_runs(
@@ -318,8 +506,8 @@ class StateManager:
         
         try:
             if self._redis:
-                # Scan for all state keys
-                pattern = f"{self.prefix}*:state"
+                # Scan for all run meta keys
+                pattern = f"{self.prefix}*:meta"
                 cursor = 0
                 keys = []
                 
@@ -332,32 +520,30 @@ class StateManager:
                     keys.extend(batch)
                     if cursor == 0:
                         break
-                
-                # Get state for each run
-                for key in keys[:limit]:
-                    data = await self._redis.get(key)
-                    if data:
-                        state = json.loads(data)
-                        runs.append({
-                            "run_id": state["run_id"],
-                            "phase": state["phase"],
-                            "started_at": state["started_at"],
-                            "metrics": state.get("metrics", {})
-                        })
-                
-                # Sort by start time, most recent first
-                runs.sort(key=lambda x: x["started_at"], reverse=True)
             else:
                 # In-memory fallback
-                for key, data in list(self._memory_state.items())[:limit]:
-                    if key.endswith(":state"):
-                        state = json.loads(data)
-                        runs.append({
-                            "run_id": state["run_id"],
-                            "phase": state["phase"],
-                            "started_at": state["started_at"],
-                            "metrics": state.get("metrics", {})
-                        })
+                keys = [k for k in self._memory_state if k.endswith(":meta")]
+            
+            # Fetch every run's meta in one round trip, newest first
+            pipe = self._pipeline()
+            for key in keys:
+                pipe.hgetall(key)
+            metas = [m for m in await pipe.execute() if m.get("run_id")]
+            metas.sort(key=lambda m: m.get("started_at", ""), reverse=True)
+            metas = metas[:limit]
+            
+            pipe = self._pipeline()
+            for meta in metas:
+                pipe.hgetall(self._get_key(meta["run_id"], "metrics"))
+            all_metrics = await pipe.execute()
+            
+            for meta, metrics in zip(metas, all_metrics):
+                runs.append({
+                    "run_id": meta["run_id"],
+                    "phase": meta.get("phase"),
+                    "started_at": meta.get("started_at"),
+                    "metrics": self._parse_metrics(metrics)
+                })
                         
         except Exception as e:
             logger.error(f"Error getting recent runs: {e}")
@@ -14,6 +14,8 @@ class BaseScraper(ABC):
             name=source_name,
             url=base_url
         )
+        # Response bytes downloaded by the last fetch_articles() call
+        self.bytes_fetched = 0
 
     @abstractmethod
     async def fetch_articles(self) -> List[RawArticle]:
@@ -33,6 +33,7 @@ import re
 import asyncio
 
 from app.scrapers.base import BaseScraper
+from app.utils.http_clients import get_http_client
 from app.models.raw_article import RawArticle
 from app.models.agent_models import SourceConfig
 from app.db.session import SessionLocal
@@ -48,6 +49,10 @@ class ConfigurableScraper(BaseScraper):
     SourceConfig.selectors JSONB field.
     """
     
+    # Article pages fetched per run, and how many are in flight at once
+    MAX_ARTICLES = 20
+    ARTICLE_CONCURRENCY = 5
+    
     def __init__(self, source_config: SourceConfig):
         """
         Initialize with a SourceConfig object from the database.
@@ -66,8 +71,10 @@ class ConfigurableScraper(BaseScraper):
         self.rate_limit = source_config.rate_limit_requests or 10
         self.rate_period = source_config.rate_limit_period or 60
         
-        # Request tracking for rate limiting
+        # Request tracking for rate limiting (the lock serializes slot
+        # reservations between concurrent article fetches)
         self._request_times: List[float] = []
+        self._rate_lock = asyncio.Lock()
         
         logger.info(f"ConfigurableScraper initialized for {source_config.name}")
         logger.debug(f"Selectors: {self.selectors}")
@@ -101,75 +108,101 @@ class ConfigurableScraper(BaseScraper):
             return None
 
     async def _rate_limit_wait(self):
-        """Implement rate limiting."""
-        now = datetime.utcnow().timestamp()
-        
-        # Remove old request times
-        self._request_times = [
-            t for t in self._request_times 
-            if now - t < self.rate_period
-        ]
-        
-        # Check if we need to wait
-        if len(self._request_times) >= self.rate_limit:
-            oldest = min(self._request_times)
-            wait_time = self.rate_period - (now - oldest)
-            if wait_time > 0:
-                logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-        
-        self._request_times.append(now)
+        """Implement rate limiting (safe to call from concurrent fetches)."""
+        async with self._rate_lock:
+            now = datetime.utcnow().timestamp()
+            
+            # Remove old request times
+            self._request_times = [
+                t for t in self._request_times 
+                if now - t < self.rate_period
+            ]
+            
+            # Check if we need to wait
+            if len(self._request_times) >= self.rate_limit:
+                oldest = min(self._request_times)
+                wait_time = self.rate_period - (now - oldest)
+                if wait_time > 0:
+                    logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
+                    await asyncio.sleep(wait_time)
+                    now = datetime.utcnow().timestamp()
+            
+            self._request_times.append(now)
 
-    async def fetch_articles(self) -> List[RawArticle]:
+    @property
+    def list_url(self) -> str:
+        """URL of the page article links are extracted from"""
+        return self.selectors.get('list_url') or self.config.base_url
+
+    async def fetch_articles(self, list_page: Optional[bytes] = None) -> List[RawArticle]:
         """
         Fetch articles using configurable selectors.
         
+        Args:
+            list_page: Body of the list page if it was already downloaded
+                (e.g. by the cache's conditional GET); skips refetching it
+        
         Returns:
             List of RawArticle objects
         """
         articles = []
-        list_url = self.selectors.get('list_url') or self.config.base_url
+        self.bytes_fetched = 0
+        list_url = self.list_url
         
         logger.info(f"Fetching articles from {list_url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
+        # Shared pooled client (browser headers, redirects, 30s timeout)
+        client = get_http_client("scraper")
         
-        async with httpx.AsyncClient(
-            follow_redirects=True, 
-            headers=headers,
-            timeout=30.0
-        ) as client:
-            try:
+        try:
+            if list_page is None:
                 await self._rate_limit_wait()
                 response = await client.get(list_url)
                 response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'lxml')
-                
-                # Find article links
-                article_links = self._extract_article_links(soup, list_url)
-                logger.info(f"Found {len(article_links)} article links")
-                
-                # Process each article
-                for link in article_links[:20]:  # Limit to 20 articles per run
-                    try:
-                        await self._rate_limit_wait()
-                        article = await self._process_article(client, link)
-                        if article:
-                            articles.append(article)
-                    except Exception as e:
-                        logger.error(f"Failed to process {link}: {e}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching article list from {list_url}: {e}")
-                
+                list_page = response.content
+            self.bytes_fetched += len(list_page)
+            
+            soup = BeautifulSoup(list_page, 'lxml')
+            
+            # Find article links
+            article_links = self._extract_article_links(soup, list_url)
+            logger.info(f"Found {len(article_links)} article links")
+            
+            articles = await self._process_articles(
+                client, article_links[:self.MAX_ARTICLES]
+            )
+                    
+        except Exception as e:
+            logger.error(f"Error fetching article list from {list_url}: {e}")
+            
         logger.info(f"Successfully scraped {len(articles)} articles from {self.config.name}")
         return articles
 
+    async def _process_articles(
+        self,
+        client: httpx.AsyncClient,
+        links: List[str]
+    ) -> List[RawArticle]:
+        """
+        Fetch and parse article pages concurrently.
+        
+        At most ARTICLE_CONCURRENCY pages are in flight, and each request
+        still takes a rate-limit slot first. Results keep link order.
+        """
+        semaphore = asyncio.Semaphore(self.ARTICLE_CONCURRENCY)
+        
+        async def fetch(link: str) -> Optional[RawArticle]:
+            async with semaphore:
+                try:
+                    await self._rate_limit_wait()
+                    return await self._process_article(client, link)
+                except Exception as e:
+                    logger.error(f"Failed to process {link}: {e}")
+                    return None
+        
+        results = await asyncio.gather(*(fetch(link) for link in links))
+        return [article for article in results if article]
+
     def _extract_article_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
         Extract article links from list page.
@@ -254,6 +287,7 @@ class ConfigurableScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
+        self.bytes_fetched += len(response.content)
         
         soup = BeautifulSoup(response.content, 'lxml')
         
@@ -6,6 +6,7 @@ from datetime import datetime
 import re
 
 from app.scrapers.base import BaseScraper
+from app.utils.http_clients import get_http_client
 from app.models.raw_article import RawArticle
 
 logger = logging.getLogger(__name__)
@@ -21,51 +22,54 @@ class AdaDeranaScraper(BaseScraper):
 
     async def fetch_articles(self) -> List[RawArticle]:
         articles = []
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            logger.info(f"Fetching news list from {self.news_url}")
-            try:
-                response = await client.get(self.news_url, timeout=30.0)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'lxml')
-                
-                # Find news items - typically in 'news-story' divs or similar
-                # Inspecting typical structure (based on blueprint knowledge/assumption)
-                # Blueprint says: "div.news-item" or similar. 
-                # Let's try a generic approach for the list if exact selector isn't known, 
-                # but usually it's .news-story or .story-text
-                
-                # Looking for links that look like news articles
-                # Pattern: http://www.adaderana.lk/news/(\d+)/...
-                
-                news_links = set()
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
-                    if '/news/' in href and 'adaderana.lk' in href:
-                         news_links.add(href)
-                    elif href.startswith('news.php?nid='): # Old style or internal
-                         news_links.add(f"{self.base_url}/{href}")
+        self.bytes_fetched = 0
+        client = get_http_client("scraper")
+        logger.info(f"Fetching news list from {self.news_url}")
+        try:
+            response = await client.get(self.news_url, timeout=30.0)
+            response.raise_for_status()
+            self.bytes_fetched += len(response.content)
+            
+            soup = BeautifulSoup(response.content, 'lxml')
+            
+            # Find news items - typically in 'news-story' divs or similar
+            # Inspecting typical structure (based on blueprint knowledge/assumption)
+            # Blueprint says: "div.news-item" or similar. 
+            # Let's try a generic approach for the list if exact selector isn't known, 
+            # but usually it's .news-story or .story-text
+            
+            # Looking for links that look like news articles
+            # Pattern: http://www.adaderana.lk/news/(\d+)/...
+            
+            news_links = set()
+            for a in soup.find_all('a', href=True):
+                href = a['href']
+                if '/news/' in href and 'adaderana.lk' in href:
+                     news_links.add(href)
+                elif href.startswith('news.php?nid='): # Old style or internal
+                     news_links.add(f"{self.base_url}/{href}")
 
-                logger.info(f"Found {len(news_links)} potential article links")
-                
-                # Process all found articles
-                for link in list(news_links):
-                    try:
-                        article = await self._process_article(client, link)
-                        if article:
-                            articles.append(article)
-                    except Exception as e:
-                        logger.error(f"Failed to process {link}: {e}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching news list: {e}")
-                
+            logger.info(f"Found {len(news_links)} potential article links")
+            
+            # Process all found articles
+            for link in list(news_links):
+                try:
+                    article = await self._process_article(client, link)
+                    if article:
+                        articles.append(article)
+                except Exception as e:
+                    logger.error(f"Failed to process {link}: {e}")
+                    
+        except Exception as e:
+            logger.error(f"Error fetching news list: {e}")
+            
         return articles
 
     async def _process_article(self, client: httpx.AsyncClient, url: str) -> RawArticle:
         logger.info(f"Processing article: {url}")
         response = await client.get(url, timeout=30.0)
         response.raise_for_status()
+        self.bytes_fetched += len(response.content)
         
         soup = BeautifulSoup(response.content, 'lxml')
         
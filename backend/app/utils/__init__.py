@@ -5,17 +5,37 @@ from app.utils.async_batch import (
     ArticleBatchProcessor,
     IndicatorBatchProcessor,
     BatchResult,
+    StreamStage,
+    StreamStageStats,
+    run_stream_pipeline,
     batch_analyze_articles,
     batch_calculate_indicators,
     get_article_processor
 )
+from app.utils.http_clients import (
+    HTTPClientRegistry,
+    HTTPClientProfile,
+    get_http_client,
+    get_http_pool_stats,
+    close_http_clients
+)
+from app.utils.async_cache import SingleFlightCache
 
 __all__ = [
     "AsyncBatchProcessor",
     "ArticleBatchProcessor", 
     "IndicatorBatchProcessor",
     "BatchResult",
+    "StreamStage",
+    "StreamStageStats",
+    "run_stream_pipeline",
     "batch_analyze_articles",
     "batch_calculate_indicators",
-    "get_article_processor"
+    "get_article_processor",
+    "HTTPClientRegistry",
+    "HTTPClientProfile",
+    "get_http_client",
+    "get_http_pool_stats",
+    "close_http_clients",
+    "SingleFlightCache"
 ]
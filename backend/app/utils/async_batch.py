@@ -8,8 +8,8 @@ Provides high-performance async batch processing for:
 """
 
 import asyncio
-from typing import List, Dict, Any, Callable, TypeVar, Optional, AsyncGenerator
-from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, TypeVar, Optional, AsyncGenerator, AsyncIterable, Awaitable
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -200,6 +200,151 @@ class AsyncBatchProcessor:
         self._executor.shutdown(wait=False)
 
 
+@dataclass
+class StreamStage:
+    """A stage of a streaming pipeline
+    
+    The processor receives one item and returns the (possibly modified)
+    item, or None to drop it. Sync processors run in the default executor
+    so CPU-bound work does not block the event loop.
+    """
+    name: str
+    processor: Callable[[Any], Any]
+    concurrency: int = 1
+    is_async: bool = False
+
+
+@dataclass
+class StreamStageStats:
+    """Throughput and queue statistics for one streaming stage"""
+    name: str
+    concurrency: int
+    queue_size: int
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_time: float = 0.0  # summed over workers
+    wall_time: float = 0.0
+    max_queue_depth: int = 0
+    _depth_total: int = field(default=0, repr=False)
+    
+    def record_depth(self, depth: int):
+        self._depth_total += depth
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+    
+    @property
+    def throughput(self) -> float:
+        """Items per second over the stage's wall time"""
+        return self.items_in / self.wall_time if self.wall_time > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_time_s": round(self.busy_time, 3),
+            "wall_time_s": round(self.wall_time, 3),
+            "throughput_per_s": round(self.throughput, 1),
+            "max_queue_depth": self.max_queue_depth,
+            "avg_queue_depth": round(self._depth_total / self.items_in, 2) if self.items_in else 0.0,
+        }
+
+
+_STREAM_DONE = object()
+
+
+async def run_stream_pipeline(
+    source: AsyncIterable[Any],
+    stages: List[StreamStage],
+    sink: Callable[[Any], Awaitable[None]],
+    queue_size: int = 100
+) -> Dict[str, StreamStageStats]:
+    """Run items through stages connected by bounded queues
+    
+    Each stage runs ``concurrency`` workers, so slow I/O-bound stages overlap
+    with CPU-bound ones. Queues are bounded by ``queue_size``, so at most
+    roughly ``len(stages) * (queue_size + concurrency)`` items are in flight
+    regardless of how many the source yields.
+    
+    Args:
+        source: Async iterable of input items
+        stages: Stages in processing order
+        sink: Async callback receiving each item that leaves the last stage
+        queue_size: Capacity of each inter-stage queue
+        
+    Returns:
+        Mapping of stage name to its statistics
+    """
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+    stats = {
+        stage.name: StreamStageStats(stage.name, stage.concurrency, queue_size)
+        for stage in stages
+    }
+    loop = asyncio.get_running_loop()
+    
+    async def feed():
+        async for item in source:
+            await queues[0].put(item)
+        for _ in range(max(1, stages[0].concurrency)):
+            await queues[0].put(_STREAM_DONE)
+    
+    async def worker(index: int, stage: StreamStage, stage_stats: StreamStageStats):
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(stages) else None
+        while True:
+            stage_stats.record_depth(inbox.qsize())
+            item = await inbox.get()
+            if item is _STREAM_DONE:
+                return
+            stage_stats.items_in += 1
+            started = time.perf_counter()
+            try:
+                if stage.is_async:
+                    result = await stage.processor(item)
+                else:
+                    result = await loop.run_in_executor(None, stage.processor, item)
+            except Exception as e:
+                stage_stats.errors += 1
+                logger.warning(f"Stream stage {stage.name} failed for item: {e}")
+                continue
+            finally:
+                stage_stats.busy_time += time.perf_counter() - started
+            if result is None:
+                continue
+            stage_stats.items_out += 1
+            if outbox is not None:
+                await outbox.put(result)
+            else:
+                await sink(result)
+    
+    async def run_stage(index: int, stage: StreamStage):
+        stage_stats = stats[stage.name]
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            worker(index, stage, stage_stats) for _ in range(max(1, stage.concurrency))
+        ])
+        stage_stats.wall_time = time.perf_counter() - started
+        if index + 1 < len(stages):
+            for _ in range(max(1, stages[index + 1].concurrency)):
+                await queues[index + 1].put(_STREAM_DONE)
+    
+    tasks = [asyncio.ensure_future(feed())] + [
+        asyncio.ensure_future(run_stage(i, stage)) for i, stage in enumerate(stages)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    
+    return stats
+
+
 class ArticleBatchProcessor(AsyncBatchProcessor):
     """Specialized batch processor for articles"""
     
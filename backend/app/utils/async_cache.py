@@ -0,0 +1,195 @@
+"""
+Single-Flight Async Cache
+
+TTL cache for values loaded from slow external feeds (CSE market data and
+similar), built so latency stays flat when entries expire.
+
+Features:
+- Single-flight loading: one load in flight per key, concurrent callers
+  await the same result
+- Stale-while-revalidate: expired entries keep being served for a grace
+  period while one background refresh runs
+- Refresh-ahead: entries are refreshed in the background shortly before
+  they expire, so callers rarely see an expired entry at all
+
+Usage:
+    cache = SingleFlightCache("cse", ttl_seconds=300, stale_seconds=600)
+    data = await cache.get("market_summary", fetch_market_summary)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    fetched_at: float
+    refresh_at: float   # Start a background refresh after this
+    expires_at: float   # Fresh until this
+    stale_until: float  # Servable (while revalidating) until this
+
+
+class SingleFlightCache:
+    """
+    Async TTL cache with single-flight loads and stale-while-revalidate.
+
+    Args:
+        name: Name used in logs and stats
+        ttl_seconds: How long a loaded value is fresh
+        stale_seconds: How long after expiry a value may still be served
+            while a refresh runs (0 disables stale serving)
+        refresh_ahead_seconds: Start a background refresh this long before
+            expiry (0 disables refresh-ahead)
+        max_entries: Least recently used keys beyond this are dropped
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        refresh_ahead_seconds: float = 0.0,
+        max_entries: int = 256
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.refresh_ahead_seconds = min(refresh_ahead_seconds, ttl_seconds)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "loads": 0,
+            "load_errors": 0,
+            "background_refreshes": 0
+        }
+
+    async def get(self, key: str, loader: Loader) -> Any:
+        """
+        Get a value, loading it with loader() when needed.
+
+        Fresh values are returned directly. Values past their refresh point
+        or expiry (within the stale window) are returned directly too, with
+        a background refresh started. Otherwise the caller waits for the
+        single in-flight load; its exception is raised to every waiter.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            if now < entry.expires_at:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+                if now >= entry.refresh_at:
+                    self._refresh_in_background(key, loader)
+                return entry.value
+
+            if now < entry.stale_until:
+                self._stats["stale_hits"] += 1
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, loader)
+                return entry.value
+
+        self._stats["misses"] += 1
+        return await asyncio.shield(self._load(key, loader))
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Return the cached value (fresh or stale) without loading."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: str, value: Any):
+        """Store a value as freshly loaded."""
+        now = time.monotonic()
+        self._entries[key] = _CacheEntry(
+            value=value,
+            fetched_at=now,
+            refresh_at=now + self.ttl_seconds - self.refresh_ahead_seconds,
+            expires_at=now + self.ttl_seconds,
+            stale_until=now + self.ttl_seconds + self.stale_seconds
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key, or every key when key is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _load(self, key: str, loader: Loader) -> asyncio.Task:
+        """The in-flight load task for a key, starting one if needed."""
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self._stats["coalesced"] += 1
+            return task
+
+        task = loop.create_task(self._run_loader(key, loader))
+        # Mark failures retrieved even if every waiter was cancelled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return task
+
+    async def _run_loader(self, key: str, loader: Loader) -> Any:
+        self._stats["loads"] += 1
+        try:
+            value = await loader()
+        except Exception:
+            self._stats["load_errors"] += 1
+            raise
+        else:
+            self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def _refresh_in_background(self, key: str, loader: Loader):
+        """Start a refresh unless one is already running for the key."""
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+
+        self._stats["background_refreshes"] += 1
+        task = self._load(key, loader)
+        self._background.add(task)
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # The stale value keeps being served until its window closes
+            logger.warning(f"[{self.name}] Background refresh failed: {task.exception()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss and load counters."""
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+        served = self._stats["hits"] + self._stats["stale_hits"]
+        return {
+            "name": self.name,
+            **self._stats,
+            "hit_rate": round(served / lookups * 100, 2) if lookups else 0.0,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "refresh_ahead_seconds": self.refresh_ahead_seconds
+        }
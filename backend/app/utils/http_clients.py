@@ -0,0 +1,302 @@
+"""
+Shared HTTP Client Registry
+
+One pooled ``httpx.AsyncClient`` per profile (scraper, detector, api) for
+the whole process, instead of a new client - and new TCP/TLS handshakes -
+per scraper run or API call.
+
+Features:
+- Keep-alive connection pools sized per profile
+- HTTP/2 when the optional ``h2`` package is installed
+- Per-host limit on in-flight requests
+- Connection reuse and pool saturation counters for health reporting
+
+Usage:
+    client = get_http_client("scraper")
+    response = await client.get(url)
+
+Clients are bound to the event loop that created them, so each running
+loop gets its own set; counters are shared per profile.
+"""
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+@dataclass
+class HTTPClientProfile:
+    """Connection settings for one shared client"""
+    timeout: float = 30.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    per_host_limit: int = 6  # In-flight requests per host
+    follow_redirects: bool = True
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+DEFAULT_PROFILES: Dict[str, HTTPClientProfile] = {
+    "scraper": HTTPClientProfile(timeout=30.0, headers=dict(BROWSER_HEADERS)),
+    "detector": HTTPClientProfile(timeout=10.0, per_host_limit=4),
+    "api": HTTPClientProfile(timeout=10.0, max_keepalive_connections=10),
+}
+
+
+@dataclass
+class HostStats:
+    """Counters for one host"""
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    limit_waits: int = 0  # Requests that queued for a host slot
+
+
+@dataclass
+class PoolStats:
+    """Counters for one profile across all of its clients"""
+    requests: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    pool_timeouts: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    hosts: Dict[str, HostStats] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(0, self.requests - self.connections_opened)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connections_reused": reused,
+            "reuse_rate": round(reused / self.requests * 100, 2) if self.requests else 0.0,
+            "pool_timeouts": self.pool_timeouts,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "host_limit_waits": sum(h.limit_waits for h in self.hosts.values()),
+            "hosts": {
+                host: {
+                    "requests": h.requests,
+                    "in_flight": h.in_flight,
+                    "peak_in_flight": h.peak_in_flight,
+                    "limit_waits": h.limit_waits
+                }
+                for host, h in self.hosts.items()
+            }
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that runs a callback once when closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                on_close, self._on_close = self._on_close, None
+                on_close()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps the pooled transport with a per-host in-flight limit.
+
+    New connections are counted through the httpcore ``trace`` request
+    extension, so every request that did not open one reused a pooled
+    connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host_limit: int, stats: PoolStats):
+        self._transport = transport
+        self._per_host_limit = max(1, per_host_limit)
+        self._stats = stats
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        stats = self._stats
+        host_stats = stats.hosts.setdefault(host, HostStats())
+        limit = self._host_limits.setdefault(host, asyncio.Semaphore(self._per_host_limit))
+
+        if limit.locked():
+            host_stats.limit_waits += 1
+
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+
+        await limit.acquire()
+        stats.requests += 1
+        host_stats.requests += 1
+        stats.in_flight += 1
+        host_stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        host_stats.peak_in_flight = max(host_stats.peak_in_flight, host_stats.in_flight)
+
+        def release():
+            stats.in_flight -= 1
+            host_stats.in_flight -= 1
+            limit.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.PoolTimeout:
+            stats.pool_timeouts += 1
+            stats.errors += 1
+            release()
+            raise
+        except Exception:
+            stats.errors += 1
+            release()
+            raise
+
+        # Hold the host slot until the body has been read and the
+        # connection returned to the pool
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of pooled HTTP clients.
+
+    Usage:
+        registry = HTTPClientRegistry()
+        client = registry.get_client("scraper")
+        stats = registry.get_stats()
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, HTTPClientProfile]] = None):
+        self.profiles: Dict[str, HTTPClientProfile] = dict(profiles or DEFAULT_PROFILES)
+        self._stats: Dict[str, PoolStats] = {}
+        # event loop -> profile -> client
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        profile = self.profiles.get(name)
+        if profile is None:
+            profile = self.profiles[name] = HTTPClientProfile()
+
+        limits = httpx.Limits(
+            max_connections=profile.max_connections,
+            max_keepalive_connections=profile.max_keepalive_connections,
+            keepalive_expiry=profile.keepalive_expiry
+        )
+        pool = httpx.AsyncHTTPTransport(limits=limits, http2=HAS_HTTP2)
+        transport = _HostLimitedTransport(
+            pool,
+            profile.per_host_limit,
+            self._stats.setdefault(name, PoolStats())
+        )
+        logger.debug(f"Creating shared HTTP client '{name}' (http2={HAS_HTTP2})")
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=profile.timeout,
+            follow_redirects=profile.follow_redirects,
+            headers=profile.headers
+        )
+
+    def get_client(self, name: str = "api") -> httpx.AsyncClient:
+        """
+        Get the shared client for a profile, creating it on first use.
+
+        Must be called from a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = self._clients[loop] = {}
+
+        client = clients.get(name)
+        if client is None or client.is_closed:
+            client = clients[name] = self._create_client(name)
+        return client
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection reuse and saturation counters per profile"""
+        return {
+            "http2": HAS_HTTP2,
+            "profiles": {
+                name: {
+                    **stats.to_dict(),
+                    "max_connections": self.profiles[name].max_connections,
+                    "per_host_limit": self.profiles[name].per_host_limit
+                }
+                for name, stats in self._stats.items()
+            }
+        }
+
+    async def close(self):
+        """Close the clients owned by the running event loop"""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            await client.aclose()
+
+
+# Global registry
+_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    """Get global HTTP client registry"""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+def get_http_client(name: str = "api") -> httpx.AsyncClient:
+    """Get a shared pooled client ("scraper", "detector" or "api")"""
+    return get_http_registry().get_client(name)
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """Get connection pool statistics for all profiles"""
+    return get_http_registry().get_stats()
+
+
+async def close_http_clients():
+    """Close shared clients (application shutdown)"""
+    if _registry is not None:
+        await _registry.close()
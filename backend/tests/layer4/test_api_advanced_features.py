@@ -181,6 +181,26 @@ class TestPortfolioAnalysisAPI:
         assert "original_risk" in data
         assert "stressed_risk" in data
     
+    def test_batch_stress_test_endpoint(self, client):
+        """Test running several stress scenarios at once."""
+        create_request = {"portfolio_id": "PORT007", "name": "Batch Stress Portfolio"}
+        client.post("/advanced/portfolio/create", json=create_request)
+        client.post("/advanced/portfolio/PORT007/companies", json={
+            "company_id": "COMP_001",
+            "company_name": "Company A",
+            "sector": "Technology",
+            "region": "Western",
+        })
+        
+        response = client.post(
+            "/advanced/portfolio/PORT007/stress-test/batch",
+            json={"scenarios": {"mild": {"market": 1.2}, "severe": {"market": 3.0}}},
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert set(results) == {"mild", "severe"}
+        assert results["severe"]["stressed_risk"] > results["mild"]["stressed_risk"]
+    
     def test_list_portfolios_endpoint(self, client):
         """Test listing all portfolios."""
         response = client.get("/advanced/portfolio")
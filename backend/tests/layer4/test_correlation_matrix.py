@@ -0,0 +1,227 @@
+"""
+Tests for the matrix-based CorrelationAnalyzer.
+
+Covers:
+- Correlation matrix from the aligned indicator matrix
+- FFT lead/lag correlations match per-lag Pearson correlations
+- Clustering on the cached correlation matrix
+- Results cached until new data arrives
+- Full refresh at 105 indicators x one year
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.layer4.advanced import CorrelationAnalyzer
+
+
+def _pearson(x, y):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = x - x.mean()
+    dy = y - y.mean()
+    denominator = np.sqrt((dx ** 2).sum() * (dy ** 2).sum())
+    return float((dx * dy).sum() / denominator) if denominator else 0.0
+
+
+def _load(analyzer, series, company_id="COMP_001"):
+    """Add {indicator: values} as daily data points ending yesterday."""
+    days = len(next(iter(series.values())))
+    start = datetime.now() - timedelta(days=days)
+    analyzer.add_historical_data(company_id, [
+        (start + timedelta(days=t), {name: float(values[t]) for name, values in series.items()})
+        for t in range(days)
+    ])
+
+
+@pytest.fixture
+def analyzer():
+    return CorrelationAnalyzer()
+
+
+class TestCorrelationMatrix:
+    """Test cases for calculate_correlation_matrix."""
+
+    def test_matches_pairwise_pearson(self, analyzer):
+        rng = np.random.default_rng(0)
+        walk = rng.standard_normal((5, 120)).cumsum(axis=1)
+        series = {f"IND_{i}": walk[i] for i in range(5)}
+        series["IND_FLAT"] = np.full(120, 0.5)
+        _load(analyzer, series)
+
+        matrix = analyzer.calculate_correlation_matrix("COMP_001")
+
+        assert len(matrix.pairs) == 15
+        for pair in matrix.pairs:
+            expected = _pearson(series[pair.indicator_a], series[pair.indicator_b])
+            assert pair.correlation == pytest.approx(expected, abs=1e-12)
+        assert matrix.correlations["IND_FLAT"]["IND_FLAT"] == 1.0
+        assert matrix.correlations["IND_FLAT"]["IND_0"] == 0.0
+        assert matrix.average_correlation == pytest.approx(
+            np.mean([p.correlation for p in matrix.pairs])
+        )
+
+    def test_values_stay_in_range(self, analyzer):
+        x = np.linspace(0.1, 0.9, 50)
+        _load(analyzer, {"A": x, "B": 1 - x, "C": x * 0.3})
+
+        matrix = analyzer.calculate_correlation_matrix("COMP_001")
+
+        for pair in matrix.pairs:
+            assert -1 <= pair.correlation <= 1
+        assert matrix.strongest_negative.correlation == pytest.approx(-1.0)
+        assert matrix.strongest_positive.correlation == pytest.approx(1.0)
+
+    def test_missing_values_count_as_zero(self, analyzer):
+        start = datetime.now() - timedelta(days=10)
+        for t in range(10):
+            point = {"A": 0.1 * t}
+            if t % 2:
+                point["B"] = 0.5
+            analyzer.add_data_point("COMP_001", start + timedelta(days=t), point)
+
+        matrix = analyzer.calculate_correlation_matrix("COMP_001")
+
+        b = [0.5 if t % 2 else 0.0 for t in range(10)]
+        assert matrix.correlations["A"]["B"] == pytest.approx(
+            _pearson([0.1 * t for t in range(10)], b)
+        )
+
+    def test_indicator_subset(self, analyzer):
+        rng = np.random.default_rng(1)
+        _load(analyzer, {name: rng.standard_normal(30) for name in "ABCD"})
+
+        matrix = analyzer.calculate_correlation_matrix("COMP_001", ["D", "B", "Z"])
+
+        assert matrix.indicators == ["B", "D"]
+        assert len(matrix.pairs) == 1
+
+
+class TestLeadLag:
+    """Test cases for FFT-based lead/lag detection."""
+
+    def test_lagged_correlations_match_windowed_pearson(self, analyzer):
+        rng = np.random.default_rng(2)
+        x = rng.standard_normal(90).cumsum()
+        y = rng.standard_normal(90).cumsum()
+
+        lags, corrs = analyzer._lagged_correlations(x, y, 30)
+
+        for lag, corr in zip(lags, corrs):
+            if lag >= 0:
+                expected = _pearson(x[:len(x) - lag], y[lag:])
+            else:
+                expected = _pearson(x[-lag:], y[:lag])
+            assert corr == pytest.approx(expected, abs=1e-9)
+
+    def test_detects_leading_indicator(self, analyzer):
+        rng = np.random.default_rng(3)
+        driver = rng.standard_normal(200).cumsum()
+        noise = rng.standard_normal(200) * 0.1
+        # Revenue follows demand 6 days later
+        _load(analyzer, {"OPS_DEMAND": driver[6:], "OPS_REVENUE": driver[:-6] + noise[6:]})
+
+        forward = analyzer.detect_lead_lag("COMP_001", "OPS_DEMAND", "OPS_REVENUE")
+        backward = analyzer.detect_lead_lag("COMP_001", "OPS_REVENUE", "OPS_DEMAND")
+
+        for relation in (forward, backward):
+            assert relation.leading_indicator == "OPS_DEMAND"
+            assert relation.lagging_indicator == "OPS_REVENUE"
+            assert relation.lag_days == 6
+            assert relation.correlation_at_lag > 0.9
+
+    def test_unrelated_flat_series(self, analyzer):
+        _load(analyzer, {"A": np.full(40, 0.3), "B": np.linspace(0, 1, 40)})
+
+        relation = analyzer.detect_lead_lag("COMP_001", "A", "B", max_lag_days=10)
+
+        assert relation.lag_days == 0
+        assert relation.correlation_at_lag == 0.0
+
+
+class TestClustering:
+    """Test cases for cluster_indicators."""
+
+    def test_separates_independent_groups(self, analyzer):
+        rng = np.random.default_rng(4)
+        first, second = rng.standard_normal((2, 150)).cumsum(axis=1)
+        series = {}
+        for i in range(3):
+            series[f"SUPPLY_{i}"] = first + rng.standard_normal(150) * 0.2
+            series[f"DEMAND_{i}"] = second + rng.standard_normal(150) * 0.2
+        _load(analyzer, series)
+
+        clusters = analyzer.cluster_indicators("COMP_001", num_clusters=2)
+
+        groups = sorted(sorted(c.indicators) for c in clusters)
+        assert groups == [
+            ["DEMAND_0", "DEMAND_1", "DEMAND_2"],
+            ["SUPPLY_0", "SUPPLY_1", "SUPPLY_2"],
+        ]
+        for cluster in clusters:
+            assert cluster.average_internal_correlation > 0.9
+            assert cluster.centroid_indicator in cluster.indicators
+
+
+class TestResultCache:
+    """Results are reused until new data arrives."""
+
+    @pytest.fixture
+    def loaded(self, analyzer):
+        rng = np.random.default_rng(5)
+        _load(analyzer, {name: rng.standard_normal(60) for name in "ABCDE"})
+        return analyzer
+
+    def test_matrix_reused(self, loaded):
+        first = loaded.calculate_correlation_matrix("COMP_001")
+        assert loaded.calculate_correlation_matrix("COMP_001") is first
+        assert loaded.cluster_indicators("COMP_001", 2)[0] is loaded.cluster_indicators("COMP_001", 2)[0]
+
+    def test_new_data_invalidates(self, loaded):
+        first = loaded.calculate_correlation_matrix("COMP_001")
+        relation = loaded.detect_lead_lag("COMP_001", "A", "B", max_lag_days=10)
+
+        loaded.add_data_point("COMP_001", datetime.now(), {"A": 5.0, "B": -5.0})
+
+        second = loaded.calculate_correlation_matrix("COMP_001")
+        assert second is not first
+        assert second.sample_size == first.sample_size + 1
+        assert loaded.detect_lead_lag("COMP_001", "A", "B", max_lag_days=10) is not relation
+
+    def test_top_correlations_leave_cached_order(self, loaded):
+        matrix = loaded.calculate_correlation_matrix("COMP_001")
+        order = [(p.indicator_a, p.indicator_b) for p in matrix.pairs]
+
+        loaded.get_top_correlations("COMP_001", n=3)
+
+        assert [(p.indicator_a, p.indicator_b) for p in matrix.pairs] == order
+
+    def test_clear_data(self, loaded):
+        loaded.calculate_correlation_matrix("COMP_001")
+        loaded.clear_data("COMP_001")
+
+        with pytest.raises(ValueError):
+            loaded.calculate_correlation_matrix("COMP_001")
+
+
+class TestCorrelationPerformance:
+    """A full refresh is fast enough to run per request."""
+
+    def test_full_refresh_105_indicators_one_year(self, analyzer):
+        rng = np.random.default_rng(6)
+        walk = rng.standard_normal((105, 364)).cumsum(axis=1)
+        _load(analyzer, {f"IND_{i:03d}": walk[i] for i in range(105)})
+
+        start = time.perf_counter()
+        matrix = analyzer.calculate_correlation_matrix("COMP_001")
+        clusters = analyzer.cluster_indicators("COMP_001", num_clusters=8)
+        for j in range(1, 21):
+            analyzer.detect_lead_lag("COMP_001", "IND_000", f"IND_{j:03d}")
+        elapsed = time.perf_counter() - start
+
+        assert len(matrix.pairs) == 105 * 104 // 2
+        assert sum(len(c.indicators) for c in clusters) == 105
+        assert elapsed < 1.0
@@ -0,0 +1,263 @@
+"""
+Tests for the matrix-based PortfolioAnalyzer.
+
+Covers:
+- Exposure and indicator matrices, cached until the portfolio changes
+- Company correlation matrix matches the pairwise definition
+- Diversification and risk aggregation on the matrices
+- Multi-scenario stress tests as one matrix product
+- 50 scenarios over 500 positions
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.layer4.advanced import PortfolioAnalyzer
+from app.layer4.advanced.portfolio_analyzer import RISK_FACTORS, STRESS_SCENARIOS
+
+
+def _pairwise_correlation(a, b):
+    """Reference: the per-pair correlation rule."""
+    common = set(a.key_indicators) & set(b.key_indicators)
+    if not common:
+        return 0.3 * (a.sector == b.sector) + 0.2 * (a.region == b.region)
+    diff = sum(abs(a.key_indicators[k] - b.key_indicators[k]) for k in common)
+    return max(0.0, 1.0 - diff / len(common))
+
+
+def _build(analyzer, n, seed=0, portfolio_id="port_001"):
+    rng = np.random.default_rng(seed)
+    analyzer.create_portfolio(portfolio_id, "Test Portfolio")
+    for i in range(n):
+        indicators = {
+            f"OPS_{k}": float(rng.random()) for k in range(8) if rng.random() < 0.4
+        }
+        analyzer.add_company(
+            portfolio_id, f"COMP_{i:03d}", f"Company {i}",
+            f"Sector {rng.integers(5)}", f"Region {rng.integers(3)}",
+            risk_scores={name: float(rng.random()) for name in ("overall",) + RISK_FACTORS},
+            indicators=indicators,
+        )
+    return analyzer.get_portfolio(portfolio_id)
+
+
+@pytest.fixture
+def analyzer():
+    return PortfolioAnalyzer()
+
+
+class TestMatrices:
+    """Test cases for the cached portfolio arrays."""
+
+    def test_layout(self, analyzer):
+        analyzer.create_portfolio("port_001", "Test")
+        analyzer.add_company(
+            "port_001", "COMP_A", "A", "Tech", "North",
+            risk_scores={"supply_chain": 0.1, "operational": 0.2, "financial": 0.3, "market": 0.4},
+            indicators={"OPS_X": 0.5},
+        )
+        analyzer.add_company("port_001", "COMP_B", "B", "Health", "North", indicators={"OPS_Y": 0.7})
+
+        m = analyzer.get_matrices("port_001")
+
+        assert m.company_ids == ["COMP_A", "COMP_B"]
+        assert m.exposures.tolist() == [[0.1, 0.2, 0.3, 0.4], [0.5, 0.5, 0.5, 0.5]]
+        assert m.weights.tolist() == [0.5, 0.5]
+        assert m.sectors == ["Tech", "Health"]
+        assert m.region_codes.tolist() == [0, 0]
+        assert m.indicator_names == ["OPS_X", "OPS_Y"]
+        assert m.indicators[0, 0] == 0.5
+        assert np.isnan(m.indicators[0, 1])
+
+    def test_cached_until_changed(self, analyzer):
+        _build(analyzer, 5)
+        first = analyzer.get_matrices("port_001")
+        assert analyzer.get_matrices("port_001") is first
+
+        analyzer.update_company_risk("port_001", "COMP_001", {"market": 0.99})
+        second = analyzer.get_matrices("port_001")
+        assert second is not first
+        assert second.exposures[1, RISK_FACTORS.index("market")] == 0.99
+
+        analyzer.remove_company("port_001", "COMP_000")
+        assert len(analyzer.get_matrices("port_001").company_ids) == 4
+
+    def test_unknown_portfolio(self, analyzer):
+        with pytest.raises(ValueError):
+            analyzer.get_matrices("missing")
+
+
+class TestCorrelations:
+    """Test cases for the company correlation matrix."""
+
+    def test_matches_pairwise_rule(self, analyzer):
+        portfolio = _build(analyzer, 40, seed=1)
+        profiles = list(portfolio.companies.values())
+
+        corr = analyzer.get_company_correlation_matrix("port_001")
+
+        for i in range(len(profiles)):
+            for j in range(i + 1, len(profiles)):
+                expected = _pairwise_correlation(profiles[i], profiles[j])
+                assert corr[i, j] == pytest.approx(expected, abs=1e-12)
+                assert corr[j, i] == corr[i, j]
+
+    def test_portfolio_risk_uses_pair_average(self, analyzer):
+        portfolio = _build(analyzer, 20, seed=2)
+        profiles = list(portfolio.companies.values())
+        pairs = [
+            _pairwise_correlation(profiles[i], profiles[j])
+            for i in range(len(profiles)) for j in range(i + 1, len(profiles))
+        ]
+
+        risk = analyzer.calculate_portfolio_risk("port_001")
+
+        assert risk.average_correlation == pytest.approx(np.mean(pairs))
+        assert risk.max_correlation == pytest.approx(max(pairs))
+        assert risk.correlation_risk_adjustment == pytest.approx(np.mean(pairs) * 0.1)
+
+
+class TestAggregation:
+    """Test cases for risk and diversification on the matrices."""
+
+    def test_weighted_risks(self, analyzer):
+        portfolio = _build(analyzer, 12, seed=3)
+        profiles = list(portfolio.companies.values())
+
+        risk = analyzer.calculate_portfolio_risk("port_001", include_correlations=False)
+
+        assert risk.weighted_market_risk == pytest.approx(
+            sum(p.market_risk * p.portfolio_weight for p in profiles)
+        )
+        by_contribution = sorted(
+            profiles, key=lambda p: p.overall_risk * p.portfolio_weight, reverse=True
+        )
+        assert risk.top_risk_contributors == [p.company_id for p in by_contribution[:5]]
+        assert sum(risk.risk_by_sector.values()) == pytest.approx(
+            sum(p.overall_risk * p.portfolio_weight for p in profiles)
+        )
+
+    def test_diversification(self, analyzer):
+        analyzer.create_portfolio("port_001", "Test")
+        for i, (sector, region, weight) in enumerate([
+            ("Tech", "North", 0.5), ("Tech", "South", 0.3), ("Health", "North", 0.2),
+        ]):
+            analyzer.add_company("port_001", f"COMP_{i}", f"C{i}", sector, region, weight)
+
+        div = analyzer.analyze_diversification("port_001")
+
+        assert div.sector_concentration == pytest.approx({"Tech": 0.8, "Health": 0.2})
+        sector_hhi = 0.8 ** 2 + 0.2 ** 2
+        assert div.sector_diversification == pytest.approx((1 - sector_hhi) / 0.5)
+        variance = np.var([0.5, 0.3, 0.2])
+        assert div.size_diversification == pytest.approx(1 - variance * 10)
+
+    def test_concentration_alerts(self, analyzer):
+        analyzer.create_portfolio("port_001", "Test")
+        for i in range(5):
+            analyzer.add_company("port_001", f"COMP_{i}", f"C{i}", "Tech" if i < 3 else "Health", "North")
+
+        alerts = analyzer.check_concentration_alerts("port_001")
+
+        by_type = {a.alert_type: a for a in alerts}
+        assert by_type["sector"].concentrated_element == "Tech"
+        assert by_type["sector"].affected_companies == ["COMP_0", "COMP_1", "COMP_2"]
+        assert by_type["regional"].concentration_percentage == 1.0
+        assert "company" not in by_type
+
+
+class TestStressTests:
+    """Test cases for batched stress testing."""
+
+    def test_batch_matches_per_company_rule(self, analyzer):
+        portfolio = _build(analyzer, 30, seed=4)
+        analyzer.calculate_portfolio_risk("port_001")
+
+        results = analyzer.run_stress_tests("port_001")
+
+        assert list(results) == list(STRESS_SCENARIOS)
+        for name, multipliers in STRESS_SCENARIOS.items():
+            expected = {
+                p.company_id: min(1.0, 0.25 * (
+                    p.supply_chain_risk * multipliers["supply_chain"] +
+                    p.operational_risk * multipliers["operational"] +
+                    p.financial_risk * multipliers["financial"] +
+                    p.market_risk * multipliers["market"]
+                ))
+                for p in portfolio.companies.values()
+            }
+            result = results[name]
+            assert result["company_stressed_risks"] == pytest.approx(expected)
+            assert result["stressed_risk"] == pytest.approx(
+                sum(expected[cid] * p.portfolio_weight for cid, p in portfolio.companies.items())
+            )
+            assert result["most_affected"] == max(expected, key=expected.get)
+            assert result["risk_increase"] == pytest.approx(
+                result["stressed_risk"] - portfolio.current_risk.overall_risk_score
+            )
+
+    def test_single_scenario_and_fallback(self, analyzer):
+        _build(analyzer, 10, seed=5)
+
+        single = analyzer.get_stress_test_results("port_001", "supply_disruption")
+        unknown = analyzer.get_stress_test_results("port_001", "meteor_strike")
+
+        assert single == analyzer.run_stress_tests("port_001")["supply_disruption"]
+        assert unknown["scenario"] == "meteor_strike"
+        assert unknown["stressed_risk"] == analyzer.get_stress_test_results(
+            "port_001", "market_crash"
+        )["stressed_risk"]
+        assert single["original_risk"] == 0.5
+
+    def test_custom_scenarios_default_to_unchanged_factors(self, analyzer):
+        _build(analyzer, 10, seed=6)
+        m = analyzer.get_matrices("port_001")
+
+        results = analyzer.run_stress_tests("port_001", {"baseline": {}})
+
+        expected = np.minimum(1.0, m.exposures.mean(axis=1))
+        assert results["baseline"]["stressed_risk"] == pytest.approx(float(m.weights @ expected))
+
+    def test_empty_portfolio(self, analyzer):
+        analyzer.create_portfolio("port_001", "Empty")
+
+        result = analyzer.get_stress_test_results("port_001")
+
+        assert result["stressed_risk"] == 0.0
+        assert result["most_affected"] is None
+        assert result["company_stressed_risks"] == {}
+
+
+class TestPortfolioPerformance:
+    """Large portfolios are analyzed in batched array operations."""
+
+    def test_fifty_scenarios_over_500_positions(self, analyzer):
+        _build(analyzer, 500, seed=7)
+        rng = np.random.default_rng(8)
+        scenarios = {
+            f"scenario_{s}": {factor: float(1 + 2 * rng.random()) for factor in RISK_FACTORS}
+            for s in range(50)
+        }
+        analyzer.get_matrices("port_001")
+
+        start = time.perf_counter()
+        results = analyzer.run_stress_tests("port_001", scenarios)
+        elapsed = time.perf_counter() - start
+
+        assert len(results) == 50
+        assert len(results["scenario_0"]["company_stressed_risks"]) == 500
+        assert elapsed < 0.1
+
+    def test_full_analysis_500_positions(self, analyzer):
+        _build(analyzer, 500, seed=9)
+
+        start = time.perf_counter()
+        risk = analyzer.calculate_portfolio_risk("port_001")
+        analyzer.analyze_diversification("port_001")
+        analyzer.check_concentration_alerts("port_001")
+        elapsed = time.perf_counter() - start
+
+        assert 0 <= risk.average_correlation <= 1
+        assert elapsed < 0.5
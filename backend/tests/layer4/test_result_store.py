@@ -0,0 +1,205 @@
+"""
+Tests for the bounded, expiring result store.
+
+Covers:
+- Least-recently-used eviction at the size limit
+- TTL expiry on access and by the write-time sweep
+- Hit/miss/eviction counters
+- Analyzers keep results in bounded stores
+- Memory stays flat under continuous load
+"""
+
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.layer4.advanced import (
+    CorrelationAnalyzer,
+    MLImpactPredictor,
+    ResultStore,
+    ScenarioSimulator,
+    TrendForecaster,
+)
+
+
+class TestBounds:
+    """Test cases for size limits and expiry."""
+
+    def test_lru_eviction(self):
+        store = ResultStore("test", max_entries=3, ttl_seconds=60)
+        for i in range(3):
+            store[f"k{i}"] = i
+        store.get("k0")  # k1 is now least recently used
+        store["k3"] = 3
+
+        assert store.keys() == ["k2", "k0", "k3"]
+        assert store.get("k1") is None
+        assert store.get_stats()["evictions"] == 1
+
+    def test_overwrite_does_not_evict(self):
+        store = ResultStore("test", max_entries=2, ttl_seconds=60)
+        store["a"] = 1
+        store["b"] = 2
+        store["a"] = 3
+
+        assert store["a"] == 3
+        assert len(store) == 2
+        assert store.get_stats()["evictions"] == 0
+
+    def test_expired_entries_are_dropped(self):
+        store = ResultStore("test", max_entries=10, ttl_seconds=0.05)
+        store["a"] = 1
+        assert "a" in store
+        time.sleep(0.06)
+
+        assert "a" not in store
+        assert store.get("a", "gone") == "gone"
+        with pytest.raises(KeyError):
+            store["a"]
+        assert store.get_stats()["expirations"] == 1
+
+    def test_sweep_on_write(self):
+        store = ResultStore("test", max_entries=100, ttl_seconds=0.05)
+        for i in range(50):
+            store[i] = i
+        time.sleep(0.06)
+        store["fresh"] = 1
+
+        assert store.get_stats()["entries"] == 1
+        assert store.values() == [1]
+
+    def test_pop_and_clear(self):
+        store = ResultStore("test", max_entries=10, ttl_seconds=60)
+        store["a"] = 1
+        store["b"] = 2
+
+        assert store.pop("a") == 1
+        assert store.pop("a", "missing") == "missing"
+        store.clear()
+        assert len(store) == 0
+
+    def test_counters(self):
+        store = ResultStore("test", max_entries=10, ttl_seconds=60)
+        store["a"] = 1
+        store.get("a")
+        store.get("a")
+        store.get("b")
+
+        stats = store.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(66.67)
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ResultStore("test", max_entries=0)
+        with pytest.raises(ValueError):
+            ResultStore("test", ttl_seconds=0)
+
+
+class TestAnalyzerStores:
+    """The analyzers keep their results in bounded stores."""
+
+    def test_simulation_results_are_bounded(self):
+        simulator = ScenarioSimulator()
+        simulator._simulation_results = ResultStore("test", max_entries=5)
+        scenario = simulator.create_preset_scenario("supply_disruption")
+
+        results = [
+            simulator.run_simulation(scenario.scenario_id, "COMP_001", {"OPS_SUPPLY_CHAIN": 0.7})
+            for _ in range(20)
+        ]
+
+        assert len(simulator._simulation_results) == 5
+        assert simulator.get_simulation_result(results[-1].simulation_id) is results[-1]
+        assert simulator.get_simulation_result(results[0].simulation_id) is None
+        assert simulator.get_result_stats()["test"]["evictions"] == 15
+
+    def test_forecasts_and_anomalies_are_bounded(self):
+        forecaster = TrendForecaster()
+        forecaster._forecasts = ResultStore("test", max_entries=3)
+        now = datetime.now()
+        forecaster.add_historical_data(
+            "COMP_001", "OPS_REVENUE",
+            [(now - timedelta(days=60 - i), 0.5 + 0.01 * i + (0.5 if i % 10 == 0 else 0)) for i in range(60)],
+        )
+
+        forecasts = [forecaster.generate_forecast("COMP_001", "OPS_REVENUE", 7) for _ in range(10)]
+        for _ in range(TrendForecaster.MAX_ANOMALIES):
+            forecaster.detect_anomalies("COMP_001", "OPS_REVENUE")
+
+        assert len(forecaster._forecasts) == 3
+        assert forecaster.get_forecast(forecasts[-1].forecast_id) is forecasts[-1]
+        assert len(forecaster._anomalies) == TrendForecaster.MAX_ANOMALIES
+        assert set(forecaster.get_result_stats()) == {
+            "trend.trends", "test", "trend.seasonal_patterns",
+        }
+
+    def test_company_predictions_come_from_the_store(self):
+        predictor = MLImpactPredictor()
+        predictor._predictions = ResultStore("test", max_entries=4)
+
+        for i in range(10):
+            features = predictor.extract_features("COMP_001", {"OPS_REVENUE": 0.1 * i, "OPS_COST": 0.5})
+            predictor.predict_impact(features)
+
+        assert len(predictor.get_predictions_for_company("COMP_001", limit=10)) == 4
+
+    def test_correlation_cache_invalidation(self):
+        analyzer = CorrelationAnalyzer()
+        now = datetime.now()
+        for company in ("COMP_001", "COMP_002"):
+            analyzer.add_historical_data(
+                company, [(now - timedelta(days=d), {"A": d, "B": d * d}) for d in range(10)]
+            )
+            analyzer.calculate_correlation_matrix(company)
+
+        kept = analyzer.calculate_correlation_matrix("COMP_002")
+        analyzer.add_data_point("COMP_001", now, {"A": 1.0, "B": 1.0})
+
+        assert analyzer.calculate_correlation_matrix("COMP_002") is kept
+        assert analyzer.calculate_correlation_matrix("COMP_001").sample_size == 11
+        assert "correlation.matrices" in analyzer.get_result_stats()
+
+
+class TestResultStorePerformance:
+    """Memory stays flat under continuous load."""
+
+    def test_flat_memory_under_load(self):
+        simulator = ScenarioSimulator()
+        simulator._simulation_results = ResultStore("test", max_entries=50)
+        scenario = simulator.create_preset_scenario("demand_surge")
+        baseline = {"OPS_DEMAND": 0.7, "OPS_REVENUE": 0.65}
+
+        def run(n):
+            for _ in range(n):
+                simulator.run_simulation(scenario.scenario_id, "COMP_001", baseline)
+
+        run(100)
+        tracemalloc.start()
+        try:
+            run(100)
+            warm, _ = tracemalloc.get_traced_memory()
+            run(300)
+            loaded, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(simulator._simulation_results) == 50
+        # Three times the load, no more than a sliver of extra memory
+        assert loaded - warm < 0.1 * max(warm, 1) + 64 * 1024
+
+    def test_put_get_throughput(self):
+        store = ResultStore("test", max_entries=1000, ttl_seconds=60)
+
+        start = time.perf_counter()
+        for i in range(50_000):
+            store[i] = i
+            store.get(i - 500)
+        elapsed = time.perf_counter() - start
+
+        assert len(store) == 1000
+        assert store.get_stats()["evictions"] == 49_000
+        assert elapsed < 0.5
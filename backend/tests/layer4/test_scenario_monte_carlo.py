@@ -0,0 +1,200 @@
+"""
+Tests for the vectorized Monte Carlo engine in ScenarioSimulator.
+
+Covers:
+- Batch simulation matches run_simulation iteration by iteration
+- Seeded runs are reproducible
+- Output statistics (percentiles, severity and direction counts)
+- 10,000-iteration runs finish quickly
+"""
+
+import time
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from app.layer4.advanced import ScenarioSimulator
+from app.layer4.advanced.scenario_simulator import ScenarioType
+
+
+BASELINE = {
+    "OPS_SUPPLY_CHAIN": 0.7,
+    "OPS_PRODUCTION": 0.65,
+    "OPS_INVENTORY": 0.6,
+    "OPS_DEMAND": 0.7,
+    "OPS_REVENUE": 0.65,
+    "OPS_COST": 0.5,
+    "OPS_PROFIT_MARGIN": 0.6,
+    "OPS_CASH_FLOW": 0.55,
+}
+
+
+def _run_one_by_one(simulator, scenario, shocks):
+    """Reference: run_simulation once per row of shocks."""
+    results = []
+    for i, row in enumerate(shocks):
+        temp = replace(
+            scenario,
+            scenario_id=f"ref_{i}",
+            affected_indicators=dict(zip(scenario.affected_indicators, row)),
+        )
+        simulator._scenarios[temp.scenario_id] = temp
+        results.append(simulator.run_simulation(temp.scenario_id, "COMP_001", BASELINE))
+        del simulator._scenarios[temp.scenario_id]
+    return results
+
+
+@pytest.fixture
+def simulator():
+    return ScenarioSimulator()
+
+
+class TestBatchMatchesLoop:
+    """The vectorized pass reproduces run_simulation for every iteration."""
+
+    @pytest.mark.parametrize("preset", ["supply_disruption", "demand_surge", "market_crash"])
+    def test_random_shocks(self, simulator, preset):
+        scenario = simulator.create_preset_scenario(preset, "severe")
+        changes = np.array(list(scenario.affected_indicators.values()))
+        rng = np.random.default_rng(7)
+        shocks = changes + rng.standard_normal((40, len(changes))) * np.abs(changes) * 0.5
+
+        batch = simulator._simulate_batch(scenario, shocks, BASELINE)
+        reference = _run_one_by_one(simulator, scenario, shocks)
+
+        np.testing.assert_allclose(
+            batch["overall_impact"], [r.overall_impact for r in reference], atol=1e-12
+        )
+        np.testing.assert_allclose(
+            batch["peak_impact"], [r.peak_impact for r in reference], atol=1e-12
+        )
+        assert list(batch["peak_day"]) == [r.peak_day for r in reference]
+        for name, values in batch["final_indicators"].items():
+            np.testing.assert_allclose(
+                values, [r.simulated_indicators[name] for r in reference], atol=1e-12
+            )
+
+    def test_onset_and_recovery(self, simulator):
+        scenario = simulator.create_scenario(
+            name="Gradual Cost Rise",
+            description="Costs rise over two weeks",
+            scenario_type=ScenarioType.COST_INCREASE,
+            affected_indicators={"OPS_COST": 0.05, "OPS_DEMAND": -0.04},
+            duration_days=40,
+        )
+        scenario.onset_days = 14
+        scenario.recovery_days = 10
+        shocks = np.array([[0.05, -0.04], [0.12, -0.01], [0.0, 0.0]])
+
+        batch = simulator._simulate_batch(scenario, shocks, BASELINE)
+        reference = _run_one_by_one(simulator, scenario, shocks)
+
+        np.testing.assert_allclose(
+            batch["overall_impact"], [r.overall_impact for r in reference], atol=1e-12
+        )
+
+    def test_min_trigger_is_per_iteration(self, simulator):
+        # OPS_DEMAND -> OPS_REVENUE only fires for |change| >= 0.05
+        scenario = simulator.create_scenario(
+            name="Demand Wobble",
+            description="Small demand change",
+            scenario_type=ScenarioType.CUSTOM,
+            affected_indicators={"OPS_DEMAND": 0.01},
+            duration_days=10,
+        )
+        shocks = np.array([[0.01], [0.2]])
+
+        batch = simulator._simulate_batch(scenario, shocks, BASELINE)
+
+        revenue = batch["final_indicators"]["OPS_REVENUE"]
+        assert revenue[0] == BASELINE["OPS_REVENUE"]
+        assert revenue[1] > BASELINE["OPS_REVENUE"]
+
+
+class TestMonteCarlo:
+    """Test cases for run_monte_carlo statistics."""
+
+    def test_seed_is_reproducible(self, simulator):
+        scenario = simulator.create_preset_scenario("demand_surge", "mild")
+
+        def run(seed):
+            return simulator.run_monte_carlo(
+                scenario.scenario_id, "COMP_001", BASELINE, 500, variance_factor=0.5, seed=seed
+            )
+
+        first, second, other = run(42), run(42), run(43)
+
+        assert first == second
+        assert first["mean_impact"] != other["mean_impact"]
+
+    def test_statistics_match_reference_loop(self, simulator):
+        scenario = simulator.create_preset_scenario("cost_inflation", "extreme")
+        n = 200
+
+        results = simulator.run_monte_carlo(
+            scenario.scenario_id, "COMP_001", BASELINE, n, variance_factor=0.3, seed=1
+        )
+
+        # Rebuild the same shocks and run them through the scalar path
+        changes = np.array(list(scenario.affected_indicators.values()))
+        noise = np.random.default_rng(1).standard_normal((n, len(changes)))
+        reference = _run_one_by_one(simulator, scenario, changes + noise * 0.3 * np.abs(changes))
+        impacts = sorted(r.overall_impact for r in reference)
+
+        assert results["percentile_5"] == pytest.approx(impacts[int(n * 0.05)])
+        assert results["percentile_95"] == pytest.approx(impacts[int(n * 0.95)])
+        assert results["min_impact"] == pytest.approx(impacts[0])
+        assert results["max_impact"] == pytest.approx(impacts[-1])
+        assert results["mean_impact"] == pytest.approx(sum(impacts) / n)
+        severity = {"low": 0, "medium": 0, "high": 0, "critical": 0}
+        for r in reference:
+            severity[r.severity] += 1
+        assert results["severity_distribution"] == severity
+        assert results["negative_outcomes"] == sum(
+            1 for r in reference if r.impact_direction == "negative"
+        )
+        assert results["positive_outcomes"] == sum(
+            1 for r in reference if r.impact_direction == "positive"
+        )
+
+    def test_zero_variance_is_deterministic(self, simulator):
+        scenario = simulator.create_preset_scenario("supply_disruption")
+        single = simulator.run_simulation(scenario.scenario_id, "COMP_001", BASELINE)
+
+        results = simulator.run_monte_carlo(
+            scenario.scenario_id, "COMP_001", BASELINE, 20, variance_factor=0.0
+        )
+
+        assert results["std_dev"] == pytest.approx(0.0, abs=1e-12)
+        assert results["mean_impact"] == pytest.approx(single.overall_impact)
+
+    def test_does_not_store_per_iteration_results(self, simulator):
+        scenario = simulator.create_preset_scenario("demand_surge")
+        scenarios_before = len(simulator.list_scenarios())
+
+        simulator.run_monte_carlo(scenario.scenario_id, "COMP_001", BASELINE, 100, seed=0)
+
+        assert len(simulator._simulation_results) == 0
+        assert len(simulator.list_scenarios()) == scenarios_before
+
+    def test_unknown_scenario(self, simulator):
+        with pytest.raises(ValueError):
+            simulator.run_monte_carlo("missing", "COMP_001", BASELINE)
+
+
+class TestMonteCarloPerformance:
+    """A 10,000-iteration stress run is a single fast pass."""
+
+    def test_ten_thousand_iterations(self, simulator):
+        scenario = simulator.create_preset_scenario("market_crash", "severe")
+
+        start = time.perf_counter()
+        results = simulator.run_monte_carlo(
+            scenario.scenario_id, "COMP_001", BASELINE, 10_000, seed=3
+        )
+        elapsed = time.perf_counter() - start
+
+        assert results["num_simulations"] == 10_000
+        assert sum(results["severity_distribution"].values()) == 10_000
+        assert elapsed < 1.0
@@ -0,0 +1,202 @@
+"""
+Tests for the columnar time-series store.
+
+Covers:
+- Ordered and out-of-order appends, bulk ingest
+- Bisect-based window slicing and retention trimming
+- Named columns and contiguous views
+- TrendForecaster and CorrelationAnalyzer sharing one store
+- Bulk ingest and append throughput
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.layer4.advanced import (
+    CorrelationAnalyzer,
+    TimeSeries,
+    TimeSeriesStore,
+    TrendForecaster,
+)
+from app.layer4.advanced.time_series_store import to_datetime
+
+
+START = datetime(2026, 1, 1)
+
+
+def _day(i):
+    return START + timedelta(days=i)
+
+
+class TestAppend:
+    """Test cases for append and extend."""
+
+    def test_ordered_appends_grow_past_capacity(self):
+        series = TimeSeries(capacity=4)
+        for i in range(100):
+            series.append(_day(i), float(i))
+
+        assert len(series) == 100
+        assert series.column("value").tolist() == [float(i) for i in range(100)]
+        assert to_datetime(series.timestamps[-1]) == _day(99)
+
+    def test_out_of_order_append_is_inserted(self):
+        series = TimeSeries()
+        for i in (0, 2, 3, 1):
+            series.append(_day(i), float(i))
+
+        assert series.column("value").tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_equal_timestamps_keep_insertion_order(self):
+        series = TimeSeries()
+        series.append(_day(1), 1.0)
+        series.append(_day(1), 2.0)
+        series.append(_day(0), 0.0)
+        series.extend([_day(1), _day(0)], [3.0, -1.0])
+
+        assert series.column("value").tolist() == [0.0, -1.0, 1.0, 2.0, 3.0]
+
+    def test_unsorted_bulk_ingest(self):
+        rng = np.random.default_rng(0)
+        order = rng.permutation(500)
+        series = TimeSeries()
+        series.extend([_day(int(i)) for i in order], [float(i) for i in order])
+
+        assert series.column("value").tolist() == [float(i) for i in range(500)]
+
+    def test_named_columns_fill_missing_with_nan(self):
+        series = TimeSeries()
+        series.append(_day(0), {"A": 1.0})
+        series.append(_day(1), {"A": 2.0, "B": 5.0})
+
+        assert series.columns == ["A", "B"]
+        assert np.isnan(series.column("B")[0])
+        assert series.column("B")[1] == 5.0
+        assert series.column("C") is None
+
+    def test_columns_are_contiguous_views(self):
+        series = TimeSeries()
+        series.extend([_day(i) for i in range(10)], [{"A": i, "B": -i} for i in range(10)])
+
+        column = series.column("A")
+        assert column.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(column, series.values)
+        assert series.values.shape == (2, 10)
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            TimeSeries().extend([_day(0)], [1.0, 2.0])
+
+
+class TestWindowAndTrim:
+    """Test cases for window slicing and retention."""
+
+    @pytest.fixture
+    def series(self):
+        series = TimeSeries()
+        series.extend([_day(i) for i in range(30)], [float(i) for i in range(30)])
+        return series
+
+    def test_window_is_half_open(self, series):
+        timestamps, values = series.column_window("value", _day(10), _day(15))
+
+        assert values.tolist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+        assert to_datetime(timestamps[0]) == _day(10)
+
+    def test_window_between_points(self, series):
+        _, values = series.window(_day(9) + timedelta(hours=1), None)
+        assert values[0, 0] == 10.0
+        assert values.shape == (1, 20)
+
+    def test_trim_drops_old_points(self, series):
+        assert series.trim(_day(25)) == 25
+        assert series.column("value").tolist() == [25.0, 26.0, 27.0, 28.0, 29.0]
+
+        # Appends after a trim reuse the freed space
+        for i in range(30, 200):
+            series.append(_day(i), float(i))
+        assert len(series) == 175
+        assert series.column("value")[0] == 25.0
+
+    def test_version_changes_on_write(self, series):
+        version = series.version
+        series.trim(_day(0))
+        assert series.version == version
+        series.append(_day(40), 1.0)
+        assert series.version == version + 1
+
+
+class TestSharedStore:
+    """Both analyzers keep their data side by side in one store."""
+
+    def test_namespaced_keys(self):
+        store = TimeSeriesStore()
+        forecaster = TrendForecaster(store)
+        analyzer = CorrelationAnalyzer(store)
+        now = datetime.now()
+
+        forecaster.add_historical_data(
+            "COMP_001", "OPS_REVENUE", [(now - timedelta(days=i), 0.5) for i in range(20)]
+        )
+        analyzer.add_historical_data(
+            "COMP_001", [(now - timedelta(days=i), {"OPS_REVENUE": 0.5}) for i in range(20)]
+        )
+
+        assert sorted(store.keys()) == [
+            ("correlation", "COMP_001"),
+            ("trend", "COMP_001", "OPS_REVENUE"),
+        ]
+
+        forecaster.clear_data()
+        assert store.keys() == [("correlation", "COMP_001")]
+        assert analyzer.get_data_summary("COMP_001")["data_points"] == 20
+
+    def test_correlation_retention(self):
+        analyzer = CorrelationAnalyzer()
+        now = datetime.now()
+
+        analyzer.add_historical_data(
+            "COMP_001", [(now - timedelta(days=d), {"A": float(d)}) for d in (400, 366, 10, 1)]
+        )
+
+        assert analyzer.get_data_summary("COMP_001")["data_points"] == 2
+
+    def test_dropped_indicator_leaves_matrix(self):
+        analyzer = CorrelationAnalyzer()
+        now = datetime.now()
+        analyzer.add_data_point("COMP_001", now - timedelta(days=370), {"OLD": 1.0})
+        analyzer.add_historical_data(
+            "COMP_001", [(now - timedelta(days=d), {"A": d, "B": -d}) for d in range(5)]
+        )
+
+        assert analyzer.calculate_correlation_matrix("COMP_001").indicators == ["A", "B"]
+
+
+class TestTimeSeriesStorePerformance:
+    """Loading history is linear, not quadratic."""
+
+    def test_bulk_ingest_year_of_hourly_points(self):
+        forecaster = TrendForecaster()
+        points = [(START + timedelta(hours=i), 0.5 + 0.0001 * i) for i in range(24 * 365)]
+        points.reverse()
+
+        start = time.perf_counter()
+        forecaster.add_historical_data("COMP_001", "OPS_REVENUE", points)
+        elapsed = time.perf_counter() - start
+
+        assert forecaster.get_data_summary("COMP_001")["indicators"]["OPS_REVENUE"]["data_points"] == 24 * 365
+        assert elapsed < 0.5
+
+    def test_single_appends(self):
+        forecaster = TrendForecaster()
+
+        start = time.perf_counter()
+        for i in range(5000):
+            forecaster.add_data_point("COMP_001", "OPS_REVENUE", START + timedelta(hours=i), float(i))
+        elapsed = time.perf_counter() - start
+
+        assert forecaster.detect_trend("COMP_001", "OPS_REVENUE").slope > 0
+        assert elapsed < 1.0
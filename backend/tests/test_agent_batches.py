@@ -0,0 +1,240 @@
+"""
+Tests for batched agent execution.
+
+Covers:
+- BaseAgent.execute_batch two-phase run (rules first, bounded LLM calls)
+- PriorityDetectionAgent LLM refinement of medium results
+- Batch APIs returning per-article results in input order
+- Orchestrator process / classify / validate nodes using the batch APIs
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.agents.base_agent import BaseAgent
+from app.agents.config import AgentConfig
+from app.agents.priority_agent import PriorityDetectionAgent
+from app.agents.processing_agent import ProcessingAgent
+from app.agents.validation_agent import ValidationAgent
+
+
+def _make(agent_cls, **config):
+    """Build an agent without touching the LLM providers."""
+    agent = agent_cls.__new__(agent_cls)
+    agent.config = AgentConfig(use_mock_llm=True, **config)
+    agent.llm_manager = MagicMock()
+    agent._tools = []
+    return agent
+
+
+BODY = (
+    "The Central Bank of Sri Lanka announced its monetary policy review today. "
+    "Officials said the decision reflects stable inflation and improving external "
+    "reserves, and that lending rates are expected to ease over the coming months. "
+) * 3
+
+
+def _article(i, title="Central Bank policy review announced"):
+    return {
+        "article_id": f"a{i}",
+        "title": f"{title} {i}",
+        "body": BODY,
+        "url": f"https://news.example.lk/news/{i}",
+        "source_name": "ada_derana",
+        "publish_date": "2024-01-01T00:00:00"
+    }
+
+
+class _TwoPhaseAgent(BaseAgent):
+    """Fake agent whose even items need a slow LLM call."""
+
+    agent_name = "two_phase"
+    supports_rule_phase = True
+
+    def __init__(self):
+        self.events = []
+        self.active = 0
+        self.peak = 0
+
+    def get_system_prompt(self):
+        return ""
+
+    def get_tools(self):
+        return []
+
+    async def execute(self, input_data):
+        return self.evaluate_rules(input_data)
+
+    def evaluate_rules(self, input_data):
+        if input_data.get("bad"):
+            raise ValueError("bad input")
+        self.events.append(("rules", input_data["i"]))
+        return {"i": input_data["i"], "method": "rules"}
+
+    def needs_llm(self, input_data, result):
+        return input_data["i"] % 2 == 0
+
+    async def refine_with_llm(self, input_data, result):
+        self.events.append(("llm", input_data["i"]))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        if input_data["i"] == 4:
+            raise RuntimeError("provider down")
+        return {**result, "method": "llm"}
+
+
+class TestExecuteBatch:
+    """Test cases for BaseAgent.execute_batch."""
+
+    @pytest.mark.asyncio
+    async def test_rules_before_llm_and_bounded(self):
+        agent = _TwoPhaseAgent()
+        agent.config = AgentConfig(use_mock_llm=True, llm_batch_concurrency=3)
+
+        results = await agent.execute_batch([{"i": i} for i in range(12)])
+
+        assert [r["i"] for r in results] == list(range(12))
+        first_llm = next(n for n, (kind, _) in enumerate(agent.events) if kind == "llm")
+        assert all(kind == "rules" for kind, _ in agent.events[:first_llm])
+        assert first_llm == 12
+        assert agent.peak == 3
+        assert [r["method"] for r in results[:3]] == ["llm", "rules", "llm"]
+        # A failed LLM call keeps the rule-based result
+        assert results[4]["method"] == "rules"
+
+    @pytest.mark.asyncio
+    async def test_item_errors_do_not_fail_batch(self):
+        agent = _TwoPhaseAgent()
+        agent.config = AgentConfig(use_mock_llm=True)
+
+        results = await agent.execute_batch([{"i": 1}, {"i": 3, "bad": True}])
+
+        assert results[0]["method"] == "rules"
+        assert results[1] == {"error": "bad input"}
+
+
+class TestPriorityRefinement:
+    """Medium results get an LLM second opinion only when enabled."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        agent = _make(PriorityDetectionAgent)
+        agent.invoke_llm = AsyncMock()
+
+        batch = await agent.classify_batch([
+            {"title": "New gazette on procurement policy", "content": "tender rules"}
+        ])
+
+        assert batch["results"][0]["urgency_level"] == "low"
+        agent.invoke_llm.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_medium_results_refined_concurrently(self):
+        agent = _make(PriorityDetectionAgent, priority_llm_refinement=True, llm_batch_concurrency=5)
+        calls = {"active": 0, "peak": 0}
+
+        async def invoke_llm(prompt):
+            calls["active"] += 1
+            calls["peak"] = max(calls["peak"], calls["active"])
+            await asyncio.sleep(0.05)
+            calls["active"] -= 1
+            return 'Result: {"urgency_level": "high", "urgency_score": 0.7, "reasoning": "Rate decision"}'
+
+        agent.invoke_llm = invoke_llm
+        articles = [
+            {"title": f"Minister visits site {i}", "content": "new road opened"}
+            for i in range(20)
+        ] + [{"title": "Tsunami warning issued", "content": "evacuation"}]
+
+        start = time.perf_counter()
+        batch = await agent.classify_batch(articles)
+        elapsed = time.perf_counter() - start
+
+        results = batch["results"]
+        assert results[0]["urgency_level"] == "high"
+        assert results[0]["decision_method"] == "llm_refined"
+        assert results[-1]["decision_method"] == "keyword_based"
+        assert calls["peak"] == 5
+        assert elapsed < 0.5  # 20 calls / 5 at a time, not 20 sequential
+        assert batch["summary"]["high_count"] == 20
+
+
+class TestOrchestratorNodes:
+    """Graph nodes go through the agents' batch APIs."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        from app.orchestrator.master_orchestrator import MasterOrchestrator
+
+        orchestrator = MasterOrchestrator.__new__(MasterOrchestrator)
+        orchestrator.config = AgentConfig(use_mock_llm=True)
+        orchestrator.state_manager = MagicMock()
+        orchestrator.state_manager.update_phase = AsyncMock()
+        orchestrator.state_manager.add_many_processed_articles = AsyncMock()
+        orchestrator.state_manager.add_many_validated_articles = AsyncMock()
+        orchestrator.processing_agent = _make(ProcessingAgent)
+        orchestrator.priority_agent = _make(PriorityDetectionAgent)
+        orchestrator.validation_agent = _make(ValidationAgent)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_pipeline_nodes(self, orchestrator):
+        scraped = [_article(i) for i in range(3)] + [{"title": "", "url": "https://x.lk/empty"}]
+        state = {"run_id": "run_1", "scraped_content": scraped, "errors": [], "metrics": {}}
+
+        processed = await orchestrator._process_articles_node(state)
+        assert len(processed["processed_articles"]) == 3
+        assert processed["processed_articles"][0]["article_id"] == "a0"
+        assert processed["errors"][0]["article_url"] == "https://x.lk/empty"
+        orchestrator.state_manager.add_many_processed_articles.assert_awaited_once()
+
+        state.update(processed)
+        classified = await orchestrator._classify_priority_node(state)
+        levels = [c["urgency_level"] for c in classified["priority_classifications"]]
+        assert levels == ["HIGH"] * 3
+        assert classified["metrics"]["critical_articles"] == 3
+
+        state.update(classified)
+        validated = await orchestrator._validate_quality_node(state)
+        assert len(validated["validated_articles"]) == 3
+        assert all(a["quality_score"] >= 60 for a in validated["validated_articles"])
+        orchestrator.state_manager.add_many_validated_articles.assert_awaited_once()
+
+
+class TestBatchPerformance:
+    """A 500-article cycle stays well under a second per node."""
+
+    @pytest.mark.asyncio
+    async def test_500_article_cycle(self):
+        from app.orchestrator.master_orchestrator import MasterOrchestrator
+
+        orchestrator = MasterOrchestrator.__new__(MasterOrchestrator)
+        orchestrator.config = AgentConfig(use_mock_llm=True)
+        orchestrator.state_manager = MagicMock()
+        orchestrator.state_manager.update_phase = AsyncMock()
+        orchestrator.state_manager.add_many_processed_articles = AsyncMock()
+        orchestrator.processing_agent = _make(ProcessingAgent)
+        orchestrator.priority_agent = _make(PriorityDetectionAgent)
+
+        state = {
+            "run_id": "run_1",
+            "scraped_content": [_article(i) for i in range(500)],
+            "errors": [],
+            "metrics": {}
+        }
+
+        start = time.perf_counter()
+        state.update(await orchestrator._process_articles_node(state))
+        state.update(await orchestrator._classify_priority_node(state))
+        elapsed = time.perf_counter() - start
+
+        assert len(state["priority_classifications"]) == 500
+        assert elapsed < 5.0
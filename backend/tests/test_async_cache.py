@@ -0,0 +1,246 @@
+"""
+Tests for the single-flight async cache.
+
+Covers:
+- Single-flight loading for concurrent misses
+- Stale-while-revalidate and refresh-ahead background loads
+- Error handling (errors reach waiters, stale values survive failed refreshes)
+- StockMarketService market summary on top of the cache
+"""
+
+import asyncio
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.utils.async_cache import SingleFlightCache
+
+
+class _Feed:
+    """Fake upstream feed that counts calls."""
+
+    def __init__(self, delay=0.02, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def load(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("feed down")
+        return {"version": self.calls}
+
+
+async def _settle():
+    """Let background refresh tasks finish."""
+    for _ in range(5):
+        await asyncio.sleep(0.03)
+
+
+class TestSingleFlight:
+    """Concurrent misses share one load."""
+
+    @pytest.mark.asyncio
+    async def test_one_load_for_concurrent_misses(self):
+        cache = SingleFlightCache("test", ttl_seconds=60)
+        feed = _Feed()
+
+        results = await asyncio.gather(*(cache.get("k", feed.load) for _ in range(50)))
+
+        assert feed.calls == 1
+        assert all(r == {"version": 1} for r in results)
+        stats = cache.get_stats()
+        assert stats["misses"] == 50
+        assert stats["coalesced"] == 49
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_hits_do_not_load(self):
+        cache = SingleFlightCache("test", ttl_seconds=60)
+        feed = _Feed()
+        await cache.get("k", feed.load)
+
+        for _ in range(10):
+            assert await cache.get("k", feed.load) == {"version": 1}
+        assert feed.calls == 1
+        assert cache.get_stats()["hits"] == 10
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_waiter(self):
+        cache = SingleFlightCache("test", ttl_seconds=60)
+        feed = _Feed(fail=True)
+
+        results = await asyncio.gather(
+            *(cache.get("k", feed.load) for _ in range(5)), return_exceptions=True
+        )
+
+        assert feed.calls == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert cache.get_stats()["load_errors"] == 1
+        assert cache.peek("k") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        cache = SingleFlightCache("test", ttl_seconds=60)
+        feed = _Feed(delay=0.05)
+
+        first = asyncio.create_task(cache.get("k", feed.load))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(cache.get("k", feed.load))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"version": 1}
+        assert feed.calls == 1
+
+
+class TestStaleWhileRevalidate:
+    """Expired values are served while one refresh runs."""
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_during_refresh(self):
+        cache = SingleFlightCache("test", ttl_seconds=0.05, stale_seconds=5)
+        feed = _Feed(delay=0.05)
+        await cache.get("k", feed.load)
+        await asyncio.sleep(0.06)
+
+        results = await asyncio.gather(*(cache.get("k", feed.load) for _ in range(20)))
+
+        # Nobody waited for the feed: all stale hits, one refresh still running
+        assert all(r == {"version": 1} for r in results)
+        assert cache.get_stats()["stale_hits"] == 20
+        assert cache.get_stats()["inflight"] == 1
+        assert cache.get_stats()["background_refreshes"] == 1
+        await asyncio.sleep(0.07)
+        assert feed.calls == 2
+        assert cache.peek("k") == {"version": 2}
+
+    @pytest.mark.asyncio
+    async def test_expired_past_stale_window_blocks(self):
+        cache = SingleFlightCache("test", ttl_seconds=0.02, stale_seconds=0.02)
+        feed = _Feed()
+        await cache.get("k", feed.load)
+        await asyncio.sleep(0.05)
+
+        assert await cache.get("k", feed.load) == {"version": 2}
+        assert cache.get_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        cache = SingleFlightCache("test", ttl_seconds=0.02, stale_seconds=5)
+        feed = _Feed(delay=0.01)
+        await cache.get("k", feed.load)
+        await asyncio.sleep(0.03)
+
+        feed.fail = True
+        assert await cache.get("k", feed.load) == {"version": 1}
+        await _settle()
+        assert await cache.get("k", feed.load) == {"version": 1}
+        assert cache.get_stats()["load_errors"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_of_expiry(self):
+        cache = SingleFlightCache("test", ttl_seconds=0.2, refresh_ahead_seconds=0.15)
+        feed = _Feed(delay=0.01)
+        await cache.get("k", feed.load)
+        await asyncio.sleep(0.07)
+
+        # Still fresh, but inside the refresh-ahead window
+        assert await cache.get("k", feed.load) == {"version": 1}
+        await _settle()
+        assert feed.calls == 2
+        assert cache.get_stats()["background_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        cache = SingleFlightCache("test", ttl_seconds=60, stale_seconds=60)
+        feed = _Feed()
+        await cache.get("k", feed.load)
+
+        cache.invalidate()
+        assert await cache.get("k", feed.load) == {"version": 2}
+
+    @pytest.mark.asyncio
+    async def test_max_entries(self):
+        cache = SingleFlightCache("test", ttl_seconds=60, max_entries=3)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+
+        assert cache.peek("k0") is None
+        assert cache.peek("k4") == 4
+        assert cache.get_stats()["entries"] == 3
+
+
+class TestStockMarketServiceCache:
+    """Test cases for the CSE market summary."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        from app.layer3.services import stock_market_service as module
+
+        cache = SingleFlightCache("cse", ttl_seconds=60, stale_seconds=60)
+        monkeypatch.setattr(module, "_cse_cache", cache)
+        return module.StockMarketService
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self, service, monkeypatch):
+        feed = _Feed()
+
+        async def fetch(endpoint):
+            return await feed.load()
+        monkeypatch.setattr(service, "_fetch_cse", staticmethod(fetch))
+
+        results = await asyncio.gather(*(service.get_market_summary() for _ in range(30)))
+
+        assert feed.calls == 1
+        assert all("indices" in r for r in results)
+        assert service.get_cache_stats()["coalesced"] == 29
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_returns_mock_data(self, service, monkeypatch):
+        async def fetch(endpoint):
+            raise ConnectionError("CSE down")
+        monkeypatch.setattr(service, "_fetch_cse", staticmethod(fetch))
+
+        result = await service.get_market_summary()
+        assert "marketSummary" in result
+        assert service.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, service, monkeypatch):
+        feed = _Feed(delay=0)
+
+        async def fetch(endpoint):
+            return await feed.load()
+        monkeypatch.setattr(service, "_fetch_cse", staticmethod(fetch))
+
+        await service.get_market_summary()
+        service.clear_cache()
+        await service.get_market_summary()
+        assert feed.calls == 2
+
+
+class TestAsyncCachePerformance:
+    """Requests never wait on the feed across a TTL boundary."""
+
+    @pytest.mark.asyncio
+    async def test_no_blocking_load_at_expiry(self):
+        cache = SingleFlightCache("test", ttl_seconds=0.05, stale_seconds=1)
+        feed = _Feed(delay=0.1)
+        await cache.get("k", feed.load)
+
+        for _ in range(30):
+            results = await asyncio.gather(*(cache.get("k", feed.load) for _ in range(20)))
+            assert all("version" in r for r in results)
+            await asyncio.sleep(0.01)
+
+        # Requests crossed the expiry several times but were all served from
+        # the cache; only the initial load was a miss
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] + stats["stale_hits"] == 600
+        assert stats["background_refreshes"] >= 1
+        assert feed.calls <= 4
@@ -0,0 +1,193 @@
+"""
+Tests for the single conditional GET change check.
+
+Covers:
+- If-None-Match / If-Modified-Since sent from stored validators
+- 304 and unchanged signature reported as cache hits
+- Changed 200 body returned for the scraper, validators captured
+- Expired / forced checks fetch unconditionally (or not at all)
+- ConfigurableScraper link extraction from a supplied list page
+"""
+
+import httpx
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.cache.smart_cache import SmartCacheManager, CacheConfig, ListPageFetch
+
+
+PAGE = "<html><body><a href='/news/1001'>Central bank holds policy rates steady</a></body></html>"
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+def _manager(handler):
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    manager = SmartCacheManager(redis_client=_FakeRedis(), config=CacheConfig())
+
+    async def get_client():
+        return client
+
+    manager._get_http_client = get_client
+    return manager, requests
+
+
+async def _prime(manager, source_name="src", etag='"v1"', page=PAGE):
+    """Store a fresh scrape with validators and the page signature."""
+    signature = manager._calculate_signature(page[:manager.config.signature_sample_size])
+    await manager.cache_articles(
+        source_name, "https://news.example.lk/", [{"title": "Story"}],
+        response_headers={"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        page_signature=signature
+    )
+
+
+class TestConditionalFetch:
+    """Test cases for SmartCacheManager.fetch_if_changed."""
+
+    @pytest.mark.asyncio
+    async def test_304_is_a_hit(self):
+        manager, requests = _manager(lambda r: httpx.Response(304))
+        await _prime(manager)
+
+        fetch = await manager.fetch_if_changed("src", "https://news.example.lk/")
+
+        assert fetch == ListPageFetch(False, "not_modified_304", status_code=304)
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert requests[0].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert manager.redis.data["cache:metrics:hits:src"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_signature_is_a_hit(self):
+        manager, _ = _manager(lambda r: httpx.Response(200, text=PAGE))
+        await _prime(manager)
+
+        fetch = await manager.fetch_if_changed("src", "https://news.example.lk/")
+
+        assert not fetch.needs_scraping
+        assert fetch.reason == "signature_unchanged"
+        assert fetch.content is None
+
+    @pytest.mark.asyncio
+    async def test_changed_page_returns_body(self):
+        changed = PAGE.replace("1001", "1002")
+        manager, requests = _manager(
+            lambda r: httpx.Response(200, text=changed, headers={"ETag": '"v2"'})
+        )
+        await _prime(manager)
+
+        fetch = await manager.fetch_if_changed("src", "https://news.example.lk/")
+
+        assert fetch.needs_scraping
+        assert fetch.reason == "etag_changed"
+        assert fetch.content == changed.encode()
+        assert fetch.headers == {"ETag": '"v2"'}
+        assert len(requests) == 1
+
+        # Storing the new validators makes the next check conditional on them
+        await manager.cache_articles(
+            "src", "https://news.example.lk/", [],
+            response_headers=fetch.headers, page_signature=fetch.signature
+        )
+        assert manager.redis.data["cache:source:src:etag"] == '"v2"'
+        assert manager.redis.data["cache:source:src:signature"] == fetch.signature
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_fetches_unconditionally(self):
+        manager, requests = _manager(lambda r: httpx.Response(200, text=PAGE))
+
+        fetch = await manager.fetch_if_changed("src", "https://news.example.lk/")
+
+        assert fetch.needs_scraping
+        assert fetch.reason == "no_previous_scrape"
+        assert fetch.content == PAGE.encode()
+        assert "If-None-Match" not in requests[0].headers
+
+    @pytest.mark.asyncio
+    async def test_no_request_when_body_not_wanted(self):
+        manager, requests = _manager(lambda r: httpx.Response(200, text=PAGE))
+        await _prime(manager)
+
+        fetch = await manager.fetch_if_changed(
+            "src", "https://news.example.lk/", force=True, keep_body=False
+        )
+
+        assert fetch == ListPageFetch(True, "force_requested")
+        assert requests == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_falls_back_to_scrape(self):
+        manager, _ = _manager(lambda r: httpx.Response(503))
+        await _prime(manager)
+
+        needs, reason = await manager.needs_scraping("src", "https://news.example.lk/")
+
+        assert needs is True
+        assert reason == "http_503"
+
+
+class TestConfigurableScraperListPage:
+    """A supplied list page body is parsed without refetching it."""
+
+    @pytest.mark.asyncio
+    async def test_uses_supplied_list_page(self, monkeypatch):
+        from app.models.agent_models import SourceConfig
+        from app.scrapers import configurable_scraper
+
+        scraper = configurable_scraper.ConfigurableScraper(SourceConfig(
+            id=1,
+            source_name="test_source",
+            base_url="https://news.example.lk",
+            selectors={"title": "h1", "body": "article"},
+            rate_limit_requests=100,
+            rate_limit_period=60,
+            language="en"
+        ))
+        fetched = []
+
+        class _Client:
+            async def get(self, url):
+                fetched.append(url)
+                raise AssertionError("list page should not be fetched")
+
+        async def process(client, links):
+            return links
+
+        monkeypatch.setattr(configurable_scraper, "get_http_client", lambda name: _Client())
+        monkeypatch.setattr(scraper, "_process_articles", process)
+
+        links = await scraper.fetch_articles(list_page=PAGE.encode())
+
+        assert links == ["https://news.example.lk/news/1001"]
+        assert fetched == []
+        assert scraper.bytes_fetched == len(PAGE)
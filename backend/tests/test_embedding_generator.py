@@ -0,0 +1,382 @@
+"""
+Tests for the embedding generator's Redis cache.
+
+Covers:
+- Batch lookups and writes use one round trip each
+- Embeddings are cached as packed float32/float16 bytes
+- Malformed or legacy cache values are treated as misses
+- Micro-batching of concurrent generate() calls and the per-article memo
+- Deterministic hashed-feature fallback when no model is loaded
+"""
+
+import asyncio
+import subprocess
+import time
+import pytest
+import numpy as np
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.deduplication.embedding_generator import EmbeddingGenerator, EmbeddingConfig
+
+
+DIM = 384
+
+
+class _FakePipeline:
+    """Collects SETEX calls; one execute() is one round trip."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def setex(self, key, ttl, value):
+        self.calls.append((key, ttl, value))
+        return self
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, ttl, value in self.calls:
+            self.redis.data[key] = value
+            self.redis.ttls[key] = ttl
+        return [True] * len(self.calls)
+
+
+class _FakeRedis:
+    """Byte-valued store that counts round trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakeModel:
+    """Deterministic stand-in for a SentenceTransformer."""
+
+    def __init__(self, delay=0.0):
+        self.encoded = []
+        self.calls = 0
+        self.delay = delay
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return self.encode([texts])[0]
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        self.encoded.extend(texts)
+        rows = []
+        for text in texts:
+            rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+            vec = rng.normal(size=DIM).astype(np.float32)
+            rows.append(vec / np.linalg.norm(vec))
+        return np.vstack(rows)
+
+
+def _generator(**config):
+    generator = EmbeddingGenerator(EmbeddingConfig(**config), redis_client=_FakeRedis())
+    generator._model = _FakeModel()
+    generator._initialized = True
+    return generator
+
+
+def _texts(n):
+    return [f"Article number {i} about the economy" for i in range(n)]
+
+
+class TestEmbeddingCache:
+    """Test cases for the batched binary cache."""
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_two_round_trips(self):
+        generator = _generator()
+        await generator.generate_batch(_texts(256))
+
+        assert generator.redis.round_trips == 2
+        assert len(generator.redis.data) == 256
+
+    @pytest.mark.asyncio
+    async def test_cached_batch_skips_model(self):
+        generator = _generator()
+        texts = _texts(20)
+        first = await generator.generate_batch(texts)
+
+        generator._model.encoded.clear()
+        generator.redis.round_trips = 0
+        second = await generator.generate_batch(texts + ["short"])
+
+        assert generator._model.encoded == []
+        assert generator.redis.round_trips == 1
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+        assert not second[-1].any()
+
+    @pytest.mark.asyncio
+    async def test_values_are_packed_float32(self):
+        generator = _generator()
+        [embedding] = await generator.generate_batch(_texts(1))
+
+        key = generator._cache_key(generator._text_hash(_texts(1)[0]))
+        raw = generator.redis.data[key]
+        assert isinstance(raw, bytes)
+        assert len(raw) == DIM * 4
+        np.testing.assert_array_equal(np.frombuffer(raw, dtype=np.float32), embedding)
+        assert generator.redis.ttls[key] == 86400
+
+    @pytest.mark.asyncio
+    async def test_float16_option(self):
+        generator = _generator(cache_dtype="float16")
+        texts = _texts(3)
+        first = await generator.generate_batch(texts)
+        second = await generator.generate_batch(texts)
+
+        raw = next(iter(generator.redis.data.values()))
+        assert len(raw) == DIM * 2
+        assert next(iter(generator.redis.data)).startswith("embedding:f16:")
+        assert second[0].dtype == np.float32
+        np.testing.assert_allclose(second[0], first[0], atol=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_malformed_value_is_a_miss(self):
+        generator = _generator()
+        text = _texts(1)[0]
+        key = generator._cache_key(generator._text_hash(text))
+        generator.redis.data[key] = b"[0.1, 0.2]"
+
+        [embedding] = await generator.generate_batch([text])
+        assert generator._model.encoded == [text]
+        assert len(generator.redis.data[key]) == DIM * 4
+
+    @pytest.mark.asyncio
+    async def test_single_generate_uses_cache(self):
+        generator = _generator()
+        text = _texts(1)[0]
+        first = await generator.generate(text)
+        generator._model.encoded.clear()
+        second = await generator.generate(text)
+
+        assert generator._model.encoded == []
+        np.testing.assert_array_equal(first, second)
+
+
+class TestMicroBatching:
+    """Concurrent single-text calls share one forward pass."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_encoded_together(self):
+        generator = _generator()
+        texts = _texts(20)
+
+        embeddings = await asyncio.gather(*(generator.generate(t) for t in texts))
+
+        assert generator._model.calls == 1
+        assert generator._model.encoded == texts
+        expected = await generator.generate_batch(texts, use_cache=False)
+        for a, b in zip(embeddings, expected):
+            np.testing.assert_array_equal(a, b)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self):
+        generator = _generator(micro_batch_max_size=4, micro_batch_wait_ms=1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(generator.generate(t) for t in _texts(8)))
+
+        assert time.perf_counter() - start < 0.5
+        assert generator._model.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_share_one_embedding(self):
+        generator = _generator()
+        text = _texts(1)[0]
+
+        first, second = await asyncio.gather(generator.generate(text), generator.generate(text))
+
+        assert generator._model.encoded == [text]
+        np.testing.assert_array_equal(first, second)
+        assert generator.get_model_info()["micro_batching"]["shared_inflight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memo_skips_model_and_redis(self):
+        generator = _generator()
+        text = _texts(1)[0]
+        await generator.generate(text)
+        generator.redis.round_trips = 0
+
+        await generator.generate(text)
+
+        assert generator._model.calls == 1
+        assert generator.redis.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_memo_is_bounded(self):
+        generator = _generator(memo_size=5)
+        for text in _texts(10):
+            await generator.generate(text)
+
+        assert len(generator._memo) == 5
+
+    @pytest.mark.asyncio
+    async def test_encode_failure_uses_fallback(self):
+        generator = _generator()
+
+        def broken(texts, **kwargs):
+            raise RuntimeError("model crashed")
+        generator._model.encode = broken
+        generator._generate_fallback_embeddings = lambda texts: np.ones((len(texts), DIM), dtype=np.float32)
+
+        embedding = await generator.generate(_texts(1)[0])
+        assert embedding.shape == (DIM,)
+        assert embedding.all()
+
+    @pytest.mark.asyncio
+    async def test_check_and_register_share_embedding(self):
+        from app.deduplication.semantic_deduplicator import (
+            SemanticDeduplicator,
+            DeduplicationConfig,
+        )
+
+        dedup = SemanticDeduplicator(DeduplicationConfig(
+            enable_url_check=False, enable_content_hash=False, auto_cluster=False
+        ))
+        dedup.embedding_generator = _generator()
+        dedup.redis = None
+        dedup._get_redis = _no_redis
+        await dedup.initialize()
+
+        result = await dedup.check_duplicate(
+            article_id="a1",
+            title="Central bank holds policy rates",
+            body="The Central Bank of Sri Lanka kept policy rates unchanged today."
+        )
+
+        assert not result.is_duplicate
+        assert dedup.embedding_generator._model.calls == 1
+
+
+async def _no_redis():
+    return None
+
+
+def _fallback_generator():
+    generator = EmbeddingGenerator(EmbeddingConfig(), redis_client=_FakeRedis())
+    generator._initialized = True  # No model: fallback only
+    return generator
+
+
+class TestHashedFallback:
+    """Test cases for the model-free fallback embedding."""
+
+    STORY = (
+        "The Central Bank of Sri Lanka kept its policy interest rates unchanged "
+        "on Tuesday, citing easing inflation and a stable rupee."
+    )
+
+    def test_shape_and_norm(self):
+        embedding = _fallback_generator()._generate_fallback_embedding(self.STORY)
+
+        assert embedding.shape == (DIM,)
+        assert embedding.dtype == np.float32
+        assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-5)
+
+    def test_vectors_are_comparable(self):
+        generator = _fallback_generator()
+        story, rewrite, unrelated = generator._generate_fallback_embeddings([
+            self.STORY,
+            "Citing easing inflation and a stable rupee, the Central Bank of Sri Lanka "
+            "kept policy interest rates unchanged on Tuesday.",
+            "Heavy monsoon rain flooded several roads in Colombo and Gampaha districts."
+        ])
+
+        assert float(story @ rewrite) > 0.7
+        assert float(story @ unrelated) < 0.3
+
+    def test_batch_matches_single(self):
+        generator = _fallback_generator()
+        texts = _texts(5)
+        batch = generator._generate_fallback_embeddings(texts)
+
+        for text, row in zip(texts, batch):
+            np.testing.assert_array_equal(generator._generate_fallback_embedding(text), row)
+
+    def test_empty_text_is_zero(self):
+        embedding = _fallback_generator()._generate_fallback_embedding("")
+        assert not embedding.any()
+
+    def test_stable_across_processes(self):
+        # Load the module file directly to skip the package's heavy imports
+        code = (
+            "import importlib.util as u;"
+            "s = u.spec_from_file_location('eg', 'app/deduplication/embedding_generator.py');"
+            "m = u.module_from_spec(s); s.loader.exec_module(m);"
+            f"print(m.EmbeddingGenerator()._generate_fallback_embedding({self.STORY!r}).tobytes().hex())"
+        )
+        backend = os.path.join(os.path.dirname(__file__), '..')
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=backend, capture_output=True, text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed}, check=True
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        assert len(outputs) == 1
+        local = _fallback_generator()._generate_fallback_embedding(self.STORY)
+        assert outputs == {local.tobytes().hex()}
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_without_model(self):
+        generator = _fallback_generator()
+        texts = _texts(3) + ["short"]
+        embeddings = await generator.generate_batch(texts)
+
+        assert all(e.shape == (DIM,) for e in embeddings)
+        assert not embeddings[-1].any()
+        # Fallback vectors are not written to the model's cache
+        assert generator.redis.data == {}
+
+
+class TestMicroBatchingPerformance:
+    """Encoding runs off the event loop in few forward passes."""
+
+    @pytest.mark.asyncio
+    async def test_encode_does_not_block_loop(self):
+        generator = _generator()
+        generator._model.delay = 0.3
+
+        tasks = [asyncio.create_task(generator.generate(t)) for t in _texts(64)]
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+
+        # The loop kept ticking while the model was still encoding
+        assert not all(task.done() for task in tasks)
+        await asyncio.gather(*tasks)
+
+        assert generator._model.calls <= 2
+        info = generator.get_model_info()["micro_batching"]
+        assert info["avg_batch_size"] >= 32
+
+    def test_fallback_batch_is_fast(self):
+        generator = _fallback_generator()
+        texts = [
+            f"Story {i}: exports rose {i % 17} percent as tea and apparel demand recovered "
+            f"in markets across Europe and Asia, officials said on day {i}." * 4
+            for i in range(1000)
+        ]
+
+        start = time.perf_counter()
+        matrix = generator._generate_fallback_embeddings(texts)
+        elapsed = time.perf_counter() - start
+
+        assert matrix.shape == (1000, DIM)
+        assert elapsed < 1.0
@@ -0,0 +1,133 @@
+"""
+Tests for the shared HTTP client registry.
+
+Covers:
+- One pooled client per profile and event loop
+- Keep-alive connection reuse counters
+- Per-host in-flight limits and limit-wait counters
+- Stats exposure through CacheMetrics
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.utils.http_clients import HTTPClientProfile, HTTPClientRegistry
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive handler that answers after a short delay."""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    handler = type("_SlowHandler", (_Handler,), {"delay": 0.05})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHTTPClientRegistry:
+    """Test cases for client sharing and counters."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_per_profile(self):
+        registry = HTTPClientRegistry()
+        try:
+            assert registry.get_client("scraper") is registry.get_client("scraper")
+            assert registry.get_client("scraper") is not registry.get_client("api")
+            assert "Mozilla" in registry.get_client("scraper").headers["User-Agent"]
+        finally:
+            await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self):
+        registry = HTTPClientRegistry()
+        client = registry.get_client("api")
+        await registry.close()
+        assert client.is_closed
+        replacement = registry.get_client("api")
+        assert replacement is not client
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_connection(self, server):
+        registry = HTTPClientRegistry()
+        try:
+            client = registry.get_client("api")
+            for _ in range(5):
+                response = await client.get(f"{server}/")
+                assert response.status_code == 200
+        finally:
+            await registry.close()
+
+        stats = registry.get_stats()["profiles"]["api"]
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["reuse_rate"] == 80.0
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, server):
+        registry = HTTPClientRegistry({"api": HTTPClientProfile(timeout=5.0, per_host_limit=2)})
+        try:
+            client = registry.get_client("api")
+            responses = await asyncio.gather(*(client.get(f"{server}/") for _ in range(6)))
+        finally:
+            await registry.close()
+
+        assert all(r.status_code == 200 for r in responses)
+        stats = registry.get_stats()["profiles"]["api"]
+        host = stats["hosts"]["127.0.0.1"]
+        assert host["peak_in_flight"] == 2
+        assert host["limit_waits"] >= 4
+        assert stats["host_limit_waits"] == host["limit_waits"]
+        assert stats["in_flight"] == 0
+        assert stats["connections_opened"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_errors_counted(self):
+        registry = HTTPClientRegistry({"api": HTTPClientProfile(timeout=1.0)})
+        try:
+            with pytest.raises(Exception):
+                await registry.get_client("api").get("http://127.0.0.1:1/")
+        finally:
+            await registry.close()
+
+        stats = registry.get_stats()["profiles"]["api"]
+        assert stats["errors"] == 1
+        assert stats["in_flight"] == 0
+
+
+class TestMetricsExposure:
+    """Pool stats are reported through CacheMetrics."""
+
+    def test_cache_metrics_includes_pool_stats(self):
+        from app.cache.cache_metrics import CacheMetrics
+
+        stats = CacheMetrics().get_http_pool_stats()
+        assert "http2" in stats
+        assert "profiles" in stats
@@ -0,0 +1,158 @@
+"""
+Unit tests for the compiled indicator keyword matcher.
+
+The single-pass matcher must give exactly the same hit counts and scores as
+the per-indicator, per-keyword regex path it replaces.
+"""
+
+import random
+import re
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.layer2.indicators.full_indicator_calculator.full_calculator import (
+    FullIndicatorCalculator,
+    IndicatorDefinition,
+)
+from app.layer2.indicators.full_indicator_calculator.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = [
+    ["fuel", "fuel shortage", "petrol", "diesel"],
+    ["oil", "oil price", "crude oil", "Oil"],
+    ["covid-19", "health", "hospital"],
+    ["u.s.", "imf", "debt", "debt restructuring"],
+    ["strike", "protest", "trade union"],
+    [],
+    ["rain", "flood", "landslide", "rainfall"],
+]
+
+VOCAB = [
+    "fuel", "shortage", "petrol", "diesel", "oil", "price", "crude", "covid-19",
+    "covid", "health", "hospital", "u.s.", "imf", "debt", "restructuring",
+    "strike", "strikes", "protest", "trade", "union", "rain", "flood",
+    "landslide", "rainfall", "the", "government", "said", "on", "monday",
+]
+
+
+def _make_calculator():
+    with patch.object(FullIndicatorCalculator, '_load_indicators'):
+        calc = FullIndicatorCalculator(pg_config={})
+    calc.indicators = [
+        IndicatorDefinition(
+            indicator_id=f"IND_{i}",
+            indicator_name=f"Indicator {i}",
+            pestel_category="Economic" if i % 2 else "Social",
+            subcategory="",
+            description="",
+            calculation_type="frequency_count" if i % 3 else "sentiment_aggregate",
+            keywords=keywords,
+            base_weight=1.0,
+            threshold_high=70.0,
+            threshold_low=30.0,
+        )
+        for i, keywords in enumerate(KEYWORDS)
+    ]
+    return calc
+
+
+def _legacy_hits(text, keywords):
+    return sum(
+        1 for kw in keywords
+        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', text)
+    )
+
+
+def _random_articles(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            'article_id': f"art_{i}",
+            'title': " ".join(rng.choice(VOCAB) for _ in range(5)).title(),
+            'body': " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, 40))),
+            'sentiment': {'score': rng.uniform(-1, 1)},
+        }
+        for i in range(n)
+    ]
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_overlapping_and_prefix_keywords(self):
+        """Prefix keywords at the same position are all counted."""
+        matcher = KeywordMatcher(KEYWORDS)
+        text = "crude oil price rise hits fuel shortage"
+        hits = matcher.count_hits(text)
+        assert hits[0] == 2  # fuel, fuel shortage
+        assert hits[1] == 4  # oil, oil price, crude oil, Oil
+
+    def test_word_boundaries(self):
+        """Keywords inside longer words do not match."""
+        matcher = KeywordMatcher(KEYWORDS)
+        assert matcher.count_hits("strikes and rainfalls") == {}
+
+    def test_matches_legacy_regex(self):
+        """Hit counts agree with per-keyword regex search."""
+        matcher = KeywordMatcher(KEYWORDS)
+        for article in _random_articles(300):
+            text = f"{article['title']} {article['body']}".lower()
+            hits = matcher.count_hits(text)
+            for idx, keywords in enumerate(KEYWORDS):
+                assert hits.get(idx, 0) == _legacy_hits(text, keywords)
+
+
+class TestFullIndicatorCalculatorMatching:
+    """Single-pass calculation must reproduce the per-pair scores."""
+
+    def test_scores_match_per_pair_path(self):
+        calc = _make_calculator()
+        articles = _random_articles(200)
+
+        results = calc.calculate_all_indicators(articles)
+
+        assert len(results) == len(KEYWORDS)
+        for indicator, result in zip(calc.indicators, results):
+            matching = [
+                a for a in articles
+                if calc._match_article_to_indicator(a, indicator) > 0.3
+            ]
+            assert result.article_count == len(matching)
+            assert result.matching_articles == [a['article_id'] for a in matching[:5]]
+
+            if indicator.calculation_type == 'sentiment_aggregate':
+                expected = calc._calculate_sentiment_indicator(matching, indicator)
+            else:
+                expected = calc._calculate_frequency_indicator(matching, indicator)
+            assert result.value == round(expected, 1)
+
+    def test_accumulator_matches_batch(self):
+        calc = _make_calculator()
+        articles = _random_articles(120, seed=21)
+
+        accumulator = calc.create_accumulator()
+        for article in articles:
+            accumulator.add(article)
+
+        streamed = [r.to_dict() for r in accumulator.results()]
+        batch = [r.to_dict() for r in calc.calculate_all_indicators(articles)]
+        for r in streamed + batch:
+            r.pop('timestamp')
+        assert streamed == batch
+
+    def test_category_filter(self):
+        calc = _make_calculator()
+        results = calc.calculate_all_indicators(_random_articles(50), category_filter="Social")
+        assert results
+        assert all(r.pestel_category == "Social" for r in results)
+
+    def test_matcher_rebuilt_when_indicators_change(self):
+        calc = _make_calculator()
+        article = {'article_id': 'a1', 'title': 'Cyclone warning', 'body': ''}
+        assert calc.calculate_all_indicators([article])[0].article_count == 0
+
+        calc.indicators[0].keywords = ["cyclone"]
+        assert calc.calculate_all_indicators([article])[0].article_count == 1
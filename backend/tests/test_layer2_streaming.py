@@ -0,0 +1,317 @@
+"""
+Tests for the streaming Layer 2 pipeline mode.
+
+Tests cover:
+- run_stream_pipeline: bounded queues, concurrency, error handling, stats
+- Layer2PipelineOrchestrator streaming mode against the batch stages
+- Bulk result storage
+- Layer2Output build benchmark (10k articles, 105 indicators)
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.utils.async_batch import StreamStage, run_stream_pipeline
+
+
+async def _numbers(n, produced=None):
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+class TestRunStreamPipeline:
+    """Test cases for run_stream_pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_all_items_reach_sink(self):
+        received = []
+
+        async def double(x):
+            await asyncio.sleep(0)
+            return x * 2
+
+        async def sink(x):
+            received.append(x)
+
+        stats = await run_stream_pipeline(
+            _numbers(200),
+            [
+                StreamStage("double", double, concurrency=4, is_async=True),
+                StreamStage("inc", lambda x: x + 1, concurrency=2),
+            ],
+            sink=sink,
+            queue_size=5,
+        )
+
+        assert sorted(received) == [i * 2 + 1 for i in range(200)]
+        assert stats["double"].items_in == 200
+        assert stats["inc"].items_out == 200
+        assert stats["inc"].max_queue_depth <= 5
+        assert stats["double"].to_dict()["throughput_per_s"] > 0
+
+    @pytest.mark.asyncio
+    async def test_source_is_backpressured(self):
+        produced = []
+        gate = asyncio.Event()
+
+        async def blocked(x):
+            await gate.wait()
+            return x
+
+        async def sink(x):
+            pass
+
+        task = asyncio.ensure_future(run_stream_pipeline(
+            _numbers(1000, produced),
+            [StreamStage("blocked", blocked, concurrency=2, is_async=True)],
+            sink=sink,
+            queue_size=10,
+        ))
+        await asyncio.sleep(0.05)
+
+        # Only queue capacity plus in-flight items are pulled from the source
+        assert len(produced) <= 10 + 2 + 1
+        gate.set()
+        stats = await task
+        assert stats["blocked"].items_out == 1000
+
+    @pytest.mark.asyncio
+    async def test_errors_and_dropped_items(self):
+        received = []
+
+        def flaky(x):
+            if x % 10 == 0:
+                raise ValueError("boom")
+            return None if x % 2 else x
+
+        async def sink(x):
+            received.append(x)
+
+        stats = await run_stream_pipeline(
+            _numbers(50), [StreamStage("flaky", flaky, concurrency=3)], sink=sink
+        )
+
+        assert stats["flaky"].errors == 5
+        assert sorted(received) == [x for x in range(50) if x % 2 == 0 and x % 10]
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.docs = []
+        self.calls = 0
+
+    async def insert_many(self, docs, ordered=True):
+        self.calls += 1
+        self.docs.extend(docs)
+        return type("Result", (), {"inserted_ids": list(range(len(docs)))})()
+
+    async def insert_one(self, doc):
+        self.calls += 1
+        self.docs.append(doc)
+
+
+class _FakeLoader:
+    def __init__(self, articles):
+        self.articles = articles
+        self.db = type("DB", (), {})()
+        self.db.indicator_calculations = _FakeCollection()
+        self.db.composite_scores = _FakeCollection()
+        self.mark_calls = []
+
+    async def mark_many_as_layer2_processed(self, article_ids, layer2_result):
+        self.mark_calls.append(list(article_ids))
+        return len(article_ids)
+
+    async def get_unprocessed_articles(self, limit=100, skip=0):
+        return [dict(a) for a in self.articles[skip:skip + limit]]
+
+    async def get_all_articles(self, limit=1000, skip=0):
+        return []
+
+
+def _articles(n):
+    topics = ["fuel shortage in colombo", "tourism arrivals rise", "strike by doctors"]
+    return [
+        {
+            'article_id': f"art_{i}",
+            'title': topics[i % 3].title(),
+            'body': f"{topics[i % 3]} reported on day {i}",
+            'source': f"source_{i % 4}",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def orchestrator():
+    from app.layer2.pipeline_orchestrator import Layer2PipelineOrchestrator
+    from app.layer2.indicators.full_indicator_calculator.full_calculator import (
+        FullIndicatorCalculator,
+        IndicatorDefinition,
+    )
+
+    with patch.object(FullIndicatorCalculator, '_load_indicators'):
+        calculator = FullIndicatorCalculator(pg_config={})
+    calculator.indicators = [
+        IndicatorDefinition(f"IND_{i}", name, "Economic", "", "", calc_type, keywords, 1.0, 70.0, 30.0)
+        for i, (name, calc_type, keywords) in enumerate([
+            ("Fuel", "frequency_count", ["fuel", "shortage"]),
+            ("Tourism", "sentiment_aggregate", ["tourism", "arrivals"]),
+            ("Strikes", "frequency_count", ["strike", "doctors"]),
+        ])
+    ]
+
+    orch = Layer2PipelineOrchestrator()
+    orch._mongodb_loader = _FakeLoader(_articles(37))
+    orch._indicator_calculator = calculator
+    orch._enhanced_pipeline = object()
+    orch._create_classifier = lambda: None
+    orch._create_sentiment_analyzer = lambda: None
+    orch._load_spacy = lambda: None
+    return orch
+
+
+class TestStreamingOrchestrator:
+    """Streaming mode must produce the same indicators as the batch mode."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_matches_batch(self, orchestrator):
+        from app.layer2.pipeline_orchestrator import StreamingConfig
+
+        batch = await orchestrator.run_full_pipeline(article_limit=37, store_results=False)
+        streamed = await orchestrator.run_full_pipeline(
+            article_limit=37,
+            store_results=False,
+            streaming=True,
+            streaming_config=StreamingConfig(fetch_page_size=5, queue_size=4),
+        )
+
+        assert batch.success and streamed.success
+        assert streamed.articles_processed == batch.articles_processed == 37
+        for name in ('FUEL', 'TOURISM', 'STRIKES'):
+            assert streamed.layer2_output.indicators[name].raw_count == \
+                batch.layer2_output.indicators[name].raw_count
+            assert streamed.layer2_output.indicators[name].value == \
+                batch.layer2_output.indicators[name].value
+
+        classify = next(s for s in streamed.stages if s.stage_name == "2_pestel_classification")
+        assert classify.details["mode"] == "streaming"
+        assert classify.details["items_in"] == 37
+        assert classify.details["max_queue_depth"] <= 4
+        assert "throughput_per_s" in classify.details
+
+    @pytest.mark.asyncio
+    async def test_streaming_respects_limit(self, orchestrator):
+        result = await orchestrator.run_full_pipeline(
+            article_limit=10, store_results=False, streaming=True
+        )
+        assert result.articles_processed == 10
+
+
+class TestBulkStorage:
+    """Stage 8 must use bulk writes and report per-batch latency."""
+
+    @pytest.mark.asyncio
+    async def test_store_results_bulk(self, orchestrator):
+        orchestrator.store_batch_size = 10
+
+        result = await orchestrator.run_full_pipeline(article_limit=37, store_results=True)
+
+        loader = orchestrator._mongodb_loader
+        assert loader.db.indicator_calculations.calls == 1
+        assert len(loader.db.indicator_calculations.docs) == 3
+        assert loader.db.composite_scores.calls == 1
+        assert [len(c) for c in loader.mark_calls] == [10, 10, 10, 7]
+
+        store = next(s for s in result.stages if s.stage_name == "8_store_results")
+        assert store.item_count == 4
+        assert store.details["articles_marked"] == 37
+        assert len(store.details["batches"]) == 6
+        assert all("latency_ms" in b for b in store.details["batches"])
+
+    @pytest.mark.asyncio
+    async def test_articles_unmarked_when_insert_fails(self, orchestrator):
+        loader = orchestrator._mongodb_loader
+
+        async def failing_insert(docs, ordered=True):
+            raise ConnectionError("mongo down")
+
+        loader.db.indicator_calculations.insert_many = failing_insert
+
+        result = await orchestrator.run_full_pipeline(article_limit=37, store_results=True)
+
+        store = next(s for s in result.stages if s.stage_name == "8_store_results")
+        assert loader.mark_calls == []
+        assert store.details["articles_marked"] == 0
+        assert store.details["errors"] == ["mongo down"]
+
+
+class TestLayer2OutputPerformance:
+    """Regression benchmark for building Layer2Output."""
+
+    def _inputs(self, n_articles=10_000, n_indicators=105):
+        import random
+        from app.layer2.indicators.full_indicator_calculator.full_calculator import IndicatorValue
+
+        rng = random.Random(5)
+        articles = [
+            {
+                'article_id': f"art_{i}",
+                'source': f"source_{i % 40}",
+                'sentiment': {'score': rng.uniform(-1, 1)} if i % 7 else 'n/a',
+            }
+            for i in range(n_articles)
+        ]
+        indicator_values = [
+            IndicatorValue(
+                indicator_id=f"IND_{j:03d}",
+                indicator_name=f"Indicator {j}",
+                pestel_category="Economic",
+                subcategory="",
+                value=55.0,
+                confidence=0.5,
+                article_count=5,
+                matching_articles=[f"art_{rng.randrange(n_articles)}" for _ in range(5)],
+                calculation_type="frequency_count",
+            )
+            for j in range(n_indicators)
+        ]
+        return articles, indicator_values
+
+    def test_build_output_10k_articles(self):
+        import time
+        from app.layer2.pipeline_orchestrator import Layer2PipelineOrchestrator
+
+        articles, indicator_values = self._inputs()
+        orch = Layer2PipelineOrchestrator()
+        composites = {'NATIONAL_ACTIVITY_INDEX': {'value': 55.0}}
+
+        start = time.perf_counter()
+        output = orch._build_layer2_output(indicator_values, composites, articles, 24)
+        elapsed = time.perf_counter() - start
+
+        assert output is not None
+        assert len(output.indicators) == 105
+        assert output.article_count == 10_000
+
+        # Spot-check against the straightforward scan
+        by_id = {a['article_id']: a for a in articles}
+        for iv in indicator_values[:10]:
+            scores = [
+                by_id[aid]['sentiment']['score'] for aid in iv.matching_articles
+                if isinstance(by_id[aid]['sentiment'], dict)
+            ]
+            expected = sum(scores) / len(scores) if scores else 0.0
+            key = iv.indicator_name.replace(' ', '_').upper()
+            assert output.indicators[key].sentiment_score == pytest.approx(expected)
+
+        # Previously O(indicators x matches x articles); must stay well under a second
+        assert elapsed < 0.5
@@ -0,0 +1,328 @@
+"""
+Tests for the LLM response cache.
+
+Covers:
+- In-process LRU tier (eviction, expiry, works without Redis)
+- Async lookups with a single MGET per batch
+- Request coalescing for identical concurrent prompts
+- BaseLLMService._call_llm_async and prefetch_cached on top of the cache
+"""
+
+import asyncio
+import json
+import time
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.layer2.services.llm_base import (
+    APIKeyManager,
+    BaseLLMService,
+    LLMCache,
+    LLMConfig,
+    _LRUTier,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def hincrby(self, key, field, amount):
+        self._ops.append((field, amount))
+        return self
+
+    async def execute(self):
+        for field, amount in self._ops:
+            self._redis.stats[field] = self._redis.stats.get(field, 0) + amount
+        return [True] * len(self._ops)
+
+
+class _FakeAsyncRedis:
+    """Records calls so tests can count round trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.stats = {}
+        self.mget_calls = 0
+        self.get_calls = 0
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(k) for k in keys]
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value.encode()
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+def _cache(monkeypatch, redis=None, **kwargs):
+    monkeypatch.setattr(LLMCache, "_init_redis", lambda self: None)
+    cache = LLMCache(**kwargs)
+    if redis is None:
+        cache._enabled = False
+    else:
+        cache._get_async_redis = lambda: redis
+    return cache
+
+
+class TestLRUTier:
+    """Test cases for the in-process tier."""
+
+    def test_evicts_least_recently_used(self):
+        tier = _LRUTier(max_entries=2, ttl_seconds=60)
+        tier.set("a", {"v": 1})
+        tier.set("b", {"v": 2})
+        tier.get("a")
+        tier.set("c", {"v": 3})
+
+        assert tier.get("b") is None
+        assert tier.get("a") == {"v": 1}
+        assert len(tier) == 2
+
+    def test_entries_expire(self):
+        tier = _LRUTier(max_entries=10, ttl_seconds=0.01)
+        tier.set("a", {"v": 1})
+        time.sleep(0.02)
+        assert tier.get("a") is None
+        assert len(tier) == 0
+
+
+class TestAsyncLookups:
+    """Test cases for aget/aset/aget_many."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_without_redis(self, monkeypatch):
+        cache = _cache(monkeypatch)
+
+        await cache.aset("p", "prompt", {"content": "x", "parsed": {"a": 1}})
+        assert await cache.aget("p", "prompt") == {"content": "x", "parsed": {"a": 1}}
+        assert await cache.aget("p", "other") is None
+        assert cache.get_stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_mget(self, monkeypatch):
+        redis = _FakeAsyncRedis()
+        cache = _cache(monkeypatch, redis)
+        redis.data[cache._generate_key("p", "r1")] = json.dumps({"parsed": 1}).encode()
+        await cache.aset("p", "m1", {"parsed": 2})
+
+        results = await cache.aget_many("p", ["r1", "m1", "missing"])
+
+        assert results == [{"parsed": 1}, {"parsed": 2}, None]
+        assert redis.mget_calls == 1
+        assert redis.stats == {"hits": 1, "misses": 1}
+
+        # Redis hits are promoted to the memory tier
+        assert await cache.aget("p", "r1") == {"parsed": 1}
+        assert redis.mget_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_all_memory_hits_skip_redis(self, monkeypatch):
+        redis = _FakeAsyncRedis()
+        cache = _cache(monkeypatch, redis)
+        for i in range(3):
+            await cache.aset("p", f"k{i}", {"i": i})
+
+        await cache.aget_many("p", ["k0", "k1", "k2"])
+        assert redis.mget_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self, monkeypatch):
+        redis = _FakeAsyncRedis()
+
+        async def broken(keys):
+            raise ConnectionError("down")
+        redis.mget = broken
+        cache = _cache(monkeypatch, redis)
+
+        assert await cache.aget("p", "x") is None
+
+
+class TestCoalescing:
+    """Identical concurrent prompts share one computation."""
+
+    @pytest.mark.asyncio
+    async def test_one_compute_for_concurrent_callers(self, monkeypatch):
+        cache = _cache(monkeypatch)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "result"
+
+        results = await asyncio.gather(
+            *(cache.coalesce("p", "same", compute) for _ in range(10))
+        )
+
+        assert results == ["result"] * 10
+        assert calls == 1
+        assert cache.get_stats()["coalesced"] == 9
+        assert cache.get_stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self, monkeypatch):
+        cache = _cache(monkeypatch)
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            *(cache.coalesce("p", "same", compute) for _ in range(3)),
+            return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_follower_recomputes_if_leader_cancelled(self, monkeypatch):
+        cache = _cache(monkeypatch)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(cache.coalesce("p", "same", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.coalesce("p", "same", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == 2
+        assert leader.cancelled()
+
+
+class _SlowLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+
+        class _Response:
+            content = '{"label": "economy"}'
+        return _Response()
+
+
+class _Service(BaseLLMService):
+    @property
+    def cache_prefix(self):
+        return "test"
+
+
+def _service(cache, llm):
+    service = object.__new__(_Service)
+    service.config = LLMConfig(retry_delay_seconds=0)
+    service._llm = llm
+    service._llm_clients = {}
+    service._current_api_key = "key-aaaa"
+    service._cache = cache
+    service._stats = {
+        "total_calls": 0,
+        "cache_hits": 0,
+        "llm_calls": 0,
+        "errors": 0,
+        "total_processing_time_ms": 0,
+        "key_rotations": 0,
+        "key_spillovers": 0
+    }
+    return service
+
+
+@pytest.fixture
+def key_manager(monkeypatch):
+    import app.layer2.services.llm_base as llm_base
+    manager = object.__new__(APIKeyManager)
+    manager._keys = ["key-aaaa"]
+    manager._current_index = 0
+    manager._key_status = {"...aaaa": {"available": True, "rate_limited_until": None,
+                                       "total_calls": 0, "errors": 0}}
+    manager.requests_per_minute = 600
+    manager._buckets = {}
+    monkeypatch.setattr(llm_base, "api_key_manager", manager)
+    return manager
+
+
+class TestServiceCaching:
+    """Test cases for the cache in the async LLM call path."""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_call_llm_once(self, monkeypatch, key_manager):
+        redis = _FakeAsyncRedis()
+        llm = _SlowLLM()
+        service = _service(_cache(monkeypatch, redis), llm)
+
+        responses = await asyncio.gather(
+            *(service._call_llm_async("same wire story", "system") for _ in range(5))
+        )
+
+        assert llm.calls == 1
+        assert all(r.parsed == {"label": "economy"} for r in responses)
+        assert len(redis.data) == 1
+
+        # Later calls are served from the memory tier
+        again = await service._call_llm_async("same wire story", "system")
+        assert again.cached
+        assert llm.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_bypasses_cache(self, monkeypatch, key_manager):
+        llm = _SlowLLM()
+        service = _service(_cache(monkeypatch), llm)
+
+        await asyncio.gather(
+            *(service._call_llm_async("p", use_cache=False) for _ in range(3))
+        )
+        assert llm.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_memory_tier(self, monkeypatch, key_manager):
+        redis = _FakeAsyncRedis()
+        cache = _cache(monkeypatch, redis)
+        for i in range(4):
+            key = cache._generate_key("test", f"sys|||prompt {i}")
+            redis.data[key] = json.dumps({"content": "{}", "parsed": {"i": i}}).encode()
+        service = _service(cache, _SlowLLM())
+
+        found = await service.prefetch_cached([f"prompt {i}" for i in range(6)], "sys")
+        assert found == 4
+        assert redis.mget_calls == 1
+
+        response = await service._call_llm_async("prompt 2", "sys")
+        assert response.cached and response.parsed == {"i": 2}
+        assert redis.mget_calls == 1
+
+
+class TestLLMCachePerformance:
+    """Batch lookups cost one round trip regardless of size."""
+
+    @pytest.mark.asyncio
+    async def test_large_batch_single_round_trip(self, monkeypatch):
+        redis = _FakeAsyncRedis()
+        cache = _cache(monkeypatch, redis)
+        for i in range(0, 500, 2):
+            redis.data[cache._generate_key("p", f"prompt {i}")] = b'{"parsed": true}'
+
+        start = time.perf_counter()
+        results = await cache.aget_many("p", [f"prompt {i}" for i in range(500)])
+        elapsed = time.perf_counter() - start
+
+        assert sum(1 for r in results if r) == 250
+        assert redis.mget_calls == 1
+        assert redis.get_calls == 0
+        assert elapsed < 0.5
@@ -0,0 +1,275 @@
+"""
+Tests for LLM request rate limiting.
+
+Covers:
+- AsyncTokenBucket waits without blocking the event loop
+- FIFO order and cancellation refunds for queued waiters
+- APIKeyManager spill-over to keys with free capacity
+- BaseLLMService._call_llm_async retries with ainvoke
+"""
+
+import asyncio
+import time
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.layer2.services.llm_base import (
+    AsyncTokenBucket,
+    APIKeyManager,
+    BaseLLMService,
+    LLMConfig,
+)
+
+
+def _key_manager(keys, requests_per_minute=60):
+    """Build an APIKeyManager without touching the process-wide singleton."""
+    manager = object.__new__(APIKeyManager)
+    manager._keys = list(keys)
+    manager._current_index = 0
+    manager._key_status = {
+        manager._get_key_id(k): {
+            "available": True,
+            "rate_limited_until": None,
+            "total_calls": 0,
+            "errors": 0
+        }
+        for k in keys
+    }
+    manager.requests_per_minute = requests_per_minute
+    manager._buckets = {}
+    return manager
+
+
+class TestAsyncTokenBucket:
+    """Test cases for the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity(self):
+        bucket = AsyncTokenBucket(60, capacity=5)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.perf_counter() - start < 0.05
+        assert not bucket.try_acquire()
+
+    @pytest.mark.asyncio
+    async def test_wait_does_not_block_loop(self):
+        # 600 rpm = one token every 0.1s
+        bucket = AsyncTokenBucket(600, capacity=1)
+        await bucket.acquire()
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await bucket.acquire()
+        elapsed = time.perf_counter() - start
+        task.cancel()
+
+        assert 0.07 <= elapsed < 0.2
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self):
+        bucket = AsyncTokenBucket(1200, capacity=1)
+        await bucket.acquire()
+        order = []
+
+        async def worker(i):
+            await bucket.acquire()
+            order.append(i)
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(worker(i)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+        assert bucket.get_stats()["waits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_refunds_token(self):
+        bucket = AsyncTokenBucket(60, capacity=1)
+        await bucket.acquire()
+
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        assert bucket.get_stats()["queued"] == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = bucket.get_stats()
+        assert stats["queued"] == 0
+        assert stats["acquired"] == 1
+
+    def test_configure_changes_rate(self):
+        bucket = AsyncTokenBucket(30)
+        bucket.configure(120)
+        assert bucket.rate == 2.0
+        assert bucket.capacity == 120
+        # The balance is not topped up by a reconfigure
+        assert bucket.get_stats()["available_tokens"] <= 30.1
+
+
+class TestAPIKeyManagerRateLimit:
+    """Test cases for per-key buckets and spill-over."""
+
+    @pytest.mark.asyncio
+    async def test_spills_over_to_second_key(self):
+        manager = _key_manager(["key-aaaa", "key-bbbb"])
+        manager.get_bucket("key-aaaa").configure(60, capacity=2)
+        manager.get_bucket("key-bbbb").configure(60, capacity=2)
+
+        keys = [await manager.acquire_key("key-aaaa") for _ in range(4)]
+
+        assert keys == ["key-aaaa", "key-aaaa", "key-bbbb", "key-bbbb"]
+
+    @pytest.mark.asyncio
+    async def test_skips_rate_limited_keys(self):
+        manager = _key_manager(["key-aaaa", "key-bbbb"])
+        manager.mark_rate_limited("key-aaaa", retry_after_seconds=60)
+
+        assert await manager.acquire_key("key-aaaa") == "key-bbbb"
+
+    @pytest.mark.asyncio
+    async def test_no_usable_keys(self):
+        manager = _key_manager(["key-aaaa"])
+        manager.mark_rate_limited("key-aaaa")
+
+        assert await manager.acquire_key() is None
+
+    def test_stats_include_buckets(self):
+        manager = _key_manager(["key-aaaa"])
+        manager.acquire_key_sync()
+
+        stats = manager.get_stats()
+        assert stats["key_status"]["...aaaa"]["rate_limiter"]["acquired"] == 1
+
+    def test_configure_rate_limit_updates_buckets(self):
+        manager = _key_manager(["key-aaaa"], requests_per_minute=30)
+        bucket = manager.get_bucket("key-aaaa")
+
+        manager.configure_rate_limit(90)
+        assert bucket.requests_per_minute == 90
+
+
+class _FakeLLM:
+    """Async chat model that fails a set number of times first."""
+
+    def __init__(self, failures=0, error="connection reset"):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError(self.error)
+
+        class _Response:
+            content = '{"ok": true}'
+        return _Response()
+
+
+class _Service(BaseLLMService):
+    @property
+    def cache_prefix(self):
+        return "test"
+
+
+def _service(llm):
+    service = object.__new__(_Service)
+    service.config = LLMConfig(retry_delay_seconds=0, enable_caching=False)
+    service._llm = llm
+    service._llm_clients = {}
+    service._current_api_key = "key-aaaa"
+    service._cache = None
+    service._stats = {
+        "total_calls": 0,
+        "cache_hits": 0,
+        "llm_calls": 0,
+        "errors": 0,
+        "total_processing_time_ms": 0,
+        "key_rotations": 0,
+        "key_spillovers": 0
+    }
+    return service
+
+
+class TestCallLLMAsync:
+    """Test cases for the async LLM call path."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        import app.layer2.services.llm_base as llm_base
+        manager = _key_manager(["key-aaaa"])
+        monkeypatch.setattr(llm_base, "api_key_manager", manager)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_success(self, manager):
+        service = _service(_FakeLLM())
+
+        response = await service._call_llm_async("prompt", "system")
+
+        assert response.success
+        assert response.parsed == {"ok": True}
+        assert manager.get_bucket("key-aaaa").get_stats()["acquired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self, manager):
+        llm = _FakeLLM(failures=2)
+        service = _service(llm)
+
+        response = await service._call_llm_async("prompt")
+
+        assert response.success
+        assert llm.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_all_keys_limited(self, manager):
+        llm = _FakeLLM(failures=10, error="429 Too Many Requests")
+        service = _service(llm)
+
+        response = await service._call_llm_async("prompt")
+
+        assert not response.success
+        assert llm.calls == 1
+        assert service._stats["errors"] == 1
+
+
+class TestRateLimiterPerformance:
+    """Waiting callers share the loop instead of serialising it."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_overlap(self):
+        # 20 requests at 600 rpm with a burst of 10: ~1s of token debt,
+        # independent work on the loop must keep running meanwhile
+        bucket = AsyncTokenBucket(600, capacity=10)
+        other_work = 0
+
+        async def background():
+            nonlocal other_work
+            for _ in range(50):
+                await asyncio.sleep(0.005)
+                other_work += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(background(), *(bucket.acquire() for _ in range(20)))
+        elapsed = time.perf_counter() - start
+
+        assert other_work == 50
+        assert 0.9 <= elapsed < 1.3
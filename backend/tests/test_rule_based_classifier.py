@@ -0,0 +1,113 @@
+"""
+Unit tests for the RuleBasedClassifier keyword index.
+
+Tests cover:
+- Tokenize-once scoring matches the per-pattern reference implementation
+- Multi-word keywords and whitespace handling
+- classify_batch API and performance against the per-pattern path
+"""
+
+import random
+import time
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.layer2.ml_classification.rule_based_classifier import RuleBasedClassifier
+from app.layer2.ml_classification.keyword_config import INDICATOR_KEYWORDS
+
+
+def _vocabulary():
+    words = ["the", "government", "said", "on", "monday", "colombo", "strikes"]
+    for config in INDICATOR_KEYWORDS.values():
+        for keyword_list in config['keywords'].values():
+            for keyword in keyword_list:
+                words.extend(keyword.split())
+    return words
+
+
+def _random_articles(n, seed=11):
+    rng = random.Random(seed)
+    vocab = _vocabulary()
+    separators = [" ", " ", " ", "  ", ", ", "-", ". "]
+
+    def sentence(length):
+        out = []
+        for _ in range(length):
+            out.append(rng.choice(vocab))
+            out.append(rng.choice(separators))
+        return "".join(out).strip()
+
+    return [
+        {'title': sentence(6).title(), 'content': sentence(rng.randint(0, 120))}
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture
+def classifier():
+    return RuleBasedClassifier(enable_cache=False)
+
+
+class TestKeywordIndex:
+    """Index-based classification must match the per-pattern reference."""
+
+    def test_matches_reference_implementation(self, classifier):
+        for article in _random_articles(300):
+            expected = classifier._classify_with_patterns(article['content'], article['title'])
+            actual = classifier._classify_uncached(article['content'], article['title'])
+            assert actual == expected
+
+    def test_multi_word_keywords(self, classifier):
+        results = classifier._classify_uncached("Load shedding and a power cut hit Colombo", "")
+        power = next(r for r in results if r['indicator_id'] == 'TEC_POWER')
+        assert 'load shedding' in power['matched_keywords']
+        assert 'power cut' in power['matched_keywords']
+
+    def test_multi_word_keywords_require_single_space(self, classifier):
+        results = classifier._classify_uncached("load-shedding and load  shedding", "")
+        assert all('load shedding' not in r['matched_keywords'] for r in results)
+
+    def test_empty_text(self, classifier):
+        assert classifier.classify_batch([{'title': 'Strike', 'content': '  '}]) == [[]]
+
+
+class TestClassifyBatch:
+    """Test cases for classify_batch."""
+
+    def test_batch_matches_single_calls(self, classifier):
+        articles = _random_articles(50)
+        batch = classifier.classify_batch(articles)
+        assert len(batch) == len(articles)
+        for article, result in zip(articles, batch):
+            if not article['content'].strip():
+                assert result == []
+            else:
+                assert result == classifier._classify_uncached(article['content'], article['title'])
+
+    def test_custom_fields(self, classifier):
+        batch = classifier.classify_batch([{'headline': 'Fuel shortage', 'body': 'Queues at sheds'}],
+                                          text_field='body', title_field='headline')
+        assert batch[0][0]['indicator_id'] == 'ECO_SUPPLY_CHAIN'
+
+
+class TestRuleBasedClassifierPerformance:
+    """Benchmark the keyword index against the per-pattern implementation."""
+
+    def test_batch_faster_than_pattern_scan(self, classifier):
+        articles = _random_articles(1000, seed=3)
+
+        start = time.perf_counter()
+        for article in articles:
+            classifier._classify_with_patterns(article['content'], article['title'])
+        pattern_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        classifier.classify_batch(articles)
+        index_elapsed = time.perf_counter() - start
+
+        # Tokenize-once should not be slower than scanning per keyword
+        assert index_elapsed < pattern_elapsed
@@ -0,0 +1,280 @@
+"""
+Tests for concurrent scraping.
+
+Covers:
+- ScrapeScheduler global and per-host concurrency caps
+- Database-configured sources are grouped by the host of their base URL
+- Result order, error capture and wall time / bytes annotation
+- Concurrent article page fetches in ConfigurableScraper
+- Per-source metrics from MasterOrchestrator._scrape_content_node
+- Database calls in _scrape_source_async run off the event loop
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.orchestrator.scrape_scheduler import ScrapeScheduler
+
+
+class _Tracker:
+    """Fake scraper that records how many sources run at once."""
+
+    def __init__(self, delay=0.05, hosts=None):
+        self.delay = delay
+        self.hosts = hosts or {}
+        self.active = 0
+        self.peak = 0
+        self.active_per_host = {}
+        self.peak_per_host = {}
+
+    def host_for(self, name):
+        return self.hosts.get(name, name)
+
+    async def execute(self, name):
+        host = self.host_for(name)
+        self.active += 1
+        self.active_per_host[host] = self.active_per_host.get(host, 0) + 1
+        self.peak = max(self.peak, self.active)
+        self.peak_per_host[host] = max(
+            self.peak_per_host.get(host, 0), self.active_per_host[host]
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            if name.startswith("bad"):
+                raise RuntimeError(f"{name} exploded")
+            return {"success": True, "articles": [{"title": name}], "bytes_fetched": 100}
+        finally:
+            self.active -= 1
+            self.active_per_host[host] -= 1
+
+
+class TestScrapeScheduler:
+    """Test cases for the scheduler limits."""
+
+    @pytest.mark.asyncio
+    async def test_runs_sources_concurrently(self):
+        tracker = _Tracker(delay=0.1)
+        scheduler = ScrapeScheduler(tracker.execute, tracker.host_for, max_concurrency=10)
+
+        start = time.perf_counter()
+        results = await scheduler.run([f"s{i}" for i in range(10)])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert tracker.peak == 10
+        assert [r["source_name"] for r in results] == [f"s{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_global_cap(self):
+        tracker = _Tracker()
+        scheduler = ScrapeScheduler(tracker.execute, tracker.host_for, max_concurrency=3)
+
+        await scheduler.run([f"s{i}" for i in range(12)])
+        assert tracker.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap(self):
+        hosts = {f"s{i}": "same.lk" for i in range(6)}
+        hosts.update({f"o{i}": f"other{i}.lk" for i in range(4)})
+        tracker = _Tracker(hosts=hosts)
+        scheduler = ScrapeScheduler(
+            tracker.execute, tracker.host_for,
+            max_concurrency=10, per_host_concurrency=2
+        )
+
+        await scheduler.run(list(hosts))
+        assert tracker.peak_per_host["same.lk"] == 2
+        # Other hosts are not blocked by the busy one
+        assert tracker.peak >= 6
+
+    @pytest.mark.asyncio
+    async def test_errors_and_annotations(self):
+        tracker = _Tracker(delay=0.01)
+        scheduler = ScrapeScheduler(tracker.execute, tracker.host_for)
+
+        good, bad = await scheduler.run(["good", "bad_source"])
+        assert good["success"] and good["bytes_fetched"] == 100
+        assert good["host"] == "good"
+        assert good["wall_time_ms"] >= 10
+        assert not bad["success"]
+        assert "exploded" in bad["error"]
+        assert bad["bytes_fetched"] == 0
+
+
+    @pytest.mark.asyncio
+    async def test_database_sources_share_host_cap(self, monkeypatch):
+        from app.agents.tools import scraper_tools
+        from app.models.agent_models import SourceConfig
+        from app.scrapers.configurable_scraper import ConfigurableScraper
+
+        urls = {
+            "db_business": "https://www.example.lk/business",
+            "db_politics": "https://example.lk/politics",
+            "db_other": "https://other.example.org",
+        }
+
+        def scraper_for(name):
+            return ConfigurableScraper(SourceConfig(
+                id=1, source_name=name, base_url=urls[name], selectors={},
+                rate_limit_requests=100, rate_limit_period=60, language="en"
+            ))
+
+        monkeypatch.setattr(scraper_tools, "get_available_scrapers", lambda: list(urls))
+        monkeypatch.setattr(scraper_tools, "get_scraper_instance", scraper_for)
+        manager = scraper_tools.ScraperToolManager()
+        tracker = _Tracker()
+        tracker.host_for = manager.get_source_host
+        scheduler = ScrapeScheduler(
+            tracker.execute, manager.get_source_host,
+            max_concurrency=10, per_host_concurrency=1
+        )
+
+        results = await scheduler.run(list(urls))
+
+        assert [r["host"] for r in results] == ["example.lk", "example.lk", "other.example.org"]
+        assert tracker.peak_per_host["example.lk"] == 1
+        assert tracker.peak == 2
+
+
+class TestConfigurableScraperConcurrency:
+    """Article pages within one source are fetched concurrently."""
+
+    @pytest.fixture
+    def scraper(self):
+        from app.models.agent_models import SourceConfig
+        from app.scrapers.configurable_scraper import ConfigurableScraper
+
+        config = SourceConfig(
+            id=1,
+            source_name="test_source",
+            base_url="https://news.example.lk",
+            selectors={"title": "h1", "body": "article"},
+            rate_limit_requests=100,
+            rate_limit_period=60,
+            language="en"
+        )
+        return ConfigurableScraper(config)
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_concurrently_in_order(self, scraper):
+        body = "<p>" + "Economic news paragraph with plenty of words. " * 5 + "</p>"
+        active = {"now": 0, "peak": 0}
+
+        class _Response:
+            def __init__(self, url):
+                self.content = f"<html><h1>{url}</h1><article>{body}</article></html>".encode()
+
+            def raise_for_status(self):
+                pass
+
+        class _Client:
+            async def get(self, url):
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                await asyncio.sleep(0.05)
+                active["now"] -= 1
+                return _Response(url)
+
+        links = [f"https://news.example.lk/news/{1000 + i}" for i in range(10)]
+        start = time.perf_counter()
+        articles = await scraper._process_articles(_Client(), links)
+        elapsed = time.perf_counter() - start
+
+        assert [a.raw_content.title for a in articles] == links
+        assert active["peak"] == scraper.ARTICLE_CONCURRENCY
+        assert elapsed < 0.3
+        assert scraper.bytes_fetched == sum(len(_Response(l).content) for l in links)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_reserves_distinct_slots(self, scraper):
+        scraper.rate_limit = 3
+        scraper.rate_period = 0.2
+
+        start = time.perf_counter()
+        await asyncio.gather(*(scraper._rate_limit_wait() for _ in range(6)))
+        elapsed = time.perf_counter() - start
+
+        # Six requests at three per 0.2s need exactly one full wait
+        assert 0.18 <= elapsed < 0.35
+        assert len(scraper._request_times) == 3
+
+
+class TestScrapeContentNode:
+    """Test cases for scrape metrics in the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_per_source_metrics(self):
+        from app.orchestrator.master_orchestrator import MasterOrchestrator
+
+        async def execute(name):
+            if name == "down":
+                return {"success": False, "error": "HTTP 503"}
+            return {
+                "success": True,
+                "articles": [{"title": f"{name} story"}],
+                "bytes_fetched": 2048,
+                "from_cache": name == "cached"
+            }
+
+        orchestrator = MasterOrchestrator.__new__(MasterOrchestrator)
+        orchestrator.state_manager = MagicMock()
+        orchestrator.state_manager.update_phase = AsyncMock()
+        orchestrator.state_manager.add_many_scraped_content = AsyncMock()
+        orchestrator.scrape_scheduler = ScrapeScheduler(execute, lambda name: f"{name}.lk")
+
+        result = await orchestrator._scrape_content_node({
+            "run_id": "run_1",
+            "sources_to_scrape": ["fresh", "cached", "down"],
+            "errors": [],
+            "metrics": {"sources_to_scrape": 3}
+        })
+
+        metrics = result["metrics"]
+        assert metrics["articles_scraped"] == 2
+        assert metrics["bytes_fetched"] == 4096
+        assert metrics["sources"]["fresh"]["bytes_fetched"] == 2048
+        assert metrics["sources"]["cached"]["from_cache"] is True
+        assert metrics["sources"]["down"]["success"] is False
+        assert "wall_time_ms" in metrics["sources"]["fresh"]
+        assert "scrape_wall_time_ms" in metrics
+        assert result["errors"] == [
+            {"phase": "scrape_content", "source": "down", "error": "HTTP 503"}
+        ]
+        assert [a["source_name"] for a in result["scraped_content"]] == ["fresh", "cached"]
+
+
+class TestScrapeSourceDatabaseCalls:
+    """Synchronous database calls stay off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_and_result_update_run_in_threads(self, monkeypatch):
+        from app.agents.tools import scraper_tools
+
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def blocking(name):
+            def call(*args, **kwargs):
+                calls.append((name, threading.get_ident()))
+                if name == "get_scraper_instance":
+                    scraper = MagicMock()
+                    scraper.fetch_articles = AsyncMock(side_effect=RuntimeError("boom"))
+                    return scraper
+                return [] if name == "get_available_scrapers" else None
+            return call
+
+        for name in ("get_scraper_instance", "get_available_scrapers", "update_scrape_result"):
+            monkeypatch.setattr(scraper_tools, name, blocking(name))
+
+        result = await scraper_tools._scrape_source_async("unconfigured_source")
+
+        assert result["success"] is False
+        assert [name for name, _ in calls] == ["get_scraper_instance", "update_scrape_result"]
+        assert all(thread != loop_thread for _, thread in calls)
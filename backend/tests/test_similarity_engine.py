@@ -0,0 +1,407 @@
+"""
+Tests for the FAISS similarity engine.
+
+Covers:
+- Search results map to the right article after evictions
+- Rolling-window and max_articles eviction without index rebuilds
+- Binary snapshot persistence: segments, compaction, legacy migration
+- Numpy fallback index (growth, swap removal, top-k) and search_many
+"""
+
+import json
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("faiss")
+
+from app.deduplication.similarity_engine import (
+    SimilarityEngine,
+    SimilarityConfig,
+    ArticleVector,
+    NumpyFlatIndex,
+)
+
+
+DIM = 16
+
+
+class _FakePipeline:
+    """Queues commands and runs them on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    """Minimal async key/value and list store (no response decoding)."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+
+    async def rpush(self, key, value):
+        self.data.setdefault(key, []).append(value)
+        return len(self.data[key])
+
+    async def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+def _vectors(n, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def engine():
+    return SimilarityEngine(
+        SimilarityConfig(embedding_dim=DIM, max_articles=1000),
+        redis_client=_FakeRedis()
+    )
+
+
+async def _add_all(engine, vectors, scraped_at=None, prefix="a"):
+    for i, vec in enumerate(vectors):
+        await engine.add_article(
+            f"{prefix}{i}", vec, f"title {i}", "src", scraped_at=scraped_at
+        )
+
+
+class TestSimilarityEngine:
+    """Test cases for the ID-mapped index."""
+
+    @pytest.mark.asyncio
+    async def test_search_returns_exact_match(self, engine):
+        vectors = _vectors(50)
+        await _add_all(engine, vectors)
+
+        for i in (0, 17, 49):
+            matches = await engine.search(vectors[i], top_k=1)
+            assert matches[0].article_id == f"a{i}"
+            assert matches[0].similarity_score == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_expired_articles_evicted_and_ids_stay_consistent(self, engine):
+        old = datetime.utcnow() - timedelta(hours=100)
+        old_vectors = _vectors(10, seed=1)
+        new_vectors = _vectors(20, seed=2)
+
+        # Expired articles are removed as soon as the next add runs cleanup
+        engine.config.window_hours = 1000
+        await _add_all(engine, old_vectors, scraped_at=old, prefix="old")
+        engine.config.window_hours = 48
+        await _add_all(engine, new_vectors, prefix="new")
+
+        assert engine.get_index_stats()["total_articles"] == 20
+        assert engine._index.ntotal == 20
+        assert not any(aid.startswith("old") for aid in engine._article_metadata)
+
+        for i, vec in enumerate(new_vectors):
+            matches = await engine.search(vec, top_k=1)
+            assert matches[0].article_id == f"new{i}"
+
+    @pytest.mark.asyncio
+    async def test_max_articles_evicts_oldest(self, engine):
+        engine.config.max_articles = 5
+        vectors = _vectors(12, seed=3)
+
+        await _add_all(engine, vectors)
+
+        assert list(engine._article_ids) == [f"a{i}" for i in range(7, 12)]
+        assert engine._index.ntotal == 5
+        for i in range(7, 12):
+            matches = await engine.search(vectors[i], top_k=1)
+            assert matches[0].article_id == f"a{i}"
+
+        matches = await engine.search(vectors[0], top_k=5)
+        assert all(m.article_id != "a0" for m in matches)
+
+    @pytest.mark.asyncio
+    async def test_reload_from_redis(self, engine):
+        vectors = _vectors(8, seed=4)
+        await _add_all(engine, vectors)
+        await engine._save_to_redis()
+
+        reloaded = SimilarityEngine(engine.config, redis_client=engine.redis)
+        await reloaded.initialize()
+
+        assert list(reloaded._article_ids) == list(engine._article_ids)
+        matches = await reloaded.search(vectors[3], top_k=1)
+        assert matches[0].article_id == "a3"
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_state(self, engine):
+        await _add_all(engine, _vectors(5))
+        engine.redis = None
+        with patch.object(engine, "_get_redis", return_value=None):
+            engine.clear()
+            await engine.initialize()
+
+        assert engine.get_index_stats()["total_articles"] == 0
+        assert engine._index.ntotal == 0
+        assert not engine._insertion_order
+
+
+class TestSnapshotPersistence:
+    """Test cases for the binary snapshot format."""
+
+    @pytest.mark.asyncio
+    async def test_periodic_saves_append_segments(self, engine):
+        engine.config.persist_every = 10
+        await _add_all(engine, _vectors(35))
+
+        redis = engine.redis.data
+        assert len(redis[SimilarityEngine.SEGMENT_META_KEY]) == 3
+        assert SimilarityEngine.SNAPSHOT_META_KEY not in redis
+        assert len(engine._unsaved) == 5
+
+        # Segments hold raw float32 rows, not JSON
+        vectors = redis[SimilarityEngine.SEGMENT_VECTORS_KEY][0]
+        assert isinstance(vectors, bytes)
+        assert len(vectors) == 10 * DIM * 4
+        meta = json.loads(redis[SimilarityEngine.SEGMENT_META_KEY][0])
+        assert [row[0] for row in meta] == [f"a{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_compaction_writes_live_articles_only(self, engine):
+        engine.config.persist_every = 10
+        engine.config.snapshot_max_segments = 2
+        engine.config.max_articles = 15
+        await _add_all(engine, _vectors(30))
+
+        redis = engine.redis.data
+        meta = json.loads(redis[SimilarityEngine.SNAPSHOT_META_KEY])
+        assert [row[0] for row in meta] == [f"a{i}" for i in range(15, 30)]
+        assert SimilarityEngine.SEGMENT_META_KEY not in redis
+
+    @pytest.mark.asyncio
+    async def test_reload_snapshot_and_segments(self, engine):
+        engine.config.persist_every = 10
+        engine.config.snapshot_max_segments = 2
+        vectors = _vectors(45, seed=6)
+        await _add_all(engine, vectors)
+        await engine._save_to_redis()
+
+        reloaded = SimilarityEngine(engine.config, redis_client=engine.redis)
+        await reloaded.initialize()
+
+        assert list(reloaded._article_ids) == list(engine._article_ids)
+        assert not reloaded._unsaved
+        np.testing.assert_array_equal(
+            reloaded._article_metadata["a44"].embedding, vectors[44]
+        )
+        matches = await reloaded.search(vectors[20], top_k=1)
+        assert matches[0].article_id == "a20"
+
+    @pytest.mark.asyncio
+    async def test_reload_reapplies_eviction(self, engine):
+        engine.config.persist_every = 5
+        await _add_all(engine, _vectors(20))
+
+        config = SimilarityConfig(embedding_dim=DIM, max_articles=8)
+        reloaded = SimilarityEngine(config, redis_client=engine.redis)
+        await reloaded.initialize()
+
+        assert list(reloaded._article_ids) == [f"a{i}" for i in range(12, 20)]
+        assert reloaded._index.ntotal == 8
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_is_migrated(self, engine):
+        vectors = _vectors(3, seed=7)
+        scraped_at = datetime.utcnow().isoformat()
+        engine.redis.data[SimilarityEngine.LEGACY_IDS_KEY] = json.dumps(["x0", "x1", "x2"])
+        engine.redis.data[SimilarityEngine.LEGACY_METADATA_KEY] = json.dumps({
+            f"x{i}": {
+                "article_id": f"x{i}",
+                "embedding": vectors[i].tolist(),
+                "title": "t",
+                "source_name": "src",
+                "scraped_at": scraped_at,
+            }
+            for i in range(3)
+        })
+
+        await engine.initialize()
+        assert list(engine._article_ids) == ["x0", "x1", "x2"]
+
+        # The next save rewrites everything as a snapshot and drops the JSON
+        await engine.add_article("x3", vectors[0], "t", "src")
+        await engine._save_to_redis()
+        redis = engine.redis.data
+        assert SimilarityEngine.LEGACY_METADATA_KEY not in redis
+        meta = json.loads(redis[SimilarityEngine.SNAPSHOT_META_KEY])
+        assert [row[0] for row in meta] == ["x0", "x1", "x2", "x3"]
+
+
+@pytest.fixture
+def numpy_engine():
+    """Engine initialized as if FAISS were not installed."""
+    engine = SimilarityEngine(
+        SimilarityConfig(embedding_dim=DIM, max_articles=1000),
+        redis_client=_FakeRedis()
+    )
+    with patch.dict(sys.modules, {"faiss": None}):
+        engine._ensure_initialized()
+    assert isinstance(engine._index, NumpyFlatIndex)
+    return engine
+
+
+class TestNumpyFallback:
+    """Test cases for the FAISS-free index."""
+
+    def test_matches_faiss_flat_index(self):
+        import faiss
+        base = _vectors(300, seed=8)
+        queries = _vectors(7, seed=9)
+        ids = np.arange(1000, 1300, dtype=np.int64)
+
+        reference = faiss.IndexIDMap2(faiss.IndexFlatIP(DIM))
+        reference.add_with_ids(base, ids)
+        index = NumpyFlatIndex(DIM, capacity=4)
+        index.add_with_ids(base, ids)
+
+        expected_scores, expected_ids = reference.search(queries, 5)
+        scores, found = index.search(queries, 5)
+        np.testing.assert_array_equal(found, expected_ids)
+        np.testing.assert_allclose(scores, expected_scores, rtol=1e-5)
+
+    def test_grows_by_doubling(self):
+        index = NumpyFlatIndex(DIM, capacity=4)
+        index.add_with_ids(_vectors(5), np.arange(5, dtype=np.int64))
+        assert len(index._ids) == 8
+        index.add_with_ids(_vectors(4, seed=1), np.arange(5, 9, dtype=np.int64))
+        assert len(index._ids) == 16
+        assert index.ntotal == 9
+
+    def test_remove_moves_last_row(self):
+        vectors = _vectors(5)
+        index = NumpyFlatIndex(DIM)
+        index.add_with_ids(vectors, np.arange(10, 15, dtype=np.int64))
+
+        assert index.remove_ids(np.array([11, 99], dtype=np.int64)) == 1
+        assert index.ntotal == 4
+        for i in (0, 2, 3, 4):
+            _, found = index.search(vectors[i], 1)
+            assert found[0, 0] == 10 + i
+
+    def test_pads_when_k_exceeds_size(self):
+        index = NumpyFlatIndex(DIM)
+        index.add_with_ids(_vectors(2), np.array([1, 2], dtype=np.int64))
+        scores, found = index.search(_vectors(1, seed=3), 4)
+        assert list(found[0, 2:]) == [-1, -1]
+        assert scores[0, 0] >= scores[0, 1]
+
+    @pytest.mark.asyncio
+    async def test_engine_without_faiss(self, numpy_engine):
+        numpy_engine.config.max_articles = 20
+        vectors = _vectors(30, seed=10)
+        await _add_all(numpy_engine, vectors)
+
+        assert numpy_engine._index.ntotal == 20
+        for i in (10, 25, 29):
+            matches = await numpy_engine.search(vectors[i], top_k=1)
+            assert matches[0].article_id == f"a{i}"
+        assert numpy_engine.search_sync(vectors[12], top_k=1)[0].article_id == "a12"
+
+    @pytest.mark.asyncio
+    async def test_search_many(self, engine):
+        vectors = _vectors(40, seed=11)
+        await _add_all(engine, vectors)
+
+        results = await engine.search_many(vectors[[3, 7, 30]], top_k=2, exclude_ids=["a7"])
+        assert len(results) == 3
+        assert results[0][0].article_id == "a3"
+        assert all(m.article_id != "a7" for m in results[1])
+        assert len(results[1]) == 2
+        assert results[2][0].article_id == "a30"
+
+
+class TestSimilarityEnginePerformance:
+    """Eviction cost should not grow with index size."""
+
+    @pytest.mark.asyncio
+    async def test_eviction_is_incremental(self, engine):
+        engine.config.max_articles = 2000
+        vectors = _vectors(2500, seed=5)
+
+        await _add_all(engine, vectors)
+
+        assert len(engine._article_ids) == 2000
+        assert len(engine._insertion_order) == 2000
+        assert engine._index.ntotal == 2000
+        matches = await engine.search(vectors[2499], top_k=1)
+        assert matches[0].article_id == "a2499"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_roundtrip_speed(self, engine):
+        import time
+        engine.config.embedding_dim = 384
+        engine.config.max_articles = 50000
+        vectors = np.random.default_rng(0).random((20000, 384), dtype=np.float32)
+        now = datetime.utcnow()
+        for i in range(len(vectors)):
+            engine._register(ArticleVector(f"a{i}", vectors[i], "t", "src", now))
+        engine._segment_count = engine.config.snapshot_max_segments
+
+        start = time.perf_counter()
+        await engine._save_to_redis()
+        reloaded = SimilarityEngine(engine.config, redis_client=engine.redis)
+        await reloaded.initialize()
+        elapsed = time.perf_counter() - start
+
+        assert len(reloaded._article_ids) == 20000
+        assert len(engine.redis.data[SimilarityEngine.SNAPSHOT_VECTORS_KEY]) == 20000 * 384 * 4
+        assert elapsed < 5.0
+
+    def test_numpy_search_within_10x_of_faiss(self):
+        import faiss
+        import time
+        dim = 384
+        rng = np.random.default_rng(1)
+        base = rng.random((20000, dim), dtype=np.float32)
+        queries = rng.random((200, dim), dtype=np.float32)
+        ids = np.arange(len(base), dtype=np.int64)
+
+        reference = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+        reference.add_with_ids(base, ids)
+        index = NumpyFlatIndex(dim)
+        index.add_with_ids(base, ids)
+
+        start = time.perf_counter()
+        reference.search(queries, 10)
+        faiss_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index.search(queries, 10)
+        numpy_time = time.perf_counter() - start
+
+        assert numpy_time < max(faiss_time * 10, 0.5)
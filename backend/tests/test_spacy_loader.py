@@ -0,0 +1,95 @@
+"""
+Tests for the shared spaCy pipeline loader and batched entity extraction.
+
+A blank English pipeline with an entity ruler stands in for en_core_web_sm.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+spacy = pytest.importorskip("spacy")
+
+from app.layer2.nlp_processing import spacy_loader
+
+
+def _fake_model(name):
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "GPE", "pattern": "Colombo"},
+        {"label": "ORG", "pattern": "Central Bank"},
+        {"label": "PERSON", "pattern": "Ranil"},
+    ])
+    nlp.add_pipe("sentencizer", name="senter")
+    return nlp
+
+
+@pytest.fixture(autouse=True)
+def fake_spacy():
+    spacy_loader.clear_spacy_cache()
+    with patch("spacy.load", side_effect=_fake_model) as load:
+        yield load
+    spacy_loader.clear_spacy_cache()
+
+
+class TestSpacyLoader:
+    """Test cases for the process-wide model cache."""
+
+    def test_model_loaded_once(self, fake_spacy):
+        first = spacy_loader.get_spacy_model()
+        second = spacy_loader.get_spacy_model()
+        assert first is second
+        assert fake_spacy.call_count == 1
+
+    def test_unused_components_disabled(self):
+        nlp = spacy_loader.get_spacy_model()
+        assert "senter" in nlp.disabled
+        assert "entity_ruler" in nlp.pipe_names
+
+    def test_resolve_n_process(self):
+        assert spacy_loader.resolve_n_process(10) == 1
+        assert spacy_loader.resolve_n_process(10, n_process=3) == 3
+        assert 1 <= spacy_loader.resolve_n_process(100_000) <= (os.cpu_count() or 1)
+
+
+class TestBatchedExtraction:
+    """Batched extraction must match per-document extraction."""
+
+    def test_entity_extractor_batch(self):
+        from app.layer2.nlp_processing.entity_extractor import EntityExtractor
+
+        EntityExtractor._instance = None
+        extractor = EntityExtractor()
+        articles = [
+            {"article_id": f"a{i}", "title": "Central Bank update",
+             "content": f"Ranil visited Colombo. Rates rose {i}%."}
+            for i in range(5)
+        ]
+
+        batch = extractor.extract_entities_batch(articles, batch_size=2, n_process=1)
+        single = [extractor.extract_entities(a["article_id"], a["title"], a["content"]) for a in articles]
+
+        for b, s in zip(batch, single):
+            assert [l.text for l in b.locations] == [l.text for l in s.locations] == ["Colombo"]
+            assert [o.text for o in b.organizations] == ["Central Bank"]
+            assert [p.value for p in b.percentages] == [p.value for p in s.percentages]
+        EntityExtractor._instance = None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_entity_stage(self, fake_spacy):
+        from app.layer2.pipeline_orchestrator import Layer2PipelineOrchestrator
+
+        orch = Layer2PipelineOrchestrator(entity_batch_size=2, entity_n_process=1)
+        articles = [{"title": "Colombo", "body": f"Central Bank {i}"} for i in range(5)]
+
+        await orch._stage_entity_extraction(articles)
+        await orch._stage_entity_extraction(articles)
+
+        assert fake_spacy.call_count == 1
+        assert all(
+            [e["label"] for e in a["entities"]] == ["GPE", "ORG"] for a in articles
+        )
@@ -0,0 +1,204 @@
+"""
+Tests for field-level pipeline run state.
+
+Covers:
+- Run creation and full state reassembly
+- Append-only article/error lists with counters
+- Batched add_many_* writes in a single round trip
+- Concurrent writers not losing items
+- Metric parsing, run completion and recent run listing
+"""
+
+import asyncio
+import json
+import time
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.orchestrator.state_manager import StateManager, PipelinePhase, _MemoryPipeline
+
+
+class _CountingRedis:
+    """Redis stand-in that counts pipeline round trips; values come back as strings like decode_responses=True."""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipeline(_MemoryPipeline):
+            async def execute(self):
+                redis.round_trips += 1
+                results = await super().execute()
+                return [_stringify(r) for r in results]
+
+        return _Pipeline(self.store)
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+
+def _stringify(value):
+    if isinstance(value, dict):
+        return {k: str(v) for k, v in value.items()}
+    return value
+
+
+@pytest.fixture
+def manager():
+    return StateManager(redis_url="redis://unused")
+
+
+@pytest.fixture
+def redis_manager():
+    manager = StateManager(redis_url="redis://unused")
+    manager._redis = _CountingRedis()
+    return manager
+
+
+class TestRunState:
+    """Test cases for reading and writing run state."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_state(self, manager):
+        run_id = await manager.create_run()
+        await manager.set_sources_to_scrape(run_id, ["ada_derana", "cbsl"])
+        await manager.update_phase(run_id, PipelinePhase.SCRAPING)
+
+        state = await manager.get_state(run_id)
+        assert state["run_id"] == run_id
+        assert state["phase"] == "scraping"
+        assert state["sources_to_scrape"] == ["ada_derana", "cbsl"]
+        assert state["scraped_content"] == []
+        assert state["metrics"]["sources_analyzed"] == 2
+        assert state["metrics"]["articles_scraped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_run(self, manager):
+        assert await manager.get_state("nope") is None
+        assert await manager.get_metrics("nope") is None
+        assert await manager.complete_run("nope") == {"error": "Run not found"}
+
+    @pytest.mark.asyncio
+    async def test_appends_and_counters(self, manager):
+        run_id = await manager.create_run()
+        await manager.add_scraped_content(run_id, {"title": "a"})
+        await manager.add_many_scraped_content(run_id, [{"title": "b"}, {"title": "c"}])
+        await manager.add_processed_article(run_id, {"title": "a"})
+        await manager.add_many_validated_articles(run_id, [{"title": "a"}])
+        await manager.add_error(run_id, {"phase": "scrape_content", "error": "boom"})
+        await manager.increment_metric(run_id, "articles_stored", 3)
+        await manager.increment_metric(run_id, "custom")
+
+        state = await manager.get_state(run_id)
+        assert [c["title"] for c in state["scraped_content"]] == ["a", "b", "c"]
+        assert len(state["processed_articles"]) == 1
+        assert len(state["validated_articles"]) == 1
+        assert state["errors"][0]["error"] == "boom"
+        assert "timestamp" in state["errors"][0]
+        assert state["metrics"]["articles_scraped"] == 3
+        assert state["metrics"]["articles_processed"] == 1
+        assert state["metrics"]["articles_validated"] == 1
+        assert state["metrics"]["errors_count"] == 1
+        assert state["metrics"]["articles_stored"] == 3
+        assert state["metrics"]["custom"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_keep_every_item(self, manager):
+        run_id = await manager.create_run()
+        await asyncio.gather(*(
+            manager.add_scraped_content(run_id, {"i": i}) for i in range(50)
+        ))
+
+        state = await manager.get_state(run_id)
+        assert sorted(c["i"] for c in state["scraped_content"]) == list(range(50))
+        assert state["metrics"]["articles_scraped"] == 50
+
+    @pytest.mark.asyncio
+    async def test_complete_run(self, manager):
+        run_id = await manager.create_run()
+        await manager.add_error(run_id, {"error": "boom"})
+
+        result = await manager.complete_run(run_id, success=False)
+        assert result["success"] is False
+        assert result["errors"][0]["error"] == "boom"
+        assert result["metrics"]["duration_seconds"] >= 0
+
+        state = await manager.get_state(run_id)
+        assert state["phase"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_recent_runs_newest_first(self, manager):
+        first = await manager.create_run()
+        await asyncio.sleep(0.001)
+        second = await manager.create_run()
+
+        runs = await manager.get_recent_runs(limit=1)
+        assert [r["run_id"] for r in runs] == [second]
+        runs = await manager.get_recent_runs(limit=10)
+        assert [r["run_id"] for r in runs] == [second, first]
+
+
+class TestRedisRoundTrips:
+    """Writes are pipelined; values decode from Redis strings."""
+
+    @pytest.mark.asyncio
+    async def test_batch_write_is_one_round_trip(self, redis_manager):
+        run_id = await redis_manager.create_run()
+        redis_manager._redis.round_trips = 0
+
+        articles = [{"title": f"article {i}", "body": "x" * 200} for i in range(1000)]
+        await redis_manager.add_many_scraped_content(run_id, articles)
+        assert redis_manager._redis.round_trips == 1
+
+        state = await redis_manager.get_state(run_id)
+        assert len(state["scraped_content"]) == 1000
+        assert state["metrics"]["articles_scraped"] == 1000
+        assert redis_manager._redis.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_redis(self, redis_manager):
+        run_id = await redis_manager.create_run()
+        redis_manager._redis.round_trips = 0
+        await redis_manager.add_many_processed_articles(run_id, [])
+        assert redis_manager._redis.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_parsed_from_strings(self, redis_manager):
+        run_id = await redis_manager.create_run()
+        await redis_manager.complete_run(run_id)
+
+        metrics = await redis_manager.get_metrics(run_id)
+        assert metrics["articles_scraped"] == 0
+        assert isinstance(metrics["duration_seconds"], float)
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_state_still_readable(self, redis_manager):
+        legacy = {"run_id": "old", "phase": "completed", "metrics": {"articles_scraped": 4}}
+        redis_manager._redis.store["agent_state:old:state"] = json.dumps(legacy)
+
+        assert await redis_manager.get_state("old") == legacy
+        assert (await redis_manager.get_metrics("old"))["articles_scraped"] == 4
+
+
+class TestStatePerformance:
+    """Appending must not rewrite the whole state."""
+
+    @pytest.mark.asyncio
+    async def test_single_appends_scale_linearly(self, manager):
+        run_id = await manager.create_run()
+        article = {"title": "t", "body": "x" * 2000}
+
+        start = time.perf_counter()
+        for _ in range(2000):
+            await manager.add_scraped_content(run_id, article)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0
+        assert (await manager.get_metrics(run_id))["articles_scraped"] == 2000